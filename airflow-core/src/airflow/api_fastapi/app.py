@@ -27,6 +27,7 @@ from fastapi import FastAPI
 from fastapi.routing import Mount
 
 from airflow.api_fastapi.common.dagbag import create_dag_bag
+from airflow.api_fastapi.common.http_cache import create_response_cache
 from airflow.api_fastapi.core_api.app import (
     init_config,
     init_error_handlers,
@@ -109,6 +110,7 @@ def create_app(apps: str = "all") -> FastAPI:
 
     if "all" in apps_list or "core" in apps_list:
         app.state.dag_bag = dag_bag
+        app.state.response_cache = create_response_cache()
         init_plugins(app)
         init_auth_manager(app)
         init_flask_plugins(app)
@@ -24,16 +24,32 @@ from __future__ import annotations
 
 import base64
 import uuid as uuid_mod
-from typing import Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Annotated, Any, NamedTuple, cast
 
 import msgspec
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Query, status
 from sqlalchemy import and_, or_
 from sqlalchemy.sql import Select
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.sqltypes import Uuid
 
-from airflow.api_fastapi.common.parameters import SortParam
+from airflow.api_fastapi.common.db.common import apply_filters_to_select
+from airflow.api_fastapi.common.parameters import LimitFilter, SortParam
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from airflow.api_fastapi.core_api.base import OrmClause
+
+QueryCursor = Annotated[
+    str | None,
+    Query(
+        description="Cursor for keyset-based pagination. "
+        "Pass an empty string for the first page, then use ``next_cursor`` from the response. "
+        "When ``cursor`` is provided, ``offset`` is ignored.",
+    ),
+]
 
 
 def _b64url_decode_padded(token: str) -> bytes:
@@ -167,3 +183,61 @@ def apply_cursor_filter(
         resolved = [(name, col, not is_desc) for name, col, is_desc in resolved]
 
     return statement.where(_nested_keyset_predicate(resolved, parsed_values))
+
+
+class CursorPage(NamedTuple):
+    """A page of rows fetched with keyset pagination, with the cursors of its neighbour pages."""
+
+    rows: list[Any]
+    next_cursor: str | None
+    previous_cursor: str | None
+
+
+async def cursor_paginated_select_async(
+    *,
+    statement: Select,
+    filters: Sequence[OrmClause | None] | None = None,
+    order_by: SortParam,
+    limit: LimitFilter,
+    cursor: str,
+    session: AsyncSession,
+) -> CursorPage:
+    """
+    Fetch the page of rows of the statement starting at the cursor, using keyset pagination.
+
+    Unlike offset pagination, the cost of fetching a page does not depend on how deep the page
+    is, as the database seeks to the cursor through the index on the sort keys.
+
+    :param cursor: Cursor of the page; an empty string for the first page.
+    """
+    # Fetch one extra row so we can detect whether a next page exists.
+    page_limit = cast("int", limit.value)  # LimitFilter value is guaranteed to be set by QueryLimit
+    cursor_limit = LimitFilter().set_value(page_limit + 1)
+    statement = apply_filters_to_select(
+        statement=statement, filters=[*(filters or []), order_by, cursor_limit]
+    )
+
+    is_backward = False
+    if cursor:
+        token, is_backward = parse_cursor(cursor)
+        if is_backward:
+            statement = order_by.to_orm(statement, reversed=True)
+        statement = apply_cursor_filter(statement, token, order_by, is_backward=is_backward)
+
+    fetched = list((await session.scalars(statement)).unique())
+    has_more = len(fetched) > page_limit
+    rows = fetched[:page_limit]
+
+    if is_backward:
+        rows.reverse()
+        has_prev = has_more
+        has_next = True
+    else:
+        has_prev = bool(cursor)
+        has_next = has_more
+
+    return CursorPage(
+        rows=rows,
+        next_cursor=encode_cursor(rows[-1], order_by) if has_next and rows else None,
+        previous_cursor=make_backward_cursor(encode_cursor(rows[0], order_by)) if has_prev and rows else None,
+    )
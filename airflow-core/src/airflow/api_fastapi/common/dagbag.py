@@ -20,12 +20,16 @@ import logging
 from typing import TYPE_CHECKING, Annotated
 
 from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from airflow.configuration import conf
+from airflow.models.dag_version import DagVersion
 from airflow.models.dagbag import DBDagBag
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
     from airflow.models.dagrun import DagRun
     from airflow.serialization.definitions.dag import SerializedDAG
 
@@ -81,6 +85,17 @@ def get_latest_version_of_dag(
     return dag
 
 
+async def check_dag_exists_async(dag_id: str, session: AsyncSession) -> None:
+    """
+    Raise 404 if the Dag has no serialized version, without reading the Dag itself.
+
+    This is the check :func:`get_latest_version_of_dag` does, for routes using async sessions which do not
+    need the Dag.
+    """
+    if await session.scalar(select(DagVersion.id).where(DagVersion.dag_id == dag_id).limit(1)) is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, f"The Dag with ID: `{dag_id}` was not found")
+
+
 def get_dag_for_run(dag_bag: DBDagBag, dag_run: DagRun, session: Session) -> SerializedDAG:
     dag = dag_bag.get_dag_for_run(dag_run, session=session)
     if not dag:
@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -29,25 +29,29 @@ from sqlalchemy.orm.interfaces import LoaderOption
 from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagrun import DagRun
+from airflow.models.dagrun_state_count import DagRunStateCount
 from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskinstancehistory import TaskInstanceHistory
 
 if TYPE_CHECKING:
+    from sqlalchemy import Row, Select
+    from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.orm import Session
 
+# The counts are added up from the hourly rollup maintained by the scheduler rather than counting all Dag runs.
 # Use the hybrid_property for dag_display_name so the CASE WHEN fallback to dag_id
 # is applied when dag_display_name is NULL.  Using __table__.c would return raw NULLs
 # and crash DagStatsResponse validation (https://github.com/apache/airflow/issues/64247).
 dagruns_select_with_state_count = (
     select(  # type: ignore[call-overload]
-        DagRun.__table__.c.dag_id,
-        DagRun.__table__.c.state,
+        DagRunStateCount.dag_id,
+        DagRunStateCount.state,
         DagModel.dag_display_name,
-        func.count(DagRun.__table__.c.state).label("count"),
+        func.sum(DagRunStateCount.run_count).label("count"),
     )
-    .join(DagModel, DagRun.__table__.c.dag_id == DagModel.__table__.c.dag_id)
-    .group_by(DagRun.__table__.c.dag_id, DagRun.__table__.c.state, DagModel.dag_display_name)
-    .order_by(DagRun.__table__.c.dag_id)
+    .join(DagModel, DagRunStateCount.dag_id == DagModel.dag_id)
+    .group_by(DagRunStateCount.dag_id, DagRunStateCount.state, DagModel.dag_display_name)
+    .order_by(DagRunStateCount.dag_id)
 )
 
 
@@ -67,32 +71,16 @@ def eager_load_dag_run_for_list() -> tuple[LoaderOption, ...]:
     )
 
 
-def attach_dag_versions_to_runs(dag_runs: Sequence[DagRun], *, session: Session) -> None:
-    """
-    Prefetch distinct dag_version_ids for each DagRun via a lightweight query.
-
-    Instead of loading all TI and TIH rows (potentially thousands per run)
-    through the ORM relationship just to extract distinct dag_version_ids,
-    this issues a single query that returns only the distinct
-    (dag_id, run_id, dag_version_id) tuples for the given runs.
-
-    The result is attached to each DagRun as ``_prefetched_dag_version_ids``
-    (a dict mapping version_id -> DagVersion), which the ``dag_versions``
-    property reads as an optimized substitute for traversing TI/TIH
-    relationships.  All business logic (bundle_version shortcut, sorting,
-    deduplication) remains solely in ``DagRun.dag_versions``.
-    """
-    if not dag_runs:
-        return
-
+def _runs_needing_dag_versions(dag_runs: Sequence[DagRun]) -> list[DagRun]:
     # Only runs without a bundle_version need TI/TIH traversal;
     # runs with bundle_version use created_dag_version directly
     # (handled by the dag_versions property).
-    runs_needing_versions = [dr for dr in dag_runs if not dr.bundle_version]
-    if not runs_needing_versions:
-        return
+    return [dr for dr in dag_runs if not dr.bundle_version]
+
 
-    run_key_values = [(dr.dag_id, dr.run_id) for dr in runs_needing_versions]
+def _run_dag_version_ids_select(dag_runs: Sequence[DagRun]) -> Select:
+    """Select the distinct (dag_id, run_id, dag_version_id) tuples of the TIs and TIHs of the runs."""
+    run_key_values = [(dr.dag_id, dr.run_id) for dr in dag_runs]
 
     ti_sub = (
         select(
@@ -115,25 +103,71 @@ def attach_dag_versions_to_runs(dag_runs: Sequence[DagRun], *, session: Session)
         .distinct()
     )
     combined = union_all(ti_sub, tih_sub).subquery()
-    rows = session.execute(
-        select(combined.c.dag_id, combined.c.run_id, combined.c.dag_version_id).distinct()
-    ).all()
+    return select(combined.c.dag_id, combined.c.run_id, combined.c.dag_version_id).distinct()
 
-    all_version_ids = {r.dag_version_id for r in rows}
-    versions_by_id: dict[UUID, DagVersion] = {}
-    if all_version_ids:
-        dv_query = (
-            select(DagVersion)
-            .where(DagVersion.id.in_(all_version_ids))
-            .options(joinedload(DagVersion.bundle))
-        )
-        versions_by_id = {dv.id: dv for dv in session.scalars(dv_query).unique()}
 
+def _dag_versions_select(version_ids: Collection[UUID]) -> Select:
+    return (
+        select(DagVersion)
+        .where(DagVersion.id.in_(version_ids))
+        .options(joinedload(DagVersion.bundle), joinedload(DagVersion.dag_model))
+    )
+
+
+def _set_prefetched_dag_versions(
+    dag_runs: Sequence[DagRun], rows: Sequence[Row], versions_by_id: dict[UUID, DagVersion]
+) -> None:
     versions_per_run: dict[tuple[str, str], dict[UUID, DagVersion]] = defaultdict(dict)
     for row in rows:
         dv = versions_by_id.get(row.dag_version_id)
         if dv:
             versions_per_run[(row.dag_id, row.run_id)][dv.id] = dv
 
-    for dr in runs_needing_versions:
+    for dr in dag_runs:
         dr._prefetched_dag_version_ids = versions_per_run.get((dr.dag_id, dr.run_id), {})
+
+
+def attach_dag_versions_to_runs(dag_runs: Sequence[DagRun], *, session: Session) -> None:
+    """
+    Prefetch distinct dag_version_ids for each DagRun via a lightweight query.
+
+    Instead of loading all TI and TIH rows (potentially thousands per run)
+    through the ORM relationship just to extract distinct dag_version_ids,
+    this issues a single query that returns only the distinct
+    (dag_id, run_id, dag_version_id) tuples for the given runs.
+
+    The result is attached to each DagRun as ``_prefetched_dag_version_ids``
+    (a dict mapping version_id -> DagVersion), which the ``dag_versions``
+    property reads as an optimized substitute for traversing TI/TIH
+    relationships.  All business logic (bundle_version shortcut, sorting,
+    deduplication) remains solely in ``DagRun.dag_versions``.
+    """
+    runs_needing_versions = _runs_needing_dag_versions(dag_runs)
+    if not runs_needing_versions:
+        return
+
+    rows = session.execute(_run_dag_version_ids_select(runs_needing_versions)).all()
+
+    all_version_ids = {r.dag_version_id for r in rows}
+    versions_by_id: dict[UUID, DagVersion] = {}
+    if all_version_ids:
+        versions_by_id = {dv.id: dv for dv in session.scalars(_dag_versions_select(all_version_ids)).unique()}
+
+    _set_prefetched_dag_versions(runs_needing_versions, rows, versions_by_id)
+
+
+async def attach_dag_versions_to_runs_async(dag_runs: Sequence[DagRun], *, session: AsyncSession) -> None:
+    """Prefetch distinct dag_version_ids for each DagRun, see :func:`attach_dag_versions_to_runs`."""
+    runs_needing_versions = _runs_needing_dag_versions(dag_runs)
+    if not runs_needing_versions:
+        return
+
+    rows = (await session.execute(_run_dag_version_ids_select(runs_needing_versions))).all()
+
+    all_version_ids = {r.dag_version_id for r in rows}
+    versions_by_id: dict[UUID, DagVersion] = {}
+    if all_version_ids:
+        versions = await session.scalars(_dag_versions_select(all_version_ids))
+        versions_by_id = {dv.id: dv for dv in versions.unique()}
+
+    _set_prefetched_dag_versions(runs_needing_versions, rows, versions_by_id)
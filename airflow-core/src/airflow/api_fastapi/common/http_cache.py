@@ -0,0 +1,172 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Conditional requests and response caching for read-heavy API endpoints.
+
+Endpoints polled by the UI derive a cheap version token of the data their response is built from, e.g. the
+latest ``dag_run.updated_at`` of a Dag, before running their full queries. The token, together with the
+route and its query parameters, makes up the ETag of the response, so that requests with a matching
+``If-None-Match`` header are answered with ``304 Not Modified``, and responses can optionally be served from
+an in-process cache while the token does not change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Annotated, Any, TypeVar
+
+from cachetools import LRUCache
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from airflow.configuration import conf
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ResponseCache:
+    """
+    Thread-safe, in-process LRU cache of endpoint responses keyed on their ETag.
+
+    :param maxsize: Maximum number of cached responses; caching is disabled if 0.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self._cache: LRUCache[str, Any] | None = LRUCache(maxsize=maxsize) if maxsize > 0 else None
+        # Lock required: cachetools caches are NOT thread-safe, and sync routes run in a thread pool.
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None
+
+    def get(self, etag: str) -> Any | None:
+        if self._cache is None:
+            return None
+        with self._lock:
+            return self._cache.get(etag)
+
+    def set(self, etag: str, value: Any) -> None:
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache[etag] = value
+
+    def clear(self) -> None:
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache.clear()
+
+
+def create_response_cache() -> ResponseCache:
+    """Create the response cache shared by the endpoints of the API server."""
+    cache_size = conf.getint("api", "response_cache_size", fallback=0)
+    if cache_size < 0:
+        log.warning("response_cache_size must be >= 0, disabling the response cache")
+        cache_size = 0
+    return ResponseCache(maxsize=cache_size)
+
+
+def compute_etag(request: Request, version_token: Hashable) -> str:
+    """
+    Compute a weak ETag for the response to the request, given the version token of its data.
+
+    :param request: The request to respond to; its path and query parameters are part of the ETag.
+    :param version_token: Token changing whenever the data the response is built from changes.
+    """
+    query_params = sorted(request.query_params.multi_items())
+    digest = hashlib.sha256(repr((request.url.path, query_params, version_token)).encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of the ETag against an ``If-None-Match`` header value."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag.removeprefix("W/")
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ConditionalRequest:
+    """
+    Conditional handling of a request, based on the version token of the data of its response.
+
+    Endpoints call :meth:`evaluate` with the version token before building their response, and pass the
+    response built through :meth:`cache`.
+    """
+
+    def __init__(self, request: Request, response: Response, response_cache: ResponseCache | None):
+        self.request = request
+        self.response = response
+        self.response_cache = response_cache
+        self.etag: str | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """
+        Headers to add to the response.
+
+        They are added automatically to responses returned as data, but need to be passed explicitly to
+        responses returned as ``Response`` objects, e.g. streamed responses.
+        """
+        if self.etag is None:
+            return {}
+        # Clients may store the response, but need to revalidate it on every use.
+        return {"ETag": self.etag, "Cache-Control": "no-cache"}
+
+    def evaluate(self, version_token: Hashable | None) -> Any | None:
+        """
+        Compare the version of the response to the one the client has, if any.
+
+        :param version_token: Token changing whenever the data the response is built from changes, or None
+            if the response cannot be versioned, in which case the request is handled unconditionally.
+        :return: The cached response for this version, if any.
+        :raises HTTPException: With ``304 Not Modified`` if the client has this version of the response.
+        """
+        if version_token is None:
+            return None
+        self.etag = compute_etag(self.request, version_token)
+        self.response.headers.update(self.headers)
+        if_none_match = self.request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, self.etag):
+            raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(self.etag)
+
+    def cache(self, value: T) -> T:
+        """Cache the response built for the evaluated version, and return it."""
+        if self.etag is not None and self.response_cache is not None:
+            self.response_cache.set(self.etag, value)
+        return value
+
+
+def conditional_request(request: Request, response: Response) -> ConditionalRequest:
+    """FastAPI dependency resolver returning the conditional handling of the request."""
+    return ConditionalRequest(request, response, getattr(request.app.state, "response_cache", None))
+
+
+ConditionalRequestDep = Annotated[ConditionalRequest, Depends(conditional_request)]
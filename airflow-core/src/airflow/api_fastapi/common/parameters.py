@@ -533,12 +533,13 @@ class SortParam(BaseParam[list[str]]):
 
             resolved.append((attr_name, column, order_by_value.startswith("-")))
 
-        primary_key_column = self.get_primary_key_column()
-        pk_name = self.get_primary_key_string()
+        # Tie-break on every column of the primary key, so that the order is total and keyset
+        # pagination neither skips nor repeats rows sharing the same sort values.
         resolved_column_keys = {getattr(col, "key", None) for _, col, _ in resolved}
-        if pk_name not in resolved_column_keys:
-            pk_desc = bool(order_by_values and order_by_values[0].startswith("-"))
-            resolved.append((pk_name, primary_key_column, pk_desc))
+        pk_desc = bool(order_by_values and order_by_values[0].startswith("-"))
+        for primary_key_column in inspect(self.model).primary_key:
+            if primary_key_column.name not in resolved_column_keys:
+                resolved.append((primary_key_column.name, primary_key_column, pk_desc))
 
         self._cached_resolution = resolved
         return self._cached_resolution
@@ -570,19 +571,33 @@ class SortParam(BaseParam[list[str]]):
             if isinstance(replacement, str):
                 return getattr(row, replacement, None)
             if replacement is not None:
-                # TODO: Column-form ``to_replace`` (e.g. ``{"last_run_state": DagRun.state}``)
-                # isn't supported for cursor pagination — no endpoint that uses cursor
-                # pagination needs it today. When one does, decide how the row exposes the
-                # value (projected label on the SELECT, eagerly loaded relationship, etc.)
-                # and wire it up here. Raising loudly so a future caller doesn't silently
-                # get ``None`` cursor tokens.
-                raise NotImplementedError(
-                    f"Cursor pagination does not support column-form ``to_replace`` mapping for "
-                    f"``{name}``. Use a string alias in ``to_replace`` or sort by a primary-model "
-                    f"attribute."
-                )
+                return self._related_row_value(row, name, replacement)
         return getattr(row, name, None)
 
+    def _related_row_value(self, row: Any, name: str, column: Any) -> Any:
+        """
+        Extract the value of a column-form ``to_replace`` mapping from a result row.
+
+        Only columns of a model the row has a single relationship to are supported, e.g.
+        ``{"run_after": DagRun.run_after}`` for task instances, read through ``row.dag_run``.
+        """
+        related_class = getattr(column, "class_", None)
+        if related_class is self.model:
+            return getattr(row, column.key, None)
+        relationships = [
+            relationship.key
+            for relationship in inspect(self.model).relationships
+            if related_class is not None and relationship.mapper.class_ is related_class
+        ]
+        if len(relationships) != 1:
+            # Raising loudly so a future caller doesn't silently get ``None`` cursor tokens.
+            raise NotImplementedError(
+                f"Cursor pagination does not support the ``to_replace`` mapping for ``{name}``. Use a "
+                f"string alias, a column of a related model or sort by a primary-model attribute."
+            )
+        related = getattr(row, relationships[0], None)
+        return getattr(related, column.key, None) if related is not None else None
+
     def get_primary_key_column(self) -> Column:
         """Get the primary key column of the model of SortParam object."""
         return inspect(self.model).primary_key[0]
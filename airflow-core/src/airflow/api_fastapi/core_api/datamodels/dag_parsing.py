@@ -0,0 +1,51 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import datetime
+
+from airflow.api_fastapi.core_api.base import BaseModel
+
+
+class ParseImportTimeResponse(BaseModel):
+    """Time spent importing a module while parsing a DAG file."""
+
+    module: str
+    duration: float
+    self_duration: float
+
+
+class ParseLineSampleResponse(BaseModel):
+    """Time spent running a line while parsing a DAG file."""
+
+    location: str
+    duration: float
+
+
+class DagFileParseProfileResponse(BaseModel):
+    """Profile of the last parsing of a DAG file, durations are in seconds."""
+
+    bundle_name: str
+    relative_fileloc: str
+    parsed_at: datetime
+    parse_duration: float
+    import_duration: float
+    user_code_duration: float
+    dagbag_duration: float
+    serialization_duration: float
+    imports: list[ParseImportTimeResponse]
+    slowest_lines: list[ParseLineSampleResponse]
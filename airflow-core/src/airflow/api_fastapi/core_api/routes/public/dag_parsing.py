@@ -26,10 +26,12 @@ from sqlalchemy import select
 from airflow.api_fastapi.auth.managers.models.resource_details import DagDetails
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.core_api.datamodels.dag_parsing import DagFileParseProfileResponse
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
 from airflow.api_fastapi.core_api.security import requires_access_dag
 from airflow.api_fastapi.logging.decorators import action_logging
 from airflow.models.dag import DagModel
+from airflow.models.dag_file_parse_profile import DagFileParseProfile
 from airflow.models.dagbag import DagPriorityParsingRequest
 
 if TYPE_CHECKING:
@@ -38,6 +40,15 @@ if TYPE_CHECKING:
 dag_parsing_router = AirflowRouter(tags=["DAG Parsing"], prefix="/parseDagFile/{file_token}")
 
 
+def _decode_file_token(file_token: str, request: Request) -> tuple[str, str]:
+    auth_s = URLSafeSerializer(request.app.state.secret_key)
+    try:
+        payload = auth_s.loads(file_token)
+    except BadSignature:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "File not found")
+    return payload["bundle_name"], payload["relative_fileloc"]
+
+
 @dag_parsing_router.put(
     "",
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
@@ -50,15 +61,7 @@ def reparse_dag_file(
     request: Request,
 ) -> None:
     """Request re-parsing a DAG file."""
-    secret_key = request.app.state.secret_key
-    auth_s = URLSafeSerializer(secret_key)
-    try:
-        payload = auth_s.loads(file_token)
-    except BadSignature:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "File not found")
-
-    bundle_name = payload["bundle_name"]
-    relative_fileloc = payload["relative_fileloc"]
+    bundle_name, relative_fileloc = _decode_file_token(file_token, request)
 
     requests: Sequence[IsAuthorizedDagRequest] = [
         {"method": "PUT", "details": DagDetails(id=dag_id)}
@@ -73,3 +76,36 @@ def reparse_dag_file(
 
     parsing_request = DagPriorityParsingRequest(bundle_name=bundle_name, relative_fileloc=relative_fileloc)
     session.add(parsing_request)
+
+
+@dag_parsing_router.get(
+    "/profile",
+    responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
+    dependencies=[Depends(requires_access_dag(method="GET"))],
+)
+def get_dag_file_parse_profile(
+    file_token: str,
+    session: SessionDep,
+    request: Request,
+) -> DagFileParseProfileResponse:
+    """
+    Get the profile of the last parsing of a DAG file.
+
+    Profiles are only recorded when ``[dag_processor] parsing_profile`` is enabled.
+    """
+    bundle_name, relative_fileloc = _decode_file_token(file_token, request)
+    profile = session.scalar(
+        select(DagFileParseProfile).where(
+            DagFileParseProfile.bundle_name == bundle_name,
+            DagFileParseProfile.relative_fileloc == relative_fileloc,
+        )
+    )
+    if profile is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "No parsing profile found for this file")
+    return DagFileParseProfileResponse(
+        bundle_name=profile.bundle_name,
+        relative_fileloc=profile.relative_fileloc,
+        parsed_at=profile.parsed_at,
+        parse_duration=profile.parse_duration,
+        **profile.profile,
+    )
@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 import textwrap
-from typing import Annotated, Literal, cast
+from typing import Annotated, Literal
 
 import structlog
 from fastapi import Depends, HTTPException, Query, Request, status
@@ -35,16 +35,20 @@ from airflow.api.common.mark_tasks import (
 )
 from airflow.api_fastapi.app import get_auth_manager
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity, DagDetails
-from airflow.api_fastapi.common.cursors import (
-    apply_cursor_filter,
-    encode_cursor,
-    make_backward_cursor,
-    parse_cursor,
+from airflow.api_fastapi.common.cursors import QueryCursor, cursor_paginated_select_async
+from airflow.api_fastapi.common.dagbag import (
+    DagBagDep,
+    check_dag_exists_async,
+    get_dag_for_run,
+    get_latest_version_of_dag,
+)
+from airflow.api_fastapi.common.db.common import (
+    AsyncSessionDep,
+    SessionDep,
+    paginated_select_async,
 )
-from airflow.api_fastapi.common.dagbag import DagBagDep, get_dag_for_run, get_latest_version_of_dag
-from airflow.api_fastapi.common.db.common import SessionDep, apply_filters_to_select, paginated_select
 from airflow.api_fastapi.common.db.dag_runs import (
-    attach_dag_versions_to_runs,
+    attach_dag_versions_to_runs_async,
     eager_load_dag_run_for_list,
 )
 from airflow.api_fastapi.common.db.task_instances import eager_load_TI_and_TIH_for_validation
@@ -374,7 +378,7 @@ def clear_dag_run(
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
 )
-def get_dag_runs(
+async def get_dag_runs(
     dag_id: str,
     limit: QueryLimit,
     offset: QueryOffset,
@@ -417,8 +421,7 @@ def get_dag_runs(
         ),
     ],
     readable_dag_runs_filter: ReadableDagRunsFilterDep,
-    session: SessionDep,
-    dag_bag: DagBagDep,
+    session: AsyncSessionDep,
     run_id_pattern: Annotated[_SearchParam, Depends(search_param_factory(DagRun.run_id, "run_id_pattern"))],
     run_id_prefix_pattern: Annotated[
         _PrefixSearchParam,
@@ -442,12 +445,7 @@ def get_dag_runs(
     partition_key_pattern: QueryDagRunPartitionKeySearch,
     partition_key_prefix_pattern: QueryDagRunPartitionKeyPrefixSearch,
     consuming_asset_pattern: QueryConsumingAssetPatternSearch,
-    cursor: str | None = Query(
-        None,
-        description="Cursor for keyset-based pagination. "
-        "Pass an empty string for the first page, then use ``next_cursor`` from the response. "
-        "When ``cursor`` is provided, ``offset`` is ignored.",
-    ),
+    cursor: QueryCursor = None,
 ) -> DAGRunCollectionResponse:
     """
     Get all DAG Runs.
@@ -463,11 +461,10 @@ def get_dag_runs(
     ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
     on the first page.
     """
-    use_cursor = cursor is not None
     query = select(DagRun).options(*eager_load_dag_run_for_list())
 
     if dag_id != "~":
-        get_latest_version_of_dag(dag_bag, dag_id, session)  # Check if the DAG exists.
+        await check_dag_exists_async(dag_id, session)
         query = query.filter(DagRun.dag_id == dag_id).options()
 
     # Add join with DagVersion if dag_version filter is active
@@ -498,44 +495,23 @@ def get_dag_runs(
         consuming_asset_pattern,
     ]
 
-    if use_cursor:
-        # Fetch one extra row so we can detect whether a next page exists.
-        page_limit = cast(
-            "int", limit.value
-        )  # LimitFilter value is guaranteed to be set to the default value of QueryLimit
-        cursor_limit = LimitFilter().set_value(page_limit + 1)
-        dag_run_select = apply_filters_to_select(statement=query, filters=[*filters, order_by, cursor_limit])
-
-        is_backward = False
-        if cursor:
-            token, is_backward = parse_cursor(cursor)
-            if is_backward:
-                dag_run_select = order_by.to_orm(dag_run_select, reversed=True)
-            dag_run_select = apply_cursor_filter(dag_run_select, token, order_by, is_backward=is_backward)
-
-        fetched = list(session.scalars(dag_run_select).unique())
-        has_more = len(fetched) > page_limit
-        dag_runs = fetched[:page_limit]
-
-        if is_backward:
-            dag_runs.reverse()
-            has_prev = has_more
-            has_next = True
-        else:
-            has_prev = bool(cursor)
-            has_next = has_more
-
-        attach_dag_versions_to_runs(dag_runs, session=session)
-
+    if cursor is not None:
+        page = await cursor_paginated_select_async(
+            statement=query,
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            cursor=cursor,
+            session=session,
+        )
+        await attach_dag_versions_to_runs_async(page.rows, session=session)
         return DAGRunCollectionResponse(
-            dag_runs=dag_runs,
-            next_cursor=(encode_cursor(dag_runs[-1], order_by) if has_next and dag_runs else None),
-            previous_cursor=(
-                make_backward_cursor(encode_cursor(dag_runs[0], order_by)) if has_prev and dag_runs else None
-            ),
+            dag_runs=page.rows,
+            next_cursor=page.next_cursor,
+            previous_cursor=page.previous_cursor,
         )
 
-    dag_run_select, total_entries = paginated_select(
+    dag_run_select, total_entries = await paginated_select_async(
         statement=query,
         filters=filters,
         order_by=order_by,
@@ -543,8 +519,8 @@ def get_dag_runs(
         limit=limit,
         session=session,
     )
-    dag_runs = list(session.scalars(dag_run_select).unique())
-    attach_dag_versions_to_runs(dag_runs, session=session)
+    dag_runs = list((await session.scalars(dag_run_select)).unique())
+    await attach_dag_versions_to_runs_async(dag_runs, session=session)
 
     return DAGRunCollectionResponse(
         dag_runs=dag_runs,
@@ -692,11 +668,11 @@ def wait_dag_run_until_finished(
     responses=create_openapi_http_exception_doc([status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
 )
-def get_list_dag_runs_batch(
+async def get_list_dag_runs_batch(
     dag_id: Literal["~"],
     body: DAGRunsBatchBody,
     readable_dag_runs_filter: ReadableDagRunsFilterDep,
-    session: SessionDep,
+    session: AsyncSessionDep,
 ) -> DAGRunCollectionResponse:
     """Get a list of DAG Runs."""
     dag_ids = FilterParam(DagRun.dag_id, body.dag_ids, FilterOptionEnum.IN)  # type: ignore[arg-type]
@@ -770,7 +746,7 @@ def get_list_dag_runs_batch(
 
     base_query = select(DagRun).options(*eager_load_dag_run_for_list())
 
-    dag_runs_select, total_entries = paginated_select(
+    dag_runs_select, total_entries = await paginated_select_async(
         statement=base_query,
         filters=[
             dag_ids,
@@ -789,8 +765,8 @@ def get_list_dag_runs_batch(
         session=session,
     )
 
-    dag_runs = list(session.scalars(dag_runs_select).unique())
-    attach_dag_versions_to_runs(dag_runs, session=session)
+    dag_runs = list((await session.scalars(dag_runs_select)).unique())
+    await attach_dag_versions_to_runs_async(dag_runs, session=session)
 
     return DAGRunCollectionResponse(
         dag_runs=dag_runs,
@@ -39,8 +39,8 @@ from airflow.api_fastapi.core_api.datamodels.dag_stats import (
     DagStatsStateResponse,
 )
 from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_exception_doc
-from airflow.api_fastapi.core_api.security import ReadableDagRunsFilterDep, requires_access_dag
-from airflow.models.dagrun import DagRun
+from airflow.api_fastapi.core_api.security import ReadableDagsFilterDep, requires_access_dag
+from airflow.models.dagrun_state_count import DagRunStateCount
 from airflow.typing_compat import Unpack
 from airflow.utils.state import DagRunState
 
@@ -61,17 +61,17 @@ dag_stats_router = AirflowRouter(tags=["DagStats"], prefix="/dagStats")
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.RUN))],
 )
 def get_dag_stats(
-    readable_dag_runs_filter: ReadableDagRunsFilterDep,
+    readable_dags_filter: ReadableDagsFilterDep,
     session: SessionDep,
     dag_ids: Annotated[
         FilterParam[list[str]],
-        Depends(filter_param_factory(DagRun.dag_id, list[str], FilterOptionEnum.IN, "dag_ids")),
+        Depends(filter_param_factory(DagRunStateCount.dag_id, list[str], FilterOptionEnum.IN, "dag_ids")),
     ],
 ) -> DagStatsCollectionResponse:
     """Get Dag statistics."""
     dagruns_select, _ = paginated_select(
         statement=dagruns_select_with_state_count,
-        filters=[dag_ids, readable_dag_runs_filter],
+        filters=[dag_ids, readable_dags_filter],
         session=session,
         return_total_entries=False,
     )
@@ -23,9 +23,11 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 
+from airflow.api_fastapi.common.cursors import QueryCursor, cursor_paginated_select_async
 from airflow.api_fastapi.common.db.common import (
+    AsyncSessionDep,
     SessionDep,
-    paginated_select,
+    paginated_select_async,
 )
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
@@ -40,6 +42,7 @@ from airflow.api_fastapi.common.parameters import (
     search_param_factory,
 )
 from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.core_api.base import OrmClause
 from airflow.api_fastapi.core_api.datamodels.event_logs import (
     EventLogCollectionResponse,
     EventLogResponse,
@@ -76,10 +79,10 @@ def get_event_log(
     "",
     dependencies=[Depends(requires_access_dag("GET", DagAccessEntity.AUDIT_LOG))],
 )
-def get_event_logs(
+async def get_event_logs(
     limit: QueryLimit,
     offset: QueryOffset,
-    session: SessionDep,
+    session: AsyncSessionDep,
     order_by: Annotated[
         SortParam,
         Depends(
@@ -154,44 +157,73 @@ def get_event_logs(
         Depends(prefix_search_param_factory(Log.event, "event_prefix_pattern")),
     ],
     readable_event_logs_filter: ReadableEventLogsFilterDep,
+    cursor: QueryCursor = None,
 ) -> EventLogCollectionResponse:
-    """Get all Event Logs."""
+    """
+    Get all Event Logs.
+
+    Supports two pagination modes:
+
+    **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`.
+
+    **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
+    When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
+    ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
+    on the first page.
+    """
     query = select(Log).options(joinedload(Log.task_instance), joinedload(Log.dag_model))
-    event_logs_select, total_entries = paginated_select(
+    filters: list[OrmClause] = [
+        # Exact match filters
+        dag_id,
+        task_id,
+        run_id,
+        map_index,
+        try_number,
+        owner,
+        event,
+        excluded_events,
+        included_events,
+        before,
+        after,
+        # Pattern search filters
+        dag_id_pattern,
+        dag_id_prefix_pattern,
+        task_id_pattern,
+        task_id_prefix_pattern,
+        run_id_pattern,
+        run_id_prefix_pattern,
+        owner_pattern,
+        owner_prefix_pattern,
+        event_pattern,
+        event_prefix_pattern,
+        # Permission
+        readable_event_logs_filter,
+    ]
+
+    if cursor is not None:
+        page = await cursor_paginated_select_async(
+            statement=query,
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            cursor=cursor,
+            session=session,
+        )
+        return EventLogCollectionResponse(
+            event_logs=page.rows,
+            next_cursor=page.next_cursor,
+            previous_cursor=page.previous_cursor,
+        )
+
+    event_logs_select, total_entries = await paginated_select_async(
         statement=query,
         order_by=order_by,
-        filters=[
-            # Exact match filters
-            dag_id,
-            task_id,
-            run_id,
-            map_index,
-            try_number,
-            owner,
-            event,
-            excluded_events,
-            included_events,
-            before,
-            after,
-            # Pattern search filters
-            dag_id_pattern,
-            dag_id_prefix_pattern,
-            task_id_pattern,
-            task_id_prefix_pattern,
-            run_id_pattern,
-            run_id_prefix_pattern,
-            owner_pattern,
-            owner_prefix_pattern,
-            event_pattern,
-            event_prefix_pattern,
-            # Permission
-            readable_event_logs_filter,
-        ],
+        filters=filters,
         offset=offset,
         limit=limit,
         session=session,
     )
-    event_logs = session.scalars(event_logs_select)
+    event_logs = await session.scalars(event_logs_select)
 
     return EventLogCollectionResponse(
         event_logs=event_logs,
@@ -18,28 +18,30 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Annotated, Literal, cast
+from typing import TYPE_CHECKING, Annotated, Literal, cast
 
 import structlog
 from fastapi import Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import or_, select
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.selectable import Select
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
-from airflow.api_fastapi.common.cursors import (
-    apply_cursor_filter,
-    encode_cursor,
-    make_backward_cursor,
-    parse_cursor,
-)
+from airflow.api_fastapi.common.cursors import QueryCursor, cursor_paginated_select_async
 from airflow.api_fastapi.common.dagbag import (
     DagBagDep,
+    check_dag_exists_async,
     get_dag_for_run,
     get_dag_for_run_or_latest_version,
     get_latest_version_of_dag,
 )
-from airflow.api_fastapi.common.db.common import SessionDep, apply_filters_to_select, paginated_select
+from airflow.api_fastapi.common.db.common import (
+    AsyncSessionDep,
+    SessionDep,
+    paginated_select,
+    paginated_select_async,
+)
 from airflow.api_fastapi.common.db.task_instances import eager_load_TI_and_TIH_for_validation
 from airflow.api_fastapi.common.parameters import (
     FilterOptionEnum,
@@ -108,8 +110,13 @@ from airflow.models.taskinstancehistory import TaskInstanceHistory as TIH
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_deps import SCHEDULER_QUEUED_DEPS
 from airflow.utils.db import get_query_count
+from airflow.utils.session import create_session
 from airflow.utils.state import DagRunState, TaskInstanceState
 
+if TYPE_CHECKING:
+    from airflow.models.dagbag import DBDagBag
+    from airflow.serialization.definitions.dag import SerializedDAG
+
 log = structlog.get_logger(__name__)
 
 task_instances_router = AirflowRouter(tags=["Task Instance"], prefix="/dags/{dag_id}")
@@ -425,12 +432,19 @@ def get_mapped_task_instance(
     return task_instance
 
 
+def _get_dag_for_task_group_filter(dag_bag: DBDagBag, dag_run_id: int | None, dag_id: str) -> SerializedDAG:
+    """Get the Dag to resolve task groups with, using a sync session as required by the Dag bag."""
+    with create_session(scoped=False) as session:
+        dag_run = session.get(DagRun, dag_run_id) if dag_run_id is not None else None
+        return get_dag_for_run_or_latest_version(dag_bag, dag_run, dag_id, session)
+
+
 @task_instances_router.get(
     task_instances_prefix,
     responses=create_openapi_http_exception_doc([status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND]),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.TASK_INSTANCE))],
 )
-def get_task_instances(
+async def get_task_instances(
     dag_id: str,
     dag_run_id: str,
     dag_bag: DagBagDep,
@@ -500,13 +514,8 @@ def get_task_instances(
         ),
     ],
     readable_ti_filter: ReadableTIFilterDep,
-    session: SessionDep,
-    cursor: str | None = Query(
-        None,
-        description="Cursor for keyset-based pagination. "
-        "Pass an empty string for the first page, then use ``next_cursor`` from the response. "
-        "When ``cursor`` is provided, ``offset`` is ignored.",
-    ),
+    session: AsyncSessionDep,
+    cursor: QueryCursor = None,
 ) -> TaskInstanceCollectionResponse:
     """
     Get list of task instances.
@@ -523,7 +532,6 @@ def get_task_instances(
     ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
     on the first page.
     """
-    use_cursor = cursor is not None
     dag_run = None
     query = eager_load_TI_and_TIH_for_validation(select(TI))
     if dag_run_id != "~":
@@ -532,7 +540,9 @@ def get_task_instances(
                 status.HTTP_400_BAD_REQUEST,
                 "dag_id is required when dag_run_id is specified",
             )
-        dag_run = session.scalar(select(DagRun).where(DagRun.dag_id == dag_id, DagRun.run_id == dag_run_id))
+        dag_run = await session.scalar(
+            select(DagRun).where(DagRun.dag_id == dag_id, DagRun.run_id == dag_run_id)
+        )
         if not dag_run:
             raise HTTPException(
                 status.HTTP_404_NOT_FOUND,
@@ -540,10 +550,13 @@ def get_task_instances(
             )
         query = query.where(TI.run_id == dag_run_id)
     if dag_id != "~":
-        dag = get_dag_for_run_or_latest_version(dag_bag, dag_run, dag_id, session)
         query = query.where(TI.dag_id == dag_id)
-        if dag:
-            task_group_id.dag = dag
+        if task_group_id.value is not None:
+            task_group_id.dag = await run_in_threadpool(
+                _get_dag_for_task_group_filter, dag_bag, dag_run.id if dag_run else None, dag_id
+            )
+        elif dag_run is None:
+            await check_dag_exists_async(dag_id, session)
 
     filters: list[OrmClause] = [
         run_after_range,
@@ -577,50 +590,22 @@ def get_task_instances(
         map_index,
     ]
 
-    if use_cursor:
-        # Fetch one extra row so we can detect whether a next page exists.
-        page_limit = cast(
-            "int", limit.value
-        )  # LimitFilter value is guaranteed to be set to the default value of QueryLimit
-        cursor_limit = LimitFilter().set_value(page_limit + 1)
-        task_instance_select = apply_filters_to_select(
-            statement=query, filters=[*filters, order_by, cursor_limit]
+    if cursor is not None:
+        page = await cursor_paginated_select_async(
+            statement=query,
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            cursor=cursor,
+            session=session,
         )
-
-        is_backward = False
-        if cursor:
-            token, is_backward = parse_cursor(cursor)
-            if is_backward:
-                task_instance_select = order_by.to_orm(task_instance_select, reversed=True)
-            task_instance_select = apply_cursor_filter(
-                task_instance_select, token, order_by, is_backward=is_backward
-            )
-
-        fetched = list(session.scalars(task_instance_select))
-        has_more = len(fetched) > page_limit
-        task_instances = fetched[:page_limit]
-
-        if is_backward:
-            task_instances.reverse()
-            has_prev = has_more
-            has_next = True
-        else:
-            has_prev = bool(cursor)
-            has_next = has_more
-
         return TaskInstanceCollectionResponse(
-            task_instances=task_instances,
-            next_cursor=(
-                encode_cursor(task_instances[-1], order_by) if has_next and task_instances else None
-            ),
-            previous_cursor=(
-                make_backward_cursor(encode_cursor(task_instances[0], order_by))
-                if has_prev and task_instances
-                else None
-            ),
+            task_instances=page.rows,
+            next_cursor=page.next_cursor,
+            previous_cursor=page.previous_cursor,
         )
 
-    task_instance_select, total_entries = paginated_select(
+    task_instance_select, total_entries = await paginated_select_async(
         statement=query,
         filters=filters,
         order_by=order_by,
@@ -628,7 +613,7 @@ def get_task_instances(
         limit=limit,
         session=session,
     )
-    task_instances = list(session.scalars(task_instance_select))
+    task_instances = list(await session.scalars(task_instance_select))
     return TaskInstanceCollectionResponse(
         task_instances=task_instances,
         total_entries=total_entries,
@@ -24,8 +24,9 @@ from sqlalchemy import and_, delete, select
 from sqlalchemy.orm import joinedload
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
+from airflow.api_fastapi.common.cursors import QueryCursor, cursor_paginated_select_async
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_dag_for_run_or_latest_version
-from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
+from airflow.api_fastapi.common.db.common import AsyncSessionDep, SessionDep, paginated_select_async
 from airflow.api_fastapi.common.parameters import (
     FilterParam,
     QueryLimit,
@@ -44,6 +45,7 @@ from airflow.api_fastapi.common.parameters import (
     filter_param_factory,
 )
 from airflow.api_fastapi.common.router import AirflowRouter
+from airflow.api_fastapi.core_api.base import OrmClause
 from airflow.api_fastapi.core_api.datamodels.xcom import (
     XComCollectionResponse,
     XComCreateBody,
@@ -148,14 +150,14 @@ def get_xcom_entry(
     ),
     dependencies=[Depends(requires_access_dag(method="GET", access_entity=DagAccessEntity.XCOM))],
 )
-def get_xcom_entries(
+async def get_xcom_entries(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
     limit: QueryLimit,
     offset: QueryOffset,
     readable_xcom_filter: ReadableXComFilterDep,
-    session: SessionDep,
+    session: AsyncSessionDep,
     xcom_key_pattern: QueryXComKeyPatternSearch,
     xcom_key_prefix_pattern: QueryXComKeyPrefixPatternSearch,
     dag_display_name_pattern: QueryXComDagDisplayNamePatternSearch,
@@ -182,11 +184,21 @@ def get_xcom_entries(
     ],
     xcom_key: Annotated[str | None, Query()] = None,
     map_index: Annotated[int | None, Query(ge=-1)] = None,
+    cursor: QueryCursor = None,
 ) -> XComCollectionResponse:
     """
     Get all XCom entries.
 
     This endpoint allows specifying `~` as the dag_id, dag_run_id, task_id to retrieve XCom entries for all DAGs.
+
+    Supports two pagination modes:
+
+    **Offset (default):** use `limit` and `offset` query parameters. Returns `total_entries`.
+
+    **Cursor:** pass `cursor` (empty string for the first page, then `next_cursor` from the response).
+    When `cursor` is provided, `offset` is ignored and `total_entries` is not returned.
+    ``next_cursor`` is ``null`` when there are no more pages; ``previous_cursor`` is ``null``
+    on the first page.
     """
     query = select(XComModel)
     if dag_id != "~":
@@ -206,28 +218,45 @@ def get_xcom_entries(
     if xcom_key is not None:
         query = query.where(XComModel.key == xcom_key)
 
-    query, total_entries = paginated_select(
+    filters: list[OrmClause] = [
+        readable_xcom_filter,
+        xcom_key_pattern,
+        xcom_key_prefix_pattern,
+        dag_display_name_pattern,
+        dag_display_name_prefix_pattern,
+        run_id_pattern,
+        run_id_prefix_pattern,
+        task_id_pattern,
+        task_id_prefix_pattern,
+        map_index_filter,
+        logical_date_range,
+        run_after_range,
+    ]
+
+    if cursor is not None:
+        page = await cursor_paginated_select_async(
+            statement=query,
+            filters=filters,
+            order_by=order_by,
+            limit=limit,
+            cursor=cursor,
+            session=session,
+        )
+        return XComCollectionResponse(
+            xcom_entries=page.rows,
+            next_cursor=page.next_cursor,
+            previous_cursor=page.previous_cursor,
+        )
+
+    query, total_entries = await paginated_select_async(
         statement=query,
-        filters=[
-            readable_xcom_filter,
-            xcom_key_pattern,
-            xcom_key_prefix_pattern,
-            dag_display_name_pattern,
-            dag_display_name_prefix_pattern,
-            run_id_pattern,
-            run_id_prefix_pattern,
-            task_id_pattern,
-            task_id_prefix_pattern,
-            map_index_filter,
-            logical_date_range,
-            run_after_range,
-        ],
+        filters=filters,
         order_by=order_by,
         offset=offset,
         limit=limit,
         session=session,
     )
-    return XComCollectionResponse(xcom_entries=session.scalars(query), total_entries=total_entries)
+    return XComCollectionResponse(xcom_entries=await session.scalars(query), total_entries=total_entries)
 
 
 @xcom_router.post(
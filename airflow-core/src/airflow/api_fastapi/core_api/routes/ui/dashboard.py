@@ -20,7 +20,7 @@ from typing import cast
 
 from fastapi import Depends, status
 from sqlalchemy import func, literal, select, union_all
-from sqlalchemy.sql.expression import case, false
+from sqlalchemy.sql.expression import case, false, true
 
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
@@ -35,6 +35,7 @@ from airflow.api_fastapi.core_api.openapi.exceptions import create_openapi_http_
 from airflow.api_fastapi.core_api.security import ReadableDagsFilterDep, requires_access_dag
 from airflow.models.dag import DagModel
 from airflow.models.dagrun import DagRun
+from airflow.models.dagrun_state_count import DagRunStateCount
 from airflow.models.taskinstance import TaskInstance
 from airflow.utils.state import DagRunState, TaskInstanceState
 
@@ -63,6 +64,25 @@ def historical_metrics(
     current_time = timezone.utcnow()
     permitted_dag_ids = cast("set[str]", readable_dags_filter.value)
 
+    # Dag runs are counted from the hourly rollup maintained by the scheduler, in the hours the runs
+    # started in. Unfinished runs have no end date yet and are only counted up to the current time.
+    unfinished_states = [DagRunState.QUEUED, DagRunState.RUNNING]
+    dag_run_state_counts = session.execute(
+        select(DagRunStateCount.state, func.sum(DagRunStateCount.run_count).label("cnt"))
+        .where(
+            DagRunStateCount.bucket >= start_date.replace(minute=0, second=0, microsecond=0),
+            DagRunStateCount.bucket <= (end_date or current_time),
+            DagRunStateCount.dag_id.in_(permitted_dag_ids),
+        )
+        .where(
+            DagRunStateCount.state.not_in(unfinished_states)
+            if end_date is not None and end_date < current_time
+            else true()
+        )
+        .group_by(DagRunStateCount.state)
+    ).all()
+
+    # Task instances are not part of the rollup; their counts are capped instead.
     dag_run_filters = [
         func.coalesce(DagRun.start_date, current_time) >= start_date,
         func.coalesce(DagRun.end_date, current_time) <= func.coalesce(end_date, current_time),
@@ -93,7 +113,6 @@ def historical_metrics(
             select(capped.c.state, func.count().label("cnt")).group_by(capped.c.state)
         ).all()
 
-    dag_run_state_counts = _capped_state_counts(DagRun, list(DagRunState), lambda s: s.value)
     ti_state_counts = _capped_state_counts(
         TaskInstance,
         [None, *TaskInstanceState],
@@ -126,6 +145,8 @@ def dag_stats(
     readable_dags_filter: ReadableDagsFilterDep,
 ) -> DashboardDagStatsResponse:
     """Return basic DAG stats with counts of DAGs in various states."""
+    # Not served from DagRunStateCount: the stats are based on the state of the latest run of each Dag,
+    # rather than on the number of runs in each state.
     permitted_dag_ids = cast("set[str]", readable_dags_filter.value)
     latest_dates_subq = (
         select(DagRun.dag_id, func.max(DagRun.logical_date).label("max_logical_date"))
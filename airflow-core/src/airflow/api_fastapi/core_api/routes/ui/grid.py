@@ -24,13 +24,14 @@ from uuid import UUID
 import structlog
 from fastapi import Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import exists, select
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session, joinedload, load_only
 
 from airflow.api_fastapi.auth.managers.models.resource_details import DagAccessEntity
 from airflow.api_fastapi.common.dagbag import DagBagDep
 from airflow.api_fastapi.common.db.common import SessionDep, paginated_select
 from airflow.api_fastapi.common.db.dag_runs import attach_dag_versions_to_runs
+from airflow.api_fastapi.common.http_cache import ConditionalRequestDep
 from airflow.api_fastapi.common.parameters import (
     QueryDagRunRunTypesFilter,
     QueryDagRunStateFilter,
@@ -121,6 +122,48 @@ def _get_serdag(
     return serdag
 
 
+def _dag_runs_version(
+    dag_id: str, session: Session, *, include_deadlines: bool = False, include_durations: bool = False
+) -> tuple | None:
+    """
+    Return a cheap version token of the latest serialized version and of the runs of a Dag.
+
+    Changes to the runs of the Dag are detected from ``dag_run.updated_at``, which is bumped on every
+    state change, and from the number of runs, which changes when runs are deleted.
+
+    The duration of runs which are not finished yet is computed from the current time, so responses
+    including durations cannot be versioned while the Dag has such runs, and None is returned.
+    """
+    columns = [
+        select(SerializedDagModel.id)
+        .where(SerializedDagModel.dag_id == dag_id)
+        .order_by(SerializedDagModel.id.desc())
+        .limit(1)
+        .scalar_subquery(),
+        select(func.count(DagRun.id)).where(DagRun.dag_id == dag_id).scalar_subquery(),
+        select(func.max(DagRun.updated_at)).where(DagRun.dag_id == dag_id).scalar_subquery(),
+    ]
+    if include_deadlines:
+        columns.append(
+            select(func.count(Deadline.id))
+            .join(DagRun, Deadline.dagrun_id == DagRun.id)
+            .where(DagRun.dag_id == dag_id, Deadline.missed.is_(True))
+            .scalar_subquery()
+        )
+    if include_durations:
+        columns.append(
+            exists()
+            .where(DagRun.dag_id == dag_id, DagRun.start_date.is_not(None), DagRun.end_date.is_(None))
+            .label("has_unfinished_runs")
+        )
+    version = tuple(session.execute(select(*columns)).one())
+    if include_durations:
+        has_unfinished_runs, version = version[-1], version[:-1]
+        if has_unfinished_runs:
+            return None
+    return version
+
+
 @grid_router.get(
     "/structure/{dag_id}",
     responses=create_openapi_http_exception_doc([status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND]),
@@ -133,6 +176,7 @@ def _get_serdag(
 def get_dag_structure(
     dag_id: str,
     session: SessionDep,
+    conditional_request: ConditionalRequestDep,
     offset: QueryOffset,
     limit: QueryLimit,
     order_by: Annotated[
@@ -150,6 +194,9 @@ def get_dag_structure(
     root: str | None = None,
 ) -> list[GridNodeResponse]:
     """Return dag structure for grid view."""
+    if (cached := conditional_request.evaluate(_dag_runs_version(dag_id, session))) is not None:
+        return cached
+
     latest_serdag = _get_latest_serdag(dag_id, session)
     latest_dag = latest_serdag.dag
     latest_serdag_id = latest_serdag.id
@@ -185,7 +232,7 @@ def get_dag_structure(
     task_group_sort = get_task_group_children_getter()
     if not run_ids:
         nodes = [task_group_to_dict_grid(x) for x in task_group_sort(latest_dag.task_group)]
-        return [GridNodeResponse(**n) for n in nodes]
+        return conditional_request.cache([GridNodeResponse(**n) for n in nodes])
 
     # Process and merge the latest serdag first
     merged_nodes: list[dict[str, Any]] = []
@@ -231,7 +278,7 @@ def get_dag_structure(
 
         session.expunge(serdag)  # to allow garbage collection
 
-    return [GridNodeResponse(**n) for n in merged_nodes]
+    return conditional_request.cache([GridNodeResponse(**n) for n in merged_nodes])
 
 
 @grid_router.get(
@@ -261,6 +308,7 @@ def get_dag_structure(
 def get_grid_runs(
     dag_id: str,
     session: SessionDep,
+    conditional_request: ConditionalRequestDep,
     offset: QueryOffset,
     limit: QueryLimit,
     order_by: Annotated[
@@ -284,6 +332,10 @@ def get_grid_runs(
     triggering_user_prefix: QueryDagRunTriggeringUserPrefixSearch,
 ) -> list[GridRunsResponse]:
     """Get info about a run for the grid."""
+    version = _dag_runs_version(dag_id, session, include_deadlines=True, include_durations=True)
+    if (cached := conditional_request.evaluate(version)) is not None:
+        return cached
+
     # Retrieve, sort the previous DAG Runs
     has_missed_deadline = (
         exists()
@@ -349,7 +401,7 @@ def get_grid_runs(
                 }
             )
         )
-    return grid_runs
+    return conditional_request.cache(grid_runs)
 
 
 def _build_ti_summaries(
@@ -447,6 +499,8 @@ def _build_ti_summaries(
 def get_grid_ti_summaries_stream(
     dag_id: str,
     dag_bag: DagBagDep,
+    session: SessionDep,
+    conditional_request: ConditionalRequestDep,
     run_ids: Annotated[list[str] | None, Query()] = None,
 ) -> StreamingResponse:
     """
@@ -459,7 +513,18 @@ def get_grid_ti_summaries_stream(
     The serialized Dag structure is served from the app-wide ``DBDagBag`` cache
     (keyed by ``dag_version_id``), which avoids repeated deserialization across
     runs of the same version *and* across requests.
+
+    Requests for unchanged task instances are answered with ``304 Not Modified``.
     """
+    conditional_request.evaluate(
+        tuple(
+            session.execute(
+                select(func.count(TaskInstance.id), func.max(TaskInstance.updated_at)).where(
+                    TaskInstance.dag_id == dag_id, TaskInstance.run_id.in_(run_ids or [])
+                )
+            ).one()
+        )
+    )
 
     def _generate() -> Generator[str, None, None]:
         # Each iteration opens and closes its own DB session so the connection is
@@ -495,4 +560,6 @@ def get_grid_ti_summaries_stream(
                 continue
             yield GridTISummaries.model_validate(summary).model_dump_json() + "\n"
 
-    return StreamingResponse(content=_generate(), media_type="application/x-ndjson")
+    return StreamingResponse(
+        content=_generate(), media_type="application/x-ndjson", headers=conditional_request.headers
+    )
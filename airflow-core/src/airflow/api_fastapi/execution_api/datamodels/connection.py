@@ -33,3 +33,15 @@ class ConnectionResponse(BaseModel):
     password: str | None
     port: int | None
     extra: str | None
+
+
+class ConnectionsBatchBody(BaseModel):
+    """Request body schema for getting several connections at once."""
+
+    conn_ids: list[str] = Field(min_length=1)
+
+
+class ConnectionsBatchResponse(BaseModel):
+    """Connections found among the requested ones; the connections which are not found are omitted."""
+
+    connections: list[ConnectionResponse]
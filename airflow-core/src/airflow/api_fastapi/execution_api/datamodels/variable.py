@@ -34,3 +34,15 @@ class VariablePostBody(StrictBaseModel):
 
     value: str | None = Field(alias="val")
     description: str | None = Field(default=None)
+
+
+class VariablesBatchBody(StrictBaseModel):
+    """Request body schema for getting several variables at once."""
+
+    keys: list[str] = Field(min_length=1)
+
+
+class VariablesBatchResponse(StrictBaseModel):
+    """Variables found among the requested ones; the variables which are not found are omitted."""
+
+    variables: list[VariableResponse]
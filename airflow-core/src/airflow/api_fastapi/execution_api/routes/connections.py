@@ -22,7 +22,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Path, status
 
-from airflow.api_fastapi.execution_api.datamodels.connection import ConnectionResponse
+from airflow.api_fastapi.execution_api.datamodels.connection import (
+    ConnectionResponse,
+    ConnectionsBatchBody,
+    ConnectionsBatchResponse,
+)
 from airflow.api_fastapi.execution_api.security import CurrentTIToken, get_team_name_dep
 from airflow.exceptions import AirflowNotFoundException
 from airflow.models.connection import Connection
@@ -48,11 +52,26 @@ async def has_connection_access(
     return True
 
 
+async def has_connections_access(body: ConnectionsBatchBody, token=CurrentTIToken) -> bool:
+    """Check if the task has access to all the requested connections."""
+    log.debug(
+        "Checking access for task instance with key '%s' to connections %s",
+        token.id,
+        body.conn_ids,
+    )
+
+    # See has_connection_access: there is no per-connection access control yet.
+    return True
+
+
 router = APIRouter(
     responses={status.HTTP_404_NOT_FOUND: {"description": "Connection not found"}},
     dependencies=[Depends(has_connection_access)],
 )
 
+# Endpoints working on several connections, which are not identified by a path parameter.
+batch_router = APIRouter(dependencies=[Depends(has_connections_access)])
+
 log = logging.getLogger(__name__)
 
 
@@ -79,3 +98,21 @@ def get_connection(
             },
         )
     return ConnectionResponse.model_validate(connection)
+
+
+@batch_router.post(
+    "/batch",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Task does not have access to the connections"},
+    },
+)
+def get_connections(
+    body: ConnectionsBatchBody,
+    team_name: Annotated[str | None, Depends(get_team_name_dep)],
+) -> ConnectionsBatchResponse:
+    """Get several Airflow connections at once; the connections which are not found are omitted."""
+    connections = Connection.get_connections_from_secrets(body.conn_ids, team_name=team_name)
+    return ConnectionsBatchResponse(
+        connections=[ConnectionResponse.model_validate(connection) for connection in connections.values()]
+    )
@@ -25,6 +25,8 @@ from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
 from airflow.api_fastapi.execution_api.datamodels.variable import (
     VariablePostBody,
     VariableResponse,
+    VariablesBatchBody,
+    VariablesBatchResponse,
 )
 from airflow.api_fastapi.execution_api.security import CurrentTIToken, get_team_name_dep
 from airflow.models.variable import Variable
@@ -54,14 +56,47 @@ async def has_variable_access(
     return True
 
 
+async def has_variables_access(body: VariablesBatchBody, token=CurrentTIToken) -> bool:
+    """Check if the task has read access to all the requested variables."""
+    log.debug(
+        "Checking read access for task instance with key '%s' to variables %s",
+        token.id,
+        body.keys,
+    )
+
+    # See has_variable_access: there is no per-variable access control yet.
+    return True
+
+
 router = APIRouter(
     responses={status.HTTP_404_NOT_FOUND: {"description": "Variable not found"}},
     dependencies=[Depends(has_variable_access)],
 )
 
+# Endpoints working on several variables, which are not identified by a path parameter.
+batch_router = APIRouter(dependencies=[Depends(has_variables_access)])
+
 log = logging.getLogger(__name__)
 
 
+@batch_router.post(
+    "/batch",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Task does not have access to the variables"},
+    },
+)
+def get_variables(
+    body: VariablesBatchBody,
+    team_name: Annotated[str | None, Depends(get_team_name_dep)],
+) -> VariablesBatchResponse:
+    """Get several Airflow Variables at once; the variables which are not found are omitted."""
+    values = Variable.get_variables_from_secrets(body.keys, team_name=team_name)
+    return VariablesBatchResponse(
+        variables=[VariableResponse(key=key, value=value) for key, value in values.items()]
+    )
+
+
 @router.get(
     "/{variable_key:path}",
     responses={
@@ -40,9 +40,11 @@ from airflow.api_fastapi.execution_api.versions.v2026_04_06 import (
     RemoveUpstreamMapIndexesField,
 )
 from airflow.api_fastapi.execution_api.versions.v2026_04_17 import AddTeamNameField
+from airflow.api_fastapi.execution_api.versions.v2026_10_19 import AddConnectionsAndVariablesBatchEndpoints
 
 bundle = VersionBundle(
     HeadVersion(),
+    Version("2026-10-19", AddConnectionsAndVariablesBatchEndpoints),
     Version(
         "2026-04-17",
         AddTeamNameField,
@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 import functools
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import attrs
 
@@ -33,6 +33,8 @@ from airflow.serialization.definitions.assets import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from sqlalchemy.orm import Session
 
 
@@ -71,3 +73,62 @@ class AssetEvaluator:
     @run.register
     def _(self, o: SerializedAssetBooleanCondition, statuses: dict[SerializedAssetUniqueKey, bool]) -> bool:
         return type(o).agg_func(self.run(x, statuses) for x in o.objects)
+
+
+def _is_static_condition(o: SerializedAssetBase) -> bool:
+    """Whether the condition can be evaluated from queued asset statuses alone, without hitting the db."""
+    return next(o.iter_asset_aliases(), None) is None and next(o.iter_asset_refs(), None) is None
+
+
+@attrs.define
+class AssetConditionIndex:
+    """
+    Remember asset condition evaluation results across scheduler loops.
+
+    The scheduler keeps one index for its lifetime. For each asset-scheduled Dag it records which asset
+    keys were queued when the condition was last found to be *not* satisfied. As long as no new asset event
+    changes that set and the Dag's asset expression stays the same, the result cannot change, so the Dag
+    does not need to be deserialized or evaluated again.
+
+    Conditions containing asset aliases or refs are resolved against the database and are never recorded.
+    """
+
+    _unsatisfied: dict[str, tuple[Any, frozenset[SerializedAssetUniqueKey]]] = attrs.field(factory=dict)
+
+    def __len__(self) -> int:
+        return len(self._unsatisfied)
+
+    def is_known_unsatisfied(
+        self,
+        dag_id: str,
+        *,
+        expression: Any,
+        queued: Collection[SerializedAssetUniqueKey],
+    ) -> bool:
+        """Check whether the Dag was already evaluated as not ready for exactly these queued assets."""
+        if (entry := self._unsatisfied.get(dag_id)) is None:
+            return False
+        return entry == (expression, frozenset(queued))
+
+    def record_unsatisfied(
+        self,
+        dag_id: str,
+        *,
+        condition: SerializedAssetBase,
+        expression: Any,
+        queued: Collection[SerializedAssetUniqueKey],
+    ) -> None:
+        """Record that the Dag's condition is not satisfied by the queued assets."""
+        if _is_static_condition(condition):
+            self._unsatisfied[dag_id] = (expression, frozenset(queued))
+        else:
+            self._unsatisfied.pop(dag_id, None)
+
+    def discard(self, dag_id: str) -> None:
+        """Forget the recorded result for the Dag."""
+        self._unsatisfied.pop(dag_id, None)
+
+    def retain(self, dag_ids: Collection[str]) -> None:
+        """Drop Dags that no longer have any queued asset events."""
+        for dag_id in [d for d in self._unsatisfied if d not in dag_ids]:
+            del self._unsatisfied[dag_id]
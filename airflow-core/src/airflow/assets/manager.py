@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Collection, Iterable
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
@@ -299,6 +300,139 @@ class AssetManager(LoggingMixin):
         )
         return asset_event
 
+    @classmethod
+    def register_asset_changes(
+        cls,
+        *,
+        task_instance: TaskInstance | None = None,
+        asset_changes: Collection[tuple[AssetModel, dict | None]],
+        session: Session,
+        partition_key: str | None = None,
+    ) -> list[AssetEvent]:
+        """
+        Register changes of many existing assets at once.
+
+        This is the batch counterpart of :meth:`register_asset_change` for assets that already exist
+        and are not emitted through an asset alias. Asset events and non-partitioned run queue records
+        are written with one statement each, and the Dags to queue are looked up once for all assets,
+        instead of doing all of it once per asset.
+
+        :param task_instance: The task instance emitting the events, if any.
+        :param asset_changes: Pairs of asset model and the extra of the event to record for it.
+        :param session: ORM Session
+        :param partition_key: Partition key of the emitting run, if any.
+        :return: The created asset events, in the order of *asset_changes*.
+        """
+        if getattr(cls.register_asset_change, "__func__", None) is not _REGISTER_ASSET_CHANGE:
+            # Keep custom per-asset behavior of asset managers overriding the single-asset method.
+            return [
+                event
+                for asset_model, extra in asset_changes
+                if (
+                    event := cls.register_asset_change(
+                        task_instance=task_instance,
+                        asset=asset_model,
+                        extra=extra,
+                        partition_key=partition_key,
+                        session=session,
+                    )
+                )
+                is not None
+            ]
+        if not asset_changes:
+            return []
+
+        from airflow.models.dag import DagModel
+
+        source_kwargs = {}
+        if task_instance:
+            source_kwargs.update(
+                source_task_id=task_instance.task_id,
+                source_dag_id=task_instance.dag_id,
+                source_run_id=task_instance.run_id,
+                source_map_index=task_instance.map_index,
+            )
+        asset_events = [
+            AssetEvent(
+                asset_id=asset_model.id, extra=extra or {}, partition_key=partition_key, **source_kwargs
+            )
+            for asset_model, extra in asset_changes
+        ]
+        session.add_all(asset_events)
+        session.flush()  # Ensure the events are written earlier than ADRQ entries below.
+
+        asset_models = {asset_model.id: asset_model for asset_model, _ in asset_changes}
+        dags_by_asset_id: dict[int, set[DagModel]] = defaultdict(set)
+        for asset_id, dag in session.execute(
+            select(DagScheduleAssetReference.asset_id, DagModel)
+            .join(DagModel, DagModel.dag_id == DagScheduleAssetReference.dag_id)
+            .where(DagScheduleAssetReference.asset_id.in_(asset_models), DagModel.is_paused.is_(False))
+        ):
+            dags_by_asset_id[asset_id].add(dag)
+        asset_ids_by_name: dict[str, set[int]] = defaultdict(set)
+        asset_ids_by_uri: dict[str, set[int]] = defaultdict(set)
+        for asset_model in asset_models.values():
+            asset_ids_by_name[asset_model.name].add(asset_model.id)
+            asset_ids_by_uri[asset_model.uri].add(asset_model.id)
+        for name, dag in session.execute(
+            select(DagScheduleAssetNameReference.name, DagModel)
+            .join(DagModel, DagModel.dag_id == DagScheduleAssetNameReference.dag_id)
+            .where(DagScheduleAssetNameReference.name.in_(asset_ids_by_name), DagModel.is_paused.is_(False))
+        ):
+            for asset_id in asset_ids_by_name[name]:
+                dags_by_asset_id[asset_id].add(dag)
+        for uri, dag in session.execute(
+            select(DagScheduleAssetUriReference.uri, DagModel)
+            .join(DagModel, DagModel.dag_id == DagScheduleAssetUriReference.dag_id)
+            .where(DagScheduleAssetUriReference.uri.in_(asset_ids_by_uri), DagModel.is_paused.is_(False))
+        ):
+            for asset_id in asset_ids_by_uri[uri]:
+                dags_by_asset_id[asset_id].add(dag)
+
+        nonpartitioned_dags_by_asset_id: dict[int, set[DagModel]] = defaultdict(set)
+        for asset_event in asset_events:
+            asset = asset_models[asset_event.asset_id].to_serialized()
+            cls.notify_asset_changed(asset=asset)
+            cls.nofity_asset_event_emitted(
+                asset_event=ListenerAssetEvent(
+                    asset=asset,
+                    extra=asset_event.extra,
+                    source_dag_id=asset_event.source_dag_id,
+                    source_task_id=asset_event.source_task_id,
+                    source_run_id=asset_event.source_run_id,
+                    source_map_index=asset_event.source_map_index,
+                    source_aliases=[],
+                    partition_key=partition_key,
+                )
+            )
+
+            dags_to_queue = dags_by_asset_id.get(asset_event.asset_id, set())
+            log.debug("asset event added", asset_event=asset_event, dags_to_queue=dags_to_queue)
+            partition_dags = [x for x in dags_to_queue if x.timetable_partitioned is True]
+            if partition_dags:
+                cls._queue_partitioned_dags(
+                    asset_id=asset_event.asset_id,
+                    partition_dags=partition_dags,
+                    event=asset_event,
+                    partition_key=partition_key,
+                    task_instance=task_instance,
+                    session=session,
+                )
+            if partition_key is None:
+                nonpartitioned_dags_by_asset_id[asset_event.asset_id].update(
+                    dags_to_queue.difference(partition_dags)
+                )
+
+        Stats.incr("asset.updates", len(asset_events))
+
+        if get_dialect_name(session) == "postgresql":
+            cls._queue_dagruns_nonpartitioned_postgres_bulk(nonpartitioned_dags_by_asset_id, session)
+        else:
+            for asset_id, dags in nonpartitioned_dags_by_asset_id.items():
+                if dags:
+                    cls._queue_dagruns_nonpartitioned_slow_path(asset_id, dags, session)
+        return asset_events
+
     @staticmethod
     def notify_asset_created(asset: SerializedAsset):
         """Run applicable notification actions when an asset is created."""
@@ -562,6 +696,23 @@ class AssetManager(LoggingMixin):
         stmt = insert(AssetDagRunQueue).values(asset_id=asset_id).on_conflict_do_nothing()
         session.execute(stmt, values)
 
+    @classmethod
+    def _queue_dagruns_nonpartitioned_postgres_bulk(
+        cls, dags_by_asset_id: dict[int, set[DagModel]], session: Session
+    ) -> None:
+        from sqlalchemy.dialects.postgresql import insert
+
+        values = [
+            {"asset_id": asset_id, "target_dag_id": dag.dag_id}
+            for asset_id, dags in dags_by_asset_id.items()
+            for dag in dags
+        ]
+        if values:
+            session.execute(insert(AssetDagRunQueue).on_conflict_do_nothing(), values)
+
+
+_REGISTER_ASSET_CHANGE = AssetManager.register_asset_change.__func__  # type: ignore[attr-defined]
+
 
 def resolve_asset_manager() -> AssetManager:
     """Retrieve the asset manager."""
@@ -541,6 +541,45 @@ ARG_DB_BATCH_SIZE = Arg(
         "Lower values reduce long-running locks but increase the number of batches."
     ),
 )
+ARG_DB_PARTITION_TABLES = Arg(
+    ("-t", "--tables"),
+    help=lazy_object_proxy.Proxy(
+        lambda: (
+            f"Table names to convert to time-partitioned storage (use comma-separated list).\n"
+            f"Options: {import_string('airflow.cli.commands.db_command.partitionable_tables')}"
+        )
+    ),
+    type=string_list_type,
+    required=True,
+)
+ARG_DB_PARTITION_INTERVAL = Arg(
+    ("--interval",),
+    help="Range of time covered by each partition. Defaults to [database] partition_interval.",
+    choices=("day", "week"),
+)
+ARG_DB_MAX_ROWS_PER_SECOND = Arg(
+    ("--max-rows-per-second",),
+    default=None,
+    type=float,
+    help=(
+        "Throttle batched cleanups to delete at most this many rows per second.\n"
+        "Only used together with --batch-size."
+    ),
+)
+ARG_DB_SLEEP_BETWEEN_BATCHES = Arg(
+    ("--sleep-between-batches",),
+    default=0,
+    type=float,
+    help="Number of seconds to pause between batches. Only used together with --batch-size.",
+)
+ARG_DB_RESUME = Arg(
+    ("--resume",),
+    help=(
+        "Resume an interrupted batched cleanup from its last committed batch, "
+        "appending to the archive table it was writing to."
+    ),
+    action="store_true",
+)
 ARG_DAG_IDS = Arg(
     ("--dag-ids",),
     default=None,
@@ -863,6 +902,12 @@ ARG_ANONYMIZE = Arg(
 ARG_FILE_IO = Arg(
     ("--file-io",), help="Send output to file.io service and returns link.", action="store_true"
 )
+ARG_IMPORT_PROFILE = Arg(
+    ("--import-profile",),
+    help="Show the modules taking the longest to import when starting Airflow processes, "
+    "measured with 'python -X importtime'.",
+    action="store_true",
+)
 
 # config
 ARG_SECTION = Arg(
@@ -1112,6 +1157,18 @@ DAGS_COMMANDS = (
         func=lazy_load_command("airflow.cli.commands.dag_command.dag_report"),
         args=(ARG_BUNDLE_NAME, ARG_OUTPUT, ARG_VERBOSE),
     ),
+    ActionCommand(
+        name="parse-report",
+        help="Show the profiles of the last parsing of Dag files",
+        description=(
+            "Show the time spent parsing Dag files by the Dag processor, slowest first, broken down into "
+            "imports, top-level user code, DagBag bookkeeping and serialization, along with the slowest "
+            "import and line of each file. Profiles are only recorded when "
+            "[dag_processor] parsing_profile is enabled."
+        ),
+        func=lazy_load_command("airflow.cli.commands.dag_command.dag_parse_report"),
+        args=(ARG_BUNDLE_NAME, ARG_OUTPUT, ARG_VERBOSE),
+    ),
     ActionCommand(
         name="list-runs",
         help="List DAG runs given a DAG id",
@@ -1601,6 +1658,9 @@ DB_COMMANDS = (
             ARG_YES,
             ARG_DB_SKIP_ARCHIVE,
             ARG_DB_BATCH_SIZE,
+            ARG_DB_MAX_ROWS_PER_SECOND,
+            ARG_DB_SLEEP_BETWEEN_BATCHES,
+            ARG_DB_RESUME,
             ARG_DAG_IDS,
             ARG_EXCLUDE_DAG_IDS,
         ),
@@ -1623,6 +1683,27 @@ DB_COMMANDS = (
         func=lazy_load_command("airflow.cli.commands.db_command.drop_archived"),
         args=(ARG_DB_TABLES, ARG_YES),
     ),
+    ActionCommand(
+        name="partition-tables",
+        help="Convert tables to time-partitioned storage (Postgres only)",
+        description=(
+            "Convert high-churn tables to declarative range partitioning on their timestamp column, "
+            "so that the db clean command archives or drops expired partitions as a whole. "
+            "The existing rows are kept in a first partition covering all times up to now."
+        ),
+        func=lazy_load_command("airflow.cli.commands.db_command.partition_tables"),
+        args=(ARG_DB_PARTITION_TABLES, ARG_DB_PARTITION_INTERVAL, ARG_YES),
+    ),
+    ActionCommand(
+        name="rotate-partitions",
+        help="Create the upcoming partitions of time-partitioned tables",
+        description=(
+            "Create the partitions of the current and next [database] partitions_to_precreate intervals "
+            "for time-partitioned tables. Run it periodically, at least once per interval."
+        ),
+        func=lazy_load_command("airflow.cli.commands.db_command.rotate_partitions"),
+        args=(ARG_DB_TABLES, ARG_DB_PARTITION_INTERVAL),
+    ),
 )
 CONNECTIONS_COMMANDS = (
     ActionCommand(
@@ -1797,6 +1878,18 @@ PROVIDERS_COMMANDS = (
         func=lazy_load_command("airflow.cli.commands.provider_command.auth_managers_list"),
         args=(ARG_OUTPUT, ARG_VERBOSE),
     ),
+    ActionCommand(
+        name="rebuild-manifest",
+        help="Rebuild the discovery manifest of the installed providers and plugins",
+        description=(
+            "Scan the installed distributions for providers and plugins, and write the result to the "
+            "discovery manifest in AIRFLOW_HOME. Once the manifest exists, Airflow processes read the "
+            "providers and plugin entry points from it instead of scanning the installed distributions. "
+            "Rebuild it whenever distributions are installed, upgraded or removed: until then, it is ignored"
+        ),
+        func=lazy_load_command("airflow.cli.commands.provider_command.rebuild_manifest"),
+        args=(ARG_VERBOSE,),
+    ),
 )
 
 
@@ -2121,6 +2214,7 @@ core_commands: list[CLICommand] = [
         args=(
             ARG_ANONYMIZE,
             ARG_FILE_IO,
+            ARG_IMPORT_PROFILE,
             ARG_VERBOSE,
             ARG_OUTPUT,
         ),
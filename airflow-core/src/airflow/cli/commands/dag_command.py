@@ -42,6 +42,7 @@ from airflow.dag_processing.dagbag import BundleDagBag, DagBag, sync_bag_to_db
 from airflow.exceptions import AirflowConfigException, AirflowException
 from airflow.jobs.job import Job
 from airflow.models import DagModel, DagRun, TaskInstance
+from airflow.models.dag_file_parse_profile import DagFileParseProfile
 from airflow.models.errors import ParseImportError
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.timetables.base import TimeRestriction
@@ -591,6 +592,41 @@ def dag_report(args) -> None:
     )
 
 
+def _slowest(entries: list[dict], key: str) -> str | None:
+    if not entries:
+        return None
+    return f"{entries[0][key]} ({entries[0]['duration']:.3f}s)"
+
+
+@cli_utils.action_cli
+@suppress_logs_and_warning
+@providers_configuration_loaded
+@provide_session
+def dag_parse_report(args, session: Session = NEW_SESSION) -> None:
+    """Display the profiles of the last parsing of Dag files, slowest first."""
+    query = select(DagFileParseProfile).order_by(DagFileParseProfile.parse_duration.desc())
+    if args.bundle_name:
+        validate_dag_bundle_arg(args.bundle_name)
+        query = query.where(DagFileParseProfile.bundle_name.in_(args.bundle_name))
+
+    AirflowConsole().print_as(
+        data=session.scalars(query).all(),
+        output=args.output,
+        mapper=lambda x: {
+            "bundle_name": x.bundle_name,
+            "file": x.relative_fileloc,
+            "parsed_at": x.parsed_at.isoformat(),
+            "duration": round(x.parse_duration, 3),
+            "imports": round(x.profile["import_duration"], 3),
+            "user_code": round(x.profile["user_code_duration"], 3),
+            "dagbag": round(x.profile["dagbag_duration"], 3),
+            "serialization": round(x.profile["serialization_duration"], 3),
+            "slowest_import": _slowest(x.profile["imports"], "module"),
+            "slowest_line": _slowest(x.profile["slowest_lines"], "location"),
+        },
+    )
+
+
 @cli_utils.action_cli
 @suppress_logs_and_warning
 @providers_configuration_loaded
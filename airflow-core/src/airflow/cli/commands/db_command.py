@@ -32,6 +32,11 @@ from airflow.utils import cli as cli_utils, db
 from airflow.utils.db import _REVISION_HEADS_MAP
 from airflow.utils.db_cleanup import config_dict, drop_archived_tables, export_archived_records, run_cleanup
 from airflow.utils.db_manager import _callable_accepts_use_migration_files
+from airflow.utils.db_partitioning import (
+    config_dict as partition_config_dict,
+    rotate_partitions as run_rotate_partitions,
+    run_partition_tables,
+)
 from airflow.utils.process_utils import execute_interactive
 from airflow.utils.providers_configuration_loader import providers_configuration_loaded
 
@@ -333,6 +338,7 @@ def check(args):
 
 # lazily imported by CLI parser for `help` command
 all_tables = sorted(config_dict)
+partitionable_tables = sorted(partition_config_dict)
 
 
 @cli_utils.action_cli(check_db=False)
@@ -347,6 +353,9 @@ def cleanup_tables(args):
         confirm=not args.yes,
         skip_archive=args.skip_archive,
         batch_size=args.batch_size,
+        max_rows_per_second=args.max_rows_per_second,
+        sleep_between_batches=args.sleep_between_batches,
+        resume=args.resume,
         dag_ids=args.dag_ids,
         exclude_dag_ids=args.exclude_dag_ids,
     )
@@ -373,3 +382,24 @@ def drop_archived(args):
         table_names=args.tables,
         needs_confirm=not args.yes,
     )
+
+
+@cli_utils.action_cli(check_db=False)
+@providers_configuration_loaded
+def partition_tables(args):
+    """Convert tables of metadata database to time-partitioned storage."""
+    run_partition_tables(
+        table_names=args.tables,
+        interval=args.interval,
+        confirm=not args.yes,
+    )
+
+
+@cli_utils.action_cli(check_db=False)
+@providers_configuration_loaded
+def rotate_partitions(args):
+    """Create the upcoming partitions of time-partitioned tables."""
+    run_rotate_partitions(
+        table_names=args.tables,
+        interval=args.interval,
+    )
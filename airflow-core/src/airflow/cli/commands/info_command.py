@@ -341,6 +341,73 @@ class AirflowInfo:
         return console.export_text()
 
 
+# Entry points whose cold import time is paid by every Airflow process, e.g. each task started by a worker.
+IMPORT_PROFILE_MODULES = (
+    "airflow",
+    "airflow.sdk",
+    "airflow.sdk.execution_time.task_runner",
+)
+
+
+def profile_imports(module: str, top: int = 15) -> list[tuple[str, int, int]]:
+    """
+    Profile the cold import of a module in a fresh interpreter, using ``python -X importtime``.
+
+    :param module: name of the module to import
+    :param top: number of modules to return
+    :return: name, self and cumulative import time in microseconds of the ``top`` modules which took the
+        longest to import, including the imports they triggered; modules imported while the interpreter
+        starts up (``site``, ``.pth`` hooks, ...) are left out
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    timings: list[tuple[str, int, int]] = []
+    pending: list[tuple[str, int, int]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        # The header line has no numbers in its columns
+        if not self_us.strip().isdigit():
+            continue
+        pending.append((name.strip(), int(self_us), int(cumulative_us)))
+        # Nested imports are indented and reported before the top-level import that triggered them. Only
+        # keep the top-level imports of the module itself or its parent packages, with what they imported.
+        if name.startswith("  "):
+            continue
+        if module == name.strip() or module.startswith(f"{name.strip()}."):
+            timings.extend(pending)
+        pending.clear()
+    if proc.returncode != 0:
+        log.warning("Importing %s failed: %s", module, proc.stderr.strip().splitlines()[-1:])
+    return sorted(timings, key=lambda timing: timing[2], reverse=True)[:top]
+
+
+def _show_import_profile(output: str) -> None:
+    profiles = {
+        module: [
+            {
+                "module": name,
+                "self_ms": round(self_us / 1000, 1),
+                "cumulative_ms": round(cumulative_us / 1000, 1),
+            }
+            for name, self_us, cumulative_us in profile_imports(module)
+        ]
+        for module in IMPORT_PROFILE_MODULES
+    }
+    console = AirflowConsole()
+    if output in ("table", "plain"):
+        for module, profile in profiles.items():
+            console.print(f"\n[bold][green]import {module}[/bold][/green]", highlight=False)
+            console.print_as(data=profile, output=output)
+    else:
+        console.print_as(data=[profiles], output=output)
+
+
 class FileIoException(Exception):
     """Raises when error happens in FileIo.io integration."""
 
@@ -380,6 +447,9 @@ def _send_report_to_fileio(info):
 @providers_configuration_loaded
 def show_info(args):
     """Show information related to Airflow, system and other."""
+    if args.import_profile:
+        _show_import_profile(args.output)
+        return
     # Enforce anonymization, when file_io upload is tuned on.
     anonymizer = PiiAnonymizer() if args.anonymize or args.file_io else NullAnonymizer()
     info = AirflowInfo(anonymizer)
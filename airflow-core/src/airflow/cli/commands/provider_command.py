@@ -21,6 +21,12 @@ from __future__ import annotations
 import re
 import sys
 
+from airflow._shared.providers_discovery import (
+    _create_provider_info_schema_validator,
+    build_discovery_manifest,
+    get_discovery_manifest_path,
+    write_discovery_manifest,
+)
 from airflow.cli.simple_table import AirflowConsole
 from airflow.providers_manager import ProvidersManager
 from airflow.utils.cli import suppress_logs_and_warning
@@ -272,3 +278,15 @@ def lazy_loaded(args):
     else:
         rich.print("[green]All ok. Providers Manager was not initialized during the CLI parsing.")
         sys.exit(0)
+
+
+@suppress_logs_and_warning
+def rebuild_manifest(args):
+    """Rebuild the discovery manifest of the installed providers and plugins."""
+    path = get_discovery_manifest_path()
+    manifest = build_discovery_manifest(_create_provider_info_schema_validator())
+    write_discovery_manifest(manifest, path)
+    print(
+        f"Discovery manifest with {len(manifest.providers)} provider(s) and "
+        f"{len(manifest.plugin_entry_points)} plugin entry point(s) written to {path}"
+    )
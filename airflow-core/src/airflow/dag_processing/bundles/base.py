@@ -228,6 +228,11 @@ class BundleUsageTrackingManager:
                 continue
             self._remove_stale_bundle_versions_for_bundle(bundle_name=bundle.name)
 
+        from airflow.dag_processing.bundles.content_store import BundleContentStore
+
+        # Files of the removed versions may not be used by any version anymore
+        BundleContentStore().evict()
+
 
 class BaseDagBundle(ABC):
     """
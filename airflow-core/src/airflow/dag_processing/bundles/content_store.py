@@ -0,0 +1,195 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from airflow._shared.observability.metrics.stats import Stats
+from airflow.configuration import conf
+from airflow.dag_processing.bundles.base import get_bundle_storage_root_path
+
+log = logging.getLogger(__name__)
+
+
+class BundleFile(NamedTuple):
+    """A file of a bundle version to materialize from a :class:`BundleContentStore`."""
+
+    path: str
+    """Path of the file, relative to the root of the bundle version."""
+
+    digest: str
+    """Digest of the content of the file, e.g. the hash of a git blob."""
+
+    executable: bool = False
+    symlink: bool = False
+    """Whether the file is a symbolic link, the content of which is the target of the link."""
+
+
+class BundleContentStore:
+    """
+    Host-local, content-addressed store of the files of bundle versions.
+
+    The content of each file is stored once by digest, and the trees of bundle versions are made of hard
+    links to the stored files. Materializing a new version thus only reads and writes the files that are not
+    already on the host, e.g. those that changed since the previous version. Stored files are read-only, as
+    changes made through any of the links would be seen by every version sharing the file.
+
+    Files no version links to anymore, e.g. once stale bundle versions are removed, are evicted least
+    recently used first when the store grows beyond ``[dag_processor] bundle_content_store_max_size``.
+
+    :param path: Directory of the store (Optional - defaults to ``_content_store`` in the bundle storage path)
+    :param max_size: Size of the store in bytes beyond which files are evicted
+        (Optional - defaults to ``[dag_processor] bundle_content_store_max_size``)
+    """
+
+    def __init__(self, path: Path | None = None, max_size: int | None = None) -> None:
+        self.path = path or get_bundle_storage_root_path() / "_content_store"
+        if max_size is None:
+            max_size = conf.getint("dag_processor", "bundle_content_store_max_size") * 2**20
+        self.max_size = max_size
+
+    @property
+    def objects_dir(self) -> Path:
+        return self.path / "objects"
+
+    def _object_path(self, digest: str, executable: bool) -> Path:
+        # Hard links share their mode, so executable files are stored apart from the others
+        name = f"{digest[2:]}.x" if executable else digest[2:]
+        return self.objects_dir / digest[:2] / name
+
+    def _store(self, digest: str, executable: bool, read: Callable[[str], bytes]) -> tuple[Path, bool]:
+        """Store the content of a file if not stored yet, and return its path and whether it was written."""
+        object_path = self._object_path(digest, executable)
+        try:
+            # The modification time of stored files is the time they were last used, for eviction
+            os.utime(object_path)
+        except FileNotFoundError:
+            # Not stored yet, or evicted by another process in the meantime
+            pass
+        else:
+            return object_path, False
+
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=object_path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(read(digest))
+            os.chmod(tmp_path, 0o555 if executable else 0o444)
+            # Concurrent writers of the same file write the same content
+            os.replace(tmp_path, object_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return object_path, True
+
+    def _link(self, file: BundleFile, dest: Path, read: Callable[[str], bytes]) -> bool:
+        object_path, stored = self._store(file.digest, file.executable, read)
+        try:
+            os.link(object_path, dest)
+        except FileNotFoundError:
+            # Evicted by another process in the meantime
+            object_path, stored = self._store(file.digest, file.executable, read)
+            os.link(object_path, dest)
+        except OSError as e:
+            # e.g. the store is on another file system than the bundle versions
+            log.debug("Could not hard link %s, copying it instead: %s", object_path, e)
+            shutil.copy2(object_path, dest)
+        return stored
+
+    def materialize(
+        self,
+        dest: Path,
+        files: Iterable[BundleFile],
+        read: Callable[[str], bytes],
+        *,
+        bundle_name: str,
+    ) -> int:
+        """
+        Materialize the tree of a bundle version from the store.
+
+        The tree is built next to ``dest`` and moved there once complete, so that ``dest`` never holds a
+        partial tree. It must not exist yet, and callers are expected to hold the lock of the bundle.
+
+        :param dest: Directory to materialize the bundle version into
+        :param files: Files of the bundle version
+        :param read: Callable returning the content of a file not stored yet from its digest
+        :param bundle_name: Name of the bundle, to tag the materialization time metric with
+        :return: The number of files that were not stored yet
+        """
+        tmp_dest = dest.with_name(f".{dest.name}.tmp")
+        if tmp_dest.exists():
+            shutil.rmtree(tmp_dest)
+        tmp_dest.mkdir(parents=True)
+
+        stored = 0
+        with Stats.timer("dag_processing.bundle_materialize_duration", tags={"bundle_name": bundle_name}):
+            try:
+                for file in files:
+                    file_dest = tmp_dest / file.path
+                    file_dest.parent.mkdir(parents=True, exist_ok=True)
+                    if file.symlink:
+                        os.symlink(os.fsdecode(read(file.digest)), file_dest)
+                    elif self._link(file, file_dest, read):
+                        stored += 1
+                os.rename(tmp_dest, dest)
+            except BaseException:
+                shutil.rmtree(tmp_dest, ignore_errors=True)
+                raise
+
+        log.info("Materialized bundle version at %s, %d new files stored", dest, stored)
+        self.evict()
+        return stored
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used files no bundle version links to, until the store fits its size.
+
+        :return: The number of bytes freed
+        """
+        if not self.objects_dir.exists():
+            return 0
+
+        total_size = 0
+        unused = []
+        for object_path in self.objects_dir.glob("*/*"):
+            if object_path.name.startswith("."):
+                continue
+            try:
+                st = object_path.stat()
+            except FileNotFoundError:
+                continue
+            total_size += st.st_size
+            if st.st_nlink == 1:
+                unused.append((st.st_mtime, st.st_size, object_path))
+
+        freed = 0
+        for _, size, object_path in sorted(unused):
+            if total_size - freed <= self.max_size:
+                break
+            object_path.unlink(missing_ok=True)
+            freed += size
+
+        if freed:
+            log.info("Evicted %d bytes of unused files from the bundle content store", freed)
+        return freed
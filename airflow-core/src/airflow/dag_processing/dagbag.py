@@ -21,6 +21,7 @@ import contextlib
 import os
 import sys
 import textwrap
+import time
 import warnings
 from collections.abc import Generator
 from datetime import datetime, timedelta
@@ -207,6 +208,8 @@ class DagBag(LoggingMixin):
         # Store import errors with relative file paths as keys (relative to bundle_path)
         self.import_errors: dict[str, str] = {}
         self.captured_warnings: dict[str, tuple[str, ...]] = {}
+        # Time spent loading each file by its importer, which runs its top-level code
+        self.file_load_durations: dict[str, float] = {}
         self.has_logged = False
         # Only used by SchedulerJob to compare the dag_hash to identify change in DAGs
         self.dags_hash: dict[str, str] = {}
@@ -304,12 +307,14 @@ class DagBag(LoggingMixin):
             self.log.debug("No importer found for file: %s", filepath)
             return []
 
+        load_start = time.perf_counter()
         result = importer.import_file(
             file_path=filepath,
             bundle_path=self.bundle_path,
             bundle_name=self.bundle_name,
             safe_mode=safe_mode,
         )
+        self.file_load_durations[filepath] = time.perf_counter() - load_start
 
         if result.skipped_files:
             for skipped in result.skipped_files:
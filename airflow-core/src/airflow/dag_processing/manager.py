@@ -53,9 +53,11 @@ from airflow.dag_processing.bundles.base import BundleUsageTrackingManager
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
 from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.result_writer import ParsingResultWriter
 from airflow.exceptions import AirflowException
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
+from airflow.models.dag_file_parse_profile import DagFileParseProfile
 from airflow.models.dagbag import DagPriorityParsingRequest
 from airflow.models.dagbundle import DagBundleModel
 from airflow.models.dagwarning import DagWarning
@@ -84,6 +86,7 @@ if TYPE_CHECKING:
 
     from airflow.callbacks.callback_requests import CallbackRequest
     from airflow.dag_processing.bundles.base import BaseDagBundle
+    from airflow.dag_processing.profiling import ParseProfile
     from airflow.sdk.api.client import Client
 
 
@@ -111,6 +114,7 @@ class DagFileStat:
     last_duration: float | None = None
     run_count: int = 0
     last_num_of_db_queries: int = 0
+    last_parse_profile: ParseProfile | None = None
 
 
 @dataclass(frozen=True)
@@ -129,6 +133,14 @@ class DagFileInfo:
         return self.bundle_path / self.rel_path
 
 
+class _PendingParsingResult(NamedTuple):
+    """Parsing result of a file being written to the metadata database by the result writer."""
+
+    file: DagFileInfo
+    previous_stat: DagFileStat
+    next_stat: DagFileStat
+
+
 def _config_int_factory(section: str, key: str):
     return functools.partial(conf.getint, section, key)
 
@@ -249,6 +261,17 @@ class DagFileProcessorManager(LoggingMixin):
         factory=_config_int_factory("dag_processor", "max_callbacks_per_loop")
     )
 
+    parsing_result_queue_size: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_result_queue_size")
+    )
+    parsing_result_batch_size: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_result_batch_size")
+    )
+    _result_writer: ParsingResultWriter | None = attrs.field(default=None, init=False)
+    """Writer of the parsing results to the metadata DB, while the parsing loop runs"""
+    _pending_results: dict[DagFileInfo, _PendingParsingResult] = attrs.field(factory=dict, init=False)
+    """Last parsing result of the files being written by the result writer"""
+
     base_log_dir: str = attrs.field(
         factory=_config_get_factory("logging", "dag_processor_child_process_log_directory")
     )
@@ -304,6 +327,7 @@ class DagFileProcessorManager(LoggingMixin):
         try:
             return self._run_parsing_loop()
         finally:
+            self._stop_result_writer()
             self.after_run()
 
     def before_run(self) -> None:
@@ -369,10 +393,11 @@ class DagFileProcessorManager(LoggingMixin):
         now = time.monotonic()
         elapsed_time_since_refresh = now - self._last_deactivate_stale_dags_time
         if elapsed_time_since_refresh > self.parsing_cleanup_interval:
+            # The DAGs of the files still being written have not been updated with their last parse yet
             last_parsed = {
                 file_info: stat.last_finish_time
                 for file_info, stat in self._file_stats.items()
-                if stat.last_finish_time
+                if stat.last_finish_time and file_info not in self._pending_results
             }
             self.deactivate_stale_dags(last_parsed=last_parsed)
             self._last_deactivate_stale_dags_time = time.monotonic()
@@ -444,6 +469,8 @@ class DagFileProcessorManager(LoggingMixin):
         # needs to be done before this process is forked to create the DAG parsing processes.
         SecretCache.init()
 
+        self._start_result_writer()
+
         poll_time = 0.0
 
         known_files: dict[str, set[DagFileInfo]] = {}
@@ -471,6 +498,8 @@ class DagFileProcessorManager(LoggingMixin):
 
             self._collect_results()
 
+            self._handle_written_results()
+
             for callback in self.fetch_callbacks():
                 self._add_callback_to_queue(callback)
             self._scan_stale_dags()
@@ -793,10 +822,9 @@ class DagFileProcessorManager(LoggingMixin):
             known_files[bundle.name] = found_files
 
             self.deactivate_deleted_dags(bundle_name=bundle.name, present=found_files)
-            self.clear_orphaned_import_errors(
-                bundle_name=bundle.name,
-                observed_filelocs=self._get_observed_filelocs(found_files),
-            )
+            observed_filelocs = self._get_observed_filelocs(found_files)
+            self.clear_orphaned_import_errors(bundle_name=bundle.name, observed_filelocs=observed_filelocs)
+            self.clear_orphaned_parse_profiles(bundle_name=bundle.name, observed_filelocs=observed_filelocs)
 
         if any_refreshed:
             self.handle_removed_files(known_files=known_files)
@@ -888,6 +916,28 @@ class DagFileProcessorManager(LoggingMixin):
         except Exception:
             self.log.exception("Error removing old import errors")
 
+    @provide_session
+    def clear_orphaned_parse_profiles(
+        self, bundle_name: str, observed_filelocs: set[str], session: Session = NEW_SESSION
+    ):
+        """
+        Clear parsing profiles of files that no longer exist.
+
+        :param session: session for ORM operations
+        """
+        self.log.debug("Removing old parsing profiles")
+        try:
+            profiles = session.scalars(
+                select(DagFileParseProfile)
+                .where(DagFileParseProfile.bundle_name == bundle_name)
+                .options(load_only(DagFileParseProfile.relative_fileloc))
+            )
+            for profile in profiles:
+                if profile.relative_fileloc not in observed_filelocs:
+                    session.delete(profile)
+        except Exception:
+            self.log.exception("Error removing old parsing profiles")
+
     def _log_file_processing_stats(self, known_files: dict[str, set[DagFileInfo]]):
         """
         Print out stats about how files are getting processed.
@@ -906,6 +956,8 @@ class DagFileProcessorManager(LoggingMixin):
         # Last Run: When the file finished processing in the previous run.
         # Last # of DB Queries: The number of queries performed to the
         # Airflow database during last parsing of the file.
+        # Imports, User Code, DagBag, Serialization: Breakdown of the last
+        # duration, only shown if parsing is profiled.
         headers = [
             "Bundle",
             "File Path",
@@ -917,6 +969,12 @@ class DagFileProcessorManager(LoggingMixin):
             "Last Run At",
         ]
 
+        profiled = any(
+            self._file_stats[file].last_parse_profile for files in known_files.values() for file in files
+        )
+        if profiled:
+            headers += ["Imports", "User Code", "DagBag", "Serialization"]
+
         rows = []
         utcnow = timezone.utcnow()
         now = time.monotonic()
@@ -946,6 +1004,7 @@ class DagFileProcessorManager(LoggingMixin):
                         num_errors,
                         stat.last_duration,
                         last_run,
+                        stat.last_parse_profile,
                     )
                 )
 
@@ -962,19 +1021,30 @@ class DagFileProcessorManager(LoggingMixin):
             num_errors,
             last_runtime,
             last_run,
+            profile,
         ) in rows:
-            formatted_rows.append(
-                (
-                    bundle_name,
-                    relative_path,
-                    pid,
-                    f"{runtime:.2f}s" if runtime else None,
-                    num_dags,
-                    num_errors,
-                    f"{last_runtime:.2f}s" if last_runtime else None,
-                    last_run.strftime("%Y-%m-%dT%H:%M:%S") if last_run else None,
-                )
+            formatted_row = (
+                bundle_name,
+                relative_path,
+                pid,
+                f"{runtime:.2f}s" if runtime else None,
+                num_dags,
+                num_errors,
+                f"{last_runtime:.2f}s" if last_runtime else None,
+                last_run.strftime("%Y-%m-%dT%H:%M:%S") if last_run else None,
             )
+            if profiled:
+                formatted_row += (
+                    (
+                        f"{profile.import_duration:.2f}s",
+                        f"{profile.user_code_duration:.2f}s",
+                        f"{profile.dagbag_duration:.2f}s",
+                        f"{profile.serialization_duration:.2f}s",
+                    )
+                    if profile
+                    else (None, None, None, None)
+                )
+            formatted_rows.append(formatted_row)
         log_str = (
             "\n"
             + "=" * 80
@@ -1050,6 +1120,10 @@ class DagFileProcessorManager(LoggingMixin):
         DAG/import-error counts are preserved while a minimal timestamp update
         throttles immediate retries, so other files in the same
         ``_collect_results`` cycle still run.
+
+        While the parsing loop runs with a result writer, the result is queued to be
+        persisted in the background instead, and the file stats are updated right
+        away; persistence failures are then handled by :meth:`_handle_written_results`.
         """
         is_callback_only = proc.had_callbacks and proc.parsing_result is None
         if is_callback_only:
@@ -1069,36 +1143,91 @@ class DagFileProcessorManager(LoggingMixin):
         )
 
         if proc.parsing_result is not None:
-            try:
-                self.persist_parsing_result(
-                    bundle_name=file.bundle_name,
-                    bundle_version=self._bundle_versions[file.bundle_name],
-                    parsing_result=proc.parsing_result,
-                    run_duration=run_duration,
-                    relative_fileloc=str(file.rel_path),
-                    session=session,
-                )
-            except Exception:
-                self.log.exception(
-                    "Failed to persist parsing result for %s in bundle %s; "
-                    "keeping previous persisted stats while throttling retries. "
-                    "Other files in this cycle are still processed.",
-                    str(file.rel_path),
-                    file.bundle_name,
-                )
-                current_stat = self._file_stats[file]
-                self._file_stats[file] = DagFileStat(
-                    num_dags=current_stat.num_dags,
-                    import_errors=current_stat.import_errors,
-                    last_finish_time=finish_time,
-                    last_duration=run_duration,
-                    run_count=current_stat.run_count + 1,
-                    last_num_of_db_queries=current_stat.last_num_of_db_queries,
+            persist = functools.partial(
+                self.persist_parsing_result,
+                bundle_name=file.bundle_name,
+                bundle_version=self._bundle_versions[file.bundle_name],
+                parsing_result=proc.parsing_result,
+                run_duration=run_duration,
+                relative_fileloc=str(file.rel_path),
+            )
+            if self._result_writer is not None:
+                pending = _PendingParsingResult(
+                    file, previous_stat=self._file_stats[file], next_stat=next_stat
                 )
+                self._pending_results[file] = pending
+                self._file_stats[file] = next_stat
+                # Blocks while the writer is behind by ``parsing_result_queue_size`` results
+                self._result_writer.submit(pending, persist)
+                return
+            try:
+                persist(session=session)
+            except Exception as e:
+                self._handle_persist_failure(file, self._file_stats[file], next_stat, e)
                 return
 
         self._file_stats[file] = next_stat
 
+    def _handle_persist_failure(
+        self, file: DagFileInfo, previous_stat: DagFileStat, next_stat: DagFileStat, error: Exception
+    ) -> None:
+        self.log.error(
+            "Failed to persist parsing result for %s in bundle %s; "
+            "keeping previous persisted stats while throttling retries. "
+            "Other files in this cycle are still processed.",
+            str(file.rel_path),
+            file.bundle_name,
+            exc_info=error,
+        )
+        self._file_stats[file] = DagFileStat(
+            num_dags=previous_stat.num_dags,
+            import_errors=previous_stat.import_errors,
+            last_finish_time=next_stat.last_finish_time,
+            last_duration=next_stat.last_duration,
+            run_count=previous_stat.run_count + 1,
+            last_num_of_db_queries=previous_stat.last_num_of_db_queries,
+        )
+
+    def _start_result_writer(self) -> None:
+        if self.parsing_result_queue_size <= 0:
+            return
+        self._result_writer = ParsingResultWriter(
+            max_queue_size=self.parsing_result_queue_size,
+            max_batch_size=self.parsing_result_batch_size,
+        )
+        self._result_writer.start()
+
+    def _stop_result_writer(self) -> None:
+        """Wait for the parsing results queued so far to be persisted, and stop the result writer."""
+        if self._result_writer is None:
+            return
+        self._result_writer.stop()
+        self._handle_written_results()
+        self._result_writer = None
+
+    def _handle_written_results(self) -> None:
+        """Handle the parsing results persisted by the result writer since the last call."""
+        if self._result_writer is None:
+            return
+        for outcome in self._result_writer.get_outcomes():
+            pending: _PendingParsingResult = outcome.key
+            if self._pending_results.get(pending.file) is pending:
+                del self._pending_results[pending.file]
+            if outcome.error is None:
+                continue
+            if self._file_stats.get(pending.file) is pending.next_stat:
+                self._handle_persist_failure(
+                    pending.file, pending.previous_stat, pending.next_stat, outcome.error
+                )
+            else:
+                # The file was parsed again or removed in the meantime
+                self.log.error(
+                    "Failed to persist parsing result for %s in bundle %s",
+                    str(pending.file.rel_path),
+                    pending.file.bundle_name,
+                    exc_info=outcome.error,
+                )
+
     def persist_parsing_result(
         self,
         *,
@@ -1137,6 +1266,14 @@ class DagFileProcessorManager(LoggingMixin):
             session=session,
             files_parsed=files_parsed,
         )
+        if parsing_result.parse_profile is not None and relative_fileloc is not None:
+            DagFileParseProfile.replace(
+                bundle_name=bundle_name,
+                relative_fileloc=relative_fileloc,
+                parse_duration=run_duration,
+                profile=parsing_result.parse_profile,
+                session=session,
+            )
 
     @provide_session
     def _collect_results(self, session: Session = NEW_SESSION):
@@ -1216,19 +1353,21 @@ class DagFileProcessorManager(LoggingMixin):
         callback_to_execute_for_file = self._callback_to_execute.pop(dag_file, [])
         logger, logger_filehandle = self._get_logger_for_dag_file(dag_file)
 
-        return DagFileProcessorProcess.start(
-            id=id,
-            path=dag_file.absolute_path,
-            bundle_path=cast("Path", dag_file.bundle_path),
-            bundle_name=dag_file.bundle_name,
-            dag_file_rel_path=str(dag_file.rel_path),
-            callbacks=callback_to_execute_for_file,
-            selector=self.selector,
-            logger=logger,
-            logger_filehandle=logger_filehandle,
-            subprocess_logs_to_stdout=conf.get("logging", "dag_processor_log_target") == "stdout",
-            client=self.client,
-        )
+        # The processor is forked, which the result writer must not be in the middle of a write for
+        with self._result_writer.paused() if self._result_writer else contextlib.nullcontext():
+            return DagFileProcessorProcess.start(
+                id=id,
+                path=dag_file.absolute_path,
+                bundle_path=cast("Path", dag_file.bundle_path),
+                bundle_name=dag_file.bundle_name,
+                dag_file_rel_path=str(dag_file.rel_path),
+                callbacks=callback_to_execute_for_file,
+                selector=self.selector,
+                logger=logger,
+                logger_filehandle=logger_filehandle,
+                subprocess_logs_to_stdout=conf.get("logging", "dag_processor_log_target") == "stdout",
+                client=self.client,
+            )
 
     def _start_new_processes(self):
         """Start more processors if we have enough slots and files to process."""
@@ -1531,4 +1670,5 @@ def process_parse_results(
         stat.num_dags = len(parsing_result.serialized_dags)
         if parsing_result.import_errors:
             stat.import_errors = len(parsing_result.import_errors)
+        stat.last_parse_profile = parsing_result.parse_profile
     return stat
@@ -38,6 +38,7 @@ from airflow.callbacks.callback_requests import (
 from airflow.configuration import conf
 from airflow.dag_processing.bundles.base import BundleVersionLock
 from airflow.dag_processing.dagbag import BundleDagBag, DagBag
+from airflow.dag_processing.profiling import ParseProfile, ParseProfiler
 from airflow.sdk.exceptions import TaskNotFound
 from airflow.sdk.execution_time.comms import (
     ConnectionResult,
@@ -120,6 +121,7 @@ class DagFileParsingResult(BaseModel):
     serialized_dags: list[LazyDeserializedDAG]
     warnings: list | None = None
     import_errors: dict[str, str] | None = None
+    parse_profile: ParseProfile | None = None
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
@@ -221,25 +223,31 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
             import_errors=stability_check_error_dict,
         )
 
-    bag = BundleDagBag(
-        dag_folder=msg.file,
-        bundle_path=msg.bundle_path,
-        bundle_name=msg.bundle_name,
-        load_op_links=False,
-    )
+    # Callbacks are not worth profiling, only the parsing of the file is
+    profiler = None if msg.callback_requests else ParseProfiler.from_config(msg.bundle_path)
+
+    with profiler.collecting_dags() if profiler else contextlib.nullcontext():
+        bag = BundleDagBag(
+            dag_folder=msg.file,
+            bundle_path=msg.bundle_path,
+            bundle_name=msg.bundle_name,
+            load_op_links=False,
+        )
 
     if msg.callback_requests:
         # If the request is for callback, we shouldn't serialize the Dags
         _execute_callbacks(bag, msg.callback_requests, log)
         return None
 
-    serialized_dags, serialization_import_errors = _serialize_dags(bag, log)
+    with profiler.serializing() if profiler else contextlib.nullcontext():
+        serialized_dags, serialization_import_errors = _serialize_dags(bag, log)
     bag.import_errors.update(serialization_import_errors)
     result = DagFileParsingResult(
         fileloc=msg.file,
         serialized_dags=serialized_dags,
         import_errors=bag.import_errors,
         warnings=stability_check_result.get_formatted_warnings(bag.dag_ids),
+        parse_profile=profiler.get_profile(bag) if profiler else None,
     )
     return result
 
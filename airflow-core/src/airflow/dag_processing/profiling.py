@@ -0,0 +1,229 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Profiling of the parsing of DAG files, enabled by ``[dag_processor] parsing_profile``.
+
+The parsing time of a file is broken down into the time spent importing modules, running the rest of the
+top-level code of the file, collecting its DAGs in the ``DagBag`` and serializing them. The slowest modules to
+import and the slowest lines of the file, found by sampling the running line, are recorded as well.
+"""
+
+from __future__ import annotations
+
+import builtins
+import contextlib
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from airflow.configuration import conf
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from airflow.dag_processing.dagbag import DagBag
+
+#: Number of modules and lines kept in a profile
+MAX_PROFILE_ENTRIES = 10
+
+
+class ImportTime(BaseModel):
+    """Time spent importing a module while parsing a DAG file."""
+
+    module: str
+    duration: float
+    """Time spent importing the module, including the modules it imports."""
+    self_duration: float
+    """Time spent importing the module, excluding the modules it imports."""
+
+
+class LineSample(BaseModel):
+    """Time spent running a line of a DAG file."""
+
+    location: str
+    """Path of the file relative to its bundle, and line number."""
+    duration: float
+
+
+class ParseProfile(BaseModel):
+    """Breakdown of the time spent parsing a DAG file, in seconds."""
+
+    import_duration: float
+    user_code_duration: float
+    dagbag_duration: float
+    serialization_duration: float
+    imports: list[ImportTime]
+    """Slowest modules to import."""
+    slowest_lines: list[LineSample]
+    """Slowest lines of the files of the bundle, including functions called from top-level code."""
+
+
+class _ImportTimer:
+    """Time the imports of modules not imported yet, done by the thread installing the timer."""
+
+    def __init__(self):
+        self.duration = 0.0
+        self.imports: list[ImportTime] = []
+        self._thread_id = threading.get_ident()
+        self._children_durations: list[float] = []
+        self._original_import = builtins.__import__
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or threading.get_ident() != self._thread_id:
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._children_durations.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            duration = time.perf_counter() - start
+            children_duration = self._children_durations.pop()
+            if self._children_durations:
+                self._children_durations[-1] += duration
+            else:
+                self.duration += duration
+            self.imports.append(
+                ImportTime(module=name, duration=duration, self_duration=duration - children_duration)
+            )
+
+    @contextlib.contextmanager
+    def installed(self) -> Iterator[None]:
+        builtins.__import__ = self._import
+        try:
+            yield
+        finally:
+            builtins.__import__ = self._original_import
+
+
+class _LineSampler(threading.Thread):
+    """Sample the line of the files of a bundle run by a thread."""
+
+    def __init__(self, bundle_path: Path, interval: float):
+        super().__init__(name="dag-parsing-line-sampler", daemon=True)
+        self.durations: dict[tuple[str, int], float] = defaultdict(float)
+        self._bundle_prefix = os.path.join(os.path.realpath(bundle_path), "")
+        self._interval = interval
+        self._thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+        self._in_bundle: dict[str, bool] = {}
+
+    def _is_in_bundle(self, filename: str) -> bool:
+        if (in_bundle := self._in_bundle.get(filename)) is None:
+            in_bundle = self._in_bundle[filename] = os.path.realpath(filename).startswith(self._bundle_prefix)
+        return in_bundle
+
+    def _sample(self, elapsed: float) -> None:
+        frame = sys._current_frames().get(self._thread_id)
+        # Attribute the time to the innermost line of the bundle, e.g. the call of a slow library function
+        while frame is not None:
+            if self._is_in_bundle(frame.f_code.co_filename):
+                self.durations[(frame.f_code.co_filename, frame.f_lineno)] += elapsed
+                return
+            frame = frame.f_back
+
+    def run(self) -> None:
+        last_sample = time.perf_counter()
+        while not self._stopped.wait(self._interval):
+            now = time.perf_counter()
+            self._sample(now - last_sample)
+            last_sample = now
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+    def slowest_lines(self) -> list[LineSample]:
+        slowest = sorted(self.durations.items(), key=lambda item: item[1], reverse=True)
+        return [
+            LineSample(
+                location=f"{os.path.relpath(os.path.realpath(filename), self._bundle_prefix)}:{lineno}",
+                duration=duration,
+            )
+            for (filename, lineno), duration in slowest[:MAX_PROFILE_ENTRIES]
+        ]
+
+
+class ParseProfiler:
+    """
+    Profile the parsing of a DAG file by the current thread.
+
+    Usage::
+
+        profiler = ParseProfiler(bundle_path)
+        with profiler.collecting_dags():
+            bag = BundleDagBag(...)
+        with profiler.serializing():
+            ...
+        profile = profiler.get_profile(bag)
+    """
+
+    def __init__(self, bundle_path: Path, sample_interval: float | None = None):
+        if sample_interval is None:
+            sample_interval = conf.getfloat("dag_processor", "parsing_profile_sample_interval")
+        self._import_timer = _ImportTimer()
+        self._line_sampler = _LineSampler(bundle_path, sample_interval)
+        self._collecting_duration = 0.0
+        self._serialization_duration = 0.0
+
+    @classmethod
+    def from_config(cls, bundle_path: Path) -> ParseProfiler | None:
+        """Return a profiler if ``[dag_processor] parsing_profile`` is enabled."""
+        if not conf.getboolean("dag_processor", "parsing_profile"):
+            return None
+        return cls(bundle_path)
+
+    @contextlib.contextmanager
+    def collecting_dags(self) -> Iterator[None]:
+        """Profile the collection of the DAGs of the file, which runs its top-level code."""
+        self._line_sampler.start()
+        start = time.perf_counter()
+        try:
+            with self._import_timer.installed():
+                yield
+        finally:
+            self._collecting_duration = time.perf_counter() - start
+            self._line_sampler.stop()
+
+    @contextlib.contextmanager
+    def serializing(self) -> Iterator[None]:
+        """Time the serialization of the DAGs of the file."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._serialization_duration = time.perf_counter() - start
+
+    def get_profile(self, bag: DagBag) -> ParseProfile:
+        """Return the profile of the parsing of the file loaded in ``bag``."""
+        load_duration = sum(bag.file_load_durations.values())
+        import_duration = self._import_timer.duration
+        imports = sorted(self._import_timer.imports, key=lambda i: i.duration, reverse=True)
+        return ParseProfile(
+            import_duration=import_duration,
+            # Modules are imported by the top-level code of the file, while it is loaded
+            user_code_duration=max(load_duration - import_duration, 0.0),
+            dagbag_duration=max(self._collecting_duration - load_duration, 0.0),
+            serialization_duration=self._serialization_duration,
+            imports=imports[:MAX_PROFILE_ENTRIES],
+            slowest_lines=self._line_sampler.slowest_lines(),
+        )
@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Writing of the results of the parsing of DAG files to the metadata database, in a background thread."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from airflow._shared.observability.metrics.stats import Stats
+from airflow.utils.session import create_session
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+log = logging.getLogger(__name__)
+
+
+class WriteOutcome(NamedTuple):
+    """Outcome of the writing of a parsing result."""
+
+    key: Any
+    """Key the result was submitted with."""
+
+    error: Exception | None
+    """Error raised while writing the result, if it could not be written."""
+
+
+class _WriteRequest(NamedTuple):
+    key: Any
+    write: Callable[..., None]
+
+
+class _TransactionRolledBack(Exception):
+    """The transaction of a batch was rolled back while writing one of its results."""
+
+
+class ParsingResultWriter:
+    """
+    Write parsing results to the metadata database from a single background thread.
+
+    Results are queued by :meth:`submit`, which blocks while ``max_queue_size`` results are already waiting,
+    and are written in submission order, in batches of up to ``max_batch_size`` results sharing a single
+    transaction. When a batch fails, its results are written again one per transaction, so that a single
+    failing result does not prevent the others from being written. The outcome of each result is returned
+    by :meth:`get_outcomes`.
+    """
+
+    def __init__(self, *, max_queue_size: int, max_batch_size: int):
+        self._requests: queue.Queue[_WriteRequest | None] = queue.Queue(maxsize=max_queue_size)
+        self._outcomes: queue.SimpleQueue[WriteOutcome] = queue.SimpleQueue()
+        self._max_batch_size = max(max_batch_size, 1)
+        # Held while writing a batch, so that the thread can be paused
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="dag-parsing-result-writer", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit(self, key: Any, write: Callable[..., None]) -> None:
+        """
+        Queue a parsing result to be written.
+
+        :param key: Key identifying the result in its outcome.
+        :param write: Callable writing the result with the ``session`` keyword argument.
+        """
+        self._requests.put(_WriteRequest(key, write))
+        Stats.gauge("dag_processing.parsing_result_queue_depth", self._requests.qsize())
+
+    def get_outcomes(self) -> list[WriteOutcome]:
+        """Return the outcomes of the results written since the last call."""
+        outcomes = []
+        while True:
+            try:
+                outcomes.append(self._outcomes.get_nowait())
+            except queue.Empty:
+                return outcomes
+
+    @contextmanager
+    def paused(self) -> Generator[None, None, None]:
+        """
+        Keep the thread from writing, waiting for the batch being written to be written.
+
+        Processes must only be forked while the thread is paused: locks held by the thread when forking,
+        e.g. those of the database connection pool or of logging handlers, would stay locked in the child.
+        """
+        with self._write_lock:
+            yield
+
+    def stop(self) -> None:
+        """Write the results queued so far, then stop the thread."""
+        if self._thread.is_alive():
+            self._requests.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._requests.get()]
+            while len(batch) < self._max_batch_size and batch[-1] is not None:
+                try:
+                    batch.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is None
+            if stopping:
+                batch.pop()
+            if batch:
+                with self._write_lock, Stats.timer("dag_processing.parsing_result_write_duration"):
+                    self._write_batch(batch)
+            Stats.gauge("dag_processing.parsing_result_queue_depth", self._requests.qsize())
+            if stopping:
+                return
+
+    def _write_batch(self, batch: list[_WriteRequest]) -> None:
+        try:
+            self._write(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                self._outcomes.put(WriteOutcome(batch[0].key, e))
+                return
+            log.warning(
+                "Failed to write a batch of %d parsing results, writing them one by one",
+                len(batch),
+                exc_info=True,
+            )
+            for request in batch:
+                try:
+                    self._write([request])
+                except Exception as error:
+                    self._outcomes.put(WriteOutcome(request.key, error))
+                else:
+                    self._outcomes.put(WriteOutcome(request.key, None))
+        else:
+            for request in batch:
+                self._outcomes.put(WriteOutcome(request.key, None))
+
+    def _write(self, batch: list[_WriteRequest]) -> None:
+        with create_session() as session:
+            transaction = session.begin()
+            for request in batch:
+                request.write(session=session)
+                # Writes retried on database errors roll back the whole transaction, including the results
+                # already written by the batch, which must then be written again.
+                if len(batch) > 1 and session.get_transaction() is not transaction:
+                    raise _TransactionRolledBack()
@@ -43,7 +43,7 @@ from airflow._shared.observability.metrics.dual_stats_manager import DualStatsMa
 from airflow._shared.observability.metrics.stats import Stats
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.execution_api.datamodels.taskinstance import DagRun as DRDataModel, TIRunContext
-from airflow.assets.evaluation import AssetEvaluator
+from airflow.assets.evaluation import AssetConditionIndex, AssetEvaluator
 from airflow.callbacks.callback_requests import (
     DagCallbackRequest,
     EmailRequest,
@@ -77,7 +77,8 @@ from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagbag import DBDagBag
 from airflow.models.dagbundle import DagBundleModel
-from airflow.models.dagrun import DagRun
+from airflow.models.dagrun import DagRun, UnmetDependenciesCache
+from airflow.models.dagrun_state_count import DagRunStateCount
 from airflow.models.dagwarning import DagWarning, DagWarningType
 from airflow.models.pool import normalize_pool_name_for_stats
 from airflow.models.serialized_dag import SerializedDagModel
@@ -127,6 +128,16 @@ DM = DagModel
 TASK_STUCK_IN_QUEUED_RESCHEDULE_EVENT = "stuck in queued reschedule"
 """:meta private:"""
 
+DAG_RUN_STATE_COUNT_REFRESH_OVERLAP = timedelta(seconds=60)
+"""
+How far back each refresh of the Dag run state counts starts.
+
+Dag runs updated in transactions committed after a refresh started, but before it finished, are
+only visible to the next refresh; going back this far keeps them from being missed.
+
+:meta private:
+"""
+
 
 def _eager_load_dag_run_for_validation() -> tuple[LoaderOption, LoaderOption]:
     """
@@ -307,6 +318,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self._log = log
 
         self.scheduler_dag_bag = DBDagBag(load_op_links=False)
+        self._asset_condition_index = AssetConditionIndex()
+        self._unmet_dependencies_cache = UnmetDependenciesCache()
+        self._dag_run_state_counts_refreshed_at: datetime | None = None
 
     @provide_session
     def heartbeat_callback(self, session: Session = NEW_SESSION) -> None:
@@ -1575,12 +1589,22 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         # Check on start up, then every configured interval
         self.adopt_or_reset_orphaned_tasks()
+        self._reconcile_dag_run_state_counts()
 
         timers.call_regular_interval(
             conf.getfloat("scheduler", "orphaned_tasks_check_interval", fallback=300.0),
             self.adopt_or_reset_orphaned_tasks,
         )
 
+        timers.call_regular_interval(
+            conf.getfloat("scheduler", "dag_run_state_count_refresh_interval", fallback=10.0),
+            self._refresh_dag_run_state_counts,
+        )
+        timers.call_regular_interval(
+            conf.getfloat("scheduler", "dag_run_state_count_reconciliation_interval", fallback=300.0),
+            self._reconcile_dag_run_state_counts,
+        )
+
         timers.call_regular_interval(
             conf.getfloat("scheduler", "trigger_timeout_check_interval", fallback=15.0),
             self.check_trigger_timeouts,
@@ -1891,7 +1915,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         """Find Dag Models needing DagRuns and Create Dag Runs with retries in case of OperationalError."""
         partition_dag_ids: set[str] = self._create_dagruns_for_partitioned_asset_dags(session)
 
-        query, triggered_date_by_dag = DagModel.dags_needing_dagruns(session)
+        query, triggered_date_by_dag = DagModel.dags_needing_dagruns(
+            session, asset_condition_index=self._asset_condition_index
+        )
         all_dags_needing_dag_runs = set(query.all())
         asset_triggered_dags = [d for d in all_dags_needing_dag_runs if d.dag_id in triggered_date_by_dag]
         non_asset_dags = {
@@ -2434,7 +2460,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         dag_run.scheduled_by_job_id = self.job.id
 
         # TODO[HA]: Rename update_state -> schedule_dag_run, ?? something else?
-        schedulable_tis, callback_to_run = dag_run.update_state(session=session, execute_callbacks=False)
+        schedulable_tis, callback_to_run = dag_run.update_state(
+            session=session,
+            execute_callbacks=False,
+            unmet_dependencies_cache=self._unmet_dependencies_cache,
+        )
 
         if dag_run.state in State.finished_dr_states and dag_run.run_type in (
             DagRunType.SCHEDULED,
@@ -2728,6 +2758,25 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
             self.previous_ti_metrics[state] = ti_metrics
 
+    @provide_session
+    def _reconcile_dag_run_state_counts(self, session: Session = NEW_SESSION) -> None:
+        """Recount the Dag runs in each state of all Dags, including Dags whose runs were deleted."""
+        refreshed_at = timezone.utcnow()
+        DagRunStateCount.refresh(session=session)
+        self._dag_run_state_counts_refreshed_at = refreshed_at
+
+    @provide_session
+    def _refresh_dag_run_state_counts(self, session: Session = NEW_SESSION) -> None:
+        """Recount the Dag runs in each state of the Dags with runs updated since the last refresh."""
+        if self._dag_run_state_counts_refreshed_at is None:
+            self._reconcile_dag_run_state_counts(session=session)
+            return
+        refreshed_at = timezone.utcnow()
+        DagRunStateCount.refresh_updated_since(
+            self._dag_run_state_counts_refreshed_at - DAG_RUN_STATE_COUNT_REFRESH_OVERLAP, session=session
+        )
+        self._dag_run_state_counts_refreshed_at = refreshed_at
+
     @provide_session
     def _emit_running_dags_metric(self, session: Session = NEW_SESSION) -> None:
         stmt = select(func.count()).select_from(DagRun).where(DagRun.state == DagRunState.RUNNING)
@@ -0,0 +1,76 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add dag_run_state_count table.
+
+Revision ID: 88c8337ef514
+Revises: 9fabad868fdb
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.migrations.db_types import StringID
+from airflow.utils.sqlalchemy import UtcDateTime
+
+# revision identifiers, used by Alembic.
+revision = "88c8337ef514"
+down_revision = "9fabad868fdb"
+branch_labels = None
+depends_on = None
+airflow_version = "3.3.0"
+
+# Start of the hour each run started in, or became due in if it has not started yet, per dialect.
+_BUCKETS = {
+    "postgresql": "date_trunc('hour', COALESCE(start_date, run_after))",
+    "mysql": "DATE_FORMAT(COALESCE(start_date, run_after), '%Y-%m-%d %H:00:00')",
+    "sqlite": "strftime('%Y-%m-%d %H:00:00', COALESCE(start_date, run_after))",
+}
+
+
+def upgrade():
+    """Add dag_run_state_count table, filled with the current counts, and index dag_run.updated_at."""
+    op.create_table(
+        "dag_run_state_count",
+        sa.Column("dag_id", StringID(), nullable=False),
+        sa.Column("state", sa.String(50), nullable=False),
+        sa.Column("bucket", UtcDateTime(), nullable=False),
+        sa.Column("run_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", UtcDateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("dag_id", "state", "bucket", name=op.f("dag_run_state_count_pkey")),
+    )
+    bucket = _BUCKETS[op.get_bind().dialect.name]
+    op.execute(
+        "INSERT INTO dag_run_state_count (dag_id, state, bucket, run_count, updated_at) "
+        f"SELECT dag_id, state, {bucket}, COUNT(*), CURRENT_TIMESTAMP FROM dag_run "
+        f"WHERE state IS NOT NULL GROUP BY dag_id, state, {bucket}"
+    )
+    with op.batch_alter_table("dag_run", schema=None) as batch_op:
+        batch_op.create_index("idx_dag_run_updated_at", ["updated_at"], unique=False)
+
+
+def downgrade():
+    """Drop dag_run_state_count table and the dag_run.updated_at index."""
+    with op.batch_alter_table("dag_run", schema=None) as batch_op:
+        batch_op.drop_index("idx_dag_run_updated_at")
+    op.drop_table("dag_run_state_count")
@@ -0,0 +1,51 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add id to the log dttm index.
+
+Revision ID: 51a7163a3133
+Revises: 88c8337ef514
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "51a7163a3133"
+down_revision = "88c8337ef514"
+branch_labels = None
+depends_on = None
+airflow_version = "3.3.0"
+
+
+def upgrade():
+    """Index log on (dttm, id), matching the keyset pagination order of the event logs."""
+    with op.batch_alter_table("log", schema=None) as batch_op:
+        batch_op.drop_index("idx_log_dttm")
+        batch_op.create_index("idx_log_dttm", ["dttm", "id"], unique=False)
+
+
+def downgrade():
+    """Index log on dttm only."""
+    with op.batch_alter_table("log", schema=None) as batch_op:
+        batch_op.drop_index("idx_log_dttm")
+        batch_op.create_index("idx_log_dttm", ["dttm"], unique=False)
@@ -0,0 +1,62 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add dag_file_parse_profile table.
+
+Revision ID: 3e1b5c7d9f24
+Revises: 51a7163a3133
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.migrations.db_types import StringID
+from airflow.utils.sqlalchemy import UtcDateTime
+
+# revision identifiers, used by Alembic.
+revision = "3e1b5c7d9f24"
+down_revision = "51a7163a3133"
+branch_labels = None
+depends_on = None
+airflow_version = "3.3.0"
+
+
+def upgrade():
+    """Add dag_file_parse_profile table."""
+    op.create_table(
+        "dag_file_parse_profile",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bundle_name", StringID(), nullable=False),
+        sa.Column("relative_fileloc", sa.String(1024), nullable=False),
+        sa.Column("parsed_at", UtcDateTime(), nullable=False),
+        sa.Column("parse_duration", sa.Float(), nullable=False),
+        sa.Column("profile", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("dag_file_parse_profile_pkey")),
+    )
+    with op.batch_alter_table("dag_file_parse_profile", schema=None) as batch_op:
+        batch_op.create_index("idx_dag_file_parse_profile_bundle_name", ["bundle_name"], unique=False)
+
+
+def downgrade():
+    """Drop dag_file_parse_profile table."""
+    op.drop_table("dag_file_parse_profile")
@@ -0,0 +1,58 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add db_clean_checkpoint table.
+
+Revision ID: 7c2e9a4b1d58
+Revises: 3e1b5c7d9f24
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from airflow.utils.sqlalchemy import UtcDateTime
+
+# revision identifiers, used by Alembic.
+revision = "7c2e9a4b1d58"
+down_revision = "3e1b5c7d9f24"
+branch_labels = None
+depends_on = None
+airflow_version = "3.3.0"
+
+
+def upgrade():
+    """Add db_clean_checkpoint table."""
+    op.create_table(
+        "db_clean_checkpoint",
+        sa.Column("table_name", sa.String(250), nullable=False),
+        sa.Column("archive_table_name", sa.String(250), nullable=True),
+        sa.Column("last_key", sa.Text(), nullable=False),
+        sa.Column("rows_deleted", sa.Integer(), nullable=False),
+        sa.Column("updated_at", UtcDateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name", name=op.f("db_clean_checkpoint_pkey")),
+    )
+
+
+def downgrade():
+    """Drop db_clean_checkpoint table."""
+    op.drop_table("db_clean_checkpoint")
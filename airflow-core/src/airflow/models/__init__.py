@@ -63,10 +63,13 @@ def import_all_models():
     import airflow.models.asset
     import airflow.models.backfill
     import airflow.models.dag_favorite
+    import airflow.models.dag_file_parse_profile
     import airflow.models.dag_version
     import airflow.models.dagbag
     import airflow.models.dagbundle
+    import airflow.models.dagrun_state_count
     import airflow.models.dagwarning
+    import airflow.models.db_clean_checkpoint
     import airflow.models.deadline_alert
     import airflow.models.errors
     import airflow.models.revoked_token
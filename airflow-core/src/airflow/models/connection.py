@@ -563,6 +563,59 @@ class Connection(Base, LoggingMixin):
 
         raise AirflowNotFoundException(f"The conn_id `{conn_id}` isn't defined")
 
+    @classmethod
+    def get_connections_from_secrets(
+        cls, conn_ids: list[str], team_name: str | None = None
+    ) -> dict[str, Connection]:
+        """
+        Get several connections by iterating over all Secret Backends.
+
+        Each backend is asked at once for all the connections not found by the previous ones.
+
+        :param conn_ids: connection ids
+        :param team_name: Team name associated to the task trying to access the connections (if any)
+        :return: connections, keyed by connection id; the connections which are not found are omitted
+        """
+        from airflow.configuration import conf, ensure_secrets_loaded
+
+        if team_name and not conf.getboolean("core", "multi_team"):
+            raise ValueError(
+                "Multi-team mode is not configured in the Airflow environment but the task trying to access the connection belongs to a team"
+            )
+
+        from airflow.sdk import SecretCache
+
+        connections: dict[str, Connection] = {}
+        missing = []
+        for conn_id in dict.fromkeys(conn_ids):
+            # check cache first
+            # enabled only if SecretCache.init() has been called first
+            try:
+                uri = SecretCache.get_connection_uri(conn_id, team_name=team_name)
+                connections[conn_id] = Connection(conn_id=conn_id, uri=uri)
+            except SecretCache.NotPresentException:
+                missing.append(conn_id)
+
+        # iterate over backends if not in cache (or expired)
+        for secrets_backend in ensure_secrets_loaded():
+            if not missing:
+                break
+            try:
+                found = secrets_backend.get_connections(conn_ids=missing, team_name=team_name)
+            except Exception:
+                log.debug(
+                    "Unable to retrieve connections from secrets backend (%s). "
+                    "Checking subsequent secrets backend.",
+                    type(secrets_backend).__name__,
+                )
+                continue
+            for conn_id, conn in found.items():
+                SecretCache.save_connection_uri(conn_id, conn.get_uri(), team_name=team_name)
+            connections.update(found)
+            missing = [conn_id for conn_id in missing if conn_id not in found]
+
+        return connections
+
     def to_dict(self, *, prune_empty: bool = False, validate: bool = True) -> dict[str, Any]:
         """
         Convert Connection to json-serializable dictionary.
@@ -54,6 +54,7 @@ from sqlalchemy.orm import (
 from sqlalchemy.sql import expression
 
 from airflow import settings
+from airflow._shared.observability.metrics.stats import Stats
 from airflow._shared.timezones import timezone
 from airflow.assets.evaluation import AssetEvaluator
 from airflow.configuration import conf as airflow_conf
@@ -79,6 +80,7 @@ if TYPE_CHECKING:
 
     from dateutil.relativedelta import relativedelta
 
+    from airflow.assets.evaluation import AssetConditionIndex
     from airflow.sdk import Context
     from airflow.serialization.definitions.assets import (
         SerializedAsset,
@@ -625,7 +627,12 @@ class DagModel(Base):
         return any_deactivated
 
     @classmethod
-    def dags_needing_dagruns(cls, session: Session) -> tuple[Any, dict[str, datetime]]:
+    def dags_needing_dagruns(
+        cls,
+        session: Session,
+        *,
+        asset_condition_index: AssetConditionIndex | None = None,
+    ) -> tuple[Any, dict[str, datetime]]:
         """
         Return (and lock) a list of Dag objects that are due to create a new DagRun.
 
@@ -637,13 +644,18 @@ class DagModel(Base):
         ``SerializedDagModel`` row are omitted from ``triggered_date_by_dag`` until serialization exists;
         ADRQs are **not** deleted here so the scheduler can re-evaluate on a later run.
 
+        :param session: ORM Session
+        :param asset_condition_index: If given, Dags whose queued assets have not changed since their asset
+            condition was last found unsatisfied are skipped without being loaded or evaluated again.
+
         :meta private:
         """
         from airflow.models.serialized_dag import SerializedDagModel
 
         evaluator = AssetEvaluator(session)
 
-        def dag_ready(dag_id: str, cond: SerializedAssetBase, statuses: dict[UKey, bool]) -> bool:
+        def dag_ready(dag_id: str, cond: SerializedAssetBase, statuses: dict[UKey, bool]) -> bool | None:
+            """Evaluate the asset condition of a Dag, returning None if it could not be evaluated."""
             try:
                 return evaluator.run(cond, statuses)
             except AttributeError:
@@ -651,10 +663,10 @@ class DagModel(Base):
                 # we may be dealing with old version.  In that case,
                 # just wait for the dag to be reserialized.
                 log.warning("Dag '%s' has old serialization; skipping run creation.", dag_id)
-                return False
+                return None
             except Exception:
                 log.exception("Dag '%s' failed to be evaluated; assuming not ready", dag_id)
-                return False
+                return None
 
         # this loads all the ADRQ records.... may need to limit num dags
         adrq_by_dag: dict[str, list[AssetDagRunQueue]] = defaultdict(list)
@@ -682,6 +694,23 @@ class DagModel(Base):
             dag_id: {SerializedAssetUniqueKey.from_asset(adrq.asset): True for adrq in adrqs}
             for dag_id, adrqs in adrq_by_dag.items()
         }
+        asset_expressions: dict[str, Any] = {
+            dag_id: adrqs[0].dag_model.asset_expression for dag_id, adrqs in adrq_by_dag.items()
+        }
+        if asset_condition_index is not None:
+            asset_condition_index.retain(adrq_by_dag)
+            if unchanged := [
+                dag_id
+                for dag_id, statuses in dag_statuses.items()
+                if asset_condition_index.is_known_unsatisfied(
+                    dag_id, expression=asset_expressions[dag_id], queued=statuses
+                )
+            ]:
+                log.debug("Asset condition unchanged and not met for %d Dags", len(unchanged))
+                Stats.incr("scheduler.asset_condition_evaluations_skipped", len(unchanged))
+                for dag_id in unchanged:
+                    del adrq_by_dag[dag_id]
+                    del dag_statuses[dag_id]
         ser_dags = SerializedDagModel.get_latest_serialized_dags(dag_ids=list(dag_statuses), session=session)
         ser_dag_ids = {ser_dag.dag_id for ser_dag in ser_dags}
         if missing_from_serialized := set(adrq_by_dag.keys()) - ser_dag_ids:
@@ -696,12 +725,22 @@ class DagModel(Base):
         for ser_dag in ser_dags:
             dag_id = ser_dag.dag_id
             statuses = dag_statuses[dag_id]
-            ready = dag_ready(dag_id, cond=ser_dag.dag.timetable.asset_condition, statuses=statuses)
+            cond = ser_dag.dag.timetable.asset_condition
+            ready = dag_ready(dag_id, cond=cond, statuses=statuses)
             if not ready:
                 log.debug("Asset condition not met for dag '%s'", dag_id)
+                # A condition which could not be evaluated is evaluated again on the next loop, e.g. once
+                # the Dag is reserialized
+                if asset_condition_index is not None and ready is False:
+                    asset_condition_index.record_unsatisfied(
+                        dag_id, condition=cond, expression=asset_expressions[dag_id], queued=statuses
+                    )
                 del adrq_by_dag[dag_id]
                 del dag_statuses[dag_id]
+            elif asset_condition_index is not None:
+                asset_condition_index.discard(dag_id)
         del dag_statuses
+        del asset_expressions
 
         # triggered dates for asset triggered dags
         triggered_date_by_dag: dict[str, datetime] = {
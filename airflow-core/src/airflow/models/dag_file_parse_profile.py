@@ -0,0 +1,78 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import sqlalchemy as sa
+from sqlalchemy import Float, Index, Integer, String, delete
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airflow._shared.timezones import timezone
+from airflow.models.base import Base, StringID
+from airflow.utils.sqlalchemy import UtcDateTime
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from airflow.dag_processing.profiling import ParseProfile
+
+
+class DagFileParseProfile(Base):
+    """
+    Profile of the last parsing of a Dag file.
+
+    Recorded by the Dag processor when ``[dag_processor] parsing_profile`` is enabled, to find the files
+    that are the slowest to parse and why.
+    """
+
+    __tablename__ = "dag_file_parse_profile"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bundle_name: Mapped[str] = mapped_column(StringID(), nullable=False)
+    relative_fileloc: Mapped[str] = mapped_column(String(1024), nullable=False)
+    parsed_at: Mapped[datetime] = mapped_column(UtcDateTime, nullable=False, default=timezone.utcnow)
+    parse_duration: Mapped[float] = mapped_column(Float, nullable=False)
+    profile: Mapped[dict[str, Any]] = mapped_column(sa.JSON(), nullable=False)
+
+    __table_args__ = (Index("idx_dag_file_parse_profile_bundle_name", bundle_name),)
+
+    @classmethod
+    def replace(
+        cls,
+        *,
+        bundle_name: str,
+        relative_fileloc: str,
+        parse_duration: float,
+        profile: ParseProfile,
+        session: Session,
+    ) -> None:
+        """Replace the profile of a file by the one of its last parsing."""
+        session.execute(
+            delete(cls)
+            .where(cls.bundle_name == bundle_name, cls.relative_fileloc == relative_fileloc)
+            .execution_options(synchronize_session=False)
+        )
+        session.add(
+            cls(
+                bundle_name=bundle_name,
+                relative_fileloc=relative_fileloc,
+                parse_duration=parse_duration,
+                profile=profile.model_dump(mode="json"),
+            )
+        )
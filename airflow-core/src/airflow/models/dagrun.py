@@ -28,6 +28,7 @@ from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast, overload
 from uuid import UUID
 
 import structlog
+from cachetools import LRUCache
 from opentelemetry import context, trace
 from opentelemetry.trace import StatusCode
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
@@ -133,6 +134,63 @@ class TISchedulingDecision(NamedTuple):
     finished_tis: list[TI]
 
 
+def _ti_states_token(tis: Iterable[TI]) -> int:
+    """Return a token that changes whenever any of the given task instances changes state or try."""
+    return hash(
+        frozenset((ti.task_id, ti.map_index, ti.state, ti.try_number, ti.dag_version_id) for ti in tis)
+    )
+
+
+class UnmetDependenciesCache:
+    """
+    Remember which schedulable task instances of a dag run had unmet dependencies in the previous loop.
+
+    The result of evaluating the dependencies of a task instance with default task deps and no
+    ``depends_on_past`` only depends on the states of the task instances of its own dag run. As long as
+    none of those changed since the last evaluation, as told by the states token of the run, the scheduler
+    can reuse the negative result instead of evaluating the dependencies again.
+
+    :param maxsize: Maximum number of dag runs to remember.
+
+    :meta private:
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._entries: LRUCache[int, tuple[int, frozenset[TaskInstanceKey]]] = LRUCache(maxsize=maxsize)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, dag_run_id: int, token: int) -> frozenset[TaskInstanceKey]:
+        """Return keys of task instances known to have unmet dependencies, if the run did not change."""
+        entry = self._entries.get(dag_run_id)
+        if entry is None or entry[0] != token:
+            return frozenset()
+        return entry[1]
+
+    def record(self, dag_run_id: int, token: int, keys: frozenset[TaskInstanceKey]) -> None:
+        """Record task instances whose dependencies were not met for the given states token."""
+        if keys:
+            self._entries[dag_run_id] = (token, keys)
+        else:
+            self.discard(dag_run_id)
+
+    def discard(self, dag_run_id: int) -> None:
+        self._entries.pop(dag_run_id, None)
+
+    @staticmethod
+    def is_cacheable(ti: TI) -> bool:
+        """Whether the dependencies of the task instance only depend on task instance states of its run."""
+        from airflow.serialization.definitions.baseoperator import DEFAULT_OPERATOR_DEPS
+
+        return (
+            ti.state is None
+            and ti.task is not None
+            and not ti.task.depends_on_past
+            and ti.task.deps == DEFAULT_OPERATOR_DEPS
+        )
+
+
 def _default_run_after(ctx):
     params = ctx.get_current_parameters()
     return params["data_interval_end"] or params["logical_date"] or timezone.utcnow()
@@ -245,6 +303,7 @@ class DagRun(Base, LoggingMixin):
         UniqueConstraint("dag_id", "logical_date", name="dag_run_dag_id_logical_date_key"),
         Index("idx_dag_run_dag_id", dag_id),
         Index("idx_dag_run_run_after", run_after),
+        Index("idx_dag_run_updated_at", updated_at),
         Index(
             "idx_dag_run_running_dags",
             "state",
@@ -313,6 +372,11 @@ class DagRun(Base, LoggingMixin):
         "max_dagruns_per_loop_to_schedule",
         fallback=20,
     )
+    MAX_TIS_EXPANDED_PER_LOOP = airflow_conf.getint(
+        "scheduler",
+        "max_tis_expanded_per_loop",
+        fallback=10000,
+    )
     _ti_dag_versions = association_proxy("task_instances", "dag_version")
     _tih_dag_versions = association_proxy("task_instances_histories", "dag_version")
 
@@ -396,11 +460,13 @@ class DagRun(Base, LoggingMixin):
     def validate_run_id(self, key: str, run_id: str) -> str | None:
         if not run_id:
             return None
-        if ".." in run_id and not airflow_conf.getboolean("core", "allow_double_dot_in_ids", fallback=False):
+        if ".." in run_id and not airflow_conf.snapshot.getboolean(
+            "core", "allow_double_dot_in_ids", fallback=False
+        ):
             raise ValueError(f"The run_id '{run_id}' must not contain '..' to prevent path traversal")
         if re.match(RUN_ID_REGEX, run_id):
             return run_id
-        regex = airflow_conf.get("scheduler", "allowed_run_id_pattern").strip()
+        regex = airflow_conf.snapshot.get("scheduler", "allowed_run_id_pattern").strip()
         if regex and re.match(regex, run_id):
             return run_id
         raise ValueError(
@@ -1086,7 +1152,11 @@ class DagRun(Base, LoggingMixin):
 
     @provide_session
     def update_state(
-        self, session: Session = NEW_SESSION, execute_callbacks: bool = True
+        self,
+        session: Session = NEW_SESSION,
+        execute_callbacks: bool = True,
+        *,
+        unmet_dependencies_cache: UnmetDependenciesCache | None = None,
     ) -> tuple[list[TI], DagCallbackRequest | None]:
         """
         Determine the overall state of the DagRun based on the state of its TaskInstances.
@@ -1094,6 +1164,8 @@ class DagRun(Base, LoggingMixin):
         :param session: Sqlalchemy ORM Session
         :param execute_callbacks: Should dag callbacks (success/failure, SLA etc.) be invoked
             directly (default: true) or recorded as a pending request in the ``returned_callback`` property
+        :param unmet_dependencies_cache: Cache of task instances with unmet dependencies, kept across
+            scheduler loops to skip re-evaluating them while the run did not change
         :return: Tuple containing tis that can be scheduled in the current loop & `returned_callback` that
             needs to be executed
         """
@@ -1132,7 +1204,9 @@ class DagRun(Base, LoggingMixin):
             extra_tags=self.stats_tags,
         ):
             dag = self.get_dag()
-            info = self.task_instance_scheduling_decisions(session)
+            info = self.task_instance_scheduling_decisions(
+                session, unmet_dependencies_cache=unmet_dependencies_cache
+            )
 
             tis = info.tis
             schedulable_tis = info.schedulable_tis
@@ -1279,7 +1353,12 @@ class DagRun(Base, LoggingMixin):
         return schedulable_tis, callback
 
     @provide_session
-    def task_instance_scheduling_decisions(self, session: Session = NEW_SESSION) -> TISchedulingDecision:
+    def task_instance_scheduling_decisions(
+        self,
+        session: Session = NEW_SESSION,
+        *,
+        unmet_dependencies_cache: UnmetDependenciesCache | None = None,
+    ) -> TISchedulingDecision:
         tis = self.get_task_instances(session=session, state=State.task_states)
         self.log.debug("number of tis tasks for %s: %s task(s)", self, len(tis))
 
@@ -1307,6 +1386,8 @@ class DagRun(Base, LoggingMixin):
                 schedulable_tis,
                 finished_tis,
                 session=session,
+                unmet_dependencies_cache=unmet_dependencies_cache,
+                states_token=_ti_states_token(tis) if unmet_dependencies_cache is not None else None,
             )
 
             # During expansion, we may change some tis into non-schedulable
@@ -1431,14 +1512,23 @@ class DagRun(Base, LoggingMixin):
         schedulable_tis: list[TI],
         finished_tis: list[TI],
         session: Session,
+        unmet_dependencies_cache: UnmetDependenciesCache | None = None,
+        states_token: int | None = None,
     ) -> tuple[list[TI], bool, bool]:
         old_states: dict[TaskInstanceKey, Any] = {}
         ready_tis: list[TI] = []
         changed_tis = False
 
         if not schedulable_tis:
+            if unmet_dependencies_cache is not None:
+                unmet_dependencies_cache.discard(self.id)
             return ready_tis, changed_tis, False
 
+        known_unmet: frozenset[TaskInstanceKey] = frozenset()
+        if unmet_dependencies_cache is not None and states_token is not None:
+            known_unmet = unmet_dependencies_cache.get(self.id, states_token)
+        skipped_evaluations = 0
+
         # If we expand TIs, we need a new list so that we iterate over them too. (We can't alter
         # `schedulable_tis` in place and have the `for` loop pick them up
         additional_tis: list[TI] = []
@@ -1448,6 +1538,10 @@ class DagRun(Base, LoggingMixin):
             finished_tis=finished_tis,
         )
 
+        # Limit how many task instances mapped tasks of this run are expanded into in one loop, so huge
+        # expansions are spread across loops instead of holding up the scheduling of other runs.
+        expansion_budget = self.MAX_TIS_EXPANDED_PER_LOOP or None
+
         def _expand_mapped_task_if_needed(ti: TI) -> Iterable[TI] | None:
             """
             Try to expand the ti, if needed.
@@ -1455,13 +1549,15 @@ class DagRun(Base, LoggingMixin):
             If the ti needs expansion, newly created task instances are
             returned as well as the original ti.
             The original ti is also modified in-place and assigned the
-            ``map_index`` of 0.
+            ``map_index`` of 0, unless the expansion is spread across several
+            loops, in which case it is kept unmapped until the last one.
 
             If the ti does not need expansion, either because the task is not
             mapped, or has already been expanded, *None* is returned.
             """
             from airflow.serialization.definitions.mappedoperator import is_mapped
 
+            nonlocal expansion_budget
             if TYPE_CHECKING:
                 assert ti.task
 
@@ -1474,9 +1570,13 @@ class DagRun(Base, LoggingMixin):
                 # the db references.
                 ti.clear_db_references(session=session)
             try:
-                expanded_tis, _ = TaskMap.expand_mapped_task(ti.task, self.run_id, session=session)
+                expanded_tis, _ = TaskMap.expand_mapped_task(
+                    ti.task, self.run_id, session=session, max_new_tis=expansion_budget
+                )
             except NotMapped:  # Not a mapped task, nothing needed.
                 return None
+            if expansion_budget is not None:
+                expansion_budget = max(expansion_budget - len(expanded_tis), 0)
             if expanded_tis:
                 return expanded_tis
             return ()
@@ -1489,6 +1589,11 @@ class DagRun(Base, LoggingMixin):
             if TYPE_CHECKING:
                 assert isinstance(schedulable.task, Operator)
             old_state = schedulable.state
+            if schedulable.key in known_unmet:
+                # Nothing changed in the run since these dependencies were last found unmet.
+                skipped_evaluations += 1
+                old_states[schedulable.key] = old_state
+                continue
             if not schedulable.are_dependencies_met(session=session, dep_context=dep_context):
                 old_states[schedulable.key] = old_state
                 continue
@@ -1504,15 +1609,26 @@ class DagRun(Base, LoggingMixin):
                 if new_tis is not None:
                     additional_tis.extend(new_tis)
                     expansion_happened = True
+                    # Expansion changes how many tis the task has; recount them when next needed.
+                    dep_context.ti_counts = None
             if new_tis is None and schedulable.state in SCHEDULEABLE_STATES:
                 # It's enough to revise map index once per task id,
                 # checking the map index for each mapped task significantly slows down scheduling
                 if schedulable.task.task_id not in revised_map_index_task_ids:
-                    ready_tis.extend(
+                    revised_tis = list(
                         self._revise_map_indexes_if_mapped(
-                            schedulable.task, dag_version_id=schedulable.dag_version_id, session=session
+                            schedulable.task,
+                            dag_version_id=schedulable.dag_version_id,
+                            session=session,
+                            max_new_tis=expansion_budget,
                         )
                     )
+                    if expansion_budget is not None:
+                        expansion_budget = max(expansion_budget - len(revised_tis), 0)
+                    if revised_tis:
+                        # New tis were created for the task; recount them when next needed.
+                        dep_context.ti_counts = None
+                    ready_tis.extend(revised_tis)
                     revised_map_index_task_ids.add(schedulable.task.task_id)
 
                 # _revise_map_indexes_if_mapped might mark the current task as REMOVED
@@ -1527,6 +1643,23 @@ class DagRun(Base, LoggingMixin):
             fresh_tis = session.scalars(select(TI).where(tis_filter)).all()
             changed_tis = any(ti.state != old_states[ti.key] for ti in fresh_tis)
 
+        if unmet_dependencies_cache is not None and states_token is not None:
+            if skipped_evaluations:
+                Stats.incr("scheduler.dependency_evaluations_skipped", skipped_evaluations)
+            if expansion_happened or changed_tis or dep_context.have_changed_ti_states:
+                # The states token no longer describes the run, evaluate everything again next time.
+                unmet_dependencies_cache.discard(self.id)
+            else:
+                unmet_dependencies_cache.record(
+                    self.id,
+                    states_token,
+                    frozenset(
+                        ti.key
+                        for ti in schedulable_tis
+                        if ti.key in old_states and UnmetDependenciesCache.is_cacheable(ti)
+                    ),
+                )
+
         return ready_tis, changed_tis, expansion_happened
 
     def _are_premature_tis(
@@ -1891,7 +2024,12 @@ class DagRun(Base, LoggingMixin):
             session.rollback()
 
     def _revise_map_indexes_if_mapped(
-        self, task: Operator, *, dag_version_id: UUID | None, session: Session
+        self,
+        task: Operator,
+        *,
+        dag_version_id: UUID | None,
+        session: Session,
+        max_new_tis: int | None = None,
     ) -> Iterator[TI]:
         """
         Check if task increased or reduced in length and handle appropriately.
@@ -1900,10 +2038,13 @@ class DagRun(Base, LoggingMixin):
         possible. Expansion only happens if all upstreams are ready; otherwise
         we delay expansion to the "last resort". See comments at the call site
         for more details.
+
+        While the unfinished unmapped task instance still exists, at most
+        ``max_new_tis`` task instances are created, and the unmapped one is
+        kept until the expansion is complete.
         """
         from airflow.models.expandinput import NotFullyPopulated
         from airflow.serialization.definitions.mappedoperator import get_mapped_ti_count
-        from airflow.settings import task_instance_mutation_hook
 
         try:
             total_length = get_mapped_ti_count(task, self.run_id, session=session)
@@ -1912,16 +2053,30 @@ class DagRun(Base, LoggingMixin):
         except NotFullyPopulated:
             return  # Upstreams not ready, don't need to revise this yet.
 
-        query = session.scalars(
-            select(TI.map_index).where(
-                TI.dag_id == self.dag_id,
-                TI.task_id == task.task_id,
-                TI.run_id == self.run_id,
+        existing_states: dict[int, str | None] = {
+            map_index: state
+            for map_index, state in session.execute(
+                select(TI.map_index, TI.state).where(
+                    TI.dag_id == self.dag_id,
+                    TI.task_id == task.task_id,
+                    TI.run_id == self.run_id,
+                )
             )
-        )
-        existing_indexes = set(query)
+        }
+        existing_indexes = set(existing_states)
 
         removed_indexes = existing_indexes.difference(range(total_length))
+        missing_indexes = [index for index in range(total_length) if index not in existing_indexes]
+        if (
+            max_new_tis is not None
+            and len(missing_indexes) > max_new_tis
+            and -1 in existing_indexes
+            and existing_states[-1] in State.unfinished
+        ):
+            # Expansion is spread over several loops; keep the unmapped task instance until it's done.
+            removed_indexes.discard(-1)
+            missing_indexes = missing_indexes[:max_new_tis]
+
         if removed_indexes:
             session.execute(
                 update(TI)
@@ -1935,16 +2090,18 @@ class DagRun(Base, LoggingMixin):
             )
             session.flush()
 
-        for index in range(total_length):
-            if index in existing_indexes:
-                continue
-            ti = TI(task, run_id=self.run_id, map_index=index, state=None, dag_version_id=dag_version_id)
-            self.log.debug("Expanding TIs upserted %s", ti)
-            task_instance_mutation_hook(ti)
-            ti = session.merge(ti)
-            ti.refresh_from_task(task)
-            session.flush()
-            yield ti
+        # Create the missing task instances one contiguous range of map indexes at a time.
+        for _, group in itertools.groupby(enumerate(missing_indexes), key=lambda item: item[1] - item[0]):
+            indexes = [index for _, index in group]
+            yield from TaskMap.create_mapped_task_instances(
+                task,
+                self.run_id,
+                range(indexes[0], indexes[-1] + 1),
+                state=None,
+                dag_version_id=dag_version_id,
+                dag_run=self,
+                session=session,
+            )
 
     @classmethod
     @provide_session
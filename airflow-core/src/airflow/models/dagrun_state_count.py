@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Integer, String, delete, func, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airflow._shared.timezones import timezone
+from airflow.models.base import Base, StringID
+from airflow.models.dagrun import DagRun
+from airflow.utils.retries import retry_db_transaction
+from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql import ColumnElement
+
+
+def _hour_bucket(column: ColumnElement, dialect: str | None) -> ColumnElement:
+    """Return a dialect-specific expression truncating a datetime column to the start of its hour."""
+    if dialect == "postgresql":
+        return func.date_trunc("hour", column)
+    if dialect == "mysql":
+        return func.date_format(column, "%Y-%m-%d %H:00:00")
+    return func.strftime("%Y-%m-%d %H:00:00", column)
+
+
+def _to_bucket(value: datetime | str) -> datetime:
+    # MySQL and SQLite return the truncated datetime as a string
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _build_upsert_stmt(dialect: str | None) -> Any:
+    """Return a dialect-specific INSERT ... ON CONFLICT UPDATE statement replacing the counts."""
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        stmt = pg_insert(DagRunStateCount)
+        return stmt.on_conflict_do_update(
+            index_elements=["dag_id", "state", "bucket"],
+            set_={"run_count": stmt.excluded.run_count, "updated_at": stmt.excluded.updated_at},
+        )
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(DagRunStateCount)
+        return stmt.on_duplicate_key_update(
+            run_count=stmt.inserted.run_count, updated_at=stmt.inserted.updated_at
+        )
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    stmt = sqlite_insert(DagRunStateCount)
+    return stmt.on_conflict_do_update(
+        index_elements=["dag_id", "state", "bucket"],
+        set_={"run_count": stmt.excluded.run_count, "updated_at": stmt.excluded.updated_at},
+    )
+
+
+class DagRunStateCount(Base):
+    """
+    Number of Dag runs of each Dag in each state, per hour.
+
+    The counts are maintained by the scheduler so that Dag statistics do not need to count the runs of
+    all Dags on every request. The counts of Dags whose runs were updated are refreshed shortly after,
+    and all counts are periodically reconciled, which also accounts for deleted runs.
+
+    Runs are counted in the hour they started in, or became due in if they have not started yet. The
+    public Dag stats add up all the hours, and the dashboard's historical metrics the hours of the
+    requested time range. The dashboard Dag stats, based on the latest run of each Dag rather than on
+    numbers of runs, still query the runs.
+    """
+
+    __tablename__ = "dag_run_state_count"
+
+    dag_id: Mapped[str] = mapped_column(StringID(), primary_key=True)
+    state: Mapped[str] = mapped_column(String(50), primary_key=True)
+    bucket: Mapped[datetime] = mapped_column(UtcDateTime, primary_key=True)
+    run_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(UtcDateTime, nullable=False, default=timezone.utcnow)
+
+    @classmethod
+    @provide_session
+    @retry_db_transaction
+    def refresh(cls, dag_ids: Collection[str] | None = None, *, session: Session = NEW_SESSION) -> None:
+        """
+        Recount the Dag runs in each state of the given Dags, or of all Dags.
+
+        :param dag_ids: Optional. The Dags to recount; all Dags are recounted if not provided.
+        :param session: ORM Session
+        """
+        dag_id_column = DagRun.__table__.c.dag_id
+        state_column = DagRun.__table__.c.state
+        bucket_column = _hour_bucket(
+            func.coalesce(DagRun.__table__.c.start_date, DagRun.__table__.c.run_after),
+            get_dialect_name(session),
+        )
+        counts_query = (
+            select(dag_id_column, state_column, bucket_column, func.count())
+            .where(state_column.is_not(None))
+            .group_by(dag_id_column, state_column, bucket_column)
+        )
+        stale_counts_query = delete(cls)
+        if dag_ids is not None:
+            if not dag_ids:
+                return
+            counts_query = counts_query.where(dag_id_column.in_(dag_ids))
+            stale_counts_query = stale_counts_query.where(cls.dag_id.in_(dag_ids))
+
+        refreshed_at = timezone.utcnow()
+        counts = [
+            {
+                "dag_id": dag_id,
+                "state": state,
+                "bucket": _to_bucket(bucket),
+                "run_count": run_count,
+                "updated_at": refreshed_at,
+            }
+            for dag_id, state, bucket, run_count in session.execute(counts_query)
+        ]
+        if counts:
+            session.execute(_build_upsert_stmt(get_dialect_name(session)), counts)
+        # Counts not written above are for states and hours without runs anymore.
+        session.execute(
+            stale_counts_query.where(cls.updated_at < refreshed_at).execution_options(
+                synchronize_session=False
+            )
+        )
+        session.commit()
+
+    @classmethod
+    @provide_session
+    def refresh_updated_since(cls, since: datetime, *, session: Session = NEW_SESSION) -> None:
+        """
+        Recount the Dag runs in each state of the Dags having runs updated since the given time.
+
+        :param since: Dags with runs created or updated from this time on are recounted.
+        :param session: ORM Session
+        """
+        dag_ids = session.scalars(select(DagRun.dag_id).where(DagRun.updated_at >= since).distinct()).all()
+        cls.refresh(dag_ids, session=session)
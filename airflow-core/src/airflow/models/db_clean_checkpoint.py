@@ -0,0 +1,44 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airflow.models.base import Base
+from airflow.utils.sqlalchemy import UtcDateTime
+
+
+class DbCleanCheckpoint(Base):
+    """
+    Progress of a batched ``airflow db clean`` of a table.
+
+    Saved with each batch, so that an interrupted cleanup can be resumed after the last deleted row.
+    """
+
+    __tablename__ = "db_clean_checkpoint"
+
+    table_name: Mapped[str] = mapped_column(String(250), primary_key=True)
+    archive_table_name: Mapped[str | None] = mapped_column(String(250), nullable=True)
+    last_key: Mapped[str] = mapped_column(Text, nullable=False)
+    """Primary key of the last deleted row, as a JSON list."""
+    rows_deleted: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(UtcDateTime, nullable=False)
@@ -67,7 +67,7 @@ class Log(Base):
     )
 
     __table_args__ = (
-        Index("idx_log_dttm", dttm),
+        Index("idx_log_dttm", dttm, id),
         Index("idx_log_event", event),
         Index("idx_log_task_instance", dag_id, task_id, run_id, map_index, try_number),
     )
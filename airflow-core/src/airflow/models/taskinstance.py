@@ -1435,7 +1435,6 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
         outlet_events: list[dict[str, Any]],
         session: Session = NEW_SESSION,
     ) -> None:
-        print(task_outlets, outlet_events)
         from airflow.serialization.definitions.assets import (
             SerializedAsset,
             SerializedAssetNameRef,
@@ -1479,6 +1478,7 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
             if "source_alias_name" not in event
         }
 
+        asset_changes: list[tuple[AssetModel, dict | None]] = []
         for key in asset_keys:
             try:
                 am = asset_models[key]
@@ -1490,13 +1490,7 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
                 )
                 continue
             ti.log.debug("register event for asset %s", am)
-            asset_manager.register_asset_change(
-                task_instance=ti,
-                asset=am,
-                extra=asset_event_extras.get(key),
-                partition_key=partition_key,
-                session=session,
-            )
+            asset_changes.append((am, asset_event_extras.get(key)))
 
         if asset_name_refs:
             asset_models_by_name = {key.name: am for key, am in asset_models.items()}
@@ -1510,13 +1504,7 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
                     )
                     continue
                 ti.log.debug("register event for asset name ref %s", am)
-                asset_manager.register_asset_change(
-                    task_instance=ti,
-                    asset=am,
-                    extra=asset_event_extras_by_name.get(nref.name),
-                    partition_key=partition_key,
-                    session=session,
-                )
+                asset_changes.append((am, asset_event_extras_by_name.get(nref.name)))
         if asset_uri_refs:
             asset_models_by_uri = {key.uri: am for key, am in asset_models.items()}
             asset_event_extras_by_uri = {key.uri: extra for key, extra in asset_event_extras.items()}
@@ -1529,13 +1517,14 @@ class TaskInstance(Base, LoggingMixin, BaseWorkload):
                     )
                     continue
                 ti.log.debug("register event for asset uri ref %s", am)
-                asset_manager.register_asset_change(
-                    task_instance=ti,
-                    asset=am,
-                    extra=asset_event_extras_by_uri.get(uref.uri),
-                    partition_key=partition_key,
-                    session=session,
-                )
+                asset_changes.append((am, asset_event_extras_by_uri.get(uref.uri)))
+
+        asset_manager.register_asset_changes(
+            task_instance=ti,
+            asset_changes=asset_changes,
+            partition_key=partition_key,
+            session=session,
+        )
 
         def _asset_event_extras_from_aliases() -> dict[tuple[SerializedAssetUniqueKey, str, str], set[str]]:
             d = defaultdict(set)
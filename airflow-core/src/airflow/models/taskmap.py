@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import collections.abc
 import enum
-from collections.abc import Collection, Iterable, Sequence
+from collections.abc import Collection, Sequence
 from typing import TYPE_CHECKING, Any
 
 from opentelemetry import trace
@@ -36,8 +36,11 @@ from airflow.utils.sqlalchemy import ExtendedJSON, with_row_locks
 from airflow.utils.state import State, TaskInstanceState
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from sqlalchemy.orm import Session
 
+    from airflow.models.dagrun import DagRun
     from airflow.models.taskinstance import TaskInstance
     from airflow.serialization.definitions.mappedoperator import Operator
 tracer = trace.get_tracer(__name__)
@@ -132,10 +135,14 @@ class TaskMap(TaskInstanceDependencies):
         run_id: str,
         *,
         session: Session,
+        max_new_tis: int | None = None,
     ) -> tuple[Sequence[TaskInstance], int]:
         """
         Create the mapped task instances for mapped task.
 
+        If more than ``max_new_tis`` task instances are missing, only that many are created and the
+        unmapped task instance is kept, so the expansion carries on the next time this is called.
+
         :raise NotMapped: If this task does not need expansion.
         :return: The newly created mapped task instances (if any) in ascending
             order by map index, and the maximum map index value.
@@ -179,6 +186,23 @@ class TaskMap(TaskInstanceDependencies):
 
         all_expanded_tis: list[TaskInstance] = []
 
+        if unmapped_ti and total_length and max_new_tis is not None:
+            current_max_mapping = cls._get_max_map_index(task, run_id, session=session) or 0
+            if total_length - 1 - current_max_mapping > max_new_tis:
+                # Too many task instances to create at once. Create the next batch only, and keep
+                # the unfinished unmapped task instance so the run cannot complete before the rest.
+                start = current_max_mapping + 1
+                expanded_tis = cls.create_mapped_task_instances(
+                    task,
+                    run_id,
+                    range(start, start + max_new_tis),
+                    state=unmapped_ti.state,
+                    dag_version_id=unmapped_ti.dag_version_id,
+                    dag_run=unmapped_ti.dag_run,
+                    session=session,
+                )
+                return expanded_tis, total_length - 1
+
         if unmapped_ti:
             if TYPE_CHECKING:
                 assert task.dag is None
@@ -223,19 +247,10 @@ class TaskMap(TaskInstanceDependencies):
 
         if total_length is None or total_length < 1:
             # Nothing to fixup.
-            indexes_to_map: Iterable[int] = ()
+            indexes_to_map = range(0)
         else:
             # Only create "missing" ones.
-            current_max_mapping = (
-                session.scalar(
-                    select(func.max(TaskInstance.map_index)).where(
-                        TaskInstance.dag_id == task.dag_id,
-                        TaskInstance.task_id == task.task_id,
-                        TaskInstance.run_id == run_id,
-                    )
-                )
-                or 0
-            )
+            current_max_mapping = cls._get_max_map_index(task, run_id, session=session) or 0
             indexes_to_map = range(current_max_mapping + 1, total_length)
 
         if unmapped_ti:
@@ -257,21 +272,20 @@ class TaskMap(TaskInstanceDependencies):
                 )
             )
 
-        for index in indexes_to_map:
-            # TODO: Make more efficient with bulk_insert_mappings/bulk_save_mappings.
-            ti = TaskInstance(
-                task,
-                run_id=run_id,
-                map_index=index,
-                state=state,
-                dag_version_id=dag_version_id,
+        if indexes_to_map:
+            if TYPE_CHECKING:
+                assert dr
+            all_expanded_tis.extend(
+                cls.create_mapped_task_instances(
+                    task,
+                    run_id,
+                    indexes_to_map,
+                    state=state,
+                    dag_version_id=dag_version_id,
+                    dag_run=dr,
+                    session=session,
+                )
             )
-            task.log.debug("Expanding TIs upserted %s", ti)
-            task_instance_mutation_hook(ti)
-            ti = session.merge(ti)
-            ti.context_carrier = new_task_run_carrier(dr.context_carrier)
-            ti.refresh_from_task(task)  # session.merge() loses task information.
-            all_expanded_tis.append(ti)
 
         # Coerce the None case to 0 -- these two are almost treated identically,
         # except the unmapped ti (if exists) is marked to different states.
@@ -290,3 +304,110 @@ class TaskMap(TaskInstanceDependencies):
             ti.state = TaskInstanceState.REMOVED
         session.flush()
         return all_expanded_tis, total_expanded_ti_count - 1
+
+    @classmethod
+    def create_mapped_task_instances(
+        cls,
+        task: Operator,
+        run_id: str,
+        map_indexes: range,
+        *,
+        state: str | None,
+        dag_version_id: UUID | None,
+        dag_run: DagRun,
+        session: Session,
+    ) -> list[TaskInstance]:
+        """
+        Create the task instances of a mapped task for the given map indexes.
+
+        Unless a task instance mutation hook is configured, which needs to see each task instance
+        before it is written, the rows are inserted in bulk and then loaded back with a single query.
+
+        :return: The created task instances, in ascending order by map index.
+
+        :meta private:
+        """
+        from airflow.models.taskinstance import TaskInstance
+        from airflow.settings import task_instance_mutation_hook
+        from airflow.task.priority_strategy import (
+            get_airflow_priority_weight_strategies,
+            validate_and_load_priority_weight_strategy,
+        )
+
+        if not map_indexes:
+            return []
+
+        if getattr(task_instance_mutation_hook, "is_noop", False):
+            weight_rule = task.weight_rule
+            if not hasattr(weight_rule, "get_weight"):
+                weight_rule = validate_and_load_priority_weight_strategy(weight_rule)
+            if type(weight_rule) in get_airflow_priority_weight_strategies().values():
+                # Built-in strategies weigh all task instances of a task the same, only the map
+                # index and the trace context differ from one task instance to the next.
+                template = TaskInstance.insert_mapping(
+                    run_id, task, map_indexes.start, dag_version_id=dag_version_id, dag_run=dag_run
+                )
+                mappings = [
+                    {
+                        **template,
+                        "map_index": map_index,
+                        "state": state,
+                        "context_carrier": new_task_run_carrier(dag_run.context_carrier),
+                    }
+                    for map_index in map_indexes
+                ]
+            else:
+                mappings = [
+                    {
+                        **TaskInstance.insert_mapping(
+                            run_id, task, map_index, dag_version_id=dag_version_id, dag_run=dag_run
+                        ),
+                        "state": state,
+                    }
+                    for map_index in map_indexes
+                ]
+            session.bulk_insert_mappings(TaskInstance.__mapper__, mappings)
+            tis = list(
+                session.scalars(
+                    select(TaskInstance)
+                    .where(
+                        TaskInstance.dag_id == task.dag_id,
+                        TaskInstance.task_id == task.task_id,
+                        TaskInstance.run_id == run_id,
+                        TaskInstance.map_index >= map_indexes.start,
+                        TaskInstance.map_index < map_indexes.stop,
+                    )
+                    .order_by(TaskInstance.map_index)
+                )
+            )
+            for ti in tis:
+                ti.task = task
+            task.log.debug("Expanding TIs created %d task instances", len(tis))
+            return tis
+
+        tis = []
+        for map_index in map_indexes:
+            ti = TaskInstance(
+                task, run_id=run_id, map_index=map_index, state=state, dag_version_id=dag_version_id
+            )
+            task.log.debug("Expanding TIs upserted %s", ti)
+            task_instance_mutation_hook(ti)
+            ti.context_carrier = new_task_run_carrier(dag_run.context_carrier)
+            tis.append(ti)
+        session.add_all(tis)
+        session.flush()
+        for ti in tis:
+            ti.refresh_from_task(task)
+        return tis
+
+    @staticmethod
+    def _get_max_map_index(task: Operator, run_id: str, *, session: Session) -> int | None:
+        from airflow.models.taskinstance import TaskInstance
+
+        return session.scalar(
+            select(func.max(TaskInstance.map_index)).where(
+                TaskInstance.dag_id == task.dag_id,
+                TaskInstance.task_id == task.task_id,
+                TaskInstance.run_id == run_id,
+            )
+        )
@@ -508,6 +508,55 @@ class Variable(Base, LoggingMixin):
         SecretCache.save_variable(key, var_val, team_name=team_name)  # we save None as well
         return var_val
 
+    @staticmethod
+    def get_variables_from_secrets(keys: list[str], team_name: str | None = None) -> dict[str, str]:
+        """
+        Get several Airflow Variables by iterating over all Secret Backends.
+
+        Each backend is asked at once for all the variables not found by the previous ones.
+
+        :param keys: Variable Keys
+        :param team_name: Team name associated to the task trying to access the variables (if any)
+        :return: Variable Values, keyed by Variable Key; the variables which are not found are omitted
+        """
+        if team_name and not conf.getboolean("core", "multi_team"):
+            raise ValueError(
+                "Multi-team mode is not configured in the Airflow environment but the task trying to access the variable belongs to a team"
+            )
+
+        from airflow.sdk import SecretCache
+
+        values: dict[str, str] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            # check cache first
+            # enabled only if SecretCache.init() has been called first
+            try:
+                if (value := SecretCache.get_variable(key, team_name=team_name)) is not None:
+                    values[key] = value
+            except SecretCache.NotPresentException:
+                missing.append(key)
+
+        # iterate over backends if not in cache (or expired)
+        for secrets_backend in ensure_secrets_loaded():
+            if not missing:
+                break
+            try:
+                found = secrets_backend.get_variables(keys=missing, team_name=team_name)
+            except Exception:
+                log.exception(
+                    "Unable to retrieve variables from secrets backend (%s). "
+                    "Checking subsequent secrets backend.",
+                    type(secrets_backend).__name__,
+                )
+                continue
+            values.update(found)
+            missing = [key for key in missing if key not in found]
+
+        for key in keys:
+            SecretCache.save_variable(key, values.get(key), team_name=team_name)  # we save None as well
+        return values
+
     @staticmethod
     @provide_session
     def get_team_name(variable_key: str, session=NEW_SESSION) -> str | None:
@@ -35,6 +35,7 @@ from airflow._shared.plugins_manager import (
     _load_plugins_from_plugin_directory,
     is_valid_plugin,
 )
+from airflow._shared.providers_discovery import get_discovery_manifest_path, load_discovery_manifest
 from airflow.configuration import conf
 
 if TYPE_CHECKING:
@@ -123,7 +124,10 @@ def _get_plugins() -> tuple[list[AirflowPlugin], dict[str, str]]:
                 ignore_file_syntax=ignore_file_syntax,
             )
         )
-        __register_plugins(*_load_entrypoint_plugins())
+        manifest = load_discovery_manifest(get_discovery_manifest_path())
+        __register_plugins(
+            *_load_entrypoint_plugins(manifest.iter_plugin_entry_points() if manifest else None)
+        )
 
         if not settings.LAZY_LOAD_PROVIDERS:
             __register_plugins(*_load_providers_plugins())
@@ -442,16 +442,21 @@ class ProvidersManager(LoggingMixin):
         self._provider_configs: dict[str, dict[str, Any]] = {}
         self._trigger_info_set: set[TriggerInfo] = set()
         self._notification_info_set: set[NotificationInfo] = set()
-        self._provider_schema_validator = _create_provider_info_schema_validator()
-        self._customized_form_fields_schema_validator = (
-            _create_customized_form_field_behaviours_schema_validator()
-        )
         # Set of plugins contained in providers
         self._plugins_set: set[PluginInfo] = set()
         self._init_airflow_core_hooks()
 
         self._runtime_manager = None
 
+    @functools.cached_property
+    def _provider_schema_validator(self):
+        # Created on first use, as importing jsonschema is costly and most processes never need it.
+        return _create_provider_info_schema_validator()
+
+    @functools.cached_property
+    def _customized_form_fields_schema_validator(self):
+        return _create_customized_form_field_behaviours_schema_validator()
+
     def __getattribute__(self, name: str):
         # Hacky but does the trick for now
         runtime_properties = {
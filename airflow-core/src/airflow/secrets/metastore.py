@@ -61,6 +61,30 @@ class MetastoreBackend(BaseSecretsBackend):
             session.expunge(conn)
         return conn
 
+    @provide_session
+    def get_connections(
+        self, conn_ids: list[str], team_name: str | None = None, session: Session = NEW_SESSION
+    ) -> dict[str, Connection]:
+        """
+        Get several Airflow Connections from Metadata DB, with a single query.
+
+        :param conn_ids: Connection IDs
+        :param team_name: Team name associated to the task trying to access the connections (if any)
+        :param session: SQLAlchemy Session
+        :return: Connection Objects, keyed by Connection ID
+        """
+        from airflow.models import Connection
+
+        connections = session.scalars(
+            select(Connection).where(
+                Connection.conn_id.in_(conn_ids),
+                or_(Connection.team_name == team_name, Connection.team_name.is_(None)),
+            )
+        ).all()
+        for conn in connections:
+            session.expunge(conn)
+        return {conn.conn_id: conn for conn in connections}
+
     @provide_session
     def get_variable(
         self, key: str, team_name: str | None = None, session: Session = NEW_SESSION
@@ -84,3 +108,26 @@ class MetastoreBackend(BaseSecretsBackend):
             session.expunge(var_value)
             return var_value.val
         return None
+
+    @provide_session
+    def get_variables(
+        self, keys: list[str], team_name: str | None = None, session: Session = NEW_SESSION
+    ) -> dict[str, str]:
+        """
+        Get several Airflow Variables from Metadata DB, with a single query.
+
+        :param keys: Variable Keys
+        :param team_name: Team name associated to the task trying to access the variables (if any)
+        :param session: SQLAlchemy Session
+        :return: Variable Values, keyed by Variable Key
+        """
+        from airflow.models import Variable
+
+        variables = session.scalars(
+            select(Variable).where(
+                Variable.key.in_(keys), or_(Variable.team_name == team_name, Variable.team_name.is_(None))
+            )
+        ).all()
+        for var in variables:
+            session.expunge(var)
+        return {var.key: var.val for var in variables if var.val is not None}
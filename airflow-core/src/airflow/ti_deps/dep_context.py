@@ -18,9 +18,11 @@
 from __future__ import annotations
 
 import contextlib
+from collections import Counter, defaultdict
 from typing import TYPE_CHECKING
 
 import attr
+from sqlalchemy import func, select
 
 from airflow.exceptions import TaskNotFound
 from airflow.utils.state import State
@@ -67,6 +69,9 @@ class DepContext:
         trigger rule
     :param ignore_ti_state: Ignore the task instance's previous failure/success
     :param finished_tis: A list of all the finished task instances of this run
+    :param finished_ti_state_counts: Number of finished task instances of this run per task id and
+        state, derived from ``finished_tis``
+    :param ti_counts: Number of task instances of this run per task id, regardless of state
     """
 
     deps: set = attr.ib(factory=set)
@@ -80,6 +85,8 @@ class DepContext:
     ignore_ti_state: bool = False
     ignore_unmapped_tasks: bool = False
     finished_tis: list[TaskInstance] | None = None
+    finished_ti_state_counts: dict[str, Counter[str]] | None = None
+    ti_counts: dict[str, int] | None = None
     description: str | None = None
 
     have_changed_ti_states: bool = False
@@ -103,3 +110,38 @@ class DepContext:
         else:
             finished_tis = self.finished_tis
         return finished_tis
+
+    def ensure_finished_ti_state_counts(self, dag_run: DagRun, session: Session) -> dict[str, Counter[str]]:
+        """
+        Count the finished task instances of this run by task id and state.
+
+        This is computed once per context, so evaluating the trigger rule of many task instances of the
+        same run does not iterate over all finished task instances each time.
+
+        :param dag_run: The DagRun for which to count finished tasks
+        :return: A mapping of task id to a counter of the states of its finished task instances
+        """
+        if self.finished_ti_state_counts is None:
+            counts: dict[str, Counter[str]] = defaultdict(Counter)
+            for ti in self.ensure_finished_tis(dag_run, session):
+                counts[ti.task_id][ti.state] += 1
+            self.finished_ti_state_counts = dict(counts)
+        return self.finished_ti_state_counts
+
+    def ensure_ti_counts(self, dag_run: DagRun, session: Session) -> dict[str, int]:
+        """
+        Count all task instances of this run by task id, with a single grouped query.
+
+        :param dag_run: The DagRun for which to count task instances
+        :return: A mapping of task id to the number of its task instances
+        """
+        if self.ti_counts is None:
+            from airflow.models.taskinstance import TaskInstance
+
+            rows = session.execute(
+                select(TaskInstance.task_id, func.count())
+                .where(TaskInstance.dag_id == dag_run.dag_id, TaskInstance.run_id == dag_run.run_id)
+                .group_by(TaskInstance.task_id)
+            )
+            self.ti_counts = {task_id: count for task_id, count in rows}
+        return self.ti_counts
@@ -20,7 +20,7 @@ from __future__ import annotations
 import collections.abc
 import functools
 from collections import Counter
-from collections.abc import Iterator, KeysView, Mapping, Sequence
+from collections.abc import Iterator, KeysView, Mapping
 from typing import TYPE_CHECKING, NamedTuple
 
 from sqlalchemy import and_, func, or_, select
@@ -31,7 +31,6 @@ from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Row
     from sqlalchemy.orm import Session
     from sqlalchemy.sql import ColumnElement
 
@@ -40,7 +39,6 @@ if TYPE_CHECKING:
     from airflow.serialization.definitions.taskgroup import SerializedMappedTaskGroup
     from airflow.ti_deps.dep_context import DepContext
     from airflow.ti_deps.deps.base_ti_dep import TIDepStatus
-    from airflow.typing_compat import Unpack
 
 
 class _UpstreamTIStates(NamedTuple):
@@ -90,6 +88,40 @@ class _UpstreamTIStates(NamedTuple):
             skipped_setup=setup_counter.get(TaskInstanceState.SKIPPED, 0),
         )
 
+    @classmethod
+    def calculate_from_state_counts(
+        cls,
+        state_counts: Mapping[str, Counter[str]],
+        relevant_tasks: Mapping[str, Operator],
+    ) -> _UpstreamTIStates:
+        """
+        Calculate states from per-task counts of finished task instances.
+
+        This gives the same result as :meth:`calculate` when all task instances of the relevant tasks
+        are relevant, but only costs one lookup per relevant task instead of one per task instance.
+
+        :param state_counts: finished task instances of the dag_run counted by task id and state
+        :param relevant_tasks: the upstream tasks to count, by task id
+        """
+        counter: Counter[str] = Counter()
+        setup_counter: Counter[str] = Counter()
+        for task_id, upstream in relevant_tasks.items():
+            if not (task_state_counts := state_counts.get(task_id)):
+                continue
+            counter.update(task_state_counts)
+            if upstream.is_setup:
+                setup_counter.update(task_state_counts)
+        return _UpstreamTIStates(
+            success=counter.get(TaskInstanceState.SUCCESS, 0),
+            skipped=counter.get(TaskInstanceState.SKIPPED, 0),
+            failed=counter.get(TaskInstanceState.FAILED, 0),
+            upstream_failed=counter.get(TaskInstanceState.UPSTREAM_FAILED, 0),
+            removed=counter.get(TaskInstanceState.REMOVED, 0),
+            done=sum(counter.values()),
+            success_setup=setup_counter.get(TaskInstanceState.SUCCESS, 0),
+            skipped_setup=setup_counter.get(TaskInstanceState.SKIPPED, 0),
+        )
+
 
 class TriggerRuleDep(BaseTIDep):
     """Determines if a task's upstream tasks are in a state that allows a given task instance to run."""
@@ -255,6 +287,36 @@ class TriggerRuleDep(BaseTIDep):
                 else:
                     yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index == map_indexes)
 
+        def _calculate_upstream_states(relevant_tasks: Mapping[str, Operator]) -> _UpstreamTIStates:
+            dag_run = ti.get_dagrun(session)
+            # Optimization: If the current task is not in a mapped task group, all tis
+            # of the relevant upstreams count, so use the per-task state counts shared
+            # by all tis of the dag run instead of going through every finished ti.
+            if task.get_closest_mapped_task_group() is None:
+                return _UpstreamTIStates.calculate_from_state_counts(
+                    dep_context.ensure_finished_ti_state_counts(dag_run, session), relevant_tasks
+                )
+            return _UpstreamTIStates.calculate(
+                finished_ti
+                for finished_ti in dep_context.ensure_finished_tis(dag_run, session)
+                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=relevant_tasks.keys())
+            )
+
+        def _count_upstream_tis(relevant_tasks: Mapping[str, Operator]) -> dict[str, int]:
+            """Count the tis of each relevant upstream task the current ti depends on."""
+            # Optimization: If the current task is not in a mapped task group, it
+            # depends on all tis of the upstreams, which are counted once per dag run.
+            if task.get_closest_mapped_task_group() is None:
+                ti_counts = dep_context.ensure_ti_counts(ti.get_dagrun(session), session)
+                return {task_id: ti_counts[task_id] for task_id in relevant_tasks if task_id in ti_counts}
+            rows = session.execute(
+                select(TaskInstance.task_id, func.count(TaskInstance.task_id))
+                .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
+                .where(or_(*_iter_upstream_conditions(relevant_tasks=relevant_tasks)))
+                .group_by(TaskInstance.task_id)
+            )
+            return {task_id: count for task_id, count in rows}
+
         def _evaluate_setup_constraint(
             *, relevant_setups: Mapping[str, Operator]
         ) -> Iterator[tuple[TIDepStatus, bool]]:
@@ -267,12 +329,7 @@ class TriggerRuleDep(BaseTIDep):
                 return
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(relevant_tasks=indirect_setups)
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -286,13 +343,7 @@ class TriggerRuleDep(BaseTIDep):
             if not any(t.get_needs_expansion() for t in indirect_setups.values()):
                 upstream = len(indirect_setups)
             else:
-                task_id_counts = session.execute(
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=indirect_setups)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
-                upstream = sum(count for _, count in task_id_counts)
+                upstream = sum(_count_upstream_tis(relevant_tasks=indirect_setups).values())
 
             new_state = None
             changed = False
@@ -350,12 +401,7 @@ class TriggerRuleDep(BaseTIDep):
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(relevant_tasks=upstream_tasks)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -372,15 +418,9 @@ class TriggerRuleDep(BaseTIDep):
                 upstream = len(upstream_tasks)
                 upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
             else:
-                # The below type annotation is acceptable on SQLA2.1, but not on 2.0
-                task_id_counts: Sequence[Row[Unpack[tuple[str, int]]]] = session.execute(  # type: ignore[type-arg]
-                    select(TaskInstance.task_id, func.count(TaskInstance.task_id))
-                    .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                    .where(or_(*_iter_upstream_conditions(relevant_tasks=upstream_tasks)))
-                    .group_by(TaskInstance.task_id)
-                ).all()
-                upstream = sum(count for _, count in task_id_counts)
-                upstream_setup = sum(c for t, c in task_id_counts if upstream_tasks[t].is_setup)
+                task_id_counts = _count_upstream_tis(relevant_tasks=upstream_tasks)
+                upstream = sum(task_id_counts.values())
+                upstream_setup = sum(c for t, c in task_id_counts.items() if upstream_tasks[t].is_setup)
 
             upstream_done = done >= upstream
 
@@ -642,23 +682,12 @@ class TriggerRuleDep(BaseTIDep):
 
             in_scope_tasks = {tid: task.dag.get_task(tid) for tid in in_scope_ids}
 
-            done = sum(
-                1
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=in_scope_ids)
-            )
+            done = _calculate_upstream_states(relevant_tasks=in_scope_tasks).done
 
             if not any(t.get_needs_expansion() for t in in_scope_tasks.values()):
                 expected = len(in_scope_tasks)
             else:
-                expected = (
-                    session.scalar(
-                        select(func.count(TaskInstance.task_id))
-                        .where(TaskInstance.dag_id == ti.dag_id, TaskInstance.run_id == ti.run_id)
-                        .where(or_(*_iter_upstream_conditions(relevant_tasks=in_scope_tasks)))
-                    )
-                    or 0
-                )
+                expected = sum(_count_upstream_tis(relevant_tasks=in_scope_tasks).values())
 
             if done < expected:
                 trigger_rule_str = getattr(task.trigger_rule, "value", task.trigger_rule)
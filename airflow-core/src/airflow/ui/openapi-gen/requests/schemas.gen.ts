@@ -3284,6 +3284,62 @@ export const $DAGWarningResponse = {
     description: 'DAG Warning serializer for responses.'
 } as const;
 
+export const $DagFileParseProfileResponse = {
+    properties: {
+        bundle_name: {
+            type: 'string',
+            title: 'Bundle Name'
+        },
+        relative_fileloc: {
+            type: 'string',
+            title: 'Relative Fileloc'
+        },
+        parsed_at: {
+            type: 'string',
+            format: 'date-time',
+            title: 'Parsed At'
+        },
+        parse_duration: {
+            type: 'number',
+            title: 'Parse Duration'
+        },
+        import_duration: {
+            type: 'number',
+            title: 'Import Duration'
+        },
+        user_code_duration: {
+            type: 'number',
+            title: 'User Code Duration'
+        },
+        dagbag_duration: {
+            type: 'number',
+            title: 'Dagbag Duration'
+        },
+        serialization_duration: {
+            type: 'number',
+            title: 'Serialization Duration'
+        },
+        imports: {
+            items: {
+                '$ref': '#/components/schemas/ParseImportTimeResponse'
+            },
+            type: 'array',
+            title: 'Imports'
+        },
+        slowest_lines: {
+            items: {
+                '$ref': '#/components/schemas/ParseLineSampleResponse'
+            },
+            type: 'array',
+            title: 'Slowest Lines'
+        }
+    },
+    type: 'object',
+    required: ['bundle_name', 'relative_fileloc', 'parsed_at', 'parse_duration', 'import_duration', 'user_code_duration', 'dagbag_duration', 'serialization_duration', 'imports', 'slowest_lines'],
+    title: 'DagFileParseProfileResponse',
+    description: 'Profile of the last parsing of a DAG file, durations are in seconds.'
+} as const;
+
 export const $DagProcessorInfoResponse = {
     properties: {
         status: {
@@ -3679,14 +3735,46 @@ export const $EventLogCollectionResponse = {
             title: 'Event Logs'
         },
         total_entries: {
-            type: 'integer',
-            title: 'Total Entries'
+            anyOf: [
+                {
+                    type: 'integer'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Total Entries',
+            description: 'Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.'
+        },
+        next_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Next Cursor',
+            description: 'Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.'
+        },
+        previous_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Previous Cursor',
+            description: 'Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.'
         }
     },
     type: 'object',
-    required: ['event_logs', 'total_entries'],
+    required: ['event_logs'],
     title: 'EventLogCollectionResponse',
-    description: 'Event Log Collection Response.'
+    description: 'Event Log Collection Response, supporting both offset and cursor pagination.'
 } as const;
 
 export const $EventLogResponse = {
@@ -4690,6 +4778,44 @@ export const $NewTaskResponse = {
     description: "Lightweight response for new tasks that don't have TaskInstances yet."
 } as const;
 
+export const $ParseImportTimeResponse = {
+    properties: {
+        module: {
+            type: 'string',
+            title: 'Module'
+        },
+        duration: {
+            type: 'number',
+            title: 'Duration'
+        },
+        self_duration: {
+            type: 'number',
+            title: 'Self Duration'
+        }
+    },
+    type: 'object',
+    required: ['module', 'duration', 'self_duration'],
+    title: 'ParseImportTimeResponse',
+    description: 'Time spent importing a module while parsing a DAG file.'
+} as const;
+
+export const $ParseLineSampleResponse = {
+    properties: {
+        location: {
+            type: 'string',
+            title: 'Location'
+        },
+        duration: {
+            type: 'number',
+            title: 'Duration'
+        }
+    },
+    type: 'object',
+    required: ['location', 'duration'],
+    title: 'ParseLineSampleResponse',
+    description: 'Time spent running a line while parsing a DAG file.'
+} as const;
+
 export const $PatchTaskInstanceBody = {
     properties: {
         new_state: {
@@ -7143,14 +7269,46 @@ export const $XComCollectionResponse = {
             title: 'Xcom Entries'
         },
         total_entries: {
-            type: 'integer',
-            title: 'Total Entries'
+            anyOf: [
+                {
+                    type: 'integer'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Total Entries',
+            description: 'Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.'
+        },
+        next_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Next Cursor',
+            description: 'Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.'
+        },
+        previous_cursor: {
+            anyOf: [
+                {
+                    type: 'string'
+                },
+                {
+                    type: 'null'
+                }
+            ],
+            title: 'Previous Cursor',
+            description: 'Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.'
         }
     },
     type: 'object',
-    required: ['xcom_entries', 'total_entries'],
+    required: ['xcom_entries'],
     title: 'XComCollectionResponse',
-    description: 'XCom Collection serializer for responses.'
+    description: 'XCom Collection serializer for responses, supporting both offset and cursor pagination.'
 } as const;
 
 export const $XComCreateBody = {
@@ -818,6 +818,22 @@ export type DAGWarningResponse = {
     dag_display_name: string;
 };
 
+/**
+ * Profile of the last parsing of a DAG file, durations are in seconds.
+ */
+export type DagFileParseProfileResponse = {
+    bundle_name: string;
+    relative_fileloc: string;
+    parsed_at: string;
+    parse_duration: number;
+    import_duration: number;
+    user_code_duration: number;
+    dagbag_duration: number;
+    serialization_duration: number;
+    imports: Array<ParseImportTimeResponse>;
+    slowest_lines: Array<ParseLineSampleResponse>;
+};
+
 /**
  * DagProcessor info serializer for responses.
  */
@@ -943,11 +959,22 @@ export type DryRunBackfillResponse = {
 };
 
 /**
- * Event Log Collection Response.
+ * Event Log Collection Response, supporting both offset and cursor pagination.
  */
 export type EventLogCollectionResponse = {
     event_logs: Array<EventLogResponse>;
-    total_entries: number;
+    /**
+     * Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.
+     */
+    total_entries?: number | null;
+    /**
+     * Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.
+     */
+    next_cursor?: string | null;
+    /**
+     * Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.
+     */
+    previous_cursor?: string | null;
 };
 
 /**
@@ -1198,6 +1225,23 @@ export type NewTaskResponse = {
     task_display_name: string;
 };
 
+/**
+ * Time spent importing a module while parsing a DAG file.
+ */
+export type ParseImportTimeResponse = {
+    module: string;
+    duration: number;
+    self_duration: number;
+};
+
+/**
+ * Time spent running a line while parsing a DAG file.
+ */
+export type ParseLineSampleResponse = {
+    location: string;
+    duration: number;
+};
+
 /**
  * Request body for Clear Task Instances endpoint.
  */
@@ -1735,11 +1779,22 @@ export type VersionInfo = {
 };
 
 /**
- * XCom Collection serializer for responses.
+ * XCom Collection serializer for responses, supporting both offset and cursor pagination.
  */
 export type XComCollectionResponse = {
     xcom_entries: Array<XComResponse>;
-    total_entries: number;
+    /**
+     * Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.
+     */
+    total_entries?: number | null;
+    /**
+     * Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.
+     */
+    next_cursor?: string | null;
+    /**
+     * Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.
+     */
+    previous_cursor?: string | null;
 };
 
 /**
@@ -3065,6 +3120,10 @@ export type GetEventLogResponse = EventLogResponse;
 export type GetEventLogsData = {
     after?: string | null;
     before?: string | null;
+    /**
+     * Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
+     */
+    cursor?: string | null;
     dagId?: string | null;
     /**
      * SQL LIKE expression — use `%` / `_` wildcards (e.g. `%customer_%`). or the pipe `|` operator for OR logic (e.g. `dag1 | dag2`). Regular expressions are **not** supported.
@@ -3742,6 +3801,10 @@ export type DeleteXcomEntryData = {
 export type DeleteXcomEntryResponse = void;
 
 export type GetXcomEntriesData = {
+    /**
+     * Cursor for keyset-based pagination. Pass an empty string for the first page, then use ``next_cursor`` from the response. When ``cursor`` is provided, ``offset`` is ignored.
+     */
+    cursor?: string | null;
     /**
      * SQL LIKE expression — use `%` / `_` wildcards (e.g. `%customer_%`). or the pipe `|` operator for OR logic (e.g. `dag1 | dag2`). Regular expressions are **not** supported.
      *
@@ -3888,6 +3951,12 @@ export type ReparseDagFileData = {
 
 export type ReparseDagFileResponse = unknown;
 
+export type GetDagFileParseProfileData = {
+    fileToken: string;
+};
+
+export type GetDagFileParseProfileResponse = DagFileParseProfileResponse;
+
 export type GetDagVersionData = {
     dagId: string;
     versionNumber: number;
@@ -7047,6 +7116,33 @@ export type $OpenApiTs = {
             };
         };
     };
+    '/api/v2/parseDagFile/{file_token}/profile': {
+        get: {
+            req: GetDagFileParseProfileData;
+            res: {
+                /**
+                 * Successful Response
+                 */
+                200: DagFileParseProfileResponse;
+                /**
+                 * Unauthorized
+                 */
+                401: HTTPExceptionResponse;
+                /**
+                 * Forbidden
+                 */
+                403: HTTPExceptionResponse;
+                /**
+                 * Not Found
+                 */
+                404: HTTPExceptionResponse;
+                /**
+                 * Validation Error
+                 */
+                422: HTTPValidationError;
+            };
+        };
+    };
     '/api/v2/dags/{dag_id}/dagVersions/{version_number}': {
         get: {
             req: GetDagVersionData;
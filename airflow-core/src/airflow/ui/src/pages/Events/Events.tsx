@@ -162,7 +162,7 @@ export const Events = () => {
   const { dagId, runId, taskId } = useParams();
   const [searchParams] = useSearchParams();
   const { setTableURLState, tableURLState } = useTableURLState();
-  const { pagination, sorting } = tableURLState;
+  const { cursor, pagination, sorting } = tableURLState;
   const [sort] = sorting;
   const { onClose, onOpen, open } = useDisclosure();
 
@@ -188,6 +188,7 @@ export const Events = () => {
     {
       after: afterDate,
       before: beforeDate,
+      cursor: cursor ?? "",
       // Use exact match for URL params (dag/run/task context)
       dagId: dagId ?? undefined,
       // Use pattern search for filter inputs (partial matching)
@@ -195,7 +196,6 @@ export const Events = () => {
       eventPrefixPattern: eventTypeFilter ?? undefined,
       limit: pagination.pageSize,
       mapIndex: mapIndexNumber,
-      offset: pagination.pageIndex * pagination.pageSize,
       orderBy,
       ownerPrefixPattern: userFilter ?? undefined,
       runId: runId ?? undefined,
@@ -233,10 +233,11 @@ export const Events = () => {
         isFetching={isFetching}
         isLoading={isLoading}
         modelName="browse:auditLog.columns.event"
+        nextCursor={data?.next_cursor ?? undefined}
         onStateChange={setTableURLState}
+        previousCursor={data?.previous_cursor ?? undefined}
         showRowCountHeading={false}
         skeletonCount={undefined}
-        total={data?.total_entries ?? 0}
       />
     </VStack>
   );
@@ -145,7 +145,7 @@ export const XCom = () => {
   const { dagId = "~", mapIndex = "-1", runId = "~", taskId = "~" } = useParams();
   const { t: translate } = useTranslation(["browse", "common"]);
   const { setTableURLState, tableURLState } = useTableURLState();
-  const { pagination, sorting } = tableURLState;
+  const { cursor, pagination, sorting } = tableURLState;
   const [sort] = sorting;
   const orderBy = sort
     ? [`${sort.desc ? "-" : ""}${sort.id === "task_display_name" ? "task_id" : sort.id}`]
@@ -166,6 +166,7 @@ export const XCom = () => {
   const runAfterLte = searchParams.get(RUN_AFTER_LTE);
 
   const apiParams = {
+    cursor: cursor ?? "",
     dagDisplayNamePrefixPattern: filteredDagDisplayName ?? undefined,
     dagId,
     dagRunId: runId,
@@ -178,7 +179,6 @@ export const XCom = () => {
         : mapIndex === "-1"
           ? undefined
           : parseInt(mapIndex, 10),
-    offset: pagination.pageIndex * pagination.pageSize,
     orderBy,
     runAfterGte: runAfterGte ?? undefined,
     runAfterLte: runAfterLte ?? undefined,
@@ -232,10 +232,11 @@ export const XCom = () => {
         isFetching={isFetching}
         isLoading={isLoading}
         modelName="browse:xcom.title"
+        nextCursor={data?.next_cursor ?? undefined}
         onStateChange={setTableURLState}
+        previousCursor={data?.previous_cursor ?? undefined}
         showRowCountHeading={false}
         skeletonCount={undefined}
-        total={data ? data.total_entries : 0}
       />
     </Box>
   );
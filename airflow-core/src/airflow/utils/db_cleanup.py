@@ -24,30 +24,50 @@ See:
 from __future__ import annotations
 
 import csv
+import json
 import logging
 import os
+import re
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import and_, column, func, inspect, select, table, text
+from sqlalchemy import (
+    Table,
+    and_,
+    column,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal_column,
+    select,
+    table,
+    text,
+)
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import ClauseElement, Executable, tuple_
 
+from airflow._shared.observability.metrics.stats import Stats
 from airflow._shared.timezones import timezone
 from airflow.cli.simple_table import AirflowConsole
 from airflow.configuration import conf
 from airflow.exceptions import AirflowException
+from airflow.models.db_clean_checkpoint import DbCleanCheckpoint
 from airflow.utils.db import reflect_tables
+from airflow.utils.db_partitioning import detach_partitions_before, is_partitioned
 from airflow.utils.helpers import ask_yesno
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.types import DagRunType
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from pendulum import DateTime
-    from sqlalchemy import Select
+    from sqlalchemy import ColumnElement, Select
     from sqlalchemy.orm import Session
 
     from airflow.models import Base
@@ -60,6 +80,8 @@ ARCHIVED_TABLES_FROM_DB_MIGRATIONS = [
     "_xcom_archive"  # Table created by the AF 2 -> 3.0.0 migration when the XComs had pickled values
 ]
 
+BASE_TABLE_ALIAS = "base"
+
 
 @dataclass
 class _TableConfig:
@@ -214,11 +236,198 @@ def _dump_table_to_file(*, target_table: str, file_path: str, export_format: str
         raise AirflowException(f"Export format {export_format} is not supported.")
 
 
+def _archive_table_name(table_name: str, suffix: str = "") -> str:
+    timestamp_str = re.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
+    return f"{ARCHIVE_TABLE_PREFIX}{table_name}__{timestamp_str}{suffix}"
+
+
+def _create_archive_table(
+    *, target_table_name: str, source_table_name: str, query: Select, session: Session
+) -> Table:
+    """Create the archive table from the rows selected by ``query``."""
+    if session.get_bind().dialect.name == "mysql":
+        # MySQL with replication needs this split into two queries, so just do it for all MySQL
+        # ERROR 1786 (HY000): Statement violates GTID consistency: CREATE TABLE ... SELECT.
+        session.execute(text(f"CREATE TABLE {target_table_name} LIKE {source_table_name}"))
+        target_table = reflect_tables([target_table_name], session).tables[target_table_name]
+        insert_stm = target_table.insert().from_select(target_table.c, query)
+        logger.debug("insert statement:\n%s", insert_stm.compile())
+        session.execute(insert_stm)
+    else:
+        stmt = CreateTableAs(target_table_name, query.selectable)
+        logger.debug("ctas query:\n%s", stmt.compile())
+        session.execute(stmt)
+    return reflect_tables([target_table_name], session).tables[target_table_name]
+
+
+def _key_condition(columns: Sequence[ColumnElement], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Select rows whose primary key sorts after ``values``."""
+    if len(columns) == 1:
+        return columns[0] > values[0]
+    return tuple_(*columns) > tuple_(*values)
+
+
+def _keys_in(columns: Sequence[ColumnElement], keys: list[tuple]) -> ColumnElement[bool]:
+    if len(columns) == 1:
+        return columns[0].in_([key[0] for key in keys])
+    return tuple_(*columns).in_(keys)
+
+
+def _load_checkpoint(*, table_name: str, source_table: Table, session: Session) -> tuple | None:
+    row = session.execute(
+        select(
+            DbCleanCheckpoint.last_key, DbCleanCheckpoint.archive_table_name, DbCleanCheckpoint.rows_deleted
+        ).where(DbCleanCheckpoint.table_name == table_name)
+    ).one_or_none()
+    if row is None:
+        return None
+    last_key = []
+    for col, value in zip(source_table.primary_key.columns, json.loads(row.last_key)):
+        try:
+            python_type = col.type.python_type
+        except NotImplementedError:
+            python_type = None
+        last_key.append(python_type(value) if python_type and not isinstance(value, python_type) else value)
+    return tuple(last_key), row.archive_table_name, row.rows_deleted
+
+
+def _save_checkpoint(
+    *,
+    table_name: str,
+    archive_table_name: str | None,
+    last_key: tuple,
+    rows_deleted: int,
+    session: Session,
+) -> None:
+    session.execute(delete(DbCleanCheckpoint).where(DbCleanCheckpoint.table_name == table_name))
+    session.execute(
+        insert(DbCleanCheckpoint).values(
+            table_name=table_name,
+            archive_table_name=archive_table_name,
+            last_key=json.dumps(last_key, default=str),
+            rows_deleted=rows_deleted,
+            updated_at=timezone.utcnow(),
+        )
+    )
+
+
+def _do_delete_in_batches(
+    *,
+    query: Select,
+    source_table: Table,
+    skip_archive: bool,
+    session: Session,
+    batch_size: int,
+    max_rows_per_second: float | None = None,
+    sleep_between_batches: float = 0,
+    resume: bool = False,
+) -> None:
+    """
+    Archive and delete the rows selected by ``query``, batch by batch in primary key order.
+
+    Each batch selects the primary keys following the last processed one, so it never scans rows
+    handled by previous batches. All batches are appended to a single archive table, and the progress
+    is saved in the same transaction as each batch so an interrupted cleanup can be resumed.
+    """
+    table_name = source_table.name
+    pk_columns = list(source_table.primary_key.columns)
+    base_pk_columns = [literal_column(f"{BASE_TABLE_ALIAS}.{col.name}", type_=col.type) for col in pk_columns]
+    keys_query = query.with_only_columns(*base_pk_columns).order_by(*base_pk_columns).limit(batch_size)
+
+    last_key: tuple | None = None
+    archive_table: Table | None = None
+    archive_table_name: str | None = None
+    rows_deleted = 0
+    if resume and (
+        checkpoint := _load_checkpoint(table_name=table_name, source_table=source_table, session=session)
+    ):
+        last_key, archive_table_name, rows_deleted = checkpoint
+        print(f"Resuming cleanup of {table_name} after {rows_deleted} deleted rows")
+        if archive_table_name and not skip_archive:
+            archive_table = reflect_tables([archive_table_name], session).tables.get(archive_table_name)
+    if archive_table is None:
+        archive_table_name = None
+
+    while True:
+        batch_start = time.monotonic()
+        batch_keys_query = (
+            keys_query if last_key is None else keys_query.where(_key_condition(base_pk_columns, last_key))
+        )
+        keys = [tuple(row) for row in session.execute(batch_keys_query)]
+        if not keys:
+            break
+
+        batch_condition = _keys_in(pk_columns, keys)
+        if not skip_archive:
+            batch_rows = select(source_table).where(batch_condition)
+            if archive_table is None:
+                archive_table_name = _archive_table_name(table_name)
+                print(f"Moving data to table {archive_table_name}")
+                archive_table = _create_archive_table(
+                    target_table_name=archive_table_name,
+                    source_table_name=table_name,
+                    query=batch_rows,
+                    session=session,
+                )
+            else:
+                session.execute(archive_table.insert().from_select(list(source_table.c.keys()), batch_rows))
+        session.execute(source_table.delete().where(batch_condition))
+
+        last_key = keys[-1]
+        rows_deleted += len(keys)
+        _save_checkpoint(
+            table_name=table_name,
+            archive_table_name=archive_table_name,
+            last_key=last_key,
+            rows_deleted=rows_deleted,
+            session=session,
+        )
+        session.commit()
+        batch_duration_ms = (time.monotonic() - batch_start) * 1000
+        Stats.incr("db_clean.rows_deleted", len(keys), tags={"table": table_name})
+        Stats.timing("db_clean.batch_duration", batch_duration_ms, tags={"table": table_name})
+        print(f"Deleted {rows_deleted} rows from {table_name} so far")
+
+        if len(keys) < batch_size:
+            break
+        pause = sleep_between_batches
+        if max_rows_per_second:
+            pause = max(pause, len(keys) / max_rows_per_second - (time.monotonic() - batch_start))
+        if pause > 0:
+            time.sleep(pause)
+
+    session.execute(delete(DbCleanCheckpoint).where(DbCleanCheckpoint.table_name == table_name))
+    session.commit()
+    print("Finished Performing Delete")
+
+
 def _do_delete(
-    *, query: Select, orm_model: Base, skip_archive: bool, session: Session, batch_size: int | None
+    *,
+    query: Select,
+    orm_model: Base,
+    skip_archive: bool,
+    session: Session,
+    batch_size: int | None,
+    max_rows_per_second: float | None = None,
+    sleep_between_batches: float = 0,
+    resume: bool = False,
 ) -> None:
     import itertools
-    import re
+
+    if batch_size:
+        source_table = reflect_tables([orm_model.name], session).tables[orm_model.name]
+        if source_table.primary_key.columns:
+            _do_delete_in_batches(
+                query=query,
+                source_table=source_table,
+                skip_archive=skip_archive,
+                session=session,
+                batch_size=batch_size,
+                max_rows_per_second=max_rows_per_second,
+                sleep_between_batches=sleep_between_batches,
+                resume=resume,
+            )
+            return
 
     bind = session.get_bind()
     dialect_name = bind.dialect.name
@@ -241,25 +450,17 @@ def _do_delete(
 
         # using bulk delete
         # create a new table and copy the rows there
-        timestamp_str = re.sub(r"[^\d]", "", timezone.utcnow().isoformat())[:14]
-        target_table_name = f"{ARCHIVE_TABLE_PREFIX}{orm_model.name}__{timestamp_str}{suffix}"
+        target_table_name = _archive_table_name(orm_model.name, suffix)
         print(f"Moving data to table {target_table_name}")
         target_table = None
 
         try:
-            if dialect_name == "mysql":
-                # MySQL with replication needs this split into two queries, so just do it for all MySQL
-                # ERROR 1786 (HY000): Statement violates GTID consistency: CREATE TABLE ... SELECT.
-                session.execute(text(f"CREATE TABLE {target_table_name} LIKE {orm_model.name}"))
-                metadata = reflect_tables([target_table_name], session)
-                target_table = metadata.tables[target_table_name]
-                insert_stm = target_table.insert().from_select(target_table.c, limited_query)
-                logger.debug("insert statement:\n%s", insert_stm.compile())
-                session.execute(insert_stm)
-            else:
-                stmt = CreateTableAs(target_table_name, limited_query.selectable)
-                logger.debug("ctas query:\n%s", stmt.compile())
-                session.execute(stmt)
+            target_table = _create_archive_table(
+                target_table_name=target_table_name,
+                source_table_name=orm_model.name,
+                query=limited_query,
+                session=session,
+            )
             session.commit()
 
             # delete the rows from the old table
@@ -293,6 +494,23 @@ def _do_delete(
     print("Finished Performing Delete")
 
 
+def _expire_partitions(
+    *, table_name: str, clean_before_timestamp: DateTime, skip_archive: bool, session: Session
+) -> None:
+    """Archive or drop the partitions of a time-partitioned table which only hold rows to purge."""
+    for partition_name in detach_partitions_before(table_name, clean_before_timestamp, session=session):
+        if skip_archive:
+            print(f"Dropping partition {partition_name}")
+            session.execute(text(f"DROP TABLE {partition_name}"))
+        else:
+            target_table_name = _archive_table_name(
+                table_name, f"__{partition_name.removeprefix(f'{table_name}_')}"
+            )
+            print(f"Moving partition {partition_name} to table {target_table_name}")
+            session.execute(text(f"ALTER TABLE {partition_name} RENAME TO {target_table_name}"))
+    session.commit()
+
+
 def _subquery_keep_last(
     *,
     recency_column,
@@ -341,9 +559,8 @@ def _build_query(
     exclude_dag_ids: list[str] | None = None,
     **kwargs,
 ) -> Select:
-    base_table_alias = "base"
-    base_table = aliased(orm_model, name=base_table_alias)
-    query = select(text(f"{base_table_alias}.*")).select_from(base_table)
+    base_table = aliased(orm_model, name=BASE_TABLE_ALIAS)
+    query = select(text(f"{BASE_TABLE_ALIAS}.*")).select_from(base_table)
     base_table_recency_col = base_table.c[recency_column.name]
     conditions = [base_table_recency_col < clean_before_timestamp]
 
@@ -392,11 +609,21 @@ def _cleanup_table(
     skip_archive: bool = False,
     session: Session,
     batch_size: int | None = None,
+    max_rows_per_second: float | None = None,
+    sleep_between_batches: float = 0,
+    resume: bool = False,
     **kwargs,
 ) -> None:
     print()
     if dry_run:
         print(f"Performing dry run for table {orm_model.name}")
+    elif not (keep_last or dag_ids or exclude_dag_ids) and is_partitioned(orm_model.name, session):
+        _expire_partitions(
+            table_name=orm_model.name,
+            clean_before_timestamp=clean_before_timestamp,
+            skip_archive=skip_archive,
+            session=session,
+        )
     query = _build_query(
         orm_model=orm_model,
         recency_column=recency_column,
@@ -420,6 +647,9 @@ def _cleanup_table(
             skip_archive=skip_archive,
             session=session,
             batch_size=batch_size,
+            max_rows_per_second=max_rows_per_second,
+            sleep_between_batches=sleep_between_batches,
+            resume=resume,
         )
 
     session.commit()
@@ -554,6 +784,9 @@ def run_cleanup(
     skip_archive: bool = False,
     session: Session = NEW_SESSION,
     batch_size: int | None = None,
+    max_rows_per_second: float | None = None,
+    sleep_between_batches: float = 0,
+    resume: bool = False,
 ) -> None:
     """
     Purges old records in airflow metadata database.
@@ -577,6 +810,13 @@ def run_cleanup(
     :param skip_archive: Set to True if you don't want the purged rows preserved in an archive table.
     :param session: Session representing connection to the metadata database.
     :param batch_size: Maximum number of rows to delete or archive in a single transaction.
+        For tables with a primary key, batches are selected in key order, appended to a single archive
+        table and their progress is checkpointed so the cleanup can be resumed.
+    :param max_rows_per_second: Optional. Throttle batched cleanups to at most this many deleted rows
+        per second.
+    :param sleep_between_batches: Number of seconds to pause between batches.
+    :param resume: If true, continue batched cleanups from the last committed batch of a previously
+        interrupted run.
     """
     clean_before_timestamp = timezone.coerce_datetime(clean_before_timestamp)
 
@@ -611,6 +851,9 @@ def run_cleanup(
                     skip_archive=skip_archive,
                     session=session,
                     batch_size=batch_size,
+                    max_rows_per_second=max_rows_per_second,
+                    sleep_between_batches=sleep_between_batches,
+                    resume=resume,
                 )
                 session.commit()
         else:
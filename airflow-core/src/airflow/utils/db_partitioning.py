@@ -0,0 +1,454 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Time-partitioned storage for high-churn metadata tables.
+
+On Postgres, the ``log`` table can be converted to declarative range partitioning on its timestamp
+column. ``airflow db clean`` then archives or drops partitions as a whole instead of
+deleting their rows one by one, and queries restricted to a recent time window only scan the
+partitions covering it.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import text
+
+from airflow._shared.timezones import timezone
+from airflow.configuration import conf
+from airflow.exceptions import AirflowException
+from airflow.utils.session import NEW_SESSION, provide_session
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+LEGACY_PARTITION_SUFFIX = "_p_legacy"
+DEFAULT_PARTITION_SUFFIX = "_p_default"
+PARTITION_INTERVALS = {"day": timedelta(days=1), "week": timedelta(weeks=1)}
+
+_RANGE_BOUND_RE = re.compile(r"^FOR VALUES FROM \((?P<lower>.+)\) TO \((?P<upper>.+)\)$")
+_UNIQUE_CONSTRAINT_RE = re.compile(r"^(?P<kind>PRIMARY KEY|UNIQUE) \((?P<columns>[^)]*)\)(?P<rest>.*)$")
+
+
+@dataclass
+class _PartitionedTableConfig:
+    """
+    Config dict for a table which can be converted to time-partitioned storage.
+
+    Postgres requires the unique constraints of a partitioned table to include the partition column, and
+    foreign keys to reference such a constraint. Only tables which are not referenced by foreign keys, and
+    whose unique constraints are either on a generated id or already include the partition column, can
+    thus be converted without losing any constraint.
+
+    :param table_name: the table name
+    :param partition_column_name: the timestamp column partitions are ranged on. It must be set on
+        insert, never be updated, and be at least as recent as the recency column ``airflow db clean``
+        uses for the table, so that a partition older than the cleanup cutoff only holds rows to purge.
+    """
+
+    table_name: str
+    partition_column_name: str
+
+
+# asset_event, task_instance_history and xcom are referenced by foreign keys or have natural keys, whose
+# uniqueness would be lost.
+config_list: list[_PartitionedTableConfig] = [
+    _PartitionedTableConfig(table_name="log", partition_column_name="dttm"),
+]
+
+config_dict: dict[str, _PartitionedTableConfig] = {x.table_name: x for x in config_list}
+
+
+@dataclass
+class Partition:
+    """A range partition; a ``None`` bound stands for ``MINVALUE`` or ``MAXVALUE``."""
+
+    name: str
+    lower: datetime | None
+    upper: datetime | None
+
+
+def _get_interval(interval: str | None = None) -> timedelta:
+    interval = interval or conf.get("database", "partition_interval")
+    if interval not in PARTITION_INTERVALS:
+        raise AirflowException(
+            f"Unsupported partition interval {interval!r}, expected one of {sorted(PARTITION_INTERVALS)}."
+        )
+    return PARTITION_INTERVALS[interval]
+
+
+def interval_start(value: datetime, interval: timedelta) -> datetime:
+    """Return the start of the day or week, in UTC, containing ``value``."""
+    start = timezone.convert_to_utc(value).replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == PARTITION_INTERVALS["week"]:
+        start -= timedelta(days=start.weekday())
+    return start
+
+
+def _get_config(table_name: str) -> _PartitionedTableConfig:
+    try:
+        return config_dict[table_name]
+    except KeyError:
+        raise AirflowException(
+            f"Table {table_name} does not support partitioning. Options: {list(config_dict)}"
+        ) from None
+
+
+def _quote(column_name: str) -> str:
+    return f'"{column_name}"'
+
+
+def _literal(value: datetime) -> str:
+    return f"'{timezone.convert_to_utc(value).isoformat()}'"
+
+
+def _parse_bound(value: str) -> datetime | None:
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return timezone.parse(value.strip("'"))
+
+
+def is_partitioned(table_name: str, session: Session) -> bool:
+    """Whether the table is a partitioned table."""
+    if session.get_bind().dialect.name != "postgresql":
+        return False
+    return session.scalar(
+        text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table_name))"),
+        {"table_name": table_name},
+    )
+
+
+def list_partitions(table_name: str, session: Session) -> list[Partition]:
+    """Return the range partitions of the table ordered by time; the default partition is not included."""
+    rows = session.execute(
+        text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = to_regclass(:table_name)"
+        ),
+        {"table_name": table_name},
+    )
+    partitions = []
+    for name, bound in rows:
+        if match := _RANGE_BOUND_RE.match(bound):
+            partitions.append(Partition(name, _parse_bound(match["lower"]), _parse_bound(match["upper"])))
+    return sorted(partitions, key=lambda p: (p.lower is not None, p.lower))
+
+
+def _create_partition(*, table_name: str, lower: datetime, upper: datetime, session: Session) -> str:
+    column = _quote(_get_config(table_name).partition_column_name)
+    partition_name = f"{table_name}_p{timezone.convert_to_utc(lower):%Y%m%d}"
+    default_partition_name = f"{table_name}{DEFAULT_PARTITION_SUFFIX}"
+    session.execute(text(f"CREATE TABLE {partition_name} (LIKE {table_name} INCLUDING DEFAULTS)"))
+    # Rows of this range stored in the default partition meanwhile would prevent attaching the partition.
+    session.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {default_partition_name} "
+            f"WHERE {column} >= :lower AND {column} < :upper RETURNING *) "
+            f"INSERT INTO {partition_name} SELECT * FROM moved"
+        ),
+        {"lower": lower, "upper": upper},
+    )
+    session.execute(
+        text(
+            f"ALTER TABLE {table_name} ATTACH PARTITION {partition_name} "
+            f"FOR VALUES FROM ({_literal(lower)}) TO ({_literal(upper)})"
+        )
+    )
+    return partition_name
+
+
+def create_partitions(
+    table_name: str,
+    *,
+    session: Session,
+    interval: str | None = None,
+    count: int | None = None,
+) -> list[str]:
+    """
+    Create the partitions of the current and next ``count`` intervals which do not exist yet.
+
+    Partitions are created contiguously after the most recent existing one, so that no range is left to
+    the default partition if the rotation did not run for a while.
+    """
+    interval_delta = _get_interval(interval)
+    if count is None:
+        count = conf.getint("database", "partitions_to_precreate")
+    now = timezone.utcnow()
+    until = interval_start(now, interval_delta) + (count + 1) * interval_delta
+    cursor = max(
+        (p.upper for p in list_partitions(table_name, session) if p.upper is not None),
+        default=interval_start(now, interval_delta),
+    )
+    created = []
+    while cursor < until:
+        upper = interval_start(cursor, interval_delta) + interval_delta
+        created.append(_create_partition(table_name=table_name, lower=cursor, upper=upper, session=session))
+        cursor = upper
+    return created
+
+
+def partition_table(
+    table_name: str,
+    *,
+    session: Session,
+    interval: str | None = None,
+    count: int | None = None,
+) -> None:
+    """
+    Convert the table to a table range-partitioned on its timestamp column.
+
+    The existing table becomes the first partition, covering all times up to now, so its rows do not
+    need to be copied; it is archived or dropped by ``airflow db clean`` once all of them are expired.
+    Unique constraints on a generated id are extended with the partition column, as Postgres requires,
+    which keeps the id unique as long as it is generated by its sequence. The table is locked during
+    the conversion, which rebuilds its unique indexes.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        raise AirflowException("Time-partitioned tables are only supported with Postgres.")
+    config = _get_config(table_name)
+    if is_partitioned(table_name, session):
+        raise AirflowException(f"Table {table_name} is already partitioned.")
+    column = _quote(config.partition_column_name)
+    legacy_name = f"{table_name}{LEGACY_PARTITION_SUFFIX}"
+    params = {"table_name": table_name}
+
+    session.execute(text(f"LOCK TABLE {table_name} IN ACCESS EXCLUSIVE MODE"))
+    if session.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {table_name} WHERE {column} IS NULL)")):
+        raise AirflowException(
+            f"Table {table_name} has rows without {config.partition_column_name}, "
+            f"they must be deleted before partitioning it."
+        )
+
+    referencing_keys = session.execute(
+        text(
+            "SELECT r.relname, a.attname FROM pg_constraint c "
+            "JOIN pg_class r ON r.oid = c.conrelid "
+            "JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = c.conkey[1] "
+            "WHERE c.contype = 'f' AND c.confrelid = to_regclass(:table_name)"
+        ),
+        params,
+    ).all()
+    for referencing_table, referencing_column in referencing_keys:
+        raise AirflowException(
+            f"Table {table_name} is referenced by {referencing_table}.{referencing_column}, "
+            f"which is not supported by partitioned tables."
+        )
+
+    constraints = session.execute(
+        text(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(:table_name) AND contype IN ('p', 'u', 'f')"
+        ),
+        params,
+    ).all()
+    generated_columns = {
+        column_name
+        for column_name, sequence_name in session.execute(
+            text(
+                "SELECT attname, pg_get_serial_sequence(:table_name, attname) FROM pg_attribute "
+                "WHERE attrelid = to_regclass(:table_name) AND attnum > 0 AND NOT attisdropped"
+            ),
+            params,
+        )
+        if sequence_name
+    }
+    partition_constraints = {
+        constraint_name: _with_partition_column(definition, config.partition_column_name, generated_columns)
+        for constraint_name, constraint_type, definition in constraints
+        if constraint_type != "f"
+    }
+    for constraint_name in partition_constraints:
+        session.execute(text(f"ALTER TABLE {table_name} DROP CONSTRAINT {constraint_name}"))
+    indexes = session.execute(
+        text(
+            "SELECT i.relname, pg_get_indexdef(i.oid) FROM pg_index x "
+            "JOIN pg_class i ON i.oid = x.indexrelid WHERE x.indrelid = to_regclass(:table_name)"
+        ),
+        params,
+    ).all()
+    # Free the index names for the partitioned table; the renamed indexes get attached to them.
+    for index_name, _ in indexes:
+        session.execute(text(f"ALTER INDEX {index_name} RENAME TO {index_name[:56]}_legacy"))
+
+    session.execute(text(f"ALTER TABLE {table_name} RENAME TO {legacy_name}"))
+    session.execute(text(f"ALTER TABLE {legacy_name} ALTER COLUMN {column} SET NOT NULL"))
+    session.execute(
+        text(
+            f"CREATE TABLE {table_name} (LIKE {legacy_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({column})"
+        )
+    )
+    sequences = session.execute(
+        text(
+            "SELECT attname, pg_get_serial_sequence(:legacy_name, attname) FROM pg_attribute "
+            "WHERE attrelid = to_regclass(:legacy_name) AND attnum > 0 AND NOT attisdropped"
+        ),
+        {"legacy_name": legacy_name},
+    ).all()
+    # Otherwise sequences would be dropped together with the legacy partition.
+    for column_name, sequence_name in sequences:
+        if sequence_name:
+            session.execute(
+                text(f"ALTER SEQUENCE {sequence_name} OWNED BY {table_name}.{_quote(column_name)}")
+            )
+    for constraint_name, _, definition in constraints:
+        constraint = partition_constraints.get(constraint_name, definition)
+        session.execute(text(f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint_name} {constraint}"))
+    for _, definition in indexes:
+        session.execute(text(definition))
+
+    max_value = session.scalar(text(f"SELECT max({column}) FROM {legacy_name}"))
+    cutoff = timezone.utcnow()
+    if max_value is not None:
+        cutoff = max(cutoff, timezone.convert_to_utc(max_value) + timedelta(microseconds=1))
+    session.execute(
+        text(
+            f"ALTER TABLE {table_name} ATTACH PARTITION {legacy_name} "
+            f"FOR VALUES FROM (MINVALUE) TO ({_literal(cutoff)})"
+        )
+    )
+    session.execute(
+        text(f"CREATE TABLE {table_name}{DEFAULT_PARTITION_SUFFIX} PARTITION OF {table_name} DEFAULT")
+    )
+    create_partitions(table_name, session=session, interval=interval, count=count)
+
+
+def _with_partition_column(definition: str, partition_column_name: str, generated_columns: set[str]) -> str:
+    """
+    Add the partition column to a primary key or unique constraint definition.
+
+    Only constraints already including the partition column, or on a single generated id, keep enforcing
+    the same uniqueness once extended.
+    """
+    match = _UNIQUE_CONSTRAINT_RE.match(definition)
+    if not match:
+        raise AirflowException(f"Unsupported constraint for partitioned tables: {definition}")
+    columns = [c.strip() for c in match["columns"].split(",")]
+    unquoted = [c.strip('"') for c in columns]
+    if partition_column_name in unquoted:
+        return definition
+    if len(unquoted) != 1 or unquoted[0] not in generated_columns:
+        raise AirflowException(
+            f"Constraint {definition} would not be enforced anymore once extended with "
+            f"{partition_column_name}, as partitioned tables require."
+        )
+    columns.append(_quote(partition_column_name))
+    return f"{match['kind']} ({', '.join(columns)}){match['rest']}"
+
+
+def detach_partitions_before(table_name: str, before: datetime, *, session: Session) -> list[str]:
+    """
+    Detach the partitions of the table only holding rows older than ``before``.
+
+    :return: the names of the detached partitions, which are now standalone tables.
+    """
+    _get_config(table_name)
+    detached = []
+    for partition in list_partitions(table_name, session):
+        if partition.upper is None or partition.upper > before:
+            continue
+        session.execute(text(f"ALTER TABLE {table_name} DETACH PARTITION {partition.name}"))
+        # Detached partitions keep the foreign keys of the table, through which deleting referenced rows
+        # would cascade into the detached rows.
+        foreign_keys = session.scalars(
+            text("SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:name) AND contype = 'f'"),
+            {"name": partition.name},
+        ).all()
+        for constraint_name in foreign_keys:
+            session.execute(text(f"ALTER TABLE {partition.name} DROP CONSTRAINT {constraint_name}"))
+        detached.append(partition.name)
+    return detached
+
+
+def _confirm_partition(*, tables: list[str]) -> None:
+    question = (
+        f"You have requested that we convert tables {tables!r} to time-partitioned storage.\n"
+        f"The tables are locked while their unique indexes are rebuilt. "
+        f"Consider backing up the tables first.\n"
+        f"Enter 'partition tables' (without quotes) to proceed."
+    )
+    print(question)
+    answer = input().strip()
+    if answer != "partition tables":
+        raise SystemExit("User did not confirm; exiting.")
+
+
+@provide_session
+def run_partition_tables(
+    *,
+    table_names: list[str],
+    interval: str | None = None,
+    confirm: bool = True,
+    session: Session = NEW_SESSION,
+) -> None:
+    """
+    Convert tables of the metadata database to time-partitioned storage.
+
+    :param table_names: List of table names to convert.
+    :param interval: Optional. Range of time covered by each partition, ``day`` or ``week``; defaults to
+        ``[database] partition_interval``.
+    :param confirm: Require user input to confirm before converting the tables.
+    :param session: Session representing connection to the metadata database.
+    """
+    for table_name in table_names:
+        _get_config(table_name)
+    _get_interval(interval)
+    if confirm:
+        _confirm_partition(tables=sorted(table_names))
+    for table_name in table_names:
+        print(f"Partitioning table {table_name}")
+        partition_table(table_name, session=session, interval=interval)
+        session.commit()
+
+
+@provide_session
+def rotate_partitions(
+    *,
+    table_names: list[str] | None = None,
+    interval: str | None = None,
+    session: Session = NEW_SESSION,
+) -> dict[str, list[str]]:
+    """
+    Create the upcoming partitions of the time-partitioned tables.
+
+    Expired partitions are archived or dropped by ``airflow db clean``.
+
+    :param table_names: Optional. List of table names to rotate. If not provided, all the partitioned
+        tables are rotated.
+    :param interval: Optional. Range of time covered by each partition, ``day`` or ``week``; defaults to
+        ``[database] partition_interval``.
+    :param session: Session representing connection to the metadata database.
+    :return: the names of the created partitions, per table.
+    """
+    created = {}
+    for table_name in table_names or list(config_dict):
+        if not is_partitioned(table_name, session):
+            if table_names:
+                logger.warning("Table %s is not partitioned. Skipping.", table_name)
+            continue
+        created[table_name] = create_partitions(table_name, session=session, interval=interval)
+        session.commit()
+        for partition_name in created[table_name]:
+            print(f"Created partition {partition_name}")
+    return created
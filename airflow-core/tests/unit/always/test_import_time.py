@@ -0,0 +1,74 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Maximum number of modules loaded by importing a module, on top of those loaded at interpreter start-up.
+# Unlike the import time, the count does not depend on the machine running the tests; it catches eager
+# imports of heavy dependencies, so leave some headroom for the odd new small import.
+IMPORTED_MODULES_BUDGET = {
+    "airflow": 1100,
+    "airflow.sdk": 1100,
+}
+
+# Modules which must only be imported by the processes that use them.
+LAZILY_IMPORTED_MODULES = {
+    "airflow": [
+        "airflow.sdk.execution_time.task_runner",
+        "airflow.sdk.execution_time.comms",
+        "opentelemetry.sdk.trace",
+    ],
+    "airflow.sdk": [
+        "airflow.sdk.execution_time.task_runner",
+        "opentelemetry.sdk.trace",
+    ],
+}
+
+
+@pytest.mark.parametrize("module", LAZILY_IMPORTED_MODULES)
+def test_heavy_modules_are_imported_lazily(module):
+    lazy_modules = LAZILY_IMPORTED_MODULES[module]
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print(*(m for m in {lazy_modules!r} if m in sys.modules), sep='\\n')",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert proc.stdout.split() == []
+
+
+@pytest.mark.parametrize("module", IMPORTED_MODULES_BUDGET)
+def test_imported_modules_budget(module):
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; before = len(sys.modules); import {module}; print(len(sys.modules) - before)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert int(proc.stdout) <= IMPORTED_MODULES_BUDGET[module]
@@ -108,3 +108,39 @@ class TestMetastoreBackendSessionSafety:
         # Attributes should still be accessible
         assert conn.conn_id == "test_conn"
         assert conn.host == "localhost"
+
+
+class TestMetastoreBackendBatch:
+    def setup_method(self) -> None:
+        clear_db_connections()
+        clear_db_variables()
+
+    def teardown_method(self) -> None:
+        clear_db_connections()
+        clear_db_variables()
+
+    def test_get_connections(self):
+        from sqlalchemy import inspect as sa_inspect
+
+        with create_session() as session:
+            session.add(Connection(conn_id="conn_1", conn_type="mysql", host="host_1"))
+            session.add(Connection(conn_id="conn_2", conn_type="http", host="host_2"))
+            session.add(Connection(conn_id="conn_3", conn_type="http", host="host_3"))
+            session.commit()
+
+        connections = MetastoreBackend().get_connections(["conn_1", "conn_2", "missing_conn"])
+
+        assert {conn_id: conn.host for conn_id, conn in connections.items()} == {
+            "conn_1": "host_1",
+            "conn_2": "host_2",
+        }
+        assert all(sa_inspect(conn).detached for conn in connections.values())
+
+    def test_get_variables(self):
+        Variable.set(key="var_1", value="value_1")
+        Variable.set(key="var_2", value="value_2")
+        Variable.set(key="var_3", value="value_3")
+
+        variables = MetastoreBackend().get_variables(["var_1", "var_2", "missing_var"])
+
+        assert variables == {"var_1": "value_1", "var_2": "value_2"}
@@ -0,0 +1,130 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from airflow.api_fastapi.common.http_cache import (
+    ConditionalRequestDep,
+    ResponseCache,
+    _etag_matches,
+    create_response_cache,
+)
+
+
+@pytest.fixture
+def data():
+    return {"version": 1, "builds": 0}
+
+
+@pytest.fixture
+def app(data):
+    app = FastAPI()
+    app.state.response_cache = ResponseCache(maxsize=8)
+
+    @app.get("/items")
+    def get_items(conditional_request: ConditionalRequestDep, limit: int = 10) -> dict:
+        if (cached := conditional_request.evaluate((data["version"],))) is not None:
+            return cached
+        data["builds"] += 1
+        return conditional_request.cache({"version": data["version"], "limit": limit})
+
+    @app.get("/unversioned")
+    def get_unversioned(conditional_request: ConditionalRequestDep) -> dict:
+        conditional_request.evaluate(None)
+        data["builds"] += 1
+        return {}
+
+    return app
+
+
+class TestConditionalRequest:
+    def test_not_modified(self, app, data):
+        client = TestClient(app)
+
+        response = client.get("/items")
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        response = client.get("/items", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        # The query parameters are part of the ETag.
+        response = client.get("/items", params={"limit": 5}, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+        data["version"] = 2
+        response = client.get("/items", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == {"version": 2, "limit": 10}
+        assert response.headers["ETag"] != etag
+
+    def test_response_cache(self, app, data):
+        client = TestClient(app)
+
+        assert client.get("/items").json() == {"version": 1, "limit": 10}
+        assert client.get("/items").json() == {"version": 1, "limit": 10}
+        assert data["builds"] == 1
+
+        data["version"] = 2
+        assert client.get("/items").json() == {"version": 2, "limit": 10}
+        assert data["builds"] == 2
+
+    def test_response_cache_disabled(self, app, data):
+        app.state.response_cache = ResponseCache(maxsize=0)
+        client = TestClient(app)
+
+        client.get("/items")
+        client.get("/items")
+        assert data["builds"] == 2
+
+    def test_unversioned(self, app, data):
+        client = TestClient(app)
+
+        response = client.get("/unversioned", headers={"If-None-Match": "*"})
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        pytest.param('W/"abc"', True, id="weak"),
+        pytest.param('"abc"', True, id="strong"),
+        pytest.param('"def", W/"abc"', True, id="list"),
+        pytest.param("*", True, id="any"),
+        pytest.param('W/"def"', False, id="other"),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert _etag_matches(if_none_match, 'W/"abc"') is expected
+
+
+@pytest.mark.parametrize(("cache_size", "expected_enabled"), [(256, True), (0, False), (-1, False)])
+@mock.patch("airflow.api_fastapi.common.http_cache.conf")
+def test_create_response_cache(mock_conf, cache_size, expected_enabled):
+    mock_conf.getint.return_value = cache_size
+    assert create_response_cache().enabled is expected_enabled
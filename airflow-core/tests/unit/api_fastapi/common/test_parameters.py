@@ -37,6 +37,7 @@ from airflow.api_fastapi.common.parameters import (
 from airflow.models import DagModel, DagRun, Log
 from airflow.models.errors import ParseImportError
 from airflow.models.taskinstance import TaskInstance
+from airflow.models.xcom import XComModel
 
 
 class TestFilterParam:
@@ -129,16 +130,33 @@ class TestSortParam:
 
     def test_row_value_raises_on_column_form_to_replace(self):
         """
-        Column-form ``to_replace`` is not supported by cursor encoding. The helper must
-        fail loudly so a future endpoint doesn't silently ship ``None`` cursor tokens.
+        Column-form ``to_replace`` is only supported by cursor encoding for columns of a
+        related model. The helper must fail loudly otherwise, so a future endpoint doesn't
+        silently ship ``None`` cursor tokens.
         """
         param = SortParam(["dag_id"], DagModel, {"last_run_state": DagRun.state}).set_value(
             ["last_run_state"]
         )
         row = SimpleNamespace(id="test_dag")
-        with pytest.raises(NotImplementedError, match="column-form ``to_replace``"):
+        with pytest.raises(NotImplementedError, match="``to_replace`` mapping for ``last_run_state``"):
             param.row_value(row, "last_run_state")
 
+    def test_row_value_reads_column_form_to_replace_through_relationship(self):
+        param = SortParam(["key"], XComModel, {"run_after": DagRun.run_after}).set_value(["run_after"])
+        row = SimpleNamespace(dag_run=SimpleNamespace(run_after="2026-04-22T00:00:00+00:00"))
+        assert param.row_value(row, "run_after") == "2026-04-22T00:00:00+00:00"
+
+    def test_tie_break_on_every_primary_key_column(self):
+        param = SortParam(["timestamp", "task_id"], XComModel).set_value(["-timestamp", "task_id"])
+        resolved = [(name, is_desc) for name, _col, is_desc in param.get_resolved_columns()]
+        assert resolved == [
+            ("timestamp", True),
+            ("task_id", False),
+            ("dag_run_id", True),
+            ("map_index", True),
+            ("key", True),
+        ]
+
     def test_primary_key_is_not_duplicated_when_alias_maps_to_pk(self):
         """Sorting by an alias that resolves to the PK must not append the PK a second time."""
         param = SortParam(["id"], ParseImportError, {"import_error_id": "id"}).set_value(["import_error_id"])
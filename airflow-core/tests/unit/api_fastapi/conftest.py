@@ -54,6 +54,22 @@ def get_api_path(request):
     return API_PATHS.get(subdirectory_name, "/")
 
 
+@pytest.fixture(autouse=True)
+def reconfigure_async_db_engine():
+    """
+    Re-create the async database engine for each test.
+
+    The way we init async engine does not work well with FastAPI app init.
+    Creating the engine implicitly creates an event loop, which Airflow does
+    once for the entire process; creating the FastAPI app also does, but our
+    test setup does it once for each test. Re-configuring the async engine for
+    each test lets routes using async sessions run correctly.
+    """
+    from airflow.settings import _configure_async_session
+
+    _configure_async_session()
+
+
 @pytest.fixture
 def test_client(request):
     with conf_vars(
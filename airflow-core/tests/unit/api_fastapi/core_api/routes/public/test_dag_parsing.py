@@ -19,10 +19,16 @@ from __future__ import annotations
 import pytest
 from sqlalchemy import select
 
+from airflow.models.dag_file_parse_profile import DagFileParseProfile
 from airflow.models.dagbag import DagPriorityParsingRequest, DBDagBag
 
 from tests_common.test_utils.api_fastapi import _check_last_log
-from tests_common.test_utils.db import clear_db_dag_parsing_requests, clear_db_logs, parse_and_sync_to_db
+from tests_common.test_utils.db import (
+    clear_db_dag_file_parse_profiles,
+    clear_db_dag_parsing_requests,
+    clear_db_logs,
+    parse_and_sync_to_db,
+)
 from tests_common.test_utils.paths import AIRFLOW_CORE_SOURCES_PATH
 
 pytestmark = pytest.mark.db_test
@@ -87,3 +93,66 @@ class TestDagParsingEndpoint:
 
         parsing_requests = session.scalars(select(DagPriorityParsingRequest)).all()
         assert parsing_requests == []
+
+
+class TestGetDagFileParseProfile:
+    PROFILE = {
+        "import_duration": 1.5,
+        "user_code_duration": 2.0,
+        "dagbag_duration": 0.25,
+        "serialization_duration": 0.125,
+        "imports": [{"module": "pandas", "duration": 1.25, "self_duration": 0.5}],
+        "slowest_lines": [{"location": "my_dag.py:12", "duration": 1.75}],
+    }
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        clear_db_dag_file_parse_profiles()
+        yield
+        clear_db_dag_file_parse_profiles()
+
+    @staticmethod
+    def _url(url_safe_serializer, relative_fileloc="my_dag.py"):
+        token = url_safe_serializer.dumps(
+            {"bundle_name": "dags-folder", "relative_fileloc": relative_fileloc}
+        )
+        return f"/parseDagFile/{token}/profile"
+
+    def test_should_respond_200(self, url_safe_serializer, session, test_client):
+        session.add(
+            DagFileParseProfile(
+                bundle_name="dags-folder",
+                relative_fileloc="my_dag.py",
+                parse_duration=4.5,
+                profile=self.PROFILE,
+            )
+        )
+        session.commit()
+
+        response = test_client.get(self._url(url_safe_serializer))
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body.pop("parsed_at")
+        assert body == {
+            "bundle_name": "dags-folder",
+            "relative_fileloc": "my_dag.py",
+            "parse_duration": 4.5,
+            **self.PROFILE,
+        }
+
+    def test_should_respond_404_without_profile(self, url_safe_serializer, test_client):
+        response = test_client.get(self._url(url_safe_serializer, "not_profiled.py"))
+        assert response.status_code == 404
+
+    def test_should_respond_404_with_bad_token(self, test_client):
+        response = test_client.get("/parseDagFile/token/profile")
+        assert response.status_code == 404
+
+    def test_should_respond_401(self, unauthenticated_test_client):
+        response = unauthenticated_test_client.get("/parseDagFile/token/profile")
+        assert response.status_code == 401
+
+    def test_should_respond_403(self, unauthorized_test_client):
+        response = unauthorized_test_client.get("/parseDagFile/token/profile")
+        assert response.status_code == 403
@@ -23,6 +23,7 @@ import pytest
 from airflow._shared.timezones import timezone
 from airflow.models.dag import DagModel
 from airflow.models.dagrun import DagRun
+from airflow.models.dagrun_state_count import DagRunStateCount
 from airflow.utils.state import DagRunState
 from airflow.utils.types import DagRunType
 
@@ -133,6 +134,7 @@ class TestDagStatsEndpoint:
         )
         session.add_all(entities)
         session.commit()
+        DagRunStateCount.refresh(session=session)
 
     @pytest.fixture(autouse=True)
     def setup(self) -> None:
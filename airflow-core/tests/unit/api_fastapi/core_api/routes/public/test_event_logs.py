@@ -352,6 +352,37 @@ class TestGetEventLogs(TestEventLogsEndpoint):
         for event_log, expected_event in zip(resp_json["event_logs"], expected_events):
             assert event_log["event"] == expected_event
 
+    @pytest.mark.parametrize("order_by", ["-when", "event", "-event_log_id"])
+    def test_get_event_logs_cursor_pagination(self, test_client, order_by):
+        response = test_client.get("/eventLogs", params={"order_by": order_by})
+        expected_ids = [event_log["event_log_id"] for event_log in response.json()["event_logs"]]
+
+        event_log_ids, pages = [], []
+        cursor = ""
+        while cursor is not None:
+            response = test_client.get(
+                "/eventLogs", params={"order_by": order_by, "limit": 3, "cursor": cursor}
+            )
+            assert response.status_code == 200
+            body = response.json()
+            assert body["total_entries"] is None
+            event_log_ids.extend(event_log["event_log_id"] for event_log in body["event_logs"])
+            pages.append(body)
+            cursor = body["next_cursor"]
+
+        assert event_log_ids == expected_ids
+        assert len(pages) == 2
+        assert pages[0]["previous_cursor"] is None
+
+        response = test_client.get(
+            "/eventLogs", params={"order_by": order_by, "limit": 3, "cursor": pages[-1]["previous_cursor"]}
+        )
+        assert [event_log["event_log_id"] for event_log in response.json()["event_logs"]] == expected_ids[:3]
+
+    def test_get_event_logs_invalid_cursor(self, test_client):
+        response = test_client.get("/eventLogs", params={"cursor": "this-is-not-valid"})
+        assert response.status_code == 400
+
     def test_should_raises_401_unauthenticated(self, unauthenticated_test_client):
         response = unauthenticated_test_client.get("/eventLogs")
         assert response.status_code == 401
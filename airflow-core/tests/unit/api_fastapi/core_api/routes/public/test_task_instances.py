@@ -1672,11 +1672,13 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
         def capture(_conn, _cursor, statement, _parameters, _context, _executemany):
             executed_statements.append(statement.upper())
 
-        event.listen(airflow.settings.engine, "before_cursor_execute", capture)
+        # The endpoint uses an async session; its statements go through the async engine.
+        engine = airflow.settings.async_engine.sync_engine
+        event.listen(engine, "before_cursor_execute", capture)
         try:
             response = test_client.get("/dags/~/dagRuns/~/taskInstances")
         finally:
-            event.remove(airflow.settings.engine, "before_cursor_execute", capture)
+            event.remove(engine, "before_cursor_execute", capture)
 
         assert response.status_code == 200
 
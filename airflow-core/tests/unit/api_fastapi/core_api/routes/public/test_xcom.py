@@ -271,6 +271,8 @@ class TestGetXComEntries(TestXComEndpoint):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
+            "previous_cursor": None,
         }
         assert response_data == expected_response
 
@@ -337,6 +339,8 @@ class TestGetXComEntries(TestXComEndpoint):
                 },
             ],
             "total_entries": 4,
+            "next_cursor": None,
+            "previous_cursor": None,
         }
         assert response_data == expected_response
 
@@ -388,6 +392,8 @@ class TestGetXComEntries(TestXComEndpoint):
         assert response_data == {
             "xcom_entries": expected_entries,
             "total_entries": len(expected_entries),
+            "next_cursor": None,
+            "previous_cursor": None,
         }
 
     @pytest.mark.parametrize(
@@ -440,6 +446,8 @@ class TestGetXComEntries(TestXComEndpoint):
         assert response_data == {
             "xcom_entries": expected_entries,
             "total_entries": len(expected_entries),
+            "next_cursor": None,
+            "previous_cursor": None,
         }
 
     @provide_session
@@ -566,6 +574,33 @@ class TestPaginationGetXComEntries(TestXComEndpoint):
         conn_ids = [conn["key"] for conn in response_data["xcom_entries"] if conn]
         assert conn_ids == expected_xcom_ids
 
+    @pytest.mark.parametrize("order_by", [[], ["-run_after"], ["timestamp"]])
+    def test_cursor_pagination(self, order_by, test_client):
+        for i in range(10):
+            self._create_xcom(f"TEST_XCOM_KEY{i}", TEST_XCOM_VALUE)
+        url = "/dags/~/dagRuns/~/taskInstances/~/xcomEntries"
+        response = test_client.get(url, params={"order_by": order_by})
+        expected_keys = [xcom["key"] for xcom in response.json()["xcom_entries"]]
+
+        keys, pages = [], []
+        cursor = ""
+        while cursor is not None:
+            response = test_client.get(url, params={"order_by": order_by, "limit": 4, "cursor": cursor})
+            assert response.status_code == 200
+            body = response.json()
+            assert body["total_entries"] is None
+            keys.extend(xcom["key"] for xcom in body["xcom_entries"])
+            pages.append(body)
+            cursor = body["next_cursor"]
+
+        assert keys == expected_keys
+        assert len(pages) == 3
+
+        response = test_client.get(
+            url, params={"order_by": order_by, "limit": 4, "cursor": pages[-1]["previous_cursor"]}
+        )
+        assert [xcom["key"] for xcom in response.json()["xcom_entries"]] == expected_keys[4:8]
+
 
 class TestCreateXComEntry(TestXComEndpoint):
     @pytest.mark.parametrize(
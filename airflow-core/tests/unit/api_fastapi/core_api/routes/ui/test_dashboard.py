@@ -25,6 +25,7 @@ import pytest
 
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DBDagBag
+from airflow.models.dagrun_state_count import DagRunStateCount
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.utils.state import DagRunState, TaskInstanceState
 from airflow.utils.types import DagRunType
@@ -105,6 +106,7 @@ def make_dag_runs(dag_maker, session, time_machine):
         ti.state = TaskInstanceState.FAILED
 
     dag_maker.sync_dagbag_to_db()
+    DagRunStateCount.refresh(session=session)
     time_machine.move_to("2023-07-02T00:00:00+00:00", tick=False)
 
 
@@ -318,7 +320,7 @@ class TestHistoricalMetricsDataEndpoint:
 
     @pytest.mark.usefixtures("freeze_time_for_dagruns", "make_dag_runs")
     def test_state_counts_are_capped(self, test_client):
-        """State counts are capped at STATE_COUNT_CAP; fixture creates 4 dag runs and 8 TIs."""
+        """Task instance state counts are capped at STATE_COUNT_CAP; fixture creates 4 dag runs and 8 TIs."""
         with mock.patch("airflow.api_fastapi.core_api.routes.ui.dashboard.STATE_COUNT_CAP", 1):
             response = test_client.get(
                 "/dashboard/historical_metrics_data",
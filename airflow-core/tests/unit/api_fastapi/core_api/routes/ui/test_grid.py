@@ -28,6 +28,7 @@ from sqlalchemy import select
 from airflow._shared.timezones import timezone
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DBDagBag
+from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.providers.standard.operators.python import PythonOperator
@@ -388,7 +389,7 @@ def _freeze_time_for_dagruns(time_machine):
 @pytest.mark.usefixtures("_freeze_time_for_dagruns")
 class TestGetGridDataEndpoint:
     def test_should_response_200(self, test_client):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [
@@ -449,7 +450,7 @@ class TestGetGridDataEndpoint:
         ],
     )
     def test_should_response_200_limit(self, test_client, limit, expected):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}", params={"limit": limit})
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == expected
@@ -474,7 +475,7 @@ class TestGetGridDataEndpoint:
         ],
     )
     def test_runs_should_response_200_date_filters(self, test_client, params, expected):
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(
                 f"/grid/runs/{DAG_ID}",
                 params=params,
@@ -499,7 +500,7 @@ class TestGetGridDataEndpoint:
                     "run_after_lte": timezone.datetime(2024, 10, 30),
                 },
                 GRID_NODES,
-                5,
+                6,
             ),
         ],
     )
@@ -531,7 +532,7 @@ class TestGetGridDataEndpoint:
         assert response.json() == {"detail": "Dag with id invalid_dag was not found"}
 
     def test_structure_should_response_200_without_dag_run(self, test_client):
-        with assert_queries_count(5):
+        with assert_queries_count(6):
             response = test_client.get(f"/grid/structure/{DAG_ID_2}")
         assert response.status_code == 200
         assert response.json() == [{"id": "task2", "label": "task2"}]
@@ -542,6 +543,61 @@ class TestGetGridDataEndpoint:
         assert response.status_code == 200
         assert response.json() == []
 
+    @pytest.mark.parametrize("endpoint", ["runs", "structure"])
+    def test_should_response_304_when_not_modified(self, session, test_client, time_machine, endpoint):
+        response = test_client.get(f"/grid/{endpoint}/{DAG_ID}")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        with assert_queries_count(3):
+            response = test_client.get(f"/grid/{endpoint}/{DAG_ID}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        time_machine.move_to("2025-01-01T00:00:00+00:00", tick=False)
+        dag_run = session.scalar(select(DagRun).where(DagRun.dag_id == DAG_ID, DagRun.run_id == "run_1"))
+        dag_run.state = DagRunState.FAILED
+        session.commit()
+
+        response = test_client.get(f"/grid/{endpoint}/{DAG_ID}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_runs_should_not_response_304_with_unfinished_runs(self, session, test_client, time_machine):
+        dag_run = session.scalar(select(DagRun).where(DagRun.dag_id == DAG_ID, DagRun.run_id == "run_1"))
+        dag_run.state = DagRunState.RUNNING
+        dag_run.end_date = None
+        session.commit()
+
+        response = test_client.get(f"/grid/runs/{DAG_ID}")
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+        duration = response.json()[0]["duration"]
+
+        # The duration of the running run grows with time, so the response is built again.
+        time_machine.shift(60)
+        response = test_client.get(f"/grid/runs/{DAG_ID}", headers={"If-None-Match": "*"})
+        assert response.status_code == 200
+        assert response.json()[0]["duration"] == duration + 60
+
+    def test_ti_summaries_should_response_304_when_not_modified(self, session, test_client, time_machine):
+        url = f"/grid/ti_summaries/{DAG_ID}?run_ids=run_1"
+        response = test_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = test_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        time_machine.move_to("2025-01-01T00:00:00+00:00", tick=False)
+        ti = session.scalar(
+            select(TaskInstance).where(TaskInstance.dag_id == DAG_ID, TaskInstance.run_id == "run_1")
+        )
+        ti.state = TaskInstanceState.FAILED
+        session.commit()
+
+        response = test_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
     def test_should_response_200_with_deleted_task_and_taskgroup(self, session, test_client):
         # Mark one of the TI of the previous runs as "REMOVED" to simulate clearing an older DagRun.
         # https://github.com/apache/airflow/issues/48670
@@ -566,7 +622,7 @@ class TestGetGridDataEndpoint:
         ]
 
         # Also verify that TI summaries include a leaf entry for the removed task
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             ti_resp = test_client.get(f"/grid/ti_summaries/{DAG_ID_3}?run_ids=run_3")
         assert ti_resp.status_code == 200
         [ti_payload] = self._parse_ndjson(ti_resp)
@@ -636,7 +692,7 @@ class TestGetGridDataEndpoint:
 
     def test_get_grid_runs(self, session, test_client):
         session.commit()
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}?limit=5")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [GRID_RUN_1, GRID_RUN_2]
@@ -695,7 +751,7 @@ class TestGetGridDataEndpoint:
 
     def test_get_grid_runs_filter_by_run_type_and_triggering_user(self, session, test_client):
         session.commit()
-        with assert_queries_count(6):
+        with assert_queries_count(7):
             response = test_client.get(f"/grid/runs/{DAG_ID}?run_type=manual&triggering_user=user2")
         assert response.status_code == 200
         assert _strip_dag_version_ids(response.json()) == [GRID_RUN_2]
@@ -720,7 +776,7 @@ class TestGetGridDataEndpoint:
         run_id = "run_4-1"
         session.commit()
 
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID_4}?run_ids={run_id}")
         assert response.status_code == 200
         [actual] = self._parse_ndjson(response)
@@ -820,7 +876,7 @@ class TestGetGridDataEndpoint:
         run_id = "run_2"
         session.commit()
 
-        with assert_queries_count(4):
+        with assert_queries_count(5):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}?run_ids={run_id}")
         assert response.status_code == 200
         [data] = self._parse_ndjson(response)
@@ -1189,7 +1245,7 @@ class TestGetGridDataEndpoint:
         run_ids = ["run_1", "run_2"]
         # 2 auth queries + 1 serdag query shared across both runs
         # + 1 TI query per run = 5 total (not 1 serdag per run which would be 6+).
-        with assert_queries_count(5):
+        with assert_queries_count(6):
             response = test_client.get(f"/grid/ti_summaries/{DAG_ID}", params={"run_ids": run_ids})
         assert response.status_code == 200
         assert len(self._parse_ndjson(response)) == len(run_ids)
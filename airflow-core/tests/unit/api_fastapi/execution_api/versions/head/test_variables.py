@@ -130,6 +130,37 @@ class TestGetVariable:
         assert any(msg.startswith("Checking read access for task instance") for msg in caplog.messages)
 
 
+class TestGetVariables:
+    @mock.patch.dict("os.environ", {"AIRFLOW_VAR_ENV_VAR": "env_value"})
+    def test_variables_get(self, client, session):
+        Variable.set(key="var1", value="value1", session=session)
+        Variable.set(key="var2/with_slash", value="value2", session=session)
+        session.commit()
+
+        response = client.post(
+            "/execution/variables/batch",
+            json={"keys": ["var1", "var2/with_slash", "env_var", "non_existent_var"]},
+        )
+
+        assert response.status_code == 200
+        assert sorted(response.json()["variables"], key=lambda var: var["key"]) == [
+            {"key": "env_var", "value": "env_value"},
+            {"key": "var1", "value": "value1"},
+            {"key": "var2/with_slash", "value": "value2"},
+        ]
+
+    def test_variables_get_none_found(self, client):
+        response = client.post("/execution/variables/batch", json={"keys": ["non_existent_var"]})
+
+        assert response.status_code == 200
+        assert response.json() == {"variables": []}
+
+    def test_variables_get_empty_keys(self, client):
+        response = client.post("/execution/variables/batch", json={"keys": []})
+
+        assert response.status_code == 422
+
+
 class TestPutVariable:
     @pytest.mark.parametrize(
         ("key", "payload"),
@@ -0,0 +1,41 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.db_test
+
+
+@pytest.fixture
+def old_ver_client(client):
+    """Execution API version immediately before the batch endpoints were added."""
+    client.headers["Airflow-API-Version"] = "2026-04-17"
+    return client
+
+
+@pytest.mark.parametrize(
+    ("path", "body"),
+    [
+        pytest.param("/execution/connections/batch", {"conn_ids": ["test_conn"]}, id="connections"),
+        pytest.param("/execution/variables/batch", {"keys": ["test_var"]}, id="variables"),
+    ],
+)
+def test_batch_endpoints_do_not_exist(old_ver_client, path, body):
+    response = old_ver_client.post(path, json=body)
+
+    assert response.status_code == 405
@@ -19,7 +19,7 @@ from __future__ import annotations
 
 import pytest
 
-from airflow.assets.evaluation import AssetEvaluator
+from airflow.assets.evaluation import AssetConditionIndex, AssetEvaluator
 from airflow.serialization.definitions.assets import (
     SerializedAsset,
     SerializedAssetAlias,
@@ -196,3 +196,40 @@ class TestAssetAlias:
         assert (
             evaluator.run(resolved_asset_alias_2, {SerializedAssetUniqueKey.from_asset(asset): True}) is True
         )
+
+
+class TestAssetConditionIndex:
+    key1 = SerializedAssetUniqueKey.from_asset(asset1)
+    key2 = SerializedAssetUniqueKey.from_asset(asset2)
+
+    def test_record_and_lookup(self):
+        index = AssetConditionIndex()
+        condition = SerializedAssetAll([asset1, asset2])
+        expression = condition.as_expression()
+        index.record_unsatisfied("dag", condition=condition, expression=expression, queued=[self.key1])
+
+        assert index.is_known_unsatisfied("dag", expression=expression, queued=[self.key1])
+        # A new asset event changes the queued set, so the condition must be evaluated again.
+        assert not index.is_known_unsatisfied("dag", expression=expression, queued=[self.key1, self.key2])
+        # So does a change of the Dag's asset expression.
+        assert not index.is_known_unsatisfied("dag", expression={"any": []}, queued=[self.key1])
+        assert not index.is_known_unsatisfied("other", expression=expression, queued=[self.key1])
+
+    def test_conditions_with_aliases_are_not_recorded(self):
+        index = AssetConditionIndex()
+        condition = SerializedAssetAll([asset1, SerializedAssetAlias("alias", "test")])
+        expression = condition.as_expression()
+        index.record_unsatisfied("dag", condition=condition, expression=expression, queued=[self.key1])
+
+        assert len(index) == 0
+        assert not index.is_known_unsatisfied("dag", expression=expression, queued=[self.key1])
+
+    def test_discard_and_retain(self):
+        index = AssetConditionIndex()
+        for dag_id in ("a", "b", "c"):
+            index.record_unsatisfied(dag_id, condition=asset1, expression=None, queued=[])
+        index.discard("a")
+        index.retain({"b"})
+
+        assert len(index) == 1
+        assert index.is_known_unsatisfied("b", expression=None, queued=[])
@@ -37,7 +37,9 @@ from airflow.models.asset import (
     AssetModel,
     AssetPartitionDagRun,
     DagScheduleAssetAliasReference,
+    DagScheduleAssetNameReference,
     DagScheduleAssetReference,
+    DagScheduleAssetUriReference,
 )
 from airflow.models.dag import DAG, DagModel
 from airflow.sdk.definitions.asset import Asset
@@ -161,6 +163,58 @@ class TestAssetManager:
         )
         assert session.scalar(select(func.count()).select_from(AssetDagRunQueue)) == 2
 
+    @pytest.mark.usefixtures("dag_maker", "testing_dag_bundle")
+    def test_register_asset_changes(self, session, mock_task_instance):
+        bundle_name = "testing"
+        dag1 = DagModel(dag_id="dag1", is_stale=False, bundle_name=bundle_name)
+        dag2 = DagModel(dag_id="dag2", is_stale=False, bundle_name=bundle_name)
+        paused_dag = DagModel(dag_id="paused_dag", is_stale=False, is_paused=True, bundle_name=bundle_name)
+        session.add_all([dag1, dag2, paused_dag])
+
+        asm1 = AssetModel(uri="test://asset1/", name="test_asset_1", group="asset")
+        asm2 = AssetModel(uri="test://asset2/", name="test_asset_2", group="asset")
+        asm3 = AssetModel(uri="test://asset3/", name="test_asset_3", group="asset")
+        session.add_all([asm1, asm2, asm3])
+        asm1.scheduled_dags = [DagScheduleAssetReference(dag_id=dag.dag_id) for dag in (dag1, paused_dag)]
+        asm2.scheduled_dags = [DagScheduleAssetReference(dag_id=dag.dag_id) for dag in (dag1, dag2)]
+        session.add(DagScheduleAssetNameReference(name="test_asset_3", dag_id=dag1.dag_id))
+        session.add(DagScheduleAssetUriReference(uri="test://asset3/", dag_id=dag2.dag_id))
+        session.execute(delete(AssetDagRunQueue))
+        session.flush()
+
+        events = AssetManager.register_asset_changes(
+            task_instance=mock_task_instance,
+            asset_changes=[(asm1, {"a": 1}), (asm2, None), (asm3, None)],
+            session=session,
+        )
+        session.flush()
+
+        assert [(e.asset_id, e.extra) for e in events] == [(asm1.id, {"a": 1}), (asm2.id, {}), (asm3.id, {})]
+        assert session.scalar(select(func.count()).select_from(AssetEvent)) == 3
+        assert set(session.execute(select(AssetDagRunQueue.asset_id, AssetDagRunQueue.target_dag_id))) == {
+            (asm1.id, "dag1"),
+            (asm2.id, "dag1"),
+            (asm2.id, "dag2"),
+            (asm3.id, "dag1"),
+            (asm3.id, "dag2"),
+        }
+
+    @pytest.mark.usefixtures("clear_assets", "testing_dag_bundle")
+    def test_register_asset_changes_uses_overridden_register_asset_change(self, session):
+        asm = AssetModel(uri="test://asset1/", name="test_asset_1", group="asset")
+        session.add(asm)
+        session.flush()
+
+        class CustomAssetManager(AssetManager):
+            @classmethod
+            def register_asset_change(cls, **kwargs):
+                return mock.sentinel.event
+
+        events = CustomAssetManager.register_asset_changes(asset_changes=[(asm, None)], session=session)
+
+        assert events == [mock.sentinel.event]
+        assert session.scalar(select(func.count()).select_from(AssetEvent)) == 0
+
     def test_register_asset_change_no_downstreams(self, session, mock_task_instance):
         asset_manager = AssetManager()
 
@@ -39,6 +39,7 @@ from airflow.dag_processing.dagbag import DagBag, sync_bag_to_db
 from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
 from airflow.exceptions import AirflowException
 from airflow.models import DagModel, DagRun
+from airflow.models.dag_file_parse_profile import DagFileParseProfile
 from airflow.models.dagbag import DBDagBag
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.providers.standard.triggers.temporal import DateTimeTrigger, TimeDeltaTrigger
@@ -54,6 +55,7 @@ from airflow.utils.types import DagRunType
 from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.dag import sync_dag_to_db
 from tests_common.test_utils.db import (
+    clear_db_dag_file_parse_profiles,
     clear_db_dags,
     clear_db_import_errors,
     clear_db_runs,
@@ -283,6 +285,40 @@ class TestCliDags:
         assert any(item["file"].endswith("example_complex.py") for item in data)
         assert any("example_complex" in item["dags"] for item in data)
 
+    def test_cli_parse_report(self, stdout_capture):
+        clear_db_dag_file_parse_profiles()
+        with create_session() as session:
+            for relative_fileloc, duration in (("fast.py", 0.5), ("slow.py", 4.0)):
+                session.add(
+                    DagFileParseProfile(
+                        bundle_name="dags-folder",
+                        relative_fileloc=relative_fileloc,
+                        parse_duration=duration,
+                        profile={
+                            "import_duration": duration / 2,
+                            "user_code_duration": duration / 4,
+                            "dagbag_duration": duration / 8,
+                            "serialization_duration": duration / 8,
+                            "imports": [{"module": "pandas", "duration": duration / 2, "self_duration": 0.1}],
+                            "slowest_lines": [],
+                        },
+                    )
+                )
+
+        args = self.parser.parse_args(["dags", "parse-report", "--output", "json"])
+        with stdout_capture as temp_stdout:
+            dag_command.dag_parse_report(args)
+            out = temp_stdout.getvalue()
+        clear_db_dag_file_parse_profiles()
+
+        data = json.loads(out)
+        assert [item["file"] for item in data] == ["slow.py", "fast.py"]
+        assert data[0]["duration"] == "4.0"
+        assert data[0]["imports"] == "2.0"
+        assert data[0]["user_code"] == "1.0"
+        assert data[0]["slowest_import"] == "pandas (2.000s)"
+        assert data[0]["slowest_line"] is None
+
     @conf_vars({("core", "load_examples"): "true"})
     def test_cli_get_dag_details(self, stdout_capture):
         args = self.parser.parse_args(["dags", "details", "example_complex", "--output", "yaml"])
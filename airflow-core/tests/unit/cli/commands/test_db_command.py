@@ -793,6 +793,9 @@ class TestCLIDBClean:
             confirm=False,
             skip_archive=False,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @pytest.mark.parametrize("timezone", ["UTC", "Europe/Berlin", "America/Los_Angeles"])
@@ -816,6 +819,9 @@ class TestCLIDBClean:
             confirm=False,
             skip_archive=False,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @pytest.mark.parametrize(("confirm_arg", "expected"), [(["-y"], False), ([], True)])
@@ -845,6 +851,9 @@ class TestCLIDBClean:
             confirm=expected,
             skip_archive=False,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @pytest.mark.parametrize(("extra_arg", "expected"), [(["--skip-archive"], True), ([], False)])
@@ -874,6 +883,9 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=expected,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @pytest.mark.parametrize(("dry_run_arg", "expected"), [(["--dry-run"], True), ([], False)])
@@ -903,6 +915,9 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @pytest.mark.parametrize(
@@ -934,6 +949,9 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @pytest.mark.parametrize(("extra_args", "expected"), [(["--verbose"], True), ([], False)])
@@ -963,6 +981,9 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @pytest.mark.parametrize(("extra_args", "expected"), [(["--batch-size", "1234"], 1234), ([], None)])
@@ -992,6 +1013,46 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=expected,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
+        )
+
+    @patch("airflow.cli.commands.db_command.run_cleanup")
+    def test_batch_throttling_and_resume(self, run_cleanup_mock):
+        """
+        Throttling and resume options should be forwarded to run_cleanup with correct type.
+        """
+        args = self.parser.parse_args(
+            [
+                "db",
+                "clean",
+                "--clean-before-timestamp",
+                "2021-01-01",
+                "--batch-size",
+                "1000",
+                "--max-rows-per-second",
+                "500",
+                "--sleep-between-batches",
+                "0.5",
+                "--resume",
+            ]
+        )
+        db_command.cleanup_tables(args)
+
+        run_cleanup_mock.assert_called_once_with(
+            table_names=None,
+            dag_ids=None,
+            exclude_dag_ids=None,
+            dry_run=False,
+            clean_before_timestamp=pendulum.parse("2021-01-01 00:00:00Z"),
+            verbose=False,
+            confirm=True,
+            skip_archive=False,
+            batch_size=1000,
+            max_rows_per_second=500.0,
+            sleep_between_batches=0.5,
+            resume=True,
         )
 
     @pytest.mark.parametrize(
@@ -1023,6 +1084,9 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @pytest.mark.parametrize(
@@ -1054,6 +1118,9 @@ class TestCLIDBClean:
             confirm=True,
             skip_archive=False,
             batch_size=None,
+            max_rows_per_second=None,
+            sleep_between_batches=0,
+            resume=False,
         )
 
     @patch("airflow.cli.commands.db_command.export_archived_records")
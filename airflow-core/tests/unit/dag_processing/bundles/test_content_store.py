@@ -0,0 +1,164 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.bundles.content_store import BundleContentStore, BundleFile
+
+from tests_common.test_utils.config import conf_vars
+
+
+@pytest.fixture(autouse=True)
+def bundle_temp_dir(tmp_path):
+    with conf_vars({("dag_processor", "dag_bundle_storage_path"): str(tmp_path)}):
+        yield tmp_path
+
+
+class FakeSource:
+    """Content of files by digest, counting the reads."""
+
+    def __init__(self):
+        self.blobs: dict[str, bytes] = {}
+        self.reads: list[str] = []
+
+    def add(self, path: str, content: bytes, **kwargs) -> BundleFile:
+        digest = hashlib.sha1(content).hexdigest()
+        self.blobs[digest] = content
+        return BundleFile(path=path, digest=digest, **kwargs)
+
+    def read(self, digest: str) -> bytes:
+        self.reads.append(digest)
+        return self.blobs[digest]
+
+
+class TestBundleContentStore:
+    def test_default_path(self, bundle_temp_dir):
+        with conf_vars({("dag_processor", "bundle_content_store_max_size"): "10"}):
+            store = BundleContentStore()
+        assert store.path == bundle_temp_dir / "_content_store"
+        assert store.max_size == 10 * 2**20
+
+    def test_materialize(self, tmp_path):
+        source = FakeSource()
+        files = [
+            source.add("dag.py", b"dag"),
+            source.add("sub/run.sh", b"#!/bin/sh", executable=True),
+            source.add("link.py", b"dag.py", symlink=True),
+        ]
+        store = BundleContentStore(max_size=2**20)
+
+        with mock.patch("airflow.dag_processing.bundles.content_store.Stats.timer") as mock_timer:
+            assert store.materialize(tmp_path / "v1", files, source.read, bundle_name="test") == 2
+        mock_timer.assert_called_once_with(
+            "dag_processing.bundle_materialize_duration", tags={"bundle_name": "test"}
+        )
+
+        assert (tmp_path / "v1" / "dag.py").read_bytes() == b"dag"
+        assert (tmp_path / "v1" / "link.py").readlink().as_posix() == "dag.py"
+        assert os.access(tmp_path / "v1" / "sub" / "run.sh", os.X_OK)
+        assert not os.access(tmp_path / "v1" / "dag.py", os.W_OK | os.X_OK)
+        assert (tmp_path / "v1" / "dag.py").stat().st_nlink == 2
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_materialize_reads_new_files_only(self, tmp_path):
+        source = FakeSource()
+        unchanged = source.add("unchanged.py", b"unchanged")
+        store = BundleContentStore(max_size=2**20)
+
+        store.materialize(
+            tmp_path / "v1", [unchanged, source.add("dag.py", b"v1")], source.read, bundle_name="t"
+        )
+        source.reads.clear()
+        changed = source.add("dag.py", b"v2")
+        assert store.materialize(tmp_path / "v2", [unchanged, changed], source.read, bundle_name="t") == 1
+
+        assert source.reads == [changed.digest]
+        assert (tmp_path / "v2" / "dag.py").read_bytes() == b"v2"
+        assert (tmp_path / "v1" / "dag.py").read_bytes() == b"v1"
+        assert (tmp_path / "v1" / "unchanged.py").samefile(tmp_path / "v2" / "unchanged.py")
+
+    def test_materialize_failure_leaves_no_tree(self, tmp_path):
+        source = FakeSource()
+        files = [source.add("dag.py", b"dag"), BundleFile(path="missing.py", digest="ab" * 20)]
+        store = BundleContentStore(max_size=2**20)
+
+        with pytest.raises(KeyError):
+            store.materialize(tmp_path / "v1", files, source.read, bundle_name="test")
+
+        assert not (tmp_path / "v1").exists()
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_materialize_stores_file_evicted_concurrently(self, tmp_path):
+        source = FakeSource()
+        file = source.add("dag.py", b"dag")
+        store = BundleContentStore(max_size=2**20)
+        store.materialize(tmp_path / "v1", [file], source.read, bundle_name="t")
+        object_path = store._object_path(file.digest, False)
+        shutil.rmtree(tmp_path / "v1")
+
+        def evict_then_utime(path, *args, **kwargs):
+            # Evicted by another process right before its modification time is updated
+            os.unlink(path)
+            raise FileNotFoundError(path)
+
+        with mock.patch("os.utime", side_effect=evict_then_utime):
+            assert store.materialize(tmp_path / "v2", [file], source.read, bundle_name="t") == 1
+
+        assert (tmp_path / "v2" / "dag.py").read_bytes() == b"dag"
+        assert (tmp_path / "v2" / "dag.py").samefile(object_path)
+
+    def test_materialize_copies_if_hard_link_fails(self, tmp_path):
+        source = FakeSource()
+        store = BundleContentStore(max_size=2**20)
+
+        with mock.patch("os.link", side_effect=OSError(18, "Invalid cross-device link")):
+            store.materialize(tmp_path / "v1", [source.add("dag.py", b"dag")], source.read, bundle_name="t")
+
+        assert (tmp_path / "v1" / "dag.py").read_bytes() == b"dag"
+        assert (tmp_path / "v1" / "dag.py").stat().st_nlink == 1
+
+    def test_evict(self, tmp_path):
+        source = FakeSource()
+        store = BundleContentStore(max_size=2**20)
+        store.materialize(tmp_path / "v1", [source.add("old.py", b"o" * 10)], source.read, bundle_name="t")
+        store.materialize(tmp_path / "v2", [source.add("new.py", b"n" * 10)], source.read, bundle_name="t")
+        store.materialize(tmp_path / "v3", [source.add("used.py", b"u" * 10)], source.read, bundle_name="t")
+        old, new, used = (store._object_path(digest, False) for digest in source.blobs)
+        os.utime(old, (0, 0))
+        shutil.rmtree(tmp_path / "v1")
+        shutil.rmtree(tmp_path / "v2")
+
+        # Fits the store
+        assert store.evict() == 0
+
+        # Files still used are kept even if the store does not fit
+        store.max_size = 25
+        assert store.evict() == 10
+        assert not old.exists()
+        assert new.exists()
+
+        store.max_size = 0
+        assert store.evict() == 10
+        assert not new.exists()
+        assert used.exists()
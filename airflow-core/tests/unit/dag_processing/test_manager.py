@@ -53,8 +53,10 @@ from airflow.dag_processing.manager import (
     DagFileStat,
 )
 from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.profiling import ParseProfile
 from airflow.models import DagModel, DbCallbackRequest
 from airflow.models.asset import TaskOutletAssetReference
+from airflow.models.dag_file_parse_profile import DagFileParseProfile
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagbundle import DagBundleModel
 from airflow.models.dagcode import DagCode
@@ -70,6 +72,7 @@ from tests_common.test_utils.db import (
     clear_db_assets,
     clear_db_callbacks,
     clear_db_dag_bundles,
+    clear_db_dag_file_parse_profiles,
     clear_db_dags,
     clear_db_import_errors,
     clear_db_runs,
@@ -80,6 +83,18 @@ from unit.models import TEST_DAGS_FOLDER
 
 pytestmark = pytest.mark.db_test
 
+
+def _parse_profile(duration: float) -> ParseProfile:
+    return ParseProfile(
+        import_duration=duration,
+        user_code_duration=duration,
+        dagbag_duration=duration,
+        serialization_duration=duration,
+        imports=[],
+        slowest_lines=[],
+    )
+
+
 logger = logging.getLogger(__name__)
 TEST_DAG_FOLDER = Path(__file__).parents[1].resolve() / "dags"
 DEFAULT_DATE = timezone.datetime(2016, 1, 1)
@@ -199,6 +214,12 @@ class TestDagFileProcessorManager:
     def clear_parse_import_errors(self):
         clear_db_import_errors()
 
+    @pytest.fixture
+    def clear_parse_profiles(self):
+        clear_db_dag_file_parse_profiles()
+        yield
+        clear_db_dag_file_parse_profiles()
+
     @pytest.mark.usefixtures("clear_parse_import_errors")
     @conf_vars({("core", "load_examples"): "False"})
     def test_remove_file_clears_import_error(self, tmp_path, configure_testing_dag_bundle):
@@ -265,6 +286,68 @@ class TestDagFileProcessorManager:
         assert len(import_errors) == 1
         assert import_errors[0].filename == "test_zip.zip/broken_dag.py"
 
+    @pytest.mark.usefixtures("clear_parse_profiles")
+    def test_persist_parsing_result_replaces_parse_profile(self, session):
+        manager = DagFileProcessorManager(max_runs=1)
+        for duration in (1.0, 2.0):
+            manager.persist_parsing_result(
+                bundle_name="testing",
+                bundle_version=None,
+                parsing_result=DagFileParsingResult(
+                    fileloc="abc.py", serialized_dags=[], parse_profile=_parse_profile(duration)
+                ),
+                run_duration=duration + 1,
+                relative_fileloc="abc.py",
+                session=session,
+            )
+            session.flush()
+
+        profile = session.scalars(select(DagFileParseProfile)).one()
+        assert profile.bundle_name == "testing"
+        assert profile.relative_fileloc == "abc.py"
+        assert profile.parse_duration == 3.0
+        assert profile.profile == _parse_profile(2.0).model_dump(mode="json")
+
+    @pytest.mark.usefixtures("clear_parse_profiles")
+    def test_clear_orphaned_parse_profiles(self, session):
+        for relative_fileloc in ("present.py", "removed.py"):
+            session.add(
+                DagFileParseProfile(
+                    bundle_name="testing",
+                    relative_fileloc=relative_fileloc,
+                    parse_duration=1.0,
+                    profile=_parse_profile(1.0).model_dump(mode="json"),
+                )
+            )
+        session.flush()
+
+        manager = DagFileProcessorManager(max_runs=1)
+        manager.clear_orphaned_parse_profiles(
+            bundle_name="testing", observed_filelocs={"present.py"}, session=session
+        )
+        session.flush()
+
+        assert session.scalars(select(DagFileParseProfile.relative_fileloc)).all() == ["present.py"]
+
+    def test_log_file_processing_stats_with_parse_profile(self, caplog):
+        manager = DagFileProcessorManager(max_runs=1)
+        profiled = DagFileInfo(
+            bundle_name="testing", rel_path=Path("profiled.py"), bundle_path=TEST_DAGS_FOLDER
+        )
+        other = DagFileInfo(bundle_name="testing", rel_path=Path("other.py"), bundle_path=TEST_DAGS_FOLDER)
+        manager._file_stats[profiled] = DagFileStat(
+            last_duration=3.5, last_parse_profile=_parse_profile(1.25)
+        )
+        manager._file_stats[other] = DagFileStat(last_duration=0.5)
+
+        with caplog.at_level(logging.INFO):
+            manager._log_file_processing_stats({"testing": {profiled, other}})
+
+        log_str = caplog.text
+        assert "Imports" in log_str
+        assert "Serialization" in log_str
+        assert "1.25s" in log_str
+
     def test_get_observed_filelocs_expands_zip_inner_paths(self, tmp_path):
         zip_path = tmp_path / "test_zip.zip"
         _create_zip_bundle_with_valid_and_broken_dags(zip_path)
@@ -982,6 +1065,89 @@ class TestDagFileProcessorManager:
         assert manager._file_stats[file_b].run_count == 2
         assert len(manager._processors) == 0
 
+    def test_handle_parsing_result_queues_result_to_writer(self, session):
+        manager = DagFileProcessorManager(max_runs=1, parsing_result_queue_size=10)
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("abc.txt"), bundle_path=TEST_DAGS_FOLDER)
+        manager._file_stats[file] = DagFileStat(run_count=1)
+        manager._bundle_versions["testing"] = "v1"
+
+        processor, _ = self.mock_processor(start_time=time.monotonic() - 1)
+        processor.had_callbacks = False
+        processor.parsing_result = DagFileParsingResult(fileloc="abc.txt", serialized_dags=[])
+
+        with mock.patch.object(manager, "persist_parsing_result") as mock_persist:
+            manager._start_result_writer()
+            # Hold the writer back, to look at the state of the manager while the result is being written
+            with mock.patch.object(manager._result_writer, "_write_batch"):
+                manager.handle_parsing_result(file, processor, session=session)
+
+                assert manager._file_stats[file].run_count == 2
+                assert manager._pending_results[file].next_stat is manager._file_stats[file]
+                manager._stop_result_writer()
+            manager._start_result_writer()
+            manager.handle_parsing_result(file, processor, session=session)
+            manager._stop_result_writer()
+
+        mock_persist.assert_called_once_with(
+            bundle_name="testing",
+            bundle_version="v1",
+            parsing_result=processor.parsing_result,
+            run_duration=mock.ANY,
+            relative_fileloc="abc.txt",
+            session=mock.ANY,
+        )
+        assert mock_persist.call_args.kwargs["session"] is not session
+        assert manager._file_stats[file].run_count == 3
+        assert manager._result_writer is None
+
+    def test_handle_written_results_throttles_retry_when_persist_fails(self, session):
+        manager = DagFileProcessorManager(max_runs=1, parsing_result_queue_size=10)
+        file_a = DagFileInfo(bundle_name="testing", rel_path=Path("a.py"), bundle_path=TEST_DAGS_FOLDER)
+        file_b = DagFileInfo(bundle_name="testing", rel_path=Path("b.py"), bundle_path=TEST_DAGS_FOLDER)
+        manager._file_stats[file_a] = DagFileStat(num_dags=2, run_count=1)
+        manager._file_stats[file_b] = DagFileStat(num_dags=2, run_count=1)
+        manager._bundle_versions["testing"] = "v1"
+
+        proc_a, _ = self.mock_processor(start_time=time.monotonic() - 1)
+        proc_a.had_callbacks = False
+        proc_a.parsing_result = DagFileParsingResult(fileloc="a.py", serialized_dags=[])
+        proc_b, _ = self.mock_processor(start_time=time.monotonic() - 1)
+        proc_b.had_callbacks = False
+        proc_b.parsing_result = DagFileParsingResult(fileloc="b.py", serialized_dags=[])
+        manager._processors = {file_a: proc_a, file_b: proc_b}
+
+        def persist(*, relative_fileloc, **kwargs):
+            if relative_fileloc == "a.py":
+                raise RuntimeError("boom")
+
+        with mock.patch.object(manager, "persist_parsing_result", side_effect=persist):
+            manager._start_result_writer()
+            manager._collect_results(session=session)
+            manager._stop_result_writer()
+
+        # The previous counts of the file are kept, as in the DB
+        assert manager._file_stats[file_a].num_dags == 2
+        assert manager._file_stats[file_a].run_count == 2
+        assert manager._file_stats[file_a].last_finish_time is not None
+        assert manager._file_stats[file_b].num_dags == 0
+        assert manager._file_stats[file_b].run_count == 2
+        assert manager._pending_results == {}
+
+    def test_scan_stale_dags_skips_files_being_written(self):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager.parsing_cleanup_interval = 0
+        file_a = DagFileInfo(bundle_name="testing", rel_path=Path("a.py"), bundle_path=TEST_DAGS_FOLDER)
+        file_b = DagFileInfo(bundle_name="testing", rel_path=Path("b.py"), bundle_path=TEST_DAGS_FOLDER)
+        finish_time = timezone.utcnow()
+        manager._file_stats[file_a] = DagFileStat(last_finish_time=finish_time)
+        manager._file_stats[file_b] = DagFileStat(last_finish_time=finish_time)
+        manager._pending_results[file_b] = mock.MagicMock()
+
+        with mock.patch.object(manager, "deactivate_stale_dags") as mock_deactivate:
+            manager._scan_stale_dags()
+
+        mock_deactivate.assert_called_once_with(last_parsed={file_a: finish_time})
+
     @pytest.mark.usefixtures("testing_dag_bundle")
     @pytest.mark.parametrize(
         ("callbacks", "path", "expected_body"),
@@ -2306,6 +2472,7 @@ class TestDagFileProcessorManager:
             mock.patch.object(manager, "_find_files_in_bundle", return_value=[]),
             mock.patch.object(manager, "deactivate_deleted_dags"),
             mock.patch.object(manager, "clear_orphaned_import_errors"),
+            mock.patch.object(manager, "clear_orphaned_parse_profiles"),
             mock.patch.object(manager, "handle_removed_files"),
             mock.patch.object(manager, "_resort_file_queue"),
             mock.patch.object(manager, "_add_new_files_to_queue"),
@@ -2376,6 +2543,7 @@ class TestDagFileProcessorManager:
             mock.patch.object(manager, "_find_files_in_bundle", return_value=[]) as mock_find,
             mock.patch.object(manager, "deactivate_deleted_dags"),
             mock.patch.object(manager, "clear_orphaned_import_errors"),
+            mock.patch.object(manager, "clear_orphaned_parse_profiles"),
             mock.patch.object(manager, "handle_removed_files"),
             mock.patch.object(manager, "_resort_file_queue"),
             mock.patch.object(manager, "_add_new_files_to_queue"),
@@ -2439,6 +2607,7 @@ class TestDagFileProcessorManager:
             mock.patch.object(manager, "_find_files_in_bundle", return_value=[]),
             mock.patch.object(manager, "deactivate_deleted_dags"),
             mock.patch.object(manager, "clear_orphaned_import_errors"),
+            mock.patch.object(manager, "clear_orphaned_parse_profiles"),
             mock.patch.object(manager, "handle_removed_files"),
             mock.patch.object(manager, "_resort_file_queue"),
             mock.patch.object(manager, "_add_new_files_to_queue"),
@@ -653,6 +653,26 @@ def test_parse_file_static_check_with_default_warning():
     )
 
 
+@pytest.mark.parametrize("parsing_profile", [True, False])
+def test_parse_file_parse_profile(parsing_profile):
+    with conf_vars({("dag_processor", "parsing_profile"): str(parsing_profile)}):
+        result = _parse_file(
+            DagFileParseRequest(
+                file=f"{TEST_DAG_FOLDER}/test_dag_version_inflation_check.py",
+                bundle_path=TEST_DAG_FOLDER,
+                bundle_name="testing",
+            ),
+            log=structlog.get_logger(),
+        )
+
+    if parsing_profile:
+        assert result.parse_profile is not None
+        assert result.parse_profile.user_code_duration > 0
+        assert result.parse_profile.serialization_duration > 0
+    else:
+        assert result.parse_profile is None
+
+
 def test_callback_processing_does_not_update_timestamps():
     """Callback processing should not update last_finish_time to prevent stale DAG detection."""
     stat = process_parse_results(
@@ -1972,6 +1992,8 @@ class TestDagProcessingMessageTypes:
             "UpdateHITLDetail",
             "GetHITLDetailResponse",
             "SetRenderedMapIndex",
+            "GetConnections",
+            "GetVariables",
         }
 
         in_task_runner_but_not_in_dag_processing_process = {
@@ -1990,6 +2012,8 @@ class TestDagProcessingMessageTypes:
             "InactiveAssetsResult",
             "CreateHITLDetailPayload",
             "HITLDetailRequestResult",
+            "ConnectionsResult",
+            "VariablesResult",
         }
 
         supervisor_diff = supervisor_types - manager_types - in_supervisor_but_not_in_manager
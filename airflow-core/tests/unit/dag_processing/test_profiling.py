@@ -0,0 +1,90 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+from __future__ import annotations
+
+import builtins
+import sys
+import textwrap
+
+import pytest
+
+from airflow.dag_processing.dagbag import BundleDagBag
+from airflow.dag_processing.profiling import ParseProfiler
+
+from tests_common.test_utils.config import conf_vars
+
+DAG_FILE = textwrap.dedent(
+    """\
+    import time
+
+    import slow_helper
+    from airflow.sdk import DAG
+
+    time.sleep(0.3)
+
+    with DAG("profiled"):
+        pass
+    """
+)
+
+SLOW_HELPER = "import time\n\ntime.sleep(0.2)\n"
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    (tmp_path / "dag.py").write_text(DAG_FILE)
+    (tmp_path / "slow_helper.py").write_text(SLOW_HELPER)
+    yield tmp_path
+    sys.modules.pop("slow_helper", None)
+    if str(tmp_path) in sys.path:
+        sys.path.remove(str(tmp_path))
+
+
+class TestParseProfiler:
+    def test_from_config(self, tmp_path):
+        assert ParseProfiler.from_config(tmp_path) is None
+        with conf_vars({("dag_processor", "parsing_profile"): "True"}):
+            assert isinstance(ParseProfiler.from_config(tmp_path), ParseProfiler)
+
+    def test_get_profile(self, bundle):
+        profiler = ParseProfiler(bundle, sample_interval=0.005)
+        with profiler.collecting_dags():
+            bag = BundleDagBag(
+                dag_folder=bundle / "dag.py", bundle_path=bundle, bundle_name="testing", load_op_links=False
+            )
+        with profiler.serializing():
+            pass
+        profile = profiler.get_profile(bag)
+
+        assert bag.dag_ids == ["profiled"]
+        assert profile.imports[0].module == "slow_helper"
+        assert profile.imports[0].duration >= 0.2
+        assert profile.import_duration >= profile.imports[0].duration
+        # The sleep of the helper is counted in the imports, not in the top-level code of the file
+        assert 0.3 <= profile.user_code_duration < 0.5
+        assert profile.dagbag_duration >= 0
+        assert profile.serialization_duration >= 0
+        locations = [line.location for line in profile.slowest_lines]
+        assert locations[:2] == ["dag.py:6", "slow_helper.py:3"]
+
+    def test_collecting_dags_restores_import(self, bundle):
+        original_import = builtins.__import__
+        profiler = ParseProfiler(bundle, sample_interval=0.005)
+        with pytest.raises(RuntimeError, match="boom"), profiler.collecting_dags():
+            raise RuntimeError("boom")
+
+        assert builtins.__import__ is original_import
@@ -0,0 +1,115 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.result_writer import ParsingResultWriter, WriteOutcome
+
+pytestmark = pytest.mark.db_test
+
+
+class RecordingWrite:
+    """Write recording the transactions it ran in, optionally failing or rolling back the transaction."""
+
+    def __init__(self, *, error: Exception | None = None, rollback: bool = False):
+        self.transactions: list = []
+        self.error = error
+        self.rollback = rollback
+
+    def __call__(self, *, session):
+        self.transactions.append(session.get_transaction())
+        if self.error:
+            raise self.error
+        if self.rollback:
+            self.rollback = False
+            session.rollback()
+
+
+def _write_all(writes: dict[str, RecordingWrite], max_batch_size: int) -> list[WriteOutcome]:
+    writer = ParsingResultWriter(max_queue_size=len(writes), max_batch_size=max_batch_size)
+    # Queued before the thread starts, so that they are written in as few batches as possible
+    for key, write in writes.items():
+        writer.submit(key, write)
+    writer.start()
+    writer.stop()
+    return writer.get_outcomes()
+
+
+class TestParsingResultWriter:
+    def test_writes_batches_in_single_transaction(self):
+        writes = {key: RecordingWrite() for key in ("a", "b", "c")}
+
+        outcomes = _write_all(writes, max_batch_size=2)
+
+        assert outcomes == [WriteOutcome("a", None), WriteOutcome("b", None), WriteOutcome("c", None)]
+        assert writes["a"].transactions == writes["b"].transactions
+        assert writes["c"].transactions != writes["a"].transactions
+
+    def test_failed_batch_is_written_one_by_one(self):
+        error = RuntimeError("boom")
+        writes = {"a": RecordingWrite(), "b": RecordingWrite(error=error), "c": RecordingWrite()}
+
+        outcomes = _write_all(writes, max_batch_size=3)
+
+        assert outcomes == [WriteOutcome("a", None), WriteOutcome("b", error), WriteOutcome("c", None)]
+        assert len(writes["a"].transactions) == 2
+        assert len(writes["b"].transactions) == 2
+        assert len(writes["c"].transactions) == 1
+
+    def test_rolled_back_batch_is_written_one_by_one(self):
+        writes = {"a": RecordingWrite(), "b": RecordingWrite(rollback=True)}
+
+        outcomes = _write_all(writes, max_batch_size=2)
+
+        assert outcomes == [WriteOutcome("a", None), WriteOutcome("b", None)]
+        # The write of "a" was rolled back with the transaction of the batch
+        assert len(writes["a"].transactions) == 2
+
+    def test_paused(self):
+        writer = ParsingResultWriter(max_queue_size=1, max_batch_size=1)
+        write = RecordingWrite()
+        writer.start()
+
+        with writer.paused():
+            writer.submit("a", write)
+            # Give the thread the opportunity to write the result
+            writer._thread.join(timeout=0.1)
+            assert write.transactions == []
+        writer.stop()
+
+        assert writer.get_outcomes() == [WriteOutcome("a", None)]
+        assert len(write.transactions) == 1
+
+    def test_metrics(self):
+        with mock.patch("airflow.dag_processing.result_writer.Stats") as mock_stats:
+            _write_all({"a": RecordingWrite(), "b": RecordingWrite()}, max_batch_size=1)
+
+        # Depth of the queue once each result is submitted, then once all the results are written
+        assert mock_stats.gauge.call_args_list[:2] == [
+            mock.call("dag_processing.parsing_result_queue_depth", 1),
+            mock.call("dag_processing.parsing_result_queue_depth", 2),
+        ]
+        assert mock_stats.gauge.call_args_list[-1] == mock.call(
+            "dag_processing.parsing_result_queue_depth", 0
+        )
+        assert mock_stats.timer.call_args_list == [
+            mock.call("dag_processing.parsing_result_write_duration"),
+            mock.call("dag_processing.parsing_result_write_duration"),
+        ]
@@ -8016,6 +8016,25 @@ class TestSchedulerJob:
 
         assert recorded == [("scheduler.dagruns.running", 2)]
 
+    @mock.patch("airflow.jobs.scheduler_job_runner.DagRunStateCount")
+    def test_refresh_dag_run_state_counts(self, mock_dag_run_state_count, session):
+        """Test that runs updated since shortly before the previous refresh are recounted."""
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(scheduler_job)
+
+        # Everything is recounted as long as the counts were not reconciled yet.
+        self.job_runner._refresh_dag_run_state_counts(session=session)
+        mock_dag_run_state_count.refresh.assert_called_once_with(session=session)
+        mock_dag_run_state_count.refresh_updated_since.assert_not_called()
+        reconciled_at = self.job_runner._dag_run_state_counts_refreshed_at
+        assert reconciled_at is not None
+
+        self.job_runner._refresh_dag_run_state_counts(session=session)
+        mock_dag_run_state_count.refresh_updated_since.assert_called_once_with(
+            reconciled_at - timedelta(seconds=60), session=session
+        )
+        assert self.job_runner._dag_run_state_counts_refreshed_at >= reconciled_at
+
     # Multi-team scheduling tests
     def test_multi_team_get_team_names_for_dag_ids_success(self, dag_maker, session):
         """Test successful team name resolution for multiple DAG IDs."""
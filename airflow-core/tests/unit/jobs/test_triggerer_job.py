@@ -1576,6 +1576,8 @@ class TestTriggererMessageTypes:
             "CreateHITLDetailPayload",
             "SetRenderedMapIndex",
             "GetDag",
+            "GetConnections",
+            "GetVariables",
         }
 
         in_task_but_not_in_trigger_runner = {
@@ -1596,6 +1598,8 @@ class TestTriggererMessageTypes:
             "PreviousTIResult",
             "HITLDetailRequestResult",
             "DagResult",
+            "ConnectionsResult",
+            "VariablesResult",
         }
 
         supervisor_diff = (
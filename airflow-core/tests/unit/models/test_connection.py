@@ -485,6 +485,18 @@ class TestConnection:
         mock_env_backend.assert_called_once_with(conn_id="test_conn", team_name=None)
         mock_db_backend.assert_called_once_with(conn_id="test_conn", team_name=None)
 
+    @mock.patch.dict("os.environ", {"AIRFLOW_CONN_ENV_CONN": "http://env-host"})
+    @mock.patch("airflow.secrets.metastore.MetastoreBackend.get_connections")
+    def test_get_connections_from_secrets(self, mock_db_backend):
+        mock_db_backend.return_value = {"db_conn": Connection(conn_id="db_conn", conn_type="test")}
+
+        result = Connection.get_connections_from_secrets(["env_conn", "db_conn", "missing_conn"])
+
+        assert result.keys() == {"env_conn", "db_conn"}
+        assert result["env_conn"].host == "env-host"
+        # Only the connections not found by the previous backends are looked up
+        mock_db_backend.assert_called_once_with(conn_ids=["db_conn", "missing_conn"], team_name=None)
+
     @pytest.mark.db_test
     @conf_vars({("core", "multi_team"): "True"})
     @mock.patch.dict(sys.modules, {"airflow.sdk.execution_time.task_runner": None})
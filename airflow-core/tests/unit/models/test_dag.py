@@ -39,6 +39,7 @@ from airflow import settings
 from airflow._shared.module_loading import qualname
 from airflow._shared.timezones import timezone
 from airflow._shared.timezones.timezone import datetime as datetime_tz
+from airflow.assets.evaluation import AssetConditionIndex, AssetEvaluator
 from airflow.configuration import conf
 from airflow.dag_processing.dagbag import BundleDagBag, DagBag
 from airflow.exceptions import AirflowException
@@ -2208,6 +2209,67 @@ class TestDagModel:
         dag_models = query.all()
         assert dag_models == [dag_model]
 
+    def test_dags_needing_dagruns_assets_condition_index(self, dag_maker, session):
+        asset1 = Asset(uri="test://asset1", group="test-group")
+        asset2 = Asset(uri="test://asset2", group="test-group")
+        with dag_maker(
+            session=session,
+            dag_id="my_dag",
+            schedule=[asset1, asset2],
+            start_date=pendulum.now().add(days=-2),
+        ) as dag:
+            EmptyOperator(task_id="dummy")
+
+        dag_model = session.scalar(select(DagModel).where(DagModel.dag_id == dag.dag_id))
+        asset_models = {a.uri: a for a in dag_model.schedule_assets}
+        session.add(AssetDagRunQueue(asset_id=asset_models[asset1.uri].id, target_dag_id=dag.dag_id))
+        session.flush()
+
+        index = AssetConditionIndex()
+        query, _ = DagModel.dags_needing_dagruns(session, asset_condition_index=index)
+        assert query.all() == []
+        assert len(index) == 1
+
+        # Nothing changed, so the serialized Dag is not loaded again.
+        with mock.patch.object(SerializedDagModel, "get_latest_serialized_dags") as get_ser_dags:
+            get_ser_dags.return_value = []
+            query, _ = DagModel.dags_needing_dagruns(session, asset_condition_index=index)
+            assert query.all() == []
+        get_ser_dags.assert_called_once_with(dag_ids=[], session=session)
+
+        # A new event for the other asset satisfies the condition.
+        session.add(AssetDagRunQueue(asset_id=asset_models[asset2.uri].id, target_dag_id=dag.dag_id))
+        session.flush()
+        query, _ = DagModel.dags_needing_dagruns(session, asset_condition_index=index)
+        assert query.all() == [dag_model]
+        assert len(index) == 0
+
+    @pytest.mark.parametrize("error", [AttributeError("old serialization"), RuntimeError("boom")])
+    def test_dags_needing_dagruns_assets_condition_index_evaluation_error(self, dag_maker, session, error):
+        asset = Asset(uri="test://asset1", group="test-group")
+        with dag_maker(
+            session=session,
+            dag_id="my_dag",
+            schedule=[asset],
+            start_date=pendulum.now().add(days=-2),
+        ) as dag:
+            EmptyOperator(task_id="dummy")
+
+        dag_model = session.scalar(select(DagModel).where(DagModel.dag_id == dag.dag_id))
+        session.add(AssetDagRunQueue(asset_id=dag_model.schedule_assets[0].id, target_dag_id=dag.dag_id))
+        session.flush()
+
+        index = AssetConditionIndex()
+        with mock.patch.object(AssetEvaluator, "run", side_effect=error):
+            query, _ = DagModel.dags_needing_dagruns(session, asset_condition_index=index)
+            assert query.all() == []
+        # The condition could not be evaluated, so it is not known to be unsatisfied
+        assert len(index) == 0
+
+        # Evaluated again once it can be, e.g. after the Dag is reserialized
+        query, _ = DagModel.dags_needing_dagruns(session, asset_condition_index=index)
+        assert query.all() == [dag_model]
+
     def test_dags_needing_dagruns_skips_adrq_when_serialized_dag_missing(
         self, session, caplog, testing_dag_bundle
     ):
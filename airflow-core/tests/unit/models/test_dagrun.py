@@ -47,7 +47,7 @@ from airflow._shared.timezones import timezone
 from airflow.callbacks.callback_requests import DagCallbackRequest, DagRunContext
 from airflow.models.dag import DagModel, infer_automated_data_interval
 from airflow.models.dag_version import DagVersion
-from airflow.models.dagrun import DagRun, DagRunNote
+from airflow.models.dagrun import DagRun, DagRunNote, UnmetDependenciesCache
 from airflow.models.deadline import Deadline
 from airflow.models.deadline_alert import DeadlineAlert as DeadlineAlertModel
 from airflow.models.serialized_dag import SerializedDagModel
@@ -1926,6 +1926,73 @@ def test_ti_scheduling_mapped_zero_length(dag_maker, session):
     assert indices == [(-1, TaskInstanceState.SKIPPED)]
 
 
+def test_ti_scheduling_skips_unchanged_unmet_dependencies(dag_maker, session):
+    with dag_maker(session=session):
+        upstream = EmptyOperator(task_id="upstream")
+        upstream >> EmptyOperator(task_id="downstream")
+        upstream >> EmptyOperator(task_id="past", depends_on_past=True)
+
+    dr: DagRun = dag_maker.create_dagrun()
+    upstream_ti = dr.get_task_instance("upstream", session=session)
+    upstream_ti.state = TaskInstanceState.RUNNING
+    session.flush()
+
+    cache = UnmetDependenciesCache()
+    decision = dr.task_instance_scheduling_decisions(session=session, unmet_dependencies_cache=cache)
+    assert decision.schedulable_tis == []
+    assert len(cache) == 1
+
+    with (
+        mock.patch.object(TaskInstance, "are_dependencies_met", autospec=True, return_value=False) as met,
+        mock.patch("airflow.models.dagrun.Stats.incr") as stats_incr,
+    ):
+        dr.task_instance_scheduling_decisions(session=session, unmet_dependencies_cache=cache)
+    # Only the task depending on the past is evaluated again.
+    assert [c.args[0].task_id for c in met.call_args_list] == ["past"]
+    stats_incr.assert_called_once_with("scheduler.dependency_evaluations_skipped", 1)
+
+    upstream_ti.state = TaskInstanceState.SUCCESS
+    session.flush()
+    decision = dr.task_instance_scheduling_decisions(session=session, unmet_dependencies_cache=cache)
+    assert sorted(ti.task_id for ti in decision.schedulable_tis) == ["downstream", "past"]
+    assert len(cache) == 0
+
+
+def test_ti_scheduling_mapped_expansion_spread_across_loops(dag_maker, session):
+    with dag_maker(session=session):
+        task = BaseOperator(task_id="task_1")
+        mapped = MockOperator.partial(task_id="task_2").expand(arg2=task.output)
+
+    dr: DagRun = dag_maker.create_dagrun()
+    ti1 = dr.get_task_instance(task.task_id, session=session)
+    ti1.state = TaskInstanceState.SUCCESS
+    session.add(
+        TaskMap(dag_id=dr.dag_id, task_id=ti1.task_id, run_id=dr.run_id, map_index=-1, length=5, keys=None)
+    )
+    session.flush()
+
+    def _get_map_indexes():
+        return session.scalars(
+            select(TI.map_index)
+            .where(TI.task_id == mapped.task_id, TI.dag_id == mapped.dag_id, TI.run_id == dr.run_id)
+            .order_by(TI.map_index)
+        ).all()
+
+    with mock.patch.object(DagRun, "MAX_TIS_EXPANDED_PER_LOOP", 2):
+        decision = dr.task_instance_scheduling_decisions(session=session)
+        assert sorted(ti.map_index for ti in decision.schedulable_tis) == [0, 1]
+        assert _get_map_indexes() == [-1, 0, 1]
+
+        # The unexpanded task instance keeps the run from finishing before the rest is created.
+        assert [(ti.task_id, ti.map_index) for ti in decision.unfinished_tis] == [(mapped.task_id, -1)]
+
+        decision = dr.task_instance_scheduling_decisions(session=session)
+        assert _get_map_indexes() == [-1, 0, 1, 2, 3]
+
+        decision = dr.task_instance_scheduling_decisions(session=session)
+        assert _get_map_indexes() == [0, 1, 2, 3, 4]
+
+
 @pytest.mark.parametrize("trigger_rule", [TriggerRule.ALL_DONE, TriggerRule.ALL_SUCCESS])
 def test_mapped_task_upstream_failed(dag_maker, session, trigger_rule):
     from airflow.providers.standard.operators.python import PythonOperator
@@ -2613,6 +2680,36 @@ def test_mapped_task_group_expands(dag_maker, session):
     }
 
 
+def test_get_ready_tis_recounts_tis_after_revising_map_indexes(dag_maker, session):
+    with dag_maker(session=session):
+        EmptyOperator(task_id="a")
+        EmptyOperator(task_id="b")
+    dr = dag_maker.create_dagrun()
+    schedulable_tis = [dr.get_task_instance(task_id, session=session) for task_id in ("a", "b")]
+
+    ti_counts_seen = []
+
+    def are_dependencies_met(ti, *, dep_context, session, **kwargs):
+        ti_counts_seen.append((ti.task_id, dep_context.ti_counts))
+        dep_context.ensure_ti_counts(dr, session)
+        return True
+
+    def revise_map_indexes(task, **kwargs):
+        if task.task_id == "a":
+            yield mock.MagicMock(task_id="a", map_index=1)
+
+    with (
+        mock.patch.object(
+            TaskInstance, "are_dependencies_met", autospec=True, side_effect=are_dependencies_met
+        ),
+        mock.patch.object(dr, "_revise_map_indexes_if_mapped", side_effect=revise_map_indexes),
+    ):
+        dr._get_ready_tis(schedulable_tis, finished_tis=[], session=session)
+
+    # The task instances created for "a" are counted again for "b"
+    assert ti_counts_seen == [("a", None), ("b", None)]
+
+
 @pytest.mark.parametrize("rerun_length", [0, 1, 2, 3])
 def test_mapped_task_rerun_with_different_length_of_args(session, dag_maker, rerun_length):
     @task
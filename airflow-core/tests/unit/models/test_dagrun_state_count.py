@@ -0,0 +1,142 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import delete, select, update
+
+from airflow._shared.timezones import timezone
+from airflow.models.dagrun import DagRun
+from airflow.models.dagrun_state_count import DagRunStateCount
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.utils.state import DagRunState
+from airflow.utils.types import DagRunType
+
+from tests_common.test_utils.db import clear_db_dags, clear_db_runs
+
+pytestmark = pytest.mark.db_test
+
+DEFAULT_DATE = timezone.datetime(2024, 1, 1)
+
+
+def _counts(session):
+    counts: Counter[tuple[str, str]] = Counter()
+    for row in session.scalars(select(DagRunStateCount)).all():
+        counts[row.dag_id, row.state] += row.run_count
+    return dict(counts)
+
+
+class TestDagRunStateCount:
+    def setup_method(self):
+        clear_db_runs()
+        clear_db_dags()
+
+    def teardown_method(self):
+        clear_db_runs()
+        clear_db_dags()
+
+    def _create_runs(self, dag_maker, dag_id, states, session):
+        with dag_maker(dag_id, schedule=None, start_date=DEFAULT_DATE, session=session):
+            EmptyOperator(task_id="task")
+        for i, state in enumerate(states):
+            dag_maker.create_dagrun(
+                run_id=f"run_{i}",
+                run_type=DagRunType.MANUAL,
+                logical_date=DEFAULT_DATE + timedelta(days=i),
+                state=state,
+                session=session,
+            )
+        session.commit()
+
+    def test_refresh(self, dag_maker, session):
+        self._create_runs(
+            dag_maker, "dag_1", [DagRunState.RUNNING, DagRunState.SUCCESS, DagRunState.SUCCESS], session
+        )
+        self._create_runs(dag_maker, "dag_2", [DagRunState.FAILED], session)
+
+        DagRunStateCount.refresh(session=session)
+
+        assert _counts(session) == {
+            ("dag_1", DagRunState.RUNNING): 1,
+            ("dag_1", DagRunState.SUCCESS): 2,
+            ("dag_2", DagRunState.FAILED): 1,
+        }
+
+        session.execute(
+            update(DagRun)
+            .where(DagRun.dag_id == "dag_1", DagRun.state == DagRunState.RUNNING)
+            .values(state=DagRunState.SUCCESS)
+        )
+        session.execute(delete(DagRun).where(DagRun.dag_id == "dag_2"))
+        session.commit()
+
+        DagRunStateCount.refresh(["dag_1"], session=session)
+
+        assert _counts(session) == {
+            ("dag_1", DagRunState.SUCCESS): 3,
+            ("dag_2", DagRunState.FAILED): 1,
+        }
+
+        DagRunStateCount.refresh(session=session)
+
+        assert _counts(session) == {("dag_1", DagRunState.SUCCESS): 3}
+
+    def test_refresh_updated_since(self, dag_maker, session):
+        self._create_runs(dag_maker, "dag_1", [DagRunState.RUNNING], session)
+        self._create_runs(dag_maker, "dag_2", [DagRunState.RUNNING], session)
+        DagRunStateCount.refresh(session=session)
+
+        since = timezone.utcnow()
+        session.execute(update(DagRun).values(state=DagRunState.SUCCESS))
+        session.execute(
+            update(DagRun).where(DagRun.dag_id == "dag_2").values(updated_at=since - timedelta(hours=1))
+        )
+        session.commit()
+
+        DagRunStateCount.refresh_updated_since(since, session=session)
+
+        assert _counts(session) == {
+            ("dag_1", DagRunState.SUCCESS): 1,
+            ("dag_2", DagRunState.RUNNING): 1,
+        }
+
+    def test_refresh_buckets(self, dag_maker, session):
+        self._create_runs(
+            dag_maker, "dag_1", [DagRunState.SUCCESS, DagRunState.SUCCESS, DagRunState.QUEUED], session
+        )
+        start_dates = [DEFAULT_DATE + timedelta(minutes=5), DEFAULT_DATE + timedelta(minutes=55), None]
+        for run_id, start_date in zip(["run_0", "run_1", "run_2"], start_dates):
+            session.execute(
+                update(DagRun)
+                .where(DagRun.run_id == run_id)
+                .values(start_date=start_date, run_after=DEFAULT_DATE + timedelta(hours=2, minutes=30))
+            )
+        session.commit()
+
+        DagRunStateCount.refresh(session=session)
+
+        rows = session.scalars(select(DagRunStateCount).order_by(DagRunStateCount.bucket)).all()
+        assert [(row.state, row.bucket, row.run_count) for row in rows] == [
+            # Started runs are counted in the hour they started in
+            (DagRunState.SUCCESS, DEFAULT_DATE, 2),
+            # Runs not started yet in the hour they became due in
+            (DagRunState.QUEUED, DEFAULT_DATE + timedelta(hours=2), 1),
+        ]
@@ -226,6 +226,45 @@ def test_expand_mapped_task_failed_state_in_db(dag_maker, session):
     assert indices == [(0, "success"), (1, "success")]
 
 
+def test_expand_mapped_task_instance_in_batches(dag_maker, session):
+    with dag_maker(session=session, serialized=True) as dag:
+        task1 = BaseOperator(task_id="op1")
+        mapped = MockOperator.partial(task_id="task_2").expand(arg2=task1.output)
+
+    dr = dag_maker.create_dagrun()
+    mapped_deser = dag.task_dict[mapped.task_id]
+    session.add(
+        TaskMap(dag_id=dr.dag_id, task_id=task1.task_id, run_id=dr.run_id, map_index=-1, length=5, keys=None)
+    )
+    session.flush()
+
+    def _get_map_indexes():
+        return session.scalars(
+            select(TaskInstance.map_index)
+            .where(
+                TaskInstance.task_id == mapped.task_id,
+                TaskInstance.dag_id == mapped.dag_id,
+                TaskInstance.run_id == dr.run_id,
+            )
+            .order_by(TaskInstance.map_index)
+        ).all()
+
+    # The unmapped task instance is kept until all mapped task instances exist.
+    tis, max_map_index = TaskMap.expand_mapped_task(mapped_deser, dr.run_id, session=session, max_new_tis=2)
+    assert [ti.map_index for ti in tis] == [0, 1]
+    assert all(ti.task is mapped_deser for ti in tis)
+    assert max_map_index == 4
+    assert _get_map_indexes() == [-1, 0, 1]
+
+    tis, _ = TaskMap.expand_mapped_task(mapped_deser, dr.run_id, session=session, max_new_tis=2)
+    assert [ti.map_index for ti in tis] == [2, 3]
+    assert _get_map_indexes() == [-1, 0, 1, 2, 3]
+
+    tis, _ = TaskMap.expand_mapped_task(mapped_deser, dr.run_id, session=session, max_new_tis=2)
+    assert [ti.map_index for ti in tis] == [4]
+    assert _get_map_indexes() == [0, 1, 2, 3, 4]
+
+
 def test_expand_mapped_task_instance_skipped_on_zero(dag_maker, session):
     with dag_maker(session=session, serialized=True) as dag:
         task1 = BaseOperator(task_id="op1")
@@ -378,6 +378,21 @@ class TestVariable:
         mock_backend.get_variable.assert_called_once()  # second call was not made because of cache
         assert first == second
 
+    @mock.patch("airflow.models.variable.ensure_secrets_loaded")
+    def test_get_variables_from_secrets(self, mock_ensure_secrets: mock.Mock):
+        first_backend = mock.Mock()
+        first_backend.get_variables.return_value = {"key_1": "first_val"}
+        second_backend = mock.Mock()
+        second_backend.get_variables.return_value = {"key_2": "second_val"}
+        mock_ensure_secrets.return_value = [first_backend, second_backend]
+
+        values = Variable.get_variables_from_secrets(["key_1", "key_2", "key_3"])
+
+        assert values == {"key_1": "first_val", "key_2": "second_val"}
+        first_backend.get_variables.assert_called_once_with(keys=["key_1", "key_2", "key_3"], team_name=None)
+        # Only the variables not found by the previous backends are looked up
+        second_backend.get_variables.assert_called_once_with(keys=["key_2", "key_3"], team_name=None)
+
     def test_cache_invalidation_on_set(self, session):
         with mock.patch.dict("os.environ", AIRFLOW_VAR_KEY="from_env"):
             a = Variable.get("key")  # value is saved in cache
@@ -90,6 +90,7 @@ def get_task_instance(monkeypatch, session, dag_maker):
             success_setup=success_setup,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: fake_upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_state_counts", lambda *_: fake_upstream_states)
 
         return ti
 
@@ -1404,6 +1405,39 @@ class TestTriggerRuleDep:
         dr.update_state(session=session)
         assert dr.state == DagRunState.SUCCESS
 
+    def test_UpstreamTIStates_from_state_counts(self, session, dag_maker):
+        with dag_maker(session=session):
+            setup = EmptyOperator(task_id="setup").as_setup()
+            op1 = EmptyOperator(task_id="op1")
+            op2 = EmptyOperator(task_id="op2")
+            op3 = EmptyOperator(task_id="op3", trigger_rule=TriggerRule.ALL_DONE)
+            setup >> (op1, op2) >> op3
+
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.task_instances}
+        tis["setup"].state = SUCCESS
+        tis["op1"].state = FAILED
+        tis["op2"].state = SKIPPED
+
+        dep_context = DepContext(finished_tis=[tis["setup"], tis["op1"], tis["op2"]])
+        state_counts = dep_context.ensure_finished_ti_state_counts(dr, session)
+        assert state_counts == {"setup": {SUCCESS: 1}, "op1": {FAILED: 1}, "op2": {SKIPPED: 1}}
+
+        for task_id in ("op1", "op3"):
+            task = tis[task_id].task
+            upstream_tasks = {t.task_id: t for t in task.upstream_list}
+            expected = _UpstreamTIStates.calculate(
+                ti for ti in dep_context.finished_tis if ti.task_id in upstream_tasks
+            )
+            assert _UpstreamTIStates.calculate_from_state_counts(state_counts, upstream_tasks) == expected
+
+        # The counts are computed once per dependency context.
+        assert dep_context.ensure_finished_ti_state_counts(dr, session) is state_counts
+        assert dep_context.ensure_ti_counts(dr, session) == {"setup": 1, "op1": 1, "op2": 1, "op3": 1}
+        with mock.patch.object(session, "execute") as execute:
+            dep_context.ensure_ti_counts(dr, session)
+        execute.assert_not_called()
+
     @pytest.mark.parametrize(("flag_upstream_failed", "expected_ti_state"), [(True, REMOVED), (False, None)])
     def test_mapped_task_upstream_removed_with_all_success_trigger_rules(
         self,
@@ -1433,6 +1467,7 @@ class TestTriggerRuleDep:
             success_setup=0,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_state_counts", lambda *_: upstream_states)
 
         _test_trigger_rule(
             ti=ti,
@@ -1470,6 +1505,7 @@ class TestTriggerRuleDep:
             success_setup=0,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_state_counts", lambda *_: upstream_states)
 
         _test_trigger_rule(ti=ti, session=session, flag_upstream_failed=flag_upstream_failed)
 
@@ -1506,6 +1542,7 @@ class TestTriggerRuleDep:
             success_setup=0,
         )
         monkeypatch.setattr(_UpstreamTIStates, "calculate", lambda *_: upstream_states)
+        monkeypatch.setattr(_UpstreamTIStates, "calculate_from_state_counts", lambda *_: upstream_states)
 
         _test_trigger_rule(ti=ti, session=session, flag_upstream_failed=flag_upstream_failed)
 
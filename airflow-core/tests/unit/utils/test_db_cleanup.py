@@ -36,6 +36,7 @@ from airflow.exceptions import AirflowException
 from airflow.models import DagModel, DagRun, TaskInstance
 from airflow.models.dag_version import DagVersion
 from airflow.models.dagbundle import DagBundleModel
+from airflow.models.db_clean_checkpoint import DbCleanCheckpoint
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.providers.standard.operators.python import PythonOperator
 from airflow.serialization.serialized_objects import LazyDeserializedDAG
@@ -47,6 +48,7 @@ from airflow.utils.db_cleanup import (
     _confirm_drop_archives,
     _dump_table_to_file,
     _get_archived_table_names,
+    _save_checkpoint,
     config_dict,
     drop_archived_tables,
     export_archived_records,
@@ -455,6 +457,136 @@ class TestDBCleanup:
             assert session.scalar(select(func.count()).select_from(model)) == 5
             assert len(_get_archived_table_names(["dag_run"], session)) == expected_archives
 
+    @pytest.mark.parametrize(
+        ("skip_archive", "expected_archives"),
+        [pytest.param(True, 0, id="skip_archive"), pytest.param(False, 1, id="do_archive")],
+    )
+    def test_cleanup_table_in_batches(self, skip_archive, expected_archives):
+        """All batches of a batched cleanup should be archived to a single table."""
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict["dag_run"].__dict__,
+                clean_before_timestamp=base_date.add(days=5),
+                dry_run=False,
+                session=session,
+                skip_archive=skip_archive,
+                batch_size=2,
+            )
+            model = config_dict["dag_run"].orm_model
+            assert session.scalar(select(func.count()).select_from(model)) == 5
+            archived_table_names = _get_archived_table_names(["dag_run"], session)
+            assert len(archived_table_names) == expected_archives
+            if archived_table_names:
+                (archived_table_name,) = archived_table_names
+                assert session.scalar(text(f"SELECT COUNT(*) FROM {archived_table_name}")) == 5
+            assert session.scalar(select(func.count()).select_from(DbCleanCheckpoint)) == 0
+
+    def test_cleanup_table_in_batches_resume(self):
+        """A resumed batched cleanup should continue after the checkpoint and reuse its archive table."""
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            saved_checkpoints = []
+
+            def interrupt_after_first_batch(**kwargs):
+                if saved_checkpoints:
+                    raise RuntimeError("Interrupted")
+                saved_checkpoints.append(kwargs)
+                _save_checkpoint(**kwargs)
+
+            with patch("airflow.utils.db_cleanup._save_checkpoint", side_effect=interrupt_after_first_batch):
+                with pytest.raises(RuntimeError):
+                    _cleanup_table(
+                        **config_dict["dag_run"].__dict__,
+                        clean_before_timestamp=base_date.add(days=5),
+                        dry_run=False,
+                        session=session,
+                        batch_size=2,
+                    )
+            session.rollback()
+            # The first batch is committed with its checkpoint, while the second one was rolled back.
+            model = config_dict["dag_run"].orm_model
+            assert session.scalar(select(func.count()).select_from(model)) == 8
+            (checkpoint,) = session.scalars(select(DbCleanCheckpoint)).all()
+            assert checkpoint.table_name == "dag_run"
+            assert checkpoint.rows_deleted == 2
+
+            _cleanup_table(
+                **config_dict["dag_run"].__dict__,
+                clean_before_timestamp=base_date.add(days=5),
+                dry_run=False,
+                session=session,
+                batch_size=2,
+                resume=True,
+            )
+            assert session.scalar(select(func.count()).select_from(model)) == 5
+            assert _get_archived_table_names(["dag_run"], session) == [checkpoint.archive_table_name]
+            archived_rows = session.scalar(text(f"SELECT COUNT(*) FROM {checkpoint.archive_table_name}"))
+            assert archived_rows == 5
+            assert session.scalar(select(func.count()).select_from(DbCleanCheckpoint)) == 0
+
+    @pytest.mark.parametrize("skip_archive", [True, False])
+    @patch(
+        "airflow.utils.db_cleanup.detach_partitions_before", return_value=["log_p_legacy", "log_p20220101"]
+    )
+    @patch("airflow.utils.db_cleanup.is_partitioned", return_value=True)
+    def test_cleanup_partitioned_table(self, is_partitioned_mock, detach_mock, skip_archive):
+        """Expired partitions of partitioned tables should be archived or dropped as a whole."""
+        clean_before_date = pendulum.DateTime(2022, 1, 5, tzinfo=pendulum.timezone("UTC"))
+        session = MagicMock()
+        with patch("airflow.utils.db_cleanup._check_for_rows", return_value=0):
+            _cleanup_table(
+                **config_dict["log"].__dict__,
+                clean_before_timestamp=clean_before_date,
+                dry_run=False,
+                session=session,
+                skip_archive=skip_archive,
+            )
+        detach_mock.assert_called_once_with("log", clean_before_date, session=session)
+        statements = [str(c.args[0]) for c in session.execute.call_args_list]
+        if skip_archive:
+            assert statements == ["DROP TABLE log_p_legacy", "DROP TABLE log_p20220101"]
+        else:
+            assert len(statements) == 2
+            assert statements[0].startswith(f"ALTER TABLE log_p_legacy RENAME TO {ARCHIVE_TABLE_PREFIX}log__")
+            assert statements[0].endswith("__p_legacy")
+            assert statements[1].endswith("__p20220101")
+
+    @patch("airflow.utils.db_cleanup._expire_partitions")
+    @patch("airflow.utils.db_cleanup.is_partitioned", return_value=True)
+    def test_cleanup_partitioned_table_for_dag_ids(self, is_partitioned_mock, expire_partitions_mock):
+        """Partitions hold rows of all dags, so they cannot be dropped when cleaning up specific dags."""
+        with patch("airflow.utils.db_cleanup._check_for_rows", return_value=0):
+            _cleanup_table(
+                **config_dict["log"].__dict__,
+                clean_before_timestamp=pendulum.DateTime(2022, 1, 5, tzinfo=pendulum.timezone("UTC")),
+                dry_run=False,
+                session=MagicMock(),
+                dag_ids=["dag1"],
+            )
+        expire_partitions_mock.assert_not_called()
+
+    @patch("airflow.utils.db_cleanup.time.sleep")
+    def test_cleanup_table_in_batches_throttled(self, sleep_mock):
+        """Batched cleanups should pause between batches to respect the requested rate."""
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone("UTC"))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict["dag_run"].__dict__,
+                clean_before_timestamp=base_date.add(days=5),
+                dry_run=False,
+                session=session,
+                skip_archive=True,
+                batch_size=2,
+                max_rows_per_second=1,
+            )
+        # Batches of 2, 2 and 1 rows: no pause is needed after the last, partial batch.
+        assert sleep_mock.call_count == 2
+        assert all(0 < call.args[0] <= 2 for call in sleep_mock.call_args_list)
+
     @patch("airflow.utils.db.reflect_tables")
     def test_skip_archive_failure_will_remove_table(self, reflect_tables_mock):
         """
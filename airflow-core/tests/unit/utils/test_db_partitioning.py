@@ -0,0 +1,213 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pendulum
+import pytest
+from sqlalchemy import PrimaryKeyConstraint, UniqueConstraint, text
+from sqlalchemy.exc import IntegrityError
+
+from airflow._shared.timezones import timezone
+from airflow.exceptions import AirflowException
+from airflow.utils.db_partitioning import (
+    PARTITION_INTERVALS,
+    _parse_bound,
+    _PartitionedTableConfig,
+    _with_partition_column,
+    config_dict,
+    create_partitions,
+    detach_partitions_before,
+    interval_start,
+    is_partitioned,
+    list_partitions,
+    partition_table,
+)
+from airflow.utils.session import create_session
+
+
+class TestPartitionHelpers:
+    @pytest.mark.parametrize(
+        ("interval", "expected"),
+        [
+            pytest.param("day", pendulum.datetime(2024, 1, 4), id="day"),
+            pytest.param("week", pendulum.datetime(2024, 1, 1), id="week"),
+        ],
+    )
+    def test_interval_start(self, interval, expected):
+        # Thursday 2024-01-04 07:30 in UTC
+        value = pendulum.datetime(2024, 1, 3, 23, 30, tz="America/Los_Angeles")
+        assert interval_start(value, PARTITION_INTERVALS[interval]) == expected
+
+    @pytest.mark.parametrize(
+        ("definition", "expected"),
+        [
+            ("PRIMARY KEY (id)", 'PRIMARY KEY (id, "dttm")'),
+            ("UNIQUE (dag_id, task_id, dttm)", "UNIQUE (dag_id, task_id, dttm)"),
+            ("PRIMARY KEY (id, dttm)", "PRIMARY KEY (id, dttm)"),
+        ],
+    )
+    def test_with_partition_column(self, definition, expected):
+        assert _with_partition_column(definition, "dttm", {"id"}) == expected
+
+    @pytest.mark.parametrize(
+        ("definition", "match"),
+        [
+            pytest.param("CHECK (id > 0)", "Unsupported constraint", id="check"),
+            pytest.param("UNIQUE (dag_id, task_id)", "would not be enforced", id="natural-key"),
+            pytest.param("PRIMARY KEY (id, key)", "would not be enforced", id="id-and-natural-key"),
+        ],
+    )
+    def test_with_partition_column_unsupported(self, definition, match):
+        with pytest.raises(AirflowException, match=match):
+            _with_partition_column(definition, "dttm", {"id"})
+
+    def test_parse_bound(self):
+        assert _parse_bound("MINVALUE") is None
+        assert _parse_bound("'2024-01-01 00:00:00+00'") == pendulum.datetime(2024, 1, 1)
+
+    def test_partition_table_requires_postgres(self):
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "mysql"
+        with pytest.raises(AirflowException, match="only supported with Postgres"):
+            partition_table("log", session=session)
+        assert not is_partitioned("log", session)
+
+    def test_configured_tables_have_partition_column(self):
+        from airflow.models import Base
+
+        for table_name, config in config_dict.items():
+            table = Base.metadata.tables[table_name]
+            assert config.partition_column_name in table.c
+            assert not table.c[config.partition_column_name].onupdate
+            # Foreign keys referencing the table would have to be dropped.
+            for other_table in Base.metadata.tables.values():
+                assert not any(fk.column.table.name == table_name for fk in other_table.foreign_keys)
+            for constraint in table.constraints:
+                if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint)):
+                    columns = [c.name for c in constraint.columns]
+                    assert config.partition_column_name in columns or (
+                        len(columns) == 1 and constraint.columns[0].autoincrement in (True, "auto")
+                    )
+
+
+@pytest.fixture
+def partitioned_table_name():
+    """A scratch table registered as partitionable, referencing another table."""
+    table_name = "test_partitioned"
+    config = _PartitionedTableConfig(table_name=table_name, partition_column_name="dttm")
+    with create_session() as session:
+        session.execute(text(f"CREATE TABLE {table_name}_ref (id INTEGER PRIMARY KEY)"))
+        session.execute(
+            text(
+                f"CREATE TABLE {table_name} "
+                f"(id SERIAL PRIMARY KEY, dttm TIMESTAMP WITH TIME ZONE NOT NULL, event VARCHAR(60), "
+                f"ref_id INTEGER REFERENCES {table_name}_ref (id) ON DELETE CASCADE)"
+            )
+        )
+        session.execute(text(f"CREATE INDEX idx_{table_name}_dttm ON {table_name} (dttm)"))
+    with patch.dict(config_dict, {table_name: config}):
+        yield table_name
+    with create_session() as session:
+        session.execute(text(f"DROP TABLE IF EXISTS {table_name} CASCADE"))
+        for (name,) in session.execute(
+            text("SELECT tablename FROM pg_tables WHERE tablename LIKE :prefix"),
+            {"prefix": f"{table_name}_p%"},
+        ):
+            session.execute(text(f"DROP TABLE {name}"))
+        session.execute(text(f"DROP TABLE IF EXISTS {table_name}_ref"))
+
+
+@pytest.mark.db_test
+@pytest.mark.backend("postgres")
+class TestPartitionTable:
+    def test_partition_table(self, partitioned_table_name):
+        table_name = partitioned_table_name
+        with create_session() as session:
+            session.execute(text(f"INSERT INTO {table_name}_ref (id) VALUES (1)"))
+            session.execute(
+                text(f"INSERT INTO {table_name} (dttm, event, ref_id) VALUES (:dttm, 'old', 1)"),
+                {"dttm": timezone.utcnow() - timedelta(days=30)},
+            )
+
+        with create_session() as session:
+            partition_table(table_name, session=session, interval="day", count=2)
+
+        with create_session() as session:
+            assert is_partitioned(table_name, session)
+            partitions = list_partitions(table_name, session)
+            # The legacy partition, today's partition and the next two days.
+            assert len(partitions) == 4
+            assert partitions[0].name == f"{table_name}_p_legacy"
+            assert partitions[0].lower is None
+            assert [p.upper for p in partitions[:-1]] == [p.lower for p in partitions[1:]]
+            assert partitions[-1].upper == interval_start(timezone.utcnow(), timedelta(days=1)) + timedelta(
+                days=3
+            )
+
+            session.execute(text(f"INSERT INTO {table_name} (dttm, event) VALUES (now(), 'new')"))
+            assert session.scalar(text(f"SELECT count(*) FROM {partitions[1].name}")) == 1
+
+            # The foreign key of the table is kept.
+            with pytest.raises(IntegrityError):
+                with session.begin_nested():
+                    session.execute(text(f"INSERT INTO {table_name} (dttm, ref_id) VALUES (now(), 2)"))
+
+            assert detach_partitions_before(table_name, timezone.utcnow(), session=session) == [
+                partitions[0].name
+            ]
+            assert session.scalar(text(f"SELECT event FROM {table_name}")) == "new"
+            # Deleting referenced rows does not cascade into the detached rows.
+            session.execute(text(f"DELETE FROM {table_name}_ref"))
+            assert session.scalar(text(f"SELECT count(*) FROM {partitions[0].name}")) == 1
+
+            # The id sequence belongs to the partitioned table, not to the first partition.
+            session.execute(text(f"DROP TABLE {partitions[0].name}"))
+            session.execute(text(f"INSERT INTO {table_name} (dttm, event) VALUES (now(), 'newer')"))
+
+    def test_partition_table_referenced_by_foreign_key(self, partitioned_table_name):
+        table_name = partitioned_table_name
+        with create_session() as session:
+            session.execute(
+                text(f"CREATE TABLE {table_name}_child (event_id INTEGER REFERENCES {table_name} (id))")
+            )
+        try:
+            with create_session() as session, pytest.raises(AirflowException, match="is referenced by"):
+                partition_table(table_name, session=session, interval="day", count=0)
+        finally:
+            with create_session() as session:
+                session.execute(text(f"DROP TABLE {table_name}_child"))
+
+    def test_create_partitions_moves_rows_from_default_partition(self, partitioned_table_name):
+        table_name = partitioned_table_name
+        with create_session() as session:
+            partition_table(table_name, session=session, interval="day", count=0)
+        with create_session() as session:
+            session.execute(
+                text(f"INSERT INTO {table_name} (dttm, event) VALUES (:dttm, 'future')"),
+                {"dttm": timezone.utcnow() + timedelta(days=3)},
+            )
+            assert session.scalar(text(f"SELECT count(*) FROM {table_name}_p_default")) == 1
+
+            created = create_partitions(table_name, session=session, interval="day", count=5)
+
+            assert len(created) == 5
+            assert session.scalar(text(f"SELECT count(*) FROM {table_name}_p_default")) == 0
+            assert session.scalar(text(f"SELECT count(*) FROM {table_name}")) == 1
+            assert create_partitions(table_name, session=session, interval="day", count=5) == []
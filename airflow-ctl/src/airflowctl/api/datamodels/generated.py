@@ -656,6 +656,25 @@ class NewTaskResponse(BaseModel):
     task_display_name: Annotated[str, Field(title="Task Display Name")]
 
 
+class ParseImportTimeResponse(BaseModel):
+    """
+    Time spent importing a module while parsing a DAG file.
+    """
+
+    module: Annotated[str, Field(title="Module")]
+    duration: Annotated[float, Field(title="Duration")]
+    self_duration: Annotated[float, Field(title="Self Duration")]
+
+
+class ParseLineSampleResponse(BaseModel):
+    """
+    Time spent running a line while parsing a DAG file.
+    """
+
+    location: Annotated[str, Field(title="Location")]
+    duration: Annotated[float, Field(title="Duration")]
+
+
 class PluginImportErrorResponse(BaseModel):
     """
     Plugin Import Error serializer for responses.
@@ -1583,6 +1602,23 @@ class DAGWarningResponse(BaseModel):
     dag_display_name: Annotated[str, Field(title="Dag Display Name")]
 
 
+class DagFileParseProfileResponse(BaseModel):
+    """
+    Profile of the last parsing of a DAG file, durations are in seconds.
+    """
+
+    bundle_name: Annotated[str, Field(title="Bundle Name")]
+    relative_fileloc: Annotated[str, Field(title="Relative Fileloc")]
+    parsed_at: Annotated[datetime, Field(title="Parsed At")]
+    parse_duration: Annotated[float, Field(title="Parse Duration")]
+    import_duration: Annotated[float, Field(title="Import Duration")]
+    user_code_duration: Annotated[float, Field(title="User Code Duration")]
+    dagbag_duration: Annotated[float, Field(title="Dagbag Duration")]
+    serialization_duration: Annotated[float, Field(title="Serialization Duration")]
+    imports: Annotated[list[ParseImportTimeResponse], Field(title="Imports")]
+    slowest_lines: Annotated[list[ParseLineSampleResponse], Field(title="Slowest Lines")]
+
+
 class DagStatsResponse(BaseModel):
     """
     DAG Stats serializer for responses.
@@ -1604,11 +1640,31 @@ class DryRunBackfillCollectionResponse(BaseModel):
 
 class EventLogCollectionResponse(BaseModel):
     """
-    Event Log Collection Response.
+    Event Log Collection Response, supporting both offset and cursor pagination.
     """
 
     event_logs: Annotated[list[EventLogResponse], Field(title="Event Logs")]
-    total_entries: Annotated[int, Field(title="Total Entries")]
+    total_entries: Annotated[
+        int | None,
+        Field(
+            description="Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.",
+            title="Total Entries",
+        ),
+    ] = None
+    next_cursor: Annotated[
+        str | None,
+        Field(
+            description="Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.",
+            title="Next Cursor",
+        ),
+    ] = None
+    previous_cursor: Annotated[
+        str | None,
+        Field(
+            description="Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.",
+            title="Previous Cursor",
+        ),
+    ] = None
 
 
 class HITLDetailResponse(BaseModel):
@@ -1865,11 +1921,31 @@ class VariableCollectionResponse(BaseModel):
 
 class XComCollectionResponse(BaseModel):
     """
-    XCom Collection serializer for responses.
+    XCom Collection serializer for responses, supporting both offset and cursor pagination.
     """
 
     xcom_entries: Annotated[list[XComResponse], Field(title="Xcom Entries")]
-    total_entries: Annotated[int, Field(title="Total Entries")]
+    total_entries: Annotated[
+        int | None,
+        Field(
+            description="Total number of matching items. Populated for offset pagination, ``null`` when using cursor pagination.",
+            title="Total Entries",
+        ),
+    ] = None
+    next_cursor: Annotated[
+        str | None,
+        Field(
+            description="Token pointing to the next page. Populated for cursor pagination, ``null`` when using offset pagination or when there is no next page.",
+            title="Next Cursor",
+        ),
+    ] = None
+    previous_cursor: Annotated[
+        str | None,
+        Field(
+            description="Token pointing to the previous page. Populated for cursor pagination, ``null`` when using offset pagination or when on the first page.",
+            title="Previous Cursor",
+        ),
+    ] = None
 
 
 class AssetCollectionResponse(BaseModel):
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+import httpx
+import rich_click as click
+
+DEFAULT_PATHS = ",".join(
+    (
+        "/api/v2/dags/~/dagRuns",
+        "/api/v2/dags/~/dagRuns/~/taskInstances",
+        "/api/v2/eventLogs",
+        "/api/v2/dags/~/dagRuns/~/taskInstances/~/xcomEntries",
+    )
+)
+
+
+async def load_endpoint(client, path, concurrency, requests):
+    """Send ``requests`` GET requests to ``path``, ``concurrency`` at a time, and return their latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def send():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise click.ClickException(f"GET {path} returned {response.status_code}: {response.text}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send() for _ in range(requests)))
+    return time.perf_counter() - start, latencies
+
+
+async def run(url, token, paths, concurrency, requests):
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, headers=headers, limits=limits, timeout=None) as client:
+        # Warm up the connections and the caches of the API server.
+        for path in paths:
+            await load_endpoint(client, path, concurrency, concurrency)
+        return {path: await load_endpoint(client, path, concurrency, requests) for path in paths}
+
+
+@click.command()
+@click.option("--url", default="http://localhost:8080", help="base url of the API server", show_default=True)
+@click.option("--token", envvar="AIRFLOW_API_TOKEN", help="JWT token used to authenticate the requests")
+@click.option("--paths", default=DEFAULT_PATHS, help="comma separated paths to load", show_default=True)
+@click.option("--concurrency", default=64, help="number of requests in flight", show_default=True)
+@click.option("--requests", default=1000, help="number of requests sent to each path", show_default=True)
+def main(url, token, paths, concurrency, requests):
+    """
+    Measure the throughput of the list endpoints of a running API server under concurrent load.
+
+    Each path is requested ``--requests`` times with ``--concurrency`` requests in flight, and the
+    achieved requests per second and latency percentiles are reported. Run it against the same
+    metadata database before and after a change, e.g. with the routes served through sync or async
+    database sessions, to compare how many concurrent readers a single API server worker can serve.
+    """
+    results = asyncio.run(run(url, token, paths.split(","), concurrency, requests))
+
+    click.echo(f"{'path':<60} {'req/s':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} {'max (ms)':>10}")
+    for path, (elapsed, latencies) in results.items():
+        quantiles = statistics.quantiles(latencies, n=20)
+        click.echo(
+            f"{path:<60} {len(latencies) / elapsed:>10.1f} {statistics.median(latencies) * 1000:>10.1f} "
+            f"{quantiles[18] * 1000:>10.1f} {max(latencies) * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
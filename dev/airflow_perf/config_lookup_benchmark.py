@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+
+import rich_click as click
+
+# (getter, section, key) of options read on hot paths of the scheduler and the task runner.
+LOOKUPS = (
+    ("get", "scheduler", "allowed_run_id_pattern"),
+    ("getboolean", "core", "allow_double_dot_in_ids"),
+    ("getint", "core", "max_templated_field_length"),
+    ("getint", "core", "parallelism"),
+    ("getfloat", "scheduler", "scheduler_idle_sleep_time"),
+)
+
+
+def measure(config, lookups):
+    """Return the number of lookups per second done through ``config``."""
+    calls = [(getattr(config, getter), section, key) for getter, section, key in LOOKUPS]
+    start = time.perf_counter()
+    for _ in range(lookups // len(calls)):
+        for getter, section, key in calls:
+            getter(section, key)
+    return lookups // len(calls) * len(calls) / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option("--lookups", default=200_000, help="number of lookups per measurement", show_default=True)
+def main(lookups):
+    """
+    Compare the throughput of configuration lookups through the parser and through its snapshot.
+
+    ``conf.get*`` resolves every lookup through deprecated option mappings and the whole lookup sequence
+    (environment variables, config file, commands, secrets, defaults) and converts the value on each call,
+    while ``conf.snapshot.get*`` returns the value resolved and converted on first access.
+    """
+    from airflow.configuration import conf
+
+    results = {"conf": measure(conf, lookups), "conf.snapshot": measure(conf.snapshot, lookups)}
+
+    click.echo(f"{'lookups through':<20} {'lookups/s':>15} {'speedup':>10}")
+    for name, rate in results.items():
+        click.echo(f"{name:<20} {rate:>15,.0f} {rate / results['conf']:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
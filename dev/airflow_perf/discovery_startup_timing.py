@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import rich_click as click
+
+# Discovers the providers and the plugins, and prints how long the discovery took.
+DISCOVERY_SCRIPT = """
+import time
+from airflow import plugins_manager
+from airflow.providers_manager import ProvidersManager
+
+start = time.perf_counter()
+ProvidersManager().initialize_providers_list()
+plugins_manager.ensure_plugins_loaded()
+print(time.perf_counter() - start)
+"""
+
+
+def measure(airflow_home, runs):
+    """Start ``runs`` processes discovering providers and plugins, and return their timings."""
+    env = {**os.environ, "AIRFLOW_HOME": airflow_home}
+    process_times, discovery_times = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.check_output([sys.executable, "-c", DISCOVERY_SCRIPT], env=env, text=True)
+        process_times.append(time.perf_counter() - start)
+        discovery_times.append(float(output.strip().splitlines()[-1]))
+    return process_times, discovery_times
+
+
+@click.command()
+@click.option("--runs", default=10, help="number of processes started in each mode", show_default=True)
+def main(runs):
+    """
+    Measure the start-up cost of discovering providers and plugins, with and without a discovery manifest.
+
+    Without a manifest, every process scans the entry points of all installed distributions and calls
+    ``get_provider_info`` of every provider. With the manifest written by
+    ``airflow providers rebuild-manifest``, they are read with a single file read instead. Each mode runs
+    in a fresh temporary ``AIRFLOW_HOME``.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as scan_home, tempfile.TemporaryDirectory() as manifest_home:
+        env = {**os.environ, "AIRFLOW_HOME": manifest_home}
+        subprocess.check_call(["airflow", "providers", "rebuild-manifest"], env=env)
+        results["scan"] = measure(scan_home, runs)
+        results["manifest"] = measure(manifest_home, runs)
+
+    click.echo(f"{'mode':<10} {'process median (ms)':>20} {'discovery median (ms)':>22}")
+    for mode, (process_times, discovery_times) in results.items():
+        click.echo(
+            f"{mode:<10} {statistics.median(process_times) * 1000:>20.1f} "
+            f"{statistics.median(discovery_times) * 1000:>22.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from unittest import mock
+
+import msgspec
+import rich_click as click
+
+
+def _recv_frame(sock):
+    """Read a length-prefixed frame from the socket, or return None once it is closed."""
+    length = b""
+    while len(length) < 4:
+        if not (data := sock.recv(4 - len(length))):
+            return None
+        length += data
+    buffer = bytearray(int.from_bytes(length, byteorder="big"))
+    view = memoryview(buffer)
+    pos = 0
+    while pos < len(buffer):
+        pos += sock.recv_into(view[pos:])
+    return buffer
+
+
+def serve(sock, values, round_trip):
+    """
+    Answer the XCom sequence requests of the task like the supervisor does.
+
+    The round trip to the API server is simulated by sleeping ``round_trip`` seconds per request.
+    """
+    from airflow.sdk.exceptions import ErrorType
+    from airflow.sdk.execution_time.comms import (
+        ErrorResponse,
+        XComSequenceIndexResult,
+        XComSequenceSliceResult,
+        _RequestFrame,
+        _ResponseFrame,
+    )
+
+    decoder = msgspec.msgpack.Decoder(_RequestFrame)
+    while (buffer := _recv_frame(sock)) is not None:
+        request = decoder.decode(buffer)
+        body = request.body
+        if body["type"] == "GetXComSequenceSlice":
+            resp = XComSequenceSliceResult(root=values[body["start"] : body["stop"]])
+        elif body["offset"] < len(values):
+            resp = XComSequenceIndexResult(root=values[body["offset"]])
+        else:
+            resp = ErrorResponse(error=ErrorType.XCOM_NOT_FOUND)
+        time.sleep(round_trip)
+        sock.sendall(_ResponseFrame(id=request.id, body=resp.model_dump()).as_bytes())
+
+
+def measure(count, prefetch_size, round_trip):
+    """Return the time taken to iterate over ``count`` mapped XCom values."""
+    from airflow.sdk.execution_time.comms import CommsDecoder
+    from airflow.sdk.execution_time.lazy_sequence import LazyXComIterator, LazyXComSequence
+
+    values = [{"map_index": i, "path": f"s3://bucket/output/{i}.json"} for i in range(count)]
+    task_sock, supervisor_sock = socket.socketpair()
+    server = threading.Thread(target=serve, args=(supervisor_sock, values, round_trip), daemon=True)
+    server.start()
+
+    xcom_arg = mock.Mock(operator=mock.Mock(dag_id="dag", task_id="task"), key="return_value")
+    seq = LazyXComSequence(xcom_arg=xcom_arg, ti=mock.Mock(run_id="run"))
+    with mock.patch(
+        "airflow.sdk.execution_time.task_runner.SUPERVISOR_COMMS", CommsDecoder(socket=task_sock), create=True
+    ):
+        start = time.perf_counter()
+        pulled = sum(1 for _ in LazyXComIterator(seq=seq, prefetch_size=prefetch_size))
+        elapsed = time.perf_counter() - start
+
+    task_sock.close()
+    server.join()
+    supervisor_sock.close()
+    if pulled != count:
+        raise click.ClickException(f"Pulled {pulled} values instead of {count}")
+    return elapsed
+
+
+@click.command()
+@click.option("--counts", default="10000,100000", help="comma separated numbers of values", show_default=True)
+@click.option(
+    "--prefetch-sizes", default="0,1000", help="comma separated prefetch sizes to compare", show_default=True
+)
+@click.option(
+    "--round-trip-ms", default=1.0, help="simulated API server round trip per request", show_default=True
+)
+def main(counts, prefetch_sizes, round_trip_ms):
+    """
+    Measure the time taken by a task to iterate over the XCom values of a mapped upstream task.
+
+    The values are pulled through the comms of the task with the supervisor, like in a task, while the
+    round trip of the supervisor to the API server is simulated. With a prefetch size of 0 values are
+    pulled one request at a time, otherwise a window of values is pulled with each request.
+    """
+    click.echo(f"{'values':>10} {'prefetch size':>14} {'pull (s)':>10} {'values/s':>12}")
+    for count in map(int, counts.split(",")):
+        for prefetch_size in map(int, prefetch_sizes.split(",")):
+            elapsed = measure(count, prefetch_size, round_trip_ms / 1000)
+            click.echo(f"{count:>10} {prefetch_size:>14} {elapsed:>10.2f} {count / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import os
+import time
+
+import rich_click as click
+
+
+@dataclasses.dataclass
+class Record:
+    id: int
+    name: str
+    score: float
+    tags: list[str]
+
+
+def make_values(size):
+    """Return XCom-like values of about ``size`` items each, by name."""
+    now = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    return {
+        "primitives": list(range(size)),
+        "strings": [f"s3://bucket/key/{i}" for i in range(size)],
+        "nested dicts": [
+            {"id": i, "name": f"row-{i}", "attrs": {"score": i / 3, "valid": True, "tags": ["a", "b"]}}
+            for i in range(size)
+        ],
+        "dataclasses": [Record(id=i, name=f"row-{i}", score=i / 3, tags=["a", "b"]) for i in range(size)],
+        "datetimes": [now + datetime.timedelta(seconds=i) for i in range(size)],
+        "tuples": [(i, f"row-{i}") for i in range(size)],
+    }
+
+
+def measure(func, value, repeat):
+    """Return the best time taken by ``func(value)`` over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(value)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--size", default=10_000, help="number of items in each value", show_default=True)
+@click.option("--repeat", default=5, help="number of runs, of which the best is reported", show_default=True)
+def main(size, repeat):
+    """
+    Measure the time taken by serde to serialize and deserialize XCom-like values.
+
+    Each value is a list of ``--size`` items of one kind: primitives, strings, nested dicts of
+    primitives, dataclasses, datetimes or tuples. Run it before and after a change to serde to compare.
+    """
+    # Allow the dataclasses of this module to be deserialized.
+    os.environ["AIRFLOW__CORE__ALLOWED_DESERIALIZATION_CLASSES"] = "airflow.* __main__.*"
+    from airflow.sdk.serde import deserialize, serialize
+
+    click.echo(f"{'value':<15} {'serialize (ms)':>15} {'deserialize (ms)':>17} {'items/s':>12}")
+    for name, value in make_values(size).items():
+        serialized = serialize(value)
+        ser = measure(serialize, value, repeat)
+        deser = measure(deserialize, serialized, repeat)
+        click.echo(f"{name:<15} {ser * 1000:>15.2f} {deser * 1000:>17.2f} {size / ser:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+
+import rich_click as click
+from sqlalchemy import delete, update
+
+
+def create_fan_in_dag_run(width, joins, session):
+    """
+    Create a dag run where ``width`` mapped upstream tis have succeeded and ``joins`` tasks wait on them.
+    """
+    from airflow._shared.timezones import timezone
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.dagrun import DagRun
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.models.taskmap import TaskMap
+    from airflow.sdk import DAG, task
+    from airflow.serialization.definitions.dag import SerializedDAG
+    from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    dag_id = f"perf_fan_in_{width}"
+    bundle_name = "perf"
+
+    @task
+    def upstream(i): ...
+
+    with DAG(dag_id, schedule=None, start_date=timezone.datetime(2024, 1, 1)) as dag:
+        fan_out = upstream.expand(i=list(range(width)))
+        for n in range(joins):
+            fan_out >> task(trigger_rule="all_done", task_id=f"join_{n}")(lambda: None)()
+
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id == dag_id))
+    session.execute(delete(DagRun).where(DagRun.dag_id == dag_id))
+    session.merge(DagBundleModel(name=bundle_name))
+    session.flush()
+    SerializedDAG.bulk_write_to_db(bundle_name, None, [dag], session=session)
+    data = DagSerialization.to_dict(dag)
+    SerializedDagModel.write_dag(LazyDeserializedDAG(data=data), bundle_name, session=session)
+    session.flush()
+
+    scheduler_dag = SerializedDagModel.get(dag_id, session=session).dag
+    now = timezone.utcnow()
+    dag_run = scheduler_dag.create_dagrun(
+        run_id="perf_fan_in",
+        logical_date=now,
+        data_interval=(now, now),
+        run_after=now,
+        run_type=DagRunType.MANUAL,
+        triggered_by=DagRunTriggeredByType.TEST,
+        state=DagRunState.RUNNING,
+        session=session,
+    )
+    TaskMap.expand_mapped_task(scheduler_dag.get_task("upstream"), dag_run.run_id, session=session)
+    session.execute(
+        update(TaskInstance)
+        .where(TaskInstance.dag_id == dag_id, TaskInstance.task_id == "upstream")
+        .values(state=TaskInstanceState.SUCCESS)
+        .execution_options(synchronize_session=False)
+    )
+    session.commit()
+    return dag_run
+
+
+@click.command()
+@click.option(
+    "--widths",
+    default="10,1000,100000",
+    help="comma separated number of mapped upstream tis to test",
+    show_default=True,
+)
+@click.option("--joins", default=10, help="number of tasks joining the mapped upstream", show_default=True)
+@click.option("--repeat", default=5, help="number of times to evaluate each dag run", show_default=True)
+def main(widths, joins, repeat):
+    """
+    Measure how long the scheduler takes to evaluate trigger rules of tasks after a wide fan-in.
+
+    For each width, a dag run is created in the configured metadata database where a mapped task has
+    been expanded to that many task instances which all succeeded, and ``--joins`` downstream tasks
+    with the ``all_done`` trigger rule wait on it. The script then times
+    ``DagRun.task_instance_scheduling_decisions``, which evaluates the dependencies of all
+    schedulable task instances of the run, exactly like the scheduler does in every loop.
+    """
+    from airflow.settings import Session
+
+    results = {}
+    for width in (int(w) for w in widths.split(",")):
+        with Session() as session:
+            dag_run = create_fan_in_dag_run(width, joins, session)
+            times = []
+            for _ in range(repeat):
+                gc.collect()
+                start = time.perf_counter()
+                decision = dag_run.task_instance_scheduling_decisions(session=session)
+                times.append(time.perf_counter() - start)
+                if len(decision.schedulable_tis) != joins:
+                    raise click.ClickException(
+                        f"Expected {joins} schedulable tis: {decision.schedulable_tis}"
+                    )
+                session.rollback()
+            results[width] = times
+
+    click.echo(f"{'width':>10} {'mean (s)':>10} {'stdev (s)':>10} {'min (s)':>10}")
+    for width, times in results.items():
+        stdev = statistics.stdev(times) if len(times) > 1 else 0.0
+        click.echo(f"{width:>10} {statistics.mean(times):>10.4f} {stdev:>10.4f} {min(times):>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import multiprocessing
+import resource
+import time
+
+import rich_click as click
+
+COLUMNS = 8
+
+
+def transport(size_mb):
+    """
+    Push a DataFrame of ``size_mb`` MB through the XCom transport and pull it back.
+
+    The value takes the same path as in a task: serialization, the msgpack frame sent to the supervisor,
+    the JSON body sent to the Execution API and the JSON column of the metadata database, and back. Run in a
+    fresh process, so that its peak RSS is the one of the transport.
+    """
+    import msgspec
+    import numpy as np
+    import pandas as pd
+
+    from airflow.sdk.bases.xcom import BaseXCom
+    from airflow.sdk.execution_time.comms import SetXCom, XComResult, _RequestFrame
+
+    rng = np.random.default_rng(seed=0)
+    rows = size_mb * 2**20 // (COLUMNS * 8)
+    df = pd.DataFrame(rng.random((rows, COLUMNS)), columns=[f"col{i}" for i in range(COLUMNS)])
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    value = BaseXCom.serialize_value(df)
+    msg = SetXCom(key="return_value", value=value, dag_id="dag", run_id="run", task_id="task")
+    frame = _RequestFrame(id=0, body=msg.model_dump()).as_bytes()
+    body = msgspec.msgpack.decode(memoryview(frame)[4:])[1]
+    stored = json.dumps(json.loads(json.dumps(body["value"])))
+    push = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = XComResult(key="return_value", value=json.loads(stored))
+    frame = _RequestFrame(id=0, body=result.model_dump()).as_bytes()
+    body = msgspec.msgpack.decode(memoryview(frame)[4:])[1]
+    BaseXCom.deserialize_value(XComResult.model_validate(body))
+    pull = time.perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_rss
+    return len(stored), push, pull, peak_rss
+
+
+@click.command()
+@click.option("--sizes", default="1,10,100", help="comma separated DataFrame sizes in MB", show_default=True)
+def main(sizes):
+    """
+    Measure the latency and peak RSS of pushing and pulling DataFrames through XCom.
+
+    Each size is measured in a fresh process. Run it before and after a change to the serialization of
+    DataFrames, e.g. hex- or base64-encoded Parquet data, to compare the size of the stored value and the
+    cost of the copies made on the way.
+    """
+    ctx = multiprocessing.get_context("spawn")
+
+    click.echo(
+        f"{'size (MB)':>10} {'stored (MB)':>12} {'push (ms)':>10} {'pull (ms)':>10} {'peak RSS (MB)':>14}"
+    )
+    for size_mb in map(int, sizes.split(",")):
+        with ctx.Pool(1) as pool:
+            stored, push, pull, peak_rss = pool.apply(transport, (size_mb,))
+        click.echo(
+            f"{size_mb:>10} {stored / 2**20:>12.1f} {push * 1000:>10.1f} {pull * 1000:>10.1f} "
+            f"{peak_rss / 1024:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
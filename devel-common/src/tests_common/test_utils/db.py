@@ -228,6 +228,12 @@ def clear_db_runs():
             session.execute(delete(TaskInstanceHistory))
         except ImportError:
             pass
+        try:
+            from airflow.models.dagrun_state_count import DagRunStateCount
+
+            session.execute(delete(DagRunStateCount))
+        except ImportError:
+            pass
 
 
 @_retry_db
@@ -396,6 +402,17 @@ def clear_db_import_errors():
         session.execute(delete(ParseImportError))
 
 
+@_retry_db
+def clear_db_dag_file_parse_profiles():
+    with create_session() as session:
+        try:
+            from airflow.models.dag_file_parse_profile import DagFileParseProfile
+
+            session.execute(delete(DagFileParseProfile))
+        except ImportError:
+            pass
+
+
 @_retry_db
 def clear_db_dag_warnings():
     with create_session() as session:
@@ -987,6 +1004,7 @@ def clear_all():
     clear_db_callbacks()
     clear_rendered_ti_fields()
     clear_db_import_errors()
+    clear_db_dag_file_parse_profiles()
     clear_db_dag_warnings()
     clear_db_logs()
     clear_db_jobs()
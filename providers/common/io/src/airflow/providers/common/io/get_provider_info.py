@@ -84,6 +84,13 @@ def get_provider_info():
                         "example": "gz",
                         "default": "",
                     },
+                    "xcom_objectstorage_lazy_load": {
+                        "description": "Whether XComs stored in object storage are only read when they are first accessed, rather\nthan when they are pulled. If set, pulled values are proxies of the stored values.\n",
+                        "version_added": "1.8.0",
+                        "type": "boolean",
+                        "example": "True",
+                        "default": "False",
+                    },
                 },
             }
         },
@@ -17,19 +17,26 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import io
+import itertools
 import json
+import re
 import uuid
 from functools import cache
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import IO, TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlsplit
 
 import fsspec.utils
+import lazy_object_proxy
 
 from airflow.providers.common.compat.sdk import conf
 from airflow.providers.common.io.version_compat import AIRFLOW_V_3_0_PLUS
 from airflow.utils.json import XComDecoder, XComEncoder
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from sqlalchemy.orm import Session
 
     from airflow.sdk.execution_time.comms import XComResult
@@ -45,6 +52,11 @@ T = TypeVar("T")
 
 SECTION = "common.io"
 
+# Approximate size of the chunks values are encoded to, and decoded from, object storage in.
+_CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"\s*")
+
 
 def _get_compression_suffix(compression: str) -> str:
     """
@@ -74,6 +86,146 @@ def _get_threshold() -> int:
     return conf.getint(SECTION, "xcom_objectstorage_threshold", fallback=-1)
 
 
+@cache
+def _get_lazy_load() -> bool:
+    return conf.getboolean(SECTION, "xcom_objectstorage_lazy_load", fallback=False)
+
+
+def _iterencode(value: Any) -> Iterator[str]:
+    """
+    Encode the value to JSON in chunks of about ``_CHUNK_SIZE``.
+
+    The items of lists and dicts are encoded in batches, so that the whole JSON document is never held in
+    memory at once, while each batch is still encoded by the (C accelerated) one-shot encoder. The
+    document is the same as the one ``json.dumps(value, cls=XComEncoder)`` returns.
+    """
+    encoder = XComEncoder()
+    if isinstance(value, list):
+        opening, closing = "[", "]"
+        items: Iterator[Any] = iter(value)
+        make_batch: Any = list
+    elif isinstance(value, dict):
+        opening, closing = "{", "}"
+        items = iter(value.items())
+        make_batch = dict
+    else:
+        yield encoder.encode(value)
+        return
+
+    yield opening
+    batch_size = 1
+    separator = ""
+    while batch := make_batch(itertools.islice(items, batch_size)):
+        chunk = encoder.encode(batch)[1:-1]
+        yield separator
+        yield chunk
+        separator = ", "
+        # Grow the batches up to the chunk size, but progressively, in case the items grow too.
+        batch_size = max(1, min(batch_size * 2, batch_size * _CHUNK_SIZE // max(len(chunk), 1)))
+    yield closing
+
+
+class _JSONStreamDecoder:
+    """
+    Decode a JSON document from a binary file, one top-level item at a time.
+
+    The items of a top-level list or dict are decoded one after another from a buffer of the text read
+    so far, so that the whole text of the document is never held in memory at once. Other documents are
+    decoded at once.
+    """
+
+    def __init__(self, f: IO[bytes]):
+        self._reader = io.TextIOWrapper(f, encoding="utf-8", newline="")
+        self._decoder = XComDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        """Read more text into the buffer, and return whether there was any left to read."""
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        # Read at least as much as buffered, so that items larger than a chunk are not decoded again and
+        # again for each chunk.
+        text = self._reader.read(max(_CHUNK_SIZE, len(self._buffer)))
+        self._buffer += text
+        return bool(text)
+
+    def _peek(self) -> str:
+        """Skip whitespace, and return the next character, or an empty string at the end of the document."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _consume(self, expected: str) -> str:
+        char = self._peek()
+        if not char or char not in expected:
+            raise json.JSONDecodeError(f"Expecting one of {expected!r}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value may be cut off at the end of the buffer.
+                if self._fill():
+                    continue
+                raise
+            # A number may be cut off at the end of the buffer too, so the value is only complete if it is
+            # followed by a delimiter, or the end of the document.
+            delimiter = _WHITESPACE.match(self._buffer, end).end()  # type: ignore[union-attr]
+            if (delimiter < len(self._buffer) and self._buffer[delimiter] in ",:]}") or not self._fill():
+                self._pos = end
+                return value
+
+    def decode(self) -> Any:
+        char = self._peek()
+        if char == "[":
+            self._pos += 1
+            result: Any = []
+            if self._peek() == "]":
+                self._pos += 1
+            else:
+                while True:
+                    result.append(self._value())
+                    if self._consume(",]") == "]":
+                        break
+        elif char == "{":
+            self._pos += 1
+            result = {}
+            if self._peek() == "}":
+                self._pos += 1
+            else:
+                while True:
+                    key = self._value()
+                    if not isinstance(key, str):
+                        raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+                    self._consume(":")
+                    result[key] = self._value()
+                    if self._consume(",}") == "}":
+                        break
+            result = self._decoder.object_hook(result)
+        else:
+            result = self._value()
+        if self._peek():
+            raise json.JSONDecodeError("Extra data", self._buffer, self._pos)
+        return result
+
+
+def _read_value(path: ObjectStoragePath, default: Any) -> Any:
+    """Read the value stored at the path, or return the default if it cannot be read."""
+    try:
+        with path.open(mode="rb", compression="infer") as f:
+            return _JSONStreamDecoder(f).decode()
+    except (FileNotFoundError, TypeError, ValueError):
+        return default
+
+
 class XComObjectStorageBackend(BaseXCom):
     """
     XCom backend that stores data in an object store or database depending on the size of the data.
@@ -117,37 +269,46 @@ class XComObjectStorageBackend(BaseXCom):
         run_id: str | None = None,
         map_index: int | None = None,
     ) -> bytes | str:
-        # We will use this serialized value to write to the object store.
-        s_val = json.dumps(value, cls=XComEncoder)
-        s_val_encoded = s_val.encode("utf-8")
+        threshold = _get_threshold()
+        if threshold < 0 and AIRFLOW_V_3_0_PLUS:  # No threshold, the value is always stored in the database.
+            return BaseXCom.serialize_value(value)
+
+        # The value is encoded in chunks, and only buffered until it crosses the threshold. From there on it
+        # is written to the object store as it is encoded.
+        chunks = _iterencode(value)
+        buffered: list[bytes] = []
+        size = 0
+        for chunk in chunks:
+            buffered.append(chunk.encode("utf-8"))
+            size += len(buffered[-1])
+            if 0 <= threshold <= size:
+                break
+        else:  # Either no threshold or value is small enough.
+            if AIRFLOW_V_3_0_PLUS:
+                return BaseXCom.serialize_value(value)
+            # TODO: Remove this branch once we drop support for Airflow 2
+            # This is for Airflow 2.10 where the value is expected to be bytes
+            return b"".join(buffered)
 
         if compression := _get_compression():
             suffix = f".{_get_compression_suffix(compression)}"
         else:
             suffix = ""
 
-        threshold = _get_threshold()
-        if threshold < 0 or len(s_val_encoded) < threshold:  # Either no threshold or value is small enough.
-            if AIRFLOW_V_3_0_PLUS:
-                return BaseXCom.serialize_value(value)
-            # TODO: Remove this branch once we drop support for Airflow 2
-            # This is for Airflow 2.10 where the value is expected to be bytes
-            return s_val_encoded
-
-        base_path = _get_base_path()
-        while True:  # Safeguard against collisions.
-            p = base_path.joinpath(
-                dag_id or "NO_DAG_ID",
-                run_id or "NO_RUN_ID",
-                task_id or "NO_TASK_ID",
-                f"{uuid.uuid4()}{suffix}",
-            )
-            if not p.exists():
-                break
+        # The name is a random UUID, so there is no need to check whether the path exists already.
+        p = _get_base_path().joinpath(
+            dag_id or "NO_DAG_ID",
+            run_id or "NO_RUN_ID",
+            task_id or "NO_TASK_ID",
+            f"{uuid.uuid4()}{suffix}",
+        )
         p.parent.mkdir(parents=True, exist_ok=True)
 
         with p.open(mode="wb", compression=compression) as f:
-            f.write(s_val_encoded)
+            f.writelines(buffered)
+            buffered.clear()
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8"))
         return BaseXCom.serialize_value(str(p))
 
     @staticmethod
@@ -155,7 +316,8 @@ class XComObjectStorageBackend(BaseXCom):
         """
         Deserializes the value from the database or object storage.
 
-        Compression is inferred from the file extension.
+        Compression is inferred from the file extension. If ``xcom_objectstorage_lazy_load`` is set,
+        values stored in object storage are returned as proxies, only read when they are first accessed.
         """
         base_xcom_deser_result = BaseXCom.deserialize_value(result)
         data = base_xcom_deser_result
@@ -169,11 +331,9 @@ class XComObjectStorageBackend(BaseXCom):
             path = XComObjectStorageBackend._get_full_path(base_xcom_deser_result)
         except (TypeError, ValueError):  # Likely value stored directly in the database.
             return data
-        try:
-            with path.open(mode="rb", compression="infer") as f:
-                return json.load(f, cls=XComDecoder)
-        except (FileNotFoundError, TypeError, ValueError):
-            return data
+        if _get_lazy_load():
+            return lazy_object_proxy.Proxy(functools.partial(_read_value, path, data))
+        return _read_value(path, data)
 
     @staticmethod
     def purge(xcom: XComResult, session: Session | None = None) -> None:
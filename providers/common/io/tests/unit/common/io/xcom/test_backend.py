@@ -17,6 +17,9 @@
 # under the License.
 from __future__ import annotations
 
+import io
+import json
+import tracemalloc
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -24,6 +27,7 @@ import pytest
 import airflow.models.xcom
 from airflow.providers.common.io.xcom.backend import XComObjectStorageBackend
 from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.utils.json import XComDecoder, XComEncoder
 
 from tests_common.test_utils import db
 from tests_common.test_utils.compat import timezone
@@ -37,6 +41,7 @@ if AIRFLOW_V_3_1_PLUS:
 if AIRFLOW_V_3_0_PLUS:
     from airflow.models.xcom import XComModel
     from airflow.sdk import ObjectStoragePath
+    from airflow.sdk.bases.xcom import BaseXCom
     from airflow.sdk.execution_time.comms import XComResult
     from airflow.sdk.execution_time.xcom import resolve_xcom_backend
 else:
@@ -61,10 +66,12 @@ def reset_cache():
     backend._get_base_path.cache_clear()
     backend._get_compression.cache_clear()
     backend._get_threshold.cache_clear()
+    backend._get_lazy_load.cache_clear()
     yield
     backend._get_base_path.cache_clear()
     backend._get_compression.cache_clear()
     backend._get_threshold.cache_clear()
+    backend._get_lazy_load.cache_clear()
 
 
 @pytest.fixture
@@ -464,3 +471,94 @@ class TestXComObjectStorageBackend:
             deserialized_data = XCom.deserialize_value(mock_xcom_ser)
 
             assert deserialized_data == expected_value
+
+    def test_serialize_value_skips_exists(self):
+        with patch.object(ObjectStoragePath, "exists") as mock_exists:
+            path = XComObjectStorageBackend.serialize_value({"key": "bigvaluebigvaluebigvalue" * 100})
+
+        mock_exists.assert_not_called()
+        assert XComObjectStorageBackend._get_full_path(BaseXCom.deserialize_value(MagicMock(value=path)))
+
+    @conf_vars({("common.io", "xcom_objectstorage_lazy_load"): "True"})
+    def test_lazy_load(self):
+        from airflow.providers.common.io.xcom import backend
+
+        value = {"key": "bigvaluebigvaluebigvalue" * 100}
+        path = XComObjectStorageBackend.serialize_value(value)
+
+        with patch.object(backend, "_read_value", wraps=backend._read_value) as mock_read_value:
+            data = XComObjectStorageBackend.deserialize_value(MagicMock(value=path))
+            mock_read_value.assert_not_called()
+
+            assert data == value
+            assert data["key"] == value["key"]
+            mock_read_value.assert_called_once()
+
+    def test_streaming_memory(self, monkeypatch):
+        """Values stored in object storage are not encoded or decoded as a whole in memory."""
+        from airflow.providers.common.io.xcom import backend
+
+        monkeypatch.setattr(backend, "_CHUNK_SIZE", 1 << 16)
+        value = [f"value-{i:08d}" for i in range(250_000)]
+        size = len(json.dumps(value))
+
+        tracemalloc.start()
+        try:
+            path = XComObjectStorageBackend.serialize_value(value)
+            _, write_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert write_peak < size / 4
+
+        p = XComObjectStorageBackend._get_full_path(BaseXCom.deserialize_value(MagicMock(value=path)))
+        tracemalloc.start()
+        try:
+            with p.open(mode="rb") as f:
+                json.load(f)
+            _, load_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            data = XComObjectStorageBackend.deserialize_value(MagicMock(value=path))
+            _, read_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert data == value
+        # Decoding the values takes the same memory either way, but the whole text is not held in memory.
+        assert read_peak < load_peak - size / 2
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param([], id="empty_list"),
+        pytest.param({}, id="empty_dict"),
+        pytest.param([1, 2.5, None, True, "value", {"key": [1, 2]}, (1, 2)], id="list"),
+        pytest.param({f"key{i}": ["value"] * i for i in range(100)}, id="dict"),
+        pytest.param((1, 2, 3), id="tuple"),
+        pytest.param("value", id="str"),
+        pytest.param(1.5e-7, id="float"),
+    ],
+)
+def test_streaming_encode_decode(value, monkeypatch):
+    from airflow.providers.common.io.xcom import backend
+
+    monkeypatch.setattr(backend, "_CHUNK_SIZE", 16)
+    encoded = "".join(backend._iterencode(value))
+
+    assert encoded == json.dumps(value, cls=XComEncoder)
+    assert backend._JSONStreamDecoder(io.BytesIO(encoded.encode())).decode() == json.loads(
+        encoded, cls=XComDecoder
+    )
+    # Whitespace between the items is allowed, as in any JSON document.
+    pretty = json.dumps(json.loads(encoded), indent=4)
+    assert backend._JSONStreamDecoder(io.BytesIO(pretty.encode())).decode() == json.loads(
+        pretty, cls=XComDecoder
+    )
+
+
+@pytest.mark.parametrize("document", ["", "[1,", "[1 2]", '{"key" 1}', "{1: 2}", "[1]2"])
+def test_streaming_decode_invalid(document, monkeypatch):
+    from airflow.providers.common.io.xcom import backend
+
+    monkeypatch.setattr(backend, "_CHUNK_SIZE", 2)
+    with pytest.raises(json.JSONDecodeError):
+        backend._JSONStreamDecoder(io.BytesIO(document.encode())).decode()
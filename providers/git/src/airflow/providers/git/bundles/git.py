@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import os
 import shutil
+import time
 from contextlib import nullcontext
 from pathlib import Path
 from urllib.parse import urlparse
@@ -30,6 +31,7 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt
 from airflow.dag_processing.bundles.base import BaseDagBundle
 from airflow.providers.common.compat.sdk import AirflowException
 from airflow.providers.git.hooks.git import GitHook
+from airflow.providers.git.version_compat import AIRFLOW_V_3_3_PLUS
 
 log = structlog.get_logger(__name__)
 
@@ -52,6 +54,22 @@ class GitDagBundle(BaseDagBundle):
         to share the object directory via hard links, but if you have a lot of current versions
         running, or an especially large git repo leaving this as True will save some disk space
         at the expense of `git` operations not working in the bundle that Tasks run from.
+    :param fetch_depth: Limit the history fetched from the repository to this many commits from the tip of
+        each branch and tag (Optional). Versions outside of it are fetched on their own when needed, which
+        requires the server to allow fetching commits by hash.
+    :param sparse_checkout: Only check out ``subdir`` and the files at the root of the repository in the
+        repos the DAGs are read from. Has no effect without ``subdir``.
+    :param shared_objects: Share the objects of the bare repo with the per-version clones through git
+        alternates instead of hard linking them, which is faster for large repos. Only use it with
+        ``prune_dotgit_folder`` set to False if nothing prunes objects from the bare repo, as the clones
+        depend on them. Ignored with ``fetch_depth``, as git does not share the objects of shallow repos.
+    :param min_fetch_interval: Minimum number of seconds between two fetches of the bare repo on a host, so
+        that tasks starting at the same time share one fetch instead of each fetching the repository. A
+        version that is not in the bare repo yet is always fetched.
+    :param use_content_store: Materialize versions as hard links to the files of the content store of the
+        host, which stores each file once, instead of cloning them. Only the files not on the host yet are
+        then read from the bare repo, and versions have no .git folder, as with ``prune_dotgit_folder``.
+        Ignored with ``submodules``. Requires Airflow 3.3+.
     """
 
     supports_versioning = True
@@ -65,6 +83,11 @@ class GitDagBundle(BaseDagBundle):
         repo_url: str | None = None,
         submodules: bool = False,
         prune_dotgit_folder: bool = True,
+        fetch_depth: int | None = None,
+        sparse_checkout: bool = False,
+        shared_objects: bool = False,
+        min_fetch_interval: float = 0,
+        use_content_store: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -78,6 +101,13 @@ class GitDagBundle(BaseDagBundle):
         self.git_conn_id = git_conn_id
         self.repo_url = repo_url
         self.submodules = submodules
+        self.fetch_depth = fetch_depth
+        self.sparse_checkout = sparse_checkout
+        self.shared_objects = shared_objects
+        self.min_fetch_interval = min_fetch_interval
+        if use_content_store and not AIRFLOW_V_3_3_PLUS:
+            raise AirflowException("use_content_store requires Airflow 3.3 or later")
+        self.use_content_store = use_content_store
 
         # Force prune to False if submodules are used, otherwise git links break
         if self.submodules:
@@ -143,6 +173,15 @@ class GitDagBundle(BaseDagBundle):
                 except InvalidGitRepositoryError as e:
                     raise RuntimeError(f"Invalid git repository at {self.bare_repo_path}") from e
                 self._ensure_version_in_bare_repo()
+
+            if self.version and self.use_content_store and not self.submodules:
+                try:
+                    self._materialize_version()
+                finally:
+                    self.bare_repo.close()
+                self.repo = None
+                self._log.debug("bundle initialize", version=self.version)
+                return
             self.bare_repo.close()
 
             try:
@@ -156,6 +195,9 @@ class GitDagBundle(BaseDagBundle):
             if self.version:
                 if not self._has_version(self.repo, self.version):
                     self.repo.remotes.origin.fetch()
+                if self.fetch_depth and not self._has_version(self.repo, self.version):
+                    # Versions outside of the shallow history are not reachable from the refs of the bare repo
+                    self.repo.remotes.origin.fetch(self.version)
                 self.repo.head.set_reference(str(self.repo.commit(self.version)))
                 self.repo.head.reset(index=True, working_tree=True)
 
@@ -194,10 +236,18 @@ class GitDagBundle(BaseDagBundle):
                 self._log.info(
                     "Cloning repository", repo_path=self.repo_path, bare_repo_path=self.bare_repo_path
                 )
+                clone_kwargs = {}
+                if self.shared_objects:
+                    clone_kwargs["shared"] = True
+                if self.sparse_checkout and self.subdir:
+                    clone_kwargs["sparse"] = True
                 Repo.clone_from(
                     url=self.bare_repo_path,
                     to_path=self.repo_path,
+                    **clone_kwargs,
                 )
+                if clone_kwargs.get("sparse"):
+                    Repo(self.repo_path).git.sparse_checkout("set", self.subdir)
             else:
                 self._log.debug("repo exists", repo_path=self.repo_path)
             self.repo = Repo(self.repo_path)
@@ -226,11 +276,13 @@ class GitDagBundle(BaseDagBundle):
         try:
             if not os.path.exists(self.bare_repo_path):
                 self._log.info("Cloning bare repository", bare_repo_path=self.bare_repo_path)
+                clone_kwargs = {"depth": self.fetch_depth} if self.fetch_depth else {}
                 Repo.clone_from(
                     url=self.repo_url,
                     to_path=self.bare_repo_path,
                     bare=True,
                     env=self.hook.env if self.hook else None,
+                    **clone_kwargs,
                 )
             self.bare_repo = Repo(self.bare_repo_path)
 
@@ -250,10 +302,41 @@ class GitDagBundle(BaseDagBundle):
         if not self.version:
             return
         if not self._has_version(self.bare_repo, self.version):
-            self._fetch_bare_repo()
+            self._fetch_bare_repo(force=True)
+            if self.fetch_depth and not self._has_version(self.bare_repo, self.version):
+                # Commits older than the fetch depth are not reachable from the refs fetched
+                try:
+                    self._fetch_bare_repo(refspecs=[self.version], force=True)
+                except GitCommandError:
+                    self._log.debug("Version could not be fetched on its own", version=self.version)
             if not self._has_version(self.bare_repo, self.version):
                 raise AirflowException(f"Version {self.version} not found in the repository")
 
+    def _materialize_version(self) -> None:
+        from airflow.dag_processing.bundles.content_store import BundleContentStore, BundleFile
+
+        args = ["-r", "-z", "--full-tree", self.version]
+        if self.sparse_checkout and self.subdir:
+            args += ["--", self.subdir]
+        files = []
+        for entry in self.bare_repo.git.ls_tree(*args).split("\0"):
+            if not entry:
+                continue
+            info, path = entry.split("\t", 1)
+            mode, object_type, digest = info.split()
+            # Skip the commits of submodules
+            if object_type != "blob":
+                continue
+            files.append(
+                BundleFile(path=path, digest=digest, executable=mode == "100755", symlink=mode == "120000")
+            )
+
+        def read(digest: str) -> bytes:
+            return self.bare_repo.odb.stream(bytes.fromhex(digest)).read()
+
+        self._log.info("Materializing version from content store", repo_path=self.repo_path)
+        BundleContentStore().materialize(self.repo_path, files, read, bundle_name=self.name)
+
     def __repr__(self):
         return (
             f"<GitDagBundle("
@@ -285,13 +368,28 @@ class GitDagBundle(BaseDagBundle):
         except (BadName, ValueError):
             return False
 
-    def _fetch_bare_repo(self):
-        refspecs = ["+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+    def _fetched_recently(self) -> bool:
+        # git updates FETCH_HEAD on every fetch, the lock of the bundle keeps concurrent fetches from racing
+        if not self.min_fetch_interval:
+            return False
+        try:
+            last_fetch = (self.bare_repo_path / "FETCH_HEAD").stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - last_fetch < self.min_fetch_interval
+
+    def _fetch_bare_repo(self, refspecs: list[str] | None = None, force: bool = False):
+        if not force and self._fetched_recently():
+            self._log.debug("Skipping fetch of bare repository, fetched recently")
+            return
+        if refspecs is None:
+            refspecs = ["+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"]
+        fetch_kwargs = {"depth": self.fetch_depth} if self.fetch_depth else {}
         cm = nullcontext()
         if self.hook and (cmd := self.hook.env.get("GIT_SSH_COMMAND")):
             cm = self.bare_repo.git.custom_environment(GIT_SSH_COMMAND=cmd)
         with cm:
-            self.bare_repo.remotes.origin.fetch(refspecs)
+            self.bare_repo.remotes.origin.fetch(refspecs, **fetch_kwargs)
             self.bare_repo.close()
 
     @retry(
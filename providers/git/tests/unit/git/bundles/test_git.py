@@ -35,7 +35,7 @@ from airflow.providers.git.bundles.git import GitDagBundle
 from airflow.providers.git.hooks.git import GitHook
 
 from tests_common.test_utils.config import conf_vars
-from tests_common.test_utils.version_compat import AIRFLOW_V_3_1_PLUS
+from tests_common.test_utils.version_compat import AIRFLOW_V_3_1_PLUS, AIRFLOW_V_3_3_PLUS
 
 
 @pytest.fixture(autouse=True)
@@ -623,6 +623,162 @@ class TestGitDagBundle:
         assert str(bundle.path).endswith(subdir)
         assert {"some_new_file.py"} == files_in_repo
 
+    @pytest.mark.parametrize("version", [None, "initial"])
+    @mock.patch("airflow.providers.git.bundles.git.GitHook")
+    def test_sparse_checkout(self, mock_githook, git_repo, version):
+        repo_path, repo = git_repo
+        mock_githook.return_value.repo_url = repo_path
+
+        for subdir in ("dags", "other"):
+            (repo_path / subdir).mkdir()
+            file_path = repo_path / subdir / f"{subdir}_file.py"
+            file_path.write_text("hello world")
+            repo.index.add([file_path])
+        repo.index.commit("Add subdirs")
+
+        bundle = GitDagBundle(
+            name="test",
+            git_conn_id=CONN_HTTPS,
+            tracking_ref=GIT_DEFAULT_BRANCH,
+            version=version and repo.head.commit.hexsha,
+            subdir="dags",
+            sparse_checkout=True,
+        )
+        bundle.initialize()
+
+        assert {f.name for f in bundle.path.iterdir()} == {"dags_file.py"}
+        assert not (bundle.repo_path / "other").exists()
+        assert (bundle.repo_path / "test_dag.py").exists()
+
+    @mock.patch("airflow.providers.git.bundles.git.GitHook")
+    def test_shared_objects(self, mock_githook, git_repo):
+        repo_path, repo = git_repo
+        mock_githook.return_value.repo_url = repo_path
+
+        bundle = GitDagBundle(
+            name="test",
+            git_conn_id=CONN_HTTPS,
+            tracking_ref=GIT_DEFAULT_BRANCH,
+            version=repo.head.commit.hexsha,
+            prune_dotgit_folder=False,
+            shared_objects=True,
+        )
+        bundle.initialize()
+
+        alternates = bundle.repo_path / ".git" / "objects" / "info" / "alternates"
+        assert alternates.read_text().strip() == str(bundle.bare_repo_path / "objects")
+        assert bundle.get_current_version() == repo.head.commit.hexsha
+
+    @mock.patch("airflow.providers.git.bundles.git.GitHook")
+    def test_fetch_depth(self, mock_githook, git_repo):
+        repo_path, repo = git_repo
+        # git ignores the depth for local paths
+        mock_githook.return_value.repo_url = f"file://{repo_path}"
+        starting_commit = repo.head.commit
+
+        for i in range(3):
+            file_path = repo_path / f"new_test_{i}.py"
+            file_path.write_text("hello world")
+            repo.index.add([file_path])
+            repo.index.commit(f"Commit {i}")
+
+        bundle = GitDagBundle(
+            name="test", git_conn_id=CONN_HTTPS, tracking_ref=GIT_DEFAULT_BRANCH, fetch_depth=1
+        )
+        bundle.initialize()
+
+        assert (bundle.bare_repo_path / "shallow").exists()
+        assert not GitDagBundle._has_version(Repo(bundle.bare_repo_path), starting_commit.hexsha)
+        assert bundle.get_current_version() == repo.head.commit.hexsha
+
+        # Versions outside of the shallow history are fetched on their own
+        bundle = GitDagBundle(
+            name="test",
+            git_conn_id=CONN_HTTPS,
+            tracking_ref=GIT_DEFAULT_BRANCH,
+            version=starting_commit.hexsha,
+            fetch_depth=1,
+        )
+        bundle.initialize()
+
+        assert bundle.get_current_version() == starting_commit.hexsha
+        assert {f.name for f in bundle.path.iterdir() if f.is_file()} == {"test_dag.py"}
+
+    @mock.patch("airflow.providers.git.bundles.git.GitHook")
+    def test_min_fetch_interval(self, mock_githook, git_repo):
+        repo_path, repo = git_repo
+        mock_githook.return_value.repo_url = repo_path
+        starting_commit = repo.head.commit
+
+        bundle = GitDagBundle(
+            name="test",
+            git_conn_id=CONN_HTTPS,
+            tracking_ref=GIT_DEFAULT_BRANCH,
+            version=starting_commit.hexsha,
+            min_fetch_interval=60,
+        )
+        bundle.initialize()
+
+        file_path = repo_path / "new_test.py"
+        file_path.write_text("hello world")
+        repo.index.add([file_path])
+        new_commit = repo.index.commit("Another commit")
+
+        # The bare repo was fetched recently, so the new commit is not seen yet
+        bundle = GitDagBundle(
+            name="test", git_conn_id=CONN_HTTPS, tracking_ref=GIT_DEFAULT_BRANCH, min_fetch_interval=60
+        )
+        bundle.initialize()
+        assert bundle.get_current_version() == starting_commit.hexsha
+
+        # Versions not fetched yet are fetched regardless
+        bundle = GitDagBundle(
+            name="test",
+            git_conn_id=CONN_HTTPS,
+            tracking_ref=GIT_DEFAULT_BRANCH,
+            version=new_commit.hexsha,
+            min_fetch_interval=60,
+        )
+        bundle.initialize()
+        assert bundle.get_current_version() == new_commit.hexsha
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_3_PLUS, reason="The content store requires Airflow 3.3+")
+    @mock.patch("airflow.providers.git.bundles.git.GitHook")
+    def test_use_content_store(self, mock_githook, git_repo):
+        repo_path, repo = git_repo
+        mock_githook.return_value.repo_url = repo_path
+        starting_commit = repo.head.commit
+
+        (repo_path / "dags").mkdir()
+        file_path = repo_path / "dags" / "new_test.py"
+        file_path.write_text("hello world")
+        os.symlink("../test_dag.py", repo_path / "dags" / "link.py")
+        repo.index.add([file_path, repo_path / "dags" / "link.py"])
+        new_commit = repo.index.commit("Another commit")
+
+        bundles = {}
+        for commit in (starting_commit, new_commit):
+            bundle = GitDagBundle(
+                name="test",
+                git_conn_id=CONN_HTTPS,
+                tracking_ref=GIT_DEFAULT_BRANCH,
+                version=commit.hexsha,
+                use_content_store=True,
+            )
+            with mock.patch.object(GitDagBundle, "_clone_repo_if_required") as mock_clone:
+                bundle.initialize()
+            mock_clone.assert_not_called()
+            assert bundle.get_current_version() == commit.hexsha
+            assert not (bundle.repo_path / ".git").exists()
+            bundles[commit] = bundle
+
+        assert {f.name for f in bundles[starting_commit].path.iterdir()} == {"test_dag.py"}
+        new_path = bundles[new_commit].path
+        assert (new_path / "dags" / "new_test.py").read_text() == "hello world"
+        assert (new_path / "dags" / "link.py").readlink().as_posix() == "../test_dag.py"
+        # Files unchanged between versions are stored once
+        assert (new_path / "test_dag.py").samefile(bundles[starting_commit].path / "test_dag.py")
+
     def test_raises_when_no_repo_url(self):
         bundle = GitDagBundle(
             name="test",
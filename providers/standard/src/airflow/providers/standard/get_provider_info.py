@@ -113,7 +113,56 @@ def get_provider_info():
                         "type": "string",
                         "example": "uv",
                         "default": "auto",
-                    }
+                    },
+                    "uv_cache_dir": {
+                        "description": "Cache directory of ``uv`` when it installs virtual environments, shared by all the virtual\nenvironments built on the worker. Defaults to the cache directory of ``uv`` for the user.\n",
+                        "version_added": "1.13.0",
+                        "type": "string",
+                        "example": "/var/cache/uv",
+                        "default": None,
+                    },
+                    "venv_pool_path": {
+                        "description": "Path of the pool of cached virtual environments of the worker, used by ``PythonVirtualenvOperator``\ntasks that do not set ``venv_cache_path``. Virtual environments are stored by hash of their\nrequirements, built once under a lock and reused by all the tasks with the same requirements.\nIf not set, the virtual environments of these tasks are built for every execution.\n",
+                        "version_added": "1.13.0",
+                        "type": "string",
+                        "example": "/var/cache/airflow/venvs",
+                        "default": None,
+                    },
+                    "venv_pool_max_size": {
+                        "description": "Size in MB of the pool of virtual environments beyond which the least recently used ones, not in\nuse by any task, are removed after a new one is built. Set to 0 to never remove them.\n",
+                        "version_added": "1.13.0",
+                        "type": "integer",
+                        "example": "10240",
+                        "default": "0",
+                    },
+                    "venv_pool_prewarm": {
+                        "description": "JSON list of the virtual environments to build in the pool ahead of tasks by running\n``python -m airflow.providers.standard.utils.venv_pool``, e.g. when starting workers. Each entry\nis a dict of the ``PythonVirtualenvOperator`` arguments of the tasks to build it for, such as\n``requirements``, ``python_version`` or ``system_site_packages``.\n",
+                        "version_added": "1.13.0",
+                        "type": "string",
+                        "example": '[{"requirements": ["pandas==2.2.3"], "system_site_packages": false}]',
+                        "default": None,
+                    },
+                    "persistent_interpreter_pool_size": {
+                        "description": "Number of persistent interpreters a worker keeps per virtual environment or external python for the\ntasks with ``use_persistent_interpreter``. Tasks run in a new interpreter when all the persistent\ninterpreters of their environment are busy.\n",
+                        "version_added": "1.13.0",
+                        "type": "integer",
+                        "example": None,
+                        "default": "2",
+                    },
+                    "persistent_interpreter_max_tasks": {
+                        "description": "Number of callables a persistent interpreter runs before it is recycled.\n",
+                        "version_added": "1.13.0",
+                        "type": "integer",
+                        "example": None,
+                        "default": "100",
+                    },
+                    "persistent_interpreter_idle_timeout": {
+                        "description": "Time in seconds after which a persistent interpreter not running any callable exits.\n",
+                        "version_added": "1.13.0",
+                        "type": "float",
+                        "example": None,
+                        "default": "300",
+                    },
                 },
             }
         },
@@ -30,7 +30,8 @@ import textwrap
 import types
 import warnings
 from abc import ABCMeta, abstractmethod
-from collections.abc import Callable, Collection, Container, Iterable, Mapping, Sequence
+from collections.abc import Callable, Collection, Container, Generator, Iterable, Mapping, Sequence
+from contextlib import contextmanager
 from functools import cache
 from itertools import chain
 from pathlib import Path
@@ -54,6 +55,8 @@ from airflow.providers.common.compat.sdk import (
     BaseBranchOperator,
     KeywordParameters,
     SkipMixin,
+    Stats,
+    conf,
     context_merge,
 )
 from airflow.providers.common.compat.standard.operators import (
@@ -61,11 +64,21 @@ from airflow.providers.common.compat.standard.operators import (
     is_async_callable,
 )
 from airflow.providers.standard.hooks.package_index import PackageIndexHook
+from airflow.providers.standard.utils.persistent_interpreter import (
+    SERVER_SCRIPT,
+    CallableResult,
+    run_in_persistent_interpreter,
+)
 from airflow.providers.standard.utils.python_virtualenv import (
     _execute_in_subprocess,
     prepare_virtualenv,
     write_python_script,
 )
+from airflow.providers.standard.utils.venv_pool import (
+    INSTALL_COMPLETE_MARKER,
+    evict_virtualenvs,
+    get_venv_pool_path,
+)
 from airflow.providers.standard.version_compat import AIRFLOW_V_3_0_PLUS, AIRFLOW_V_3_2_PLUS
 from airflow.utils import hashlib_wrapper
 from airflow.utils.file import get_unique_dag_module_name
@@ -491,6 +504,7 @@ class _BasePythonVirtualenvOperator(PythonOperator, metaclass=ABCMeta):
         skip_on_exit_code: int | Container[int] | None = None,
         env_vars: dict[str, str] | None = None,
         inherit_env: bool = True,
+        use_persistent_interpreter: bool = False,
         **kwargs,
     ):
         if (
@@ -531,6 +545,7 @@ class _BasePythonVirtualenvOperator(PythonOperator, metaclass=ABCMeta):
         )
         self.env_vars = env_vars
         self.inherit_env = inherit_env
+        self.use_persistent_interpreter = use_persistent_interpreter
 
     @abstractmethod
     def _iter_serializable_context_keys(self):
@@ -610,8 +625,11 @@ class _BasePythonVirtualenvOperator(PythonOperator, metaclass=ABCMeta):
     def _read_result(self, path: Path):
         if path.stat().st_size == 0:
             return None
+        return self._deserialize_result(path.read_bytes())
+
+    def _deserialize_result(self, data: bytes):
         try:
-            return self.pickling_library.loads(path.read_bytes())
+            return self.pickling_library.loads(data)
         except ValueError as value_error:
             raise DeserializingResultError() from value_error
 
@@ -620,7 +638,7 @@ class _BasePythonVirtualenvOperator(PythonOperator, metaclass=ABCMeta):
         memo[id(self.pickling_library)] = self.pickling_library
         return super().__deepcopy__(memo)
 
-    def _execute_python_callable_in_subprocess(self, python_path: Path):
+    def _execute_python_callable_in_subprocess(self, python_path: Path, *, persistent: bool = False):
         with TemporaryDirectory(prefix="venv-call") as tmp:
             tmp_dir = Path(tmp)
             op_kwargs: dict[str, Any] = dict(self.op_kwargs)
@@ -656,11 +674,24 @@ class _BasePythonVirtualenvOperator(PythonOperator, metaclass=ABCMeta):
             )
 
             env_vars = dict(os.environ) if self.inherit_env else {}
-            if fd := os.getenv("__AIRFLOW_SUPERVISOR_FD"):
-                env_vars["__AIRFLOW_SUPERVISOR_FD"] = fd
             if self.env_vars:
                 env_vars.update(self.env_vars)
 
+            if persistent and jinja_context.get("pendulum_version_mismatch"):
+                self.log.info(
+                    "Persistent interpreters do not support pendulum version mismatches, "
+                    "running the callable in a new interpreter."
+                )
+            elif persistent:
+                callable_result = self._execute_python_callable_in_persistent_interpreter(
+                    python_path, input_path, jinja_context, env_vars
+                )
+                if callable_result is not None:
+                    return self._handle_callable_result(callable_result, python_path)
+
+            if fd := os.getenv("__AIRFLOW_SUPERVISOR_FD"):
+                env_vars["__AIRFLOW_SUPERVISOR_FD"] = fd
+
             # Add bundle_path to PYTHONPATH for subprocess to import Dag bundle modules
             if self._bundle_path:
                 bundle_path = self._bundle_path
@@ -700,6 +731,38 @@ class _BasePythonVirtualenvOperator(PythonOperator, metaclass=ABCMeta):
 
             return self._read_result(output_path)
 
+    def _execute_python_callable_in_persistent_interpreter(
+        self, python_path: Path, input_path: Path, jinja_context: dict, env_vars: dict[str, str]
+    ) -> CallableResult | None:
+        """Run the callable in a persistent interpreter, or return None if none is available."""
+        request = {
+            "source": jinja_context["python_callable_source"],
+            "python_callable": jinja_context["python_callable"],
+            "modified_dag_module_name": jinja_context.get("modified_dag_module_name"),
+            "pickling_library": self.serializer,
+            "args": input_path.read_bytes() if input_path.exists() else None,
+            "string_args": [arg.strip() for arg in "\n".join(map(str, self.string_args)).splitlines()],
+            "expect_airflow": self.expect_airflow,
+            "env": env_vars,
+            "sys_path": [self._bundle_path] if self._bundle_path else [],
+            "cwd": os.getcwd(),
+        }
+        return run_in_persistent_interpreter(python_path, request, env_vars)
+
+    def _handle_callable_result(self, callable_result: CallableResult, python_path: Path) -> Any:
+        exit_code = callable_result.exit_code
+        if exit_code in self.skip_on_exit_code:
+            raise AirflowSkipException(f"Process exited with code {exit_code}. Skipping.")
+        if callable_result.error:
+            raise AirflowException(
+                f"Process returned non-zero exit status {exit_code}.\n{callable_result.error}"
+            )
+        if exit_code:
+            raise subprocess.CalledProcessError(exit_code, [os.fspath(python_path), os.fspath(SERVER_SCRIPT)])
+        if callable_result.result is None:
+            return None
+        return self._deserialize_result(callable_result.result)
+
     def _get_additional_jinja_context(self) -> dict:
         """Return additional Jinja context variables for the virtualenv script template."""
         return {}
@@ -811,14 +874,20 @@ class PythonVirtualenvOperator(_BasePythonVirtualenvOperator):
         Will be appended to ``index_urls``.
     :param venv_cache_path: Optional path to the virtual environment parent folder in which the
         virtual environment will be cached, creates a sub-folder venv-{hash} whereas hash will be replaced
-        with a checksum of requirements. If not provided the virtual environment will be created and deleted
-        in a temp folder for every execution.
+        with a checksum of requirements. If not provided, the virtual environment is cached in the pool of the
+        worker if ``[standard] venv_pool_path`` is set, otherwise it will be created and deleted in a temp
+        folder for every execution.
     :param env_vars: A dictionary containing additional environment variables to set for the virtual
         environment when it is executed.
     :param inherit_env: Whether to inherit the current environment variables when executing the virtual
         environment. If set to ``True``, the virtual environment will inherit the environment variables
         of the parent process (``os.environ``). If set to ``False``, the virtual environment will be
         executed with a clean environment.
+    :param use_persistent_interpreter: Whether to run the callable in a persistent interpreter of the
+        virtual environment, shared with other tasks of the worker, instead of starting a new interpreter
+        for it. Modules imported by callables are kept loaded across tasks, so this saves the startup time of
+        short callables, but callables cannot access Airflow variables, connections or XComs through the
+        Task SDK. See ``[standard] persistent_interpreter_*`` options.
     """
 
     template_fields: Sequence[str] = tuple(
@@ -849,6 +918,7 @@ class PythonVirtualenvOperator(_BasePythonVirtualenvOperator):
         venv_cache_path: None | os.PathLike[str] = None,
         env_vars: dict[str, str] | None = None,
         inherit_env: bool = True,
+        use_persistent_interpreter: bool = False,
         **kwargs,
     ):
         if (
@@ -899,6 +969,7 @@ class PythonVirtualenvOperator(_BasePythonVirtualenvOperator):
             skip_on_exit_code=skip_on_exit_code,
             env_vars=env_vars,
             inherit_env=inherit_env,
+            use_persistent_interpreter=use_persistent_interpreter,
             **kwargs,
         )
 
@@ -959,58 +1030,93 @@ class PythonVirtualenvOperator(_BasePythonVirtualenvOperator):
 
     def _ensure_venv_cache_exists(self, venv_cache_path: Path) -> Path:
         """Ensure a valid virtual environment is set up and will create inplace."""
+        with self._use_venv_cache(venv_cache_path) as venv_path:
+            return venv_path
+
+    @contextmanager
+    def _use_venv_cache(self, venv_cache_path: Path) -> Generator[Path, None, None]:
+        """
+        Ensure a valid cached virtual environment is set up, and keep it from being evicted while in use.
+
+        The virtual environment is built under an exclusive lock, so that it is not built by parallel
+        workers, and used under a shared lock of another lock file, so that tasks using the same virtual
+        environment run concurrently.
+        """
         cache_hash, hash_data = self._calculate_cache_hash()
         venv_path = venv_cache_path / f"venv-{cache_hash}"
         self.log.info("Python virtual environment will be cached in %s", venv_path)
         venv_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(f"{venv_path}.lock", "w") as f:
+        with (
+            open(f"{venv_path}.lock", "w") as build_lock,
+            open(f"{venv_path}.in_use.lock", "w") as in_use_lock,
+        ):
             # Ensure that cache is not build by parallel workers
             import fcntl
 
-            fcntl.flock(f, fcntl.LOCK_EX)
-
-            hash_marker = venv_path / "install_complete_marker.json"
+            fcntl.flock(build_lock, fcntl.LOCK_EX)
             try:
-                if venv_path.exists():
-                    if hash_marker.exists():
-                        previous_hash_data = hash_marker.read_text(encoding="utf8")
-                        if previous_hash_data == hash_data:
-                            self.log.info("Reusing cached Python virtual environment in %s", venv_path)
-                            return venv_path
-
-                        _, hash_data_before_upgrade = self._calculate_cache_hash(exclude_cloudpickle=True)
-                        if previous_hash_data == hash_data_before_upgrade:
-                            self.log.warning(
-                                "Found a previous virtual environment in  with outdated dependencies %s, "
-                                "deleting and re-creating.",
-                                venv_path,
-                            )
-                        else:
-                            self.log.error(
-                                "Unicorn alert: Found a previous virtual environment in %s "
-                                "with the same hash but different parameters. Previous setup: '%s' / "
-                                "Requested venv setup: '%s'. Please report a bug to airflow!",
-                                venv_path,
-                                previous_hash_data,
-                                hash_data,
-                            )
-                    else:
+                built = self._build_venv_cache(venv_path, hash_data)
+                # Taken before the build lock is released, so that the virtual environment cannot be evicted
+                # in between
+                fcntl.flock(in_use_lock, fcntl.LOCK_SH)
+            finally:
+                fcntl.flock(build_lock, fcntl.LOCK_UN)
+
+            pool_path = get_venv_pool_path()
+            max_size = conf.getint("standard", "venv_pool_max_size", fallback=0) * 2**20
+            if built and max_size > 0 and pool_path and venv_cache_path.resolve() == pool_path.resolve():
+                evict_virtualenvs(venv_cache_path, max_size)
+            yield venv_path
+
+    def _build_venv_cache(self, venv_path: Path, hash_data: str) -> bool:
+        """Build the cached virtual environment unless it is up to date, and return whether it was built."""
+        hash_marker = venv_path / INSTALL_COMPLETE_MARKER
+        try:
+            if venv_path.exists():
+                if hash_marker.exists():
+                    previous_hash_data = hash_marker.read_text(encoding="utf8")
+                    if previous_hash_data == hash_data:
+                        self.log.info("Reusing cached Python virtual environment in %s", venv_path)
+                        # The last use of the virtual environment, for eviction
+                        os.utime(hash_marker)
+                        Stats.incr("python_virtualenv.cache_hit")
+                        return False
+
+                    _, hash_data_before_upgrade = self._calculate_cache_hash(exclude_cloudpickle=True)
+                    if previous_hash_data == hash_data_before_upgrade:
                         self.log.warning(
-                            "Found a previous (probably partial installed) virtual environment in %s, "
+                            "Found a previous virtual environment in  with outdated dependencies %s, "
                             "deleting and re-creating.",
                             venv_path,
                         )
+                    else:
+                        self.log.error(
+                            "Unicorn alert: Found a previous virtual environment in %s "
+                            "with the same hash but different parameters. Previous setup: '%s' / "
+                            "Requested venv setup: '%s'. Please report a bug to airflow!",
+                            venv_path,
+                            previous_hash_data,
+                            hash_data,
+                        )
+                else:
+                    self.log.warning(
+                        "Found a previous (probably partial installed) virtual environment in %s, "
+                        "deleting and re-creating.",
+                        venv_path,
+                    )
 
-                    shutil.rmtree(venv_path)
+                shutil.rmtree(venv_path)
 
-                venv_path.mkdir(parents=True)
+            Stats.incr("python_virtualenv.cache_miss")
+            venv_path.mkdir(parents=True)
+            with Stats.timer("python_virtualenv.cache_build_duration"):
                 self._prepare_venv(venv_path)
-                hash_marker.write_text(hash_data, encoding="utf8")
-            except Exception as e:
-                shutil.rmtree(venv_path)
-                raise AirflowException(f"Unable to create new virtual environment in {venv_path}") from e
-            self.log.info("New Python virtual environment created in %s", venv_path)
-            return venv_path
+            hash_marker.write_text(hash_data, encoding="utf8")
+        except Exception as e:
+            shutil.rmtree(venv_path)
+            raise AirflowException(f"Unable to create new virtual environment in {venv_path}") from e
+        self.log.info("New Python virtual environment created in %s", venv_path)
+        return True
 
     def _cleanup_python_pycache_dir(self, cache_dir_path: Path) -> None:
         try:
@@ -1033,10 +1139,18 @@ class PythonVirtualenvOperator(_BasePythonVirtualenvOperator):
         if self.index_urls_from_connection_ids:
             self._retrieve_index_urls_from_connection_ids()
 
-        if self.venv_cache_path:
-            venv_path = self._ensure_venv_cache_exists(Path(self.venv_cache_path))
-            python_path = venv_path / "bin" / "python"
-            return self._execute_python_callable_in_subprocess(python_path)
+        if venv_cache_path := self.venv_cache_path or get_venv_pool_path():
+            with self._use_venv_cache(Path(venv_cache_path)) as venv_path:
+                python_path = venv_path / "bin" / "python"
+                return self._execute_python_callable_in_subprocess(
+                    python_path, persistent=self.use_persistent_interpreter
+                )
+
+        if self.use_persistent_interpreter:
+            self.log.warning(
+                "Persistent interpreters require a cached virtual environment, set venv_cache_path or "
+                "[standard] venv_pool_path to use them."
+            )
 
         with TemporaryDirectory(prefix="venv") as tmp_dir:
             tmp_path = Path(tmp_dir)
@@ -1212,6 +1326,11 @@ class ExternalPythonOperator(_BasePythonVirtualenvOperator):
         environment. If set to ``True``, the virtual environment will inherit the environment variables
         of the parent process (``os.environ``). If set to ``False``, the virtual environment will be
         executed with a clean environment.
+    :param use_persistent_interpreter: Whether to run the callable in a persistent interpreter of the
+        virtual environment, shared with other tasks of the worker, instead of starting a new interpreter
+        for it. Modules imported by callables are kept loaded across tasks, so this saves the startup time of
+        short callables, but callables cannot access Airflow variables, connections or XComs through the
+        Task SDK. See ``[standard] persistent_interpreter_*`` options.
     """
 
     template_fields: Sequence[str] = tuple({"python"}.union(PythonOperator.template_fields))
@@ -1232,6 +1351,7 @@ class ExternalPythonOperator(_BasePythonVirtualenvOperator):
         skip_on_exit_code: int | Container[int] | None = None,
         env_vars: dict[str, str] | None = None,
         inherit_env: bool = True,
+        use_persistent_interpreter: bool = False,
         **kwargs,
     ):
         if not python:
@@ -1250,6 +1370,7 @@ class ExternalPythonOperator(_BasePythonVirtualenvOperator):
             skip_on_exit_code=skip_on_exit_code,
             env_vars=env_vars,
             inherit_env=inherit_env,
+            use_persistent_interpreter=use_persistent_interpreter,
             **kwargs,
         )
 
@@ -1269,7 +1390,9 @@ class ExternalPythonOperator(_BasePythonVirtualenvOperator):
                 f"Sys version: {sys.version_info}. "
                 f"Virtual environment version: {python_version}"
             )
-        return self._execute_python_callable_in_subprocess(python_path)
+        return self._execute_python_callable_in_subprocess(
+            python_path, persistent=self.use_persistent_interpreter
+        )
 
     def _iter_serializable_context_keys(self):
         yield from self.BASE_SERIALIZABLE_CONTEXT_KEYS
@@ -0,0 +1,195 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Pools of persistent interpreters running the callables of ``PythonVirtualenvOperator`` and co.
+
+Each python binary gets a pool of ``[standard] persistent_interpreter_pool_size`` interpreters, shared by the
+tasks of a worker. An interpreter runs the callables of one task at a time, sent to it over a unix socket, and
+keeps the modules they import across tasks. It is recycled after ``[standard] persistent_interpreter_max_tasks``
+callables, and exits once idle for ``[standard] persistent_interpreter_idle_timeout`` seconds.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import logging
+import os
+import pickle
+import signal
+import socket
+import struct
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from airflow.providers.common.compat.sdk import AirflowException, conf
+
+log = logging.getLogger(__name__)
+
+SERVER_SCRIPT = Path(__file__).with_name("python_interpreter_server.py")
+
+_HEADER = struct.Struct("!Q")
+_PID = struct.Struct("!I")
+_START_TIMEOUT = 60
+
+
+class CallableResult(NamedTuple):
+    """Result of a callable run in a persistent interpreter."""
+
+    exit_code: int
+    error: str | None
+    """Message of the exception raised by the callable, if any."""
+
+    result: bytes | None
+    """Return value of the callable serialized by the pickling library, if not None."""
+
+
+def get_interpreters_dir() -> Path:
+    """Return the directory of the sockets of the persistent interpreters, only accessible by the current user."""
+    path = Path(tempfile.gettempdir()) / f"airflow-python-interpreters-{os.getuid()}"
+    path.mkdir(mode=0o700, exist_ok=True)
+    st = path.stat()
+    # Anyone able to connect to the sockets can run code as the current user
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise AirflowException(
+            f"Directory {path} of the persistent interpreters must be private to its owner"
+        )
+    return path
+
+
+def _pool_key(python_path: Path) -> str:
+    # A virtual environment re-created at the same path gets new interpreters
+    st = os.lstat(python_path)
+    return hashlib.sha256(f"{python_path}:{st.st_ino}:{st.st_mtime_ns}".encode()).hexdigest()[:16]
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 2**20))
+        if not chunk:
+            raise EOFError("Connection closed by the persistent interpreter")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _connect(socket_path: Path) -> tuple[socket.socket, int] | None:
+    """Connect to the interpreter listening at ``socket_path``, returning the connection and its pid."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(os.fspath(socket_path))
+        # The interpreter may have exited after the connection was queued, e.g. when idle or recycled
+        pid = _PID.unpack(_recv_exactly(sock, _PID.size))[0]
+    except (OSError, EOFError):
+        sock.close()
+        return None
+    return sock, pid
+
+
+def _start(python_path: Path, socket_path: Path, env: dict[str, str]) -> tuple[socket.socket, int]:
+    max_tasks = conf.getint("standard", "persistent_interpreter_max_tasks", fallback=100)
+    idle_timeout = conf.getfloat("standard", "persistent_interpreter_idle_timeout", fallback=300)
+    cmd = [
+        os.fspath(python_path),
+        os.fspath(SERVER_SCRIPT),
+        os.fspath(socket_path),
+        str(max_tasks),
+        str(idle_timeout),
+    ]
+    log.info("Starting persistent interpreter: %s", " ".join(cmd))
+    try:
+        subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            env=env,
+            check=True,
+            timeout=_START_TIMEOUT,
+        )
+    except subprocess.CalledProcessError as e:
+        raise AirflowException(
+            f"Persistent interpreter exited with code {e.returncode} on start:\n{e.stderr.decode(errors='replace')}"
+        ) from None
+    if not (connection := _connect(socket_path)):
+        raise AirflowException(f"Could not connect to the persistent interpreter at {socket_path}")
+    return connection
+
+
+def _log_output(output: int) -> None:
+    with os.fdopen(output, "rb") as f:
+        for line in iter(f.readline, b""):
+            log.info("%s", line.decode(errors="replace").rstrip())
+
+
+def _run(sock: socket.socket, pid: int, request: dict[str, Any]) -> CallableResult:
+    data = pickle.dumps(request, protocol=4)
+    output, output_w = os.pipe()
+    output_thread = threading.Thread(target=_log_output, args=(output,), daemon=True)
+    output_thread.start()
+    try:
+        try:
+            socket.send_fds(sock, [_HEADER.pack(len(data))], [output_w])
+        finally:
+            os.close(output_w)
+        sock.sendall(data)
+        size = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))[0]
+        response = pickle.loads(_recv_exactly(sock, size))
+    except EOFError:
+        raise AirflowException("Persistent interpreter exited while running the callable") from None
+    except BaseException:
+        # e.g. the task timed out, the callable must not keep running in the background
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(pid, signal.SIGKILL)
+        raise
+    finally:
+        output_thread.join()
+    return CallableResult(response["exit_code"], response["error"], response["result"])
+
+
+def run_in_persistent_interpreter(
+    python_path: Path, request: dict[str, Any], env: dict[str, str]
+) -> CallableResult | None:
+    """
+    Run a callable in a persistent interpreter of ``python_path``.
+
+    :param python_path: Python binary of the interpreter.
+    :param request: The callable, its arguments and the environment to run it with.
+    :param env: Environment variables to start the interpreter with if none is running.
+    :return: The result of the callable, or None if all the interpreters of the pool are busy.
+    """
+    interpreters_dir = get_interpreters_dir()
+    key = _pool_key(python_path)
+    pool_size = conf.getint("standard", "persistent_interpreter_pool_size", fallback=2)
+    for slot in range(pool_size):
+        with open(interpreters_dir / f"{key}-{slot}.lock", "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+            socket_path = interpreters_dir / f"{key}-{slot}.sock"
+            connection = _connect(socket_path) or _start(python_path, socket_path, env)
+            sock, pid = connection
+            with sock:
+                log.info("Running callable in persistent interpreter %d of %s", pid, python_path)
+                return _run(sock, pid, request)
+    log.info("All the persistent interpreters of %s are busy", python_path)
+    return None
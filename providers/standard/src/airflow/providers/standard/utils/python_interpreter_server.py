@@ -0,0 +1,250 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Server running python callables in a persistent interpreter, one at a time.
+
+This script is run by the interpreter of a virtual environment, which may have neither Airflow nor the
+Python version of Airflow installed, so it only uses the standard library. It is started by
+:mod:`airflow.providers.standard.utils.persistent_interpreter` with the command below, which returns once the
+server listens in the background::
+
+    python python_interpreter_server.py SOCKET_PATH MAX_TASKS IDLE_TIMEOUT
+"""
+
+from __future__ import annotations
+
+import array
+import builtins
+import importlib
+import os
+import pickle
+import socket
+import struct
+import sys
+import traceback
+import types
+
+_HEADER = struct.Struct("!Q")
+
+
+def _recv_exactly(conn, size):
+    chunks = []
+    while size:
+        chunk = conn.recv(min(size, 2**20))
+        if not chunk:
+            raise EOFError("Connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_header_and_fd(conn):
+    """Receive the size of the request, along with the file descriptor to write the output of the callable."""
+    fds = array.array("i")
+    data, ancdata, _, _ = conn.recvmsg(_HEADER.size, socket.CMSG_SPACE(fds.itemsize))
+    for level, type_, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and type_ == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[: len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+    if not data:
+        raise EOFError("Connection closed")
+    if len(data) < _HEADER.size:
+        data += _recv_exactly(conn, _HEADER.size - len(data))
+    return _HEADER.unpack(data)[0], fds[0] if fds else None
+
+
+def _send(conn, obj):
+    data = pickle.dumps(obj, protocol=4)
+    conn.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _exit_code(e):
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=sys.stderr)
+    return 1
+
+
+class _Interpreter:
+    def __init__(self):
+        self.base_sys_path = list(sys.path)
+        self.macros_plugins_integrated = False
+
+    def _integrate_macros_plugins(self):
+        if self.macros_plugins_integrated:
+            return
+        self.macros_plugins_integrated = True
+        try:
+            from airflow.plugins_manager import integrate_macros_plugins
+
+            integrate_macros_plugins()
+        except ImportError:
+            pass
+
+    def _forget_modules(self, path):
+        """Remove the modules imported from ``path``, which may be another version of them next time."""
+        prefix = os.path.join(os.path.realpath(path), "")
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if module_file and os.path.realpath(module_file).startswith(prefix):
+                del sys.modules[name]
+
+    def run(self, request):
+        """
+        Run the callable of a request.
+
+        :return: The response to the request, and whether the interpreter must be recycled after it.
+        """
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.environ["PYTHON_OPERATORS_VIRTUAL_ENV_MODE"] = "1"
+        sys.path[:] = self.base_sys_path + request["sys_path"]
+
+        response = {"exit_code": 0, "error": None, "result": None}
+        recycle = False
+        try:
+            os.chdir(request["cwd"])
+            if request["expect_airflow"]:
+                self._integrate_macros_plugins()
+            pickling_library = importlib.import_module(request["pickling_library"])
+            if request["args"]:
+                arg_dict = pickling_library.loads(request["args"])
+            else:
+                arg_dict = {"args": [], "kwargs": {}}
+
+            namespace = {
+                "__name__": "__main__",
+                "__builtins__": builtins,
+                "virtualenv_string_args": request["string_args"],
+            }
+            exec(compile(request["source"], "<python_callable>", "exec"), namespace)
+            python_callable = namespace[request["python_callable"]]
+            if request["modified_dag_module_name"]:
+                module = types.ModuleType(request["modified_dag_module_name"])
+                setattr(module, request["python_callable"], python_callable)
+                sys.modules[request["modified_dag_module_name"]] = module
+
+            res = python_callable(*arg_dict["args"], **arg_dict["kwargs"])
+            if res is not None:
+                response["result"] = pickling_library.dumps(res)
+        except SystemExit as e:
+            # The callable expects its process to exit, so it is not reused
+            response["exit_code"] = _exit_code(e)
+            recycle = True
+        except Exception as e:
+            traceback.print_exc()
+            response["exit_code"] = 1
+            response["error"] = str(e)
+        finally:
+            for path in request["sys_path"]:
+                self._forget_modules(path)
+        return response, recycle
+
+
+def _handle(interpreter, conn):
+    # Let the client know the connection was accepted, and which process runs its callable
+    conn.sendall(struct.pack("!I", os.getpid()))
+    size, output_fd = _recv_header_and_fd(conn)
+    request = pickle.loads(_recv_exactly(conn, size))
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = os.dup(1), os.dup(2)
+    if output_fd is not None:
+        os.dup2(output_fd, 1)
+        os.dup2(output_fd, 2)
+        os.close(output_fd)
+    try:
+        response, recycle = interpreter.run(request)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Restoring the original file descriptors closes the output of the callable for the client
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+        os.close(saved_fds[0])
+        os.close(saved_fds[1])
+    _send(conn, response)
+    return recycle
+
+
+def _daemonize():
+    """
+    Detach from the process starting the server, which exits once the server listens.
+
+    :return: File descriptor to write to once the server listens.
+    """
+    ready_r, ready_w = os.pipe()
+    if os.fork():
+        os.close(ready_w)
+        os._exit(0 if os.read(ready_r, 1) else 1)
+    os.close(ready_r)
+    os.setsid()
+    return ready_w
+
+
+def main():
+    socket_path, max_tasks, idle_timeout = sys.argv[1], int(sys.argv[2]), float(sys.argv[3])
+    # The script directory is not meant to be importable by callables
+    sys.path[:] = [p for p in sys.path if p != os.path.dirname(os.path.abspath(__file__))]
+    ready = _daemonize()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Bind to a temporary path and move it in place, so that clients never connect to a socket not listening yet
+    tmp_socket_path = f"{socket_path}.{os.getpid()}"
+    server.bind(tmp_socket_path)
+    server.listen(1)
+    os.rename(tmp_socket_path, socket_path)
+    socket_inode = os.stat(socket_path).st_ino
+    server.settimeout(idle_timeout)
+
+    # Errors until now are reported by the process starting the server, the output of callables is sent to clients
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.close(devnull)
+    os.write(ready, b"1")
+    os.close(ready)
+
+    interpreter = _Interpreter()
+    try:
+        for _ in range(max_tasks):
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:  # noqa: UP041 - alias of TimeoutError only since Python 3.10
+                break
+            with conn:
+                conn.settimeout(None)
+                try:
+                    if _handle(interpreter, conn):
+                        break
+                except (EOFError, OSError):
+                    # The client went away, e.g. as its task was killed
+                    continue
+    finally:
+        server.close()
+        try:
+            # Another server may have replaced the socket in the meantime
+            if os.stat(socket_path).st_ino == socket_inode:
+                os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -134,6 +134,15 @@ def _index_urls_to_uv_env_vars(index_urls: list[str] | None = None) -> dict[str,
     return uv_index_env_vars
 
 
+def _uv_env_vars(index_urls: list[str] | None = None) -> dict[str, str]:
+    """Build the environment variables to run uv with."""
+    uv_env_vars = _index_urls_to_uv_env_vars(index_urls)
+    # Share the cache of downloaded and built wheels between the virtual environments of the worker
+    if uv_cache_dir := conf.get("standard", "uv_cache_dir", fallback=None):
+        uv_env_vars["UV_CACHE_DIR"] = uv_cache_dir
+    return uv_env_vars
+
+
 def _execute_in_subprocess(cmd: list[str], cwd: str | None = None, env: dict[str, str] | None = None) -> None:
     """
     Execute a process and stream output to logger.
@@ -200,7 +209,7 @@ def prepare_virtualenv(
 
     if _use_uv():
         venv_cmd = _generate_uv_cmd(venv_directory, python_bin, system_site_packages)
-        _execute_in_subprocess(venv_cmd, env={**os.environ, **_index_urls_to_uv_env_vars(index_urls)})
+        _execute_in_subprocess(venv_cmd, env={**os.environ, **_uv_env_vars(index_urls)})
     else:
         venv_cmd = _generate_venv_cmd(venv_directory, python_bin, system_site_packages)
         _execute_in_subprocess(venv_cmd)
@@ -222,7 +231,7 @@ def prepare_virtualenv(
             )
 
     if pip_cmd:
-        _execute_in_subprocess(pip_cmd, env={**os.environ, **_index_urls_to_uv_env_vars(index_urls)})
+        _execute_in_subprocess(pip_cmd, env={**os.environ, **_uv_env_vars(index_urls)})
 
     return f"{venv_directory}/bin/python"
 
@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Worker-level pool of cached virtual environments for the ``PythonVirtualenvOperator``.
+
+The virtual environments of the pool are stored in ``[standard] venv_pool_path`` by hash of their
+requirements. They can be built ahead of tasks from ``[standard] venv_pool_prewarm``, e.g. in the entrypoint
+of worker images, with::
+
+    python -m airflow.providers.standard.utils.venv_pool
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from airflow.providers.common.compat.sdk import AirflowException, conf
+
+log = logging.getLogger(__name__)
+
+INSTALL_COMPLETE_MARKER = "install_complete_marker.json"
+
+
+def get_venv_pool_path() -> Path | None:
+    """Return the path of the pool of virtual environments, or None if there is no pool."""
+    if pool_path := conf.get("standard", "venv_pool_path", fallback=None):
+        return Path(pool_path)
+    return None
+
+
+def _dir_size(path: Path) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.lstat(os.path.join(root, name)).st_size
+            except FileNotFoundError:
+                continue
+    return size
+
+
+def evict_virtualenvs(venv_cache_path: Path, max_size: int) -> list[Path]:
+    """
+    Remove the least recently used virtual environments until the cache fits in ``max_size`` bytes.
+
+    Virtual environments in use by tasks, which hold a shared lock on their ``.in_use.lock`` file, or being
+    built, under an exclusive lock on their ``.lock`` file, are never removed. Their last use is the
+    modification time of their install marker, which is touched on every use.
+
+    :param venv_cache_path: Directory the virtual environments are cached in.
+    :param max_size: Size of the cache in bytes beyond which virtual environments are removed.
+    :return: The paths of the virtual environments removed.
+    """
+    venvs = []
+    total_size = 0
+    for venv_path in venv_cache_path.glob("venv-*"):
+        if not venv_path.is_dir():
+            continue
+        size = _dir_size(venv_path)
+        total_size += size
+        marker = venv_path / INSTALL_COMPLETE_MARKER
+        last_used = marker.stat().st_mtime if marker.exists() else 0
+        venvs.append((last_used, size, venv_path))
+
+    removed: list[Path] = []
+    for _, size, venv_path in sorted(venvs):
+        if total_size <= max_size:
+            break
+        with (
+            open(f"{venv_path}.lock", "a") as build_lock,
+            open(f"{venv_path}.in_use.lock", "a") as in_use_lock,
+        ):
+            try:
+                fcntl.flock(build_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(in_use_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                log.debug("Virtual environment %s is in use, not removing it", venv_path)
+                continue
+            log.info("Removing least recently used virtual environment %s", venv_path)
+            shutil.rmtree(venv_path, ignore_errors=True)
+        total_size -= size
+        removed.append(venv_path)
+    return removed
+
+
+def _noop():
+    pass
+
+
+def prewarm_venv_pool() -> list[Path]:
+    """
+    Build the virtual environments declared in ``[standard] venv_pool_prewarm`` in the pool.
+
+    Each entry is a dict of ``PythonVirtualenvOperator`` arguments the virtual environment is built for, e.g.
+    ``requirements``, ``python_version`` or ``system_site_packages``, so that tasks with the same arguments
+    reuse it.
+
+    :return: The paths of the virtual environments of the pool.
+    """
+    from airflow.providers.standard.operators.python import PythonVirtualenvOperator
+
+    pool_path = get_venv_pool_path()
+    if not pool_path:
+        raise AirflowException(
+            "[standard] venv_pool_path must be set to prewarm the virtual environment pool"
+        )
+    specs = json.loads(conf.get("standard", "venv_pool_prewarm", fallback="") or "[]")
+
+    venv_paths = []
+    for i, spec in enumerate(specs):
+        op = PythonVirtualenvOperator(task_id=f"venv_pool_prewarm_{i}", python_callable=_noop, **spec)
+        venv_paths.append(op._ensure_venv_cache_exists(pool_path))
+    return venv_paths
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    prewarm_venv_pool()
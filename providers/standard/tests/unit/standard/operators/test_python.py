@@ -23,6 +23,7 @@ import logging
 import os
 import pickle
 import re
+import signal
 import sys
 import tempfile
 import warnings
@@ -58,12 +59,14 @@ from airflow.providers.standard.operators.python import (
     _PythonVersionInfo,
     get_current_context,
 )
+from airflow.providers.standard.utils import persistent_interpreter
 from airflow.providers.standard.utils.python_virtualenv import _execute_in_subprocess, prepare_virtualenv
 from airflow.utils.session import create_session
 from airflow.utils.state import DagRunState, State, TaskInstanceState
 from airflow.utils.types import DagRunType
 
 from tests_common.test_utils.compat import TriggerRule, timezone
+from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.db import clear_db_runs
 from tests_common.test_utils.taskinstance import get_template_context, run_task_instance
 from tests_common.test_utils.version_compat import (
@@ -103,6 +106,22 @@ if AIRFLOW_V_3_0_1:
     from airflow.providers.common.compat.sdk import DownstreamTasksSkipped
 
 
+@pytest.fixture
+def persistent_interpreters():
+    # Short path, as the path of unix sockets is limited in length
+    with TemporaryDirectory(prefix="pi-") as tmp_dir:
+        path = Path(tmp_dir)
+        with mock.patch(
+            "airflow.providers.standard.utils.persistent_interpreter.get_interpreters_dir",
+            return_value=path,
+        ):
+            yield path
+        for socket_path in path.glob("*.sock"):
+            if connection := persistent_interpreter._connect(socket_path):
+                connection[0].close()
+                os.kill(connection[1], signal.SIGKILL)
+
+
 class BasePythonTest:
     """Base test class for TestPythonOperator and TestPythonSensor classes"""
 
@@ -1597,6 +1616,41 @@ class TestPythonVirtualenvOperator(BaseTestPythonVirtualenvOperator):
         with TemporaryDirectory(prefix="pytest_venv_1234") as tmp_dir:
             self.run_as_task(f, venv_cache_path=tmp_dir, op_args=[4])
 
+    def test_caching_with_persistent_interpreter(self, persistent_interpreters):
+        def f():
+            import sys
+
+            return sys.executable
+
+        with TemporaryDirectory(prefix="pytest_venv_persistent") as tmp_dir:
+            with mock.patch(
+                "airflow.providers.standard.operators.python.run_in_persistent_interpreter",
+                wraps=persistent_interpreter.run_in_persistent_interpreter,
+            ) as mock_run:
+                ti = self.run_as_task(
+                    f, return_ti=True, venv_cache_path=tmp_dir, use_persistent_interpreter=True
+                )
+            mock_run.assert_called_once()
+            assert TaskInstance.xcom_pull(ti).startswith(tmp_dir)
+
+    def test_caching_in_venv_pool(self):
+        def f(a):
+            import sys
+
+            assert "pytest_venv_pool" in sys.executable
+            return a
+
+        with TemporaryDirectory(prefix="pytest_venv_pool") as tmp_dir:
+            with conf_vars({("standard", "venv_pool_path"): tmp_dir}):
+                with mock.patch("airflow.providers.standard.operators.python.Stats") as mock_stats:
+                    self.run_as_operator(f, do_not_use_caching=True, op_args=[4])
+                    self.run_as_operator(f, do_not_use_caching=True, op_args=[4])
+            assert len(list(Path(tmp_dir).glob("venv-*/bin/python"))) == 1
+        assert mock_stats.incr.call_args_list == [
+            mock.call("python_virtualenv.cache_miss"),
+            mock.call("python_virtualenv.cache_hit"),
+        ]
+
     # This tests might take longer than default 60 seconds as it is serializing a lot of
     # context using dill/cloudpickle (which is slow apparently).
     @pytest.mark.execution_timeout(120)
@@ -2060,6 +2114,62 @@ class TestExternalPythonOperator(BaseTestPythonVirtualenvOperator):
         assert base_keys <= keys
         assert not (airflow_keys & keys), "Airflow keys should not be present when expect_airflow=False"
 
+    def test_use_persistent_interpreter(self, persistent_interpreters):
+        def f(a, b):
+            import os
+
+            return [a + b, os.getpid()]
+
+        with mock.patch(
+            "airflow.providers.standard.operators.python.run_in_persistent_interpreter",
+            wraps=persistent_interpreter.run_in_persistent_interpreter,
+        ) as mock_run:
+            ti = self.run_as_task(
+                f, return_ti=True, op_args=[1], op_kwargs={"b": 2}, use_persistent_interpreter=True
+            )
+
+        mock_run.assert_called_once()
+        result, pid = TaskInstance.xcom_pull(ti)
+        assert result == 3
+        assert [pid] == [
+            persistent_interpreter._connect(socket_path)[1]
+            for socket_path in persistent_interpreters.glob("*.sock")
+        ]
+
+    @pytest.mark.parametrize(
+        ("exit_code", "expected_state"),
+        [(100, TaskInstanceState.SKIPPED), (101, TaskInstanceState.FAILED)],
+    )
+    def test_use_persistent_interpreter_on_skip_exit_code(
+        self, persistent_interpreters, exit_code, expected_state
+    ):
+        def f(exit_code):
+            raise SystemExit(exit_code)
+
+        kwargs = {
+            "op_kwargs": {"exit_code": exit_code},
+            "skip_on_exit_code": 100,
+            "use_persistent_interpreter": True,
+        }
+        if expected_state == TaskInstanceState.FAILED:
+            with pytest.raises(CalledProcessError):
+                self.run_as_task(f, **kwargs)
+        else:
+            ti = self.run_as_task(f, return_ti=True, **kwargs)
+            assert ti.state == expected_state
+
+    def test_use_persistent_interpreter_all_busy(self, persistent_interpreters):
+        def f():
+            return 42
+
+        with mock.patch(
+            "airflow.providers.standard.operators.python.run_in_persistent_interpreter", return_value=None
+        ) as mock_run:
+            ti = self.run_as_task(f, return_ti=True, use_persistent_interpreter=True)
+
+        mock_run.assert_called_once()
+        assert TaskInstance.xcom_pull(ti) == 42
+
 
 class BaseTestBranchPythonVirtualenvOperator(BaseTestPythonVirtualenvOperator):
     @pytest.fixture(autouse=True)
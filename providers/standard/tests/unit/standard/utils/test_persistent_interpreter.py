@@ -0,0 +1,130 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import logging
+import os
+import pickle
+import signal
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from airflow.providers.common.compat.sdk import AirflowException
+from airflow.providers.standard.utils import persistent_interpreter
+from airflow.providers.standard.utils.persistent_interpreter import (
+    get_interpreters_dir,
+    run_in_persistent_interpreter,
+)
+
+from tests_common.test_utils.config import conf_vars
+
+PYTHON = Path(sys.executable)
+
+
+@pytest.fixture
+def interpreters_dir():
+    # Short path, as the path of unix sockets is limited in length
+    with tempfile.TemporaryDirectory(prefix="pi-") as tmp_dir:
+        path = Path(tmp_dir)
+        with mock.patch.object(persistent_interpreter, "get_interpreters_dir", return_value=path):
+            yield path
+        for socket_path in path.glob("*.sock"):
+            if connection := persistent_interpreter._connect(socket_path):
+                connection[0].close()
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(connection[1], signal.SIGKILL)
+
+
+def _request(source: str, *args, **kwargs) -> dict:
+    return {
+        "source": source,
+        "python_callable": "f",
+        "modified_dag_module_name": None,
+        "pickling_library": "pickle",
+        "args": pickle.dumps({"args": args, "kwargs": kwargs}),
+        "string_args": ["a", "b"],
+        "expect_airflow": False,
+        "env": {"PERSISTENT_TEST": "1"},
+        "sys_path": [],
+        "cwd": os.getcwd(),
+    }
+
+
+GET_PID = """
+def f(a, b=None):
+    import os
+
+    print("running", a, b, virtualenv_string_args, os.environ["PERSISTENT_TEST"])
+    return os.getpid()
+"""
+
+
+class TestPersistentInterpreter:
+    def test_run_reuses_interpreter(self, interpreters_dir, caplog):
+        caplog.set_level(logging.INFO, logger=persistent_interpreter.__name__)
+
+        first = run_in_persistent_interpreter(PYTHON, _request(GET_PID, 1, b=2), dict(os.environ))
+        second = run_in_persistent_interpreter(PYTHON, _request(GET_PID, 3), dict(os.environ))
+
+        assert first.exit_code == second.exit_code == 0
+        assert pickle.loads(first.result) == pickle.loads(second.result) != os.getpid()
+        assert "running 1 2 ['a', 'b'] 1" in caplog.messages
+        assert "running 3 None ['a', 'b'] 1" in caplog.messages
+
+    def test_run_recycles_interpreter(self, interpreters_dir):
+        with conf_vars({("standard", "persistent_interpreter_max_tasks"): "1"}):
+            first = run_in_persistent_interpreter(PYTHON, _request(GET_PID, 1), dict(os.environ))
+            second = run_in_persistent_interpreter(PYTHON, _request(GET_PID, 1), dict(os.environ))
+
+        assert pickle.loads(first.result) != pickle.loads(second.result)
+
+    @pytest.mark.parametrize(
+        ("source", "exit_code", "error"),
+        [
+            pytest.param("def f():\n    raise ValueError('boom')\n", 1, "boom", id="exception"),
+            pytest.param("def f():\n    raise SystemExit(100)\n", 100, None, id="exit"),
+            pytest.param("def f():\n    raise SystemExit\n", 0, None, id="exit-zero"),
+        ],
+    )
+    def test_run_failures(self, interpreters_dir, source, exit_code, error):
+        result = run_in_persistent_interpreter(PYTHON, _request(source), dict(os.environ))
+
+        assert result.exit_code == exit_code
+        assert result.error == error
+        assert result.result is None
+
+    def test_run_all_interpreters_busy(self, interpreters_dir):
+        key = persistent_interpreter._pool_key(PYTHON)
+        with conf_vars({("standard", "persistent_interpreter_pool_size"): "1"}):
+            with open(interpreters_dir / f"{key}-0.lock", "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                assert run_in_persistent_interpreter(PYTHON, _request(GET_PID, 1), dict(os.environ)) is None
+
+    def test_interpreters_dir_must_be_private(self, tmp_path):
+        with mock.patch("tempfile.gettempdir", return_value=os.fspath(tmp_path)):
+            path = get_interpreters_dir()
+            assert path.stat().st_mode & 0o777 == 0o700
+
+            path.chmod(0o755)
+            with pytest.raises(AirflowException, match="must be private"):
+                get_interpreters_dir()
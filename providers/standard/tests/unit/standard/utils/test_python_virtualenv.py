@@ -98,6 +98,16 @@ class TestPrepareVirtualenv:
             env=mock.ANY,
         )
 
+    @mock.patch("airflow.providers.standard.utils.python_virtualenv._execute_in_subprocess")
+    @conf_vars({("standard", "venv_install_method"): "uv", ("standard", "uv_cache_dir"): "/UV_CACHE"})
+    def test_should_create_virtualenv_uv_with_cache_dir(self, mock_execute_in_subprocess):
+        prepare_virtualenv(
+            venv_directory="/VENV", python_bin="pythonVER", system_site_packages=False, requirements=["a"]
+        )
+        assert mock_execute_in_subprocess.call_count == 2
+        for call in mock_execute_in_subprocess.call_args_list:
+            assert call.kwargs["env"]["UV_CACHE_DIR"] == "/UV_CACHE"
+
     @mock.patch("airflow.providers.standard.utils.python_virtualenv._execute_in_subprocess")
     @conf_vars({("standard", "venv_install_method"): "pip"})
     def test_should_create_virtualenv_with_system_packages_pip(self, mock_execute_in_subprocess):
@@ -0,0 +1,135 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from airflow.providers.common.compat.sdk import AirflowException
+from airflow.providers.standard.operators.python import PythonVirtualenvOperator
+from airflow.providers.standard.utils.venv_pool import (
+    INSTALL_COMPLETE_MARKER,
+    evict_virtualenvs,
+    get_venv_pool_path,
+    prewarm_venv_pool,
+)
+
+from tests_common.test_utils.config import conf_vars
+
+
+def _make_venv(path: Path, size: int, last_used: float) -> Path:
+    path.mkdir()
+    (path / "lib.so").write_bytes(b"x" * size)
+    marker = path / INSTALL_COMPLETE_MARKER
+    marker.write_text("{}")
+    os.utime(marker, (last_used, last_used))
+    return path
+
+
+class TestVenvPool:
+    def test_get_venv_pool_path(self):
+        with conf_vars({("standard", "venv_pool_path"): "/pool"}):
+            assert get_venv_pool_path() == Path("/pool")
+        with conf_vars({("standard", "venv_pool_path"): ""}):
+            assert get_venv_pool_path() is None
+
+    def test_evict_virtualenvs(self, tmp_path):
+        oldest = _make_venv(tmp_path / "venv-oldest", 100, last_used=1)
+        old = _make_venv(tmp_path / "venv-old", 100, last_used=2)
+        recent = _make_venv(tmp_path / "venv-recent", 100, last_used=3)
+
+        assert evict_virtualenvs(tmp_path, max_size=1000) == []
+        assert evict_virtualenvs(tmp_path, max_size=250) == [oldest]
+        assert not oldest.exists()
+        assert old.exists()
+        assert recent.exists()
+
+    def test_evict_virtualenvs_skips_in_use(self, tmp_path):
+        in_use = _make_venv(tmp_path / "venv-in-use", 100, last_used=1)
+        old = _make_venv(tmp_path / "venv-old", 100, last_used=2)
+
+        with open(f"{in_use}.in_use.lock", "w") as f:
+            fcntl.flock(f, fcntl.LOCK_SH)
+            assert evict_virtualenvs(tmp_path, max_size=0) == [old]
+        assert in_use.exists()
+
+    def test_evict_virtualenvs_skips_being_built(self, tmp_path):
+        building = _make_venv(tmp_path / "venv-building", 100, last_used=1)
+
+        with open(f"{building}.lock", "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            assert evict_virtualenvs(tmp_path, max_size=0) == []
+        assert building.exists()
+
+    def test_cached_venv_is_used_concurrently(self, tmp_path):
+        def f():
+            pass
+
+        op = PythonVirtualenvOperator(task_id="task", python_callable=f, venv_cache_path=tmp_path)
+        entered = threading.Event()
+
+        def use_venv():
+            with op._use_venv_cache(tmp_path):
+                entered.set()
+
+        with (
+            mock.patch.object(PythonVirtualenvOperator, "_build_venv_cache", return_value=False),
+            op._use_venv_cache(tmp_path) as venv_path,
+        ):
+            # Another task using the same virtual environment meanwhile is not blocked
+            thread = threading.Thread(target=use_venv)
+            thread.start()
+            assert entered.wait(timeout=10)
+            thread.join()
+
+            # But the virtual environment cannot be evicted while in use
+            venv_path.mkdir()
+            assert evict_virtualenvs(tmp_path, max_size=0) == []
+
+    def test_prewarm_venv_pool(self, tmp_path):
+        specs = [
+            {"requirements": ["funcsigs==0.4"]},
+            {"requirements": ["dill"], "system_site_packages": False},
+        ]
+        with conf_vars(
+            {
+                ("standard", "venv_pool_path"): str(tmp_path),
+                ("standard", "venv_pool_prewarm"): json.dumps(specs),
+            }
+        ):
+            with mock.patch.object(
+                PythonVirtualenvOperator, "_ensure_venv_cache_exists", autospec=True
+            ) as mock_ensure:
+                prewarm_venv_pool()
+
+        assert mock_ensure.call_count == 2
+        (op1, path1), (op2, path2) = (call.args for call in mock_ensure.call_args_list)
+        assert path1 == path2 == tmp_path
+        assert op1.requirements == ["funcsigs==0.4"]
+        assert op2.requirements == ["dill"]
+        assert op2.system_site_packages is False
+
+    def test_prewarm_venv_pool_requires_pool_path(self):
+        with conf_vars({("standard", "venv_pool_path"): ""}):
+            with pytest.raises(AirflowException, match="venv_pool_path must be set"):
+                prewarm_venv_pool()
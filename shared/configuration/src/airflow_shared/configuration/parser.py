@@ -29,6 +29,7 @@ import os
 import shlex
 import subprocess
 import sys
+import time
 import warnings
 from collections.abc import Callable, Generator, Iterable
 from configparser import ConfigParser, NoOptionError, NoSectionError
@@ -93,6 +94,67 @@ class ValueNotFound:
 VALUE_NOT_FOUND_SENTINEL = ValueNotFound()
 
 
+class ConfigSnapshot:
+    """
+    Memoized, typed view of the configuration for lookups on hot paths.
+
+    Each option is resolved through the full lookup sequence of the parser on first access only, and
+    later lookups return the already converted value from memory. Options which can be resolved through
+    ``_cmd`` or ``_secret`` sources, and options marked with ``mark_dynamic_option``, are resolved again once
+    their time-to-live expires.
+
+    The parser discards its snapshot whenever its configuration is modified through ``set``,
+    ``remove_option`` or by reading configuration. Changes to environment variables cannot be detected and
+    require calling ``invalidate_cache`` on the parser.
+
+    :param parser: The configuration parser the values are resolved through.
+    """
+
+    def __init__(self, parser: AirflowConfigParser):
+        self._parser = parser
+        # (section, key, type) -> (value, expiry time on the monotonic clock or None if it never expires)
+        self._values: dict[tuple[str, str, str], tuple[Any, float | None]] = {}
+
+    def _expires_at(self, section: str, key: str) -> float | None:
+        option = (section.lower(), key.lower())
+        ttl = self._parser._dynamic_option_ttls.get(option)
+        if ttl is None and option in self._parser.sensitive_config_values:
+            ttl = self._parser.dynamic_option_ttl
+        return None if ttl is None else time.monotonic() + ttl
+
+    def _lookup(self, section: str, key: str, type_: str, fallback: Any) -> Any:
+        entry = self._values.get((section, key, type_))
+        if entry is None or (entry[1] is not None and entry[1] <= time.monotonic()):
+            value = self._parser.get(
+                section, key, fallback=VALUE_NOT_FOUND_SENTINEL, suppress_warnings=True, _extra_stacklevel=2
+            )
+            if value is not VALUE_NOT_FOUND_SENTINEL and type_ != "str":
+                value = getattr(self._parser, f"_to_{type_}")(section, key, value)
+            entry = (value, self._expires_at(section, key))
+            self._values[(section, key, type_)] = entry
+        if entry[0] is not VALUE_NOT_FOUND_SENTINEL:
+            return entry[0]
+        if fallback is not VALUE_NOT_FOUND_SENTINEL:
+            return fallback
+        raise AirflowConfigException(f"section/key [{section}/{key}] not found in config")
+
+    def get(self, section: str, key: str, fallback: Any = VALUE_NOT_FOUND_SENTINEL) -> Any:
+        """Get config value."""
+        return self._lookup(section, key, "str", fallback)
+
+    def getboolean(self, section: str, key: str, fallback: Any = VALUE_NOT_FOUND_SENTINEL) -> Any:
+        """Get config value as boolean."""
+        return self._lookup(section, key, "bool", fallback)
+
+    def getint(self, section: str, key: str, fallback: Any = VALUE_NOT_FOUND_SENTINEL) -> Any:
+        """Get config value as integer."""
+        return self._lookup(section, key, "int", fallback)
+
+    def getfloat(self, section: str, key: str, fallback: Any = VALUE_NOT_FOUND_SENTINEL) -> Any:
+        """Get config value as float."""
+        return self._lookup(section, key, "float", fallback)
+
+
 @overload
 def expand_env_var(env_var: None) -> None: ...
 @overload
@@ -264,6 +326,10 @@ class AirflowConfigParser(ConfigParser):
     # A mapping of new section -> (old section, since_version).
     deprecated_sections: dict[str, tuple[str, str]] = {}
 
+    # Number of seconds the snapshot caches options which can be resolved through ``_cmd`` or ``_secret``
+    # sources before resolving them again.
+    dynamic_option_ttl: float = 60.0
+
     @property
     def _lookup_sequence(self) -> list[Callable]:
         """
@@ -510,6 +576,7 @@ class AirflowConfigParser(ConfigParser):
         # The _use_providers_configuration flag will always be True unless we call `write(include_providers=False)` or `with self.make_sure_configuration_loaded(with_providers=False)`.
         # Even when we call those methods, the flag will be set back to True after the method is done, so it only affects the current call to `as_dict()` and does not have any effect on subsequent calls.
         self._use_providers_configuration = True
+        self._dynamic_option_ttls: dict[tuple[str, str], float] = {}
 
     def invalidate_cache(self) -> None:
         """
@@ -529,6 +596,34 @@ class AirflowConfigParser(ConfigParser):
         """Invalidate caches related to provider configuration flags."""
         self.__dict__.pop("configuration_description", None)
         self.__dict__.pop("sensitive_config_values", None)
+        self._invalidate_snapshot()
+
+    def _invalidate_snapshot(self) -> None:
+        """Discard the snapshot of the configuration values, if any."""
+        self.__dict__.pop("snapshot", None)
+
+    @functools.cached_property
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Memoized, typed view of the configuration, for lookups on hot paths.
+
+        It is discarded when the configuration is modified through the parser, and by ``invalidate_cache``.
+        """
+        return ConfigSnapshot(self)
+
+    def mark_dynamic_option(self, section: str, key: str, ttl: float) -> None:
+        """
+        Make the snapshot resolve the option again once it has been cached for ``ttl`` seconds.
+
+        Options which can be resolved through ``_cmd`` or ``_secret`` sources are dynamic by default, and
+        cached for ``dynamic_option_ttl`` seconds.
+
+        :param section: section of the option
+        :param key: key of the option
+        :param ttl: number of seconds the value of the option is cached for, 0 to never cache it
+        """
+        self._dynamic_option_ttls[(section.lower(), key.lower())] = ttl
+        self._invalidate_snapshot()
 
     @functools.cached_property
     def inversed_deprecated_options(self):
@@ -574,6 +669,7 @@ class AirflowConfigParser(ConfigParser):
         """
         parser = ConfigParser()
         parser.read_string(config_string)
+        self._invalidate_snapshot()
         for section in parser.sections():
             if section not in self._default_values.sections():
                 self._default_values.add_section(section)
@@ -1365,7 +1461,11 @@ class AirflowConfigParser(ConfigParser):
 
     def getboolean(self, section: str, key: str, **kwargs) -> bool:  # type: ignore[override]
         """Get config value as boolean."""
-        val = str(self.get(section, key, _extra_stacklevel=1, **kwargs)).lower().strip()
+        return self._to_bool(section, key, self.get(section, key, _extra_stacklevel=1, **kwargs))
+
+    @staticmethod
+    def _to_bool(section: str, key: str, value: Any) -> bool:
+        val = str(value).lower().strip()
         if "#" in val:
             val = val.split("#")[0].strip()
         if val in ("t", "true", "1"):
@@ -1379,7 +1479,10 @@ class AirflowConfigParser(ConfigParser):
 
     def getint(self, section: str, key: str, **kwargs) -> int:  # type: ignore[override]
         """Get config value as integer."""
-        val = self.get(section, key, _extra_stacklevel=1, **kwargs)
+        return self._to_int(section, key, self.get(section, key, _extra_stacklevel=1, **kwargs))
+
+    @staticmethod
+    def _to_int(section: str, key: str, val: Any) -> int:
         if val is None:
             raise AirflowConfigException(
                 f"Failed to convert value None to int. "
@@ -1400,7 +1503,10 @@ class AirflowConfigParser(ConfigParser):
 
     def getfloat(self, section: str, key: str, **kwargs) -> float:  # type: ignore[override]
         """Get config value as float."""
-        val = self.get(section, key, _extra_stacklevel=1, **kwargs)
+        return self._to_float(section, key, self.get(section, key, _extra_stacklevel=1, **kwargs))
+
+    @staticmethod
+    def _to_float(section: str, key: str, val: Any) -> float:
         if val is None:
             raise AirflowConfigException(
                 f"Failed to convert value None to float. "
@@ -1582,8 +1688,13 @@ class AirflowConfigParser(ConfigParser):
         filenames: str | bytes | os.PathLike | Iterable[str | bytes | os.PathLike],
         encoding: str | None = None,
     ) -> list[str]:
+        self._invalidate_snapshot()
         return super().read(filenames=filenames, encoding=encoding)
 
+    def read_file(self, f: Iterable[str], source: str | None = None) -> None:
+        self._invalidate_snapshot()
+        super().read_file(f, source=source)
+
     def read_dict(  # type: ignore[override]
         self, dictionary: dict[str, dict[str, Any]], source: str = "<dict>"
     ) -> None:
@@ -1594,6 +1705,7 @@ class AirflowConfigParser(ConfigParser):
         :param source: source to be used to store the configuration
         :return:
         """
+        self._invalidate_snapshot()
         super().read_dict(dictionary=dictionary, source=source)
 
     def _has_section_in_any_defaults(self, section: str) -> bool:
@@ -1676,6 +1788,7 @@ class AirflowConfigParser(ConfigParser):
             # Trying to set a key in a section that exists in default, but not in the user config;
             # automatically create it
             self.add_section(section)
+        self._invalidate_snapshot()
         super().set(section, option, value)
 
     def remove_option(self, section: str, option: str, remove_default: bool = True):  # type: ignore[override]
@@ -1687,12 +1800,17 @@ class AirflowConfigParser(ConfigParser):
         """
         section = section.lower()
         option = option.lower()
+        self._invalidate_snapshot()
         if super().has_option(section, option):
             super().remove_option(section, option)
 
         if remove_default and self._default_values.has_option(section, option):
             self._default_values.remove_option(section, option)
 
+    def remove_section(self, section: str) -> bool:
+        self._invalidate_snapshot()
+        return super().remove_section(section)
+
     def optionxform(self, optionstr: str) -> str:
         """
         Transform option names on every read, get, or set operation.
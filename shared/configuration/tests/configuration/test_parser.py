@@ -1188,3 +1188,108 @@ existing_list = one,two,three
             test_conf.load_providers_configuration()
         assert test_conf._use_providers_configuration is True
         assert "configuration_description" not in test_conf.__dict__
+
+
+class TestConfigSnapshot:
+    """Test the memoized, typed snapshot of the configuration."""
+
+    def test_typed_lookups(self):
+        test_conf = AirflowConfigParser(
+            default_config=textwrap.dedent(
+                """\
+                [snapshot]
+                str_key = value
+                bool_key = true #comment
+                int_key = 10
+                float_key = 1.5
+                """
+            )
+        )
+        snapshot = test_conf.snapshot
+
+        assert snapshot.get("snapshot", "str_key") == "value"
+        assert snapshot.getboolean("snapshot", "bool_key") is True
+        assert snapshot.getint("snapshot", "int_key") == 10
+        assert snapshot.getfloat("snapshot", "float_key") == 1.5
+        assert snapshot.get("snapshot", "int_key") == "10"
+        assert snapshot.getint("snapshot", "missing", fallback=5) == 5
+        with pytest.raises(AirflowConfigException, match=re.escape("section/key [snapshot/missing]")):
+            snapshot.get("snapshot", "missing")
+        with pytest.raises(AirflowConfigException, match="Failed to convert value to int"):
+            snapshot.getint("snapshot", "str_key")
+
+    def test_values_are_memoized(self):
+        test_conf = AirflowConfigParser()
+        snapshot = test_conf.snapshot
+
+        assert snapshot.getint("test", "key2") == 123
+        with patch.object(test_conf, "get", side_effect=AssertionError("not memoized")):
+            assert snapshot.getint("test", "key2") == 123
+            assert test_conf.snapshot is snapshot
+
+    @pytest.mark.parametrize(
+        "modify",
+        [
+            pytest.param(lambda test_conf: test_conf.set("test", "key1", "new_value"), id="set"),
+            pytest.param(
+                lambda test_conf: test_conf.read_string("[test]\nkey1 = new_value"), id="read_string"
+            ),
+            pytest.param(
+                lambda test_conf: test_conf.read_dict({"test": {"key1": "new_value"}}), id="read_dict"
+            ),
+            pytest.param(
+                lambda test_conf: test_conf._update_defaults_from_string("[test]\nkey1 = new_value"),
+                id="update_defaults",
+            ),
+        ],
+    )
+    def test_invalidated_on_modification(self, modify):
+        test_conf = AirflowConfigParser()
+        assert test_conf.snapshot.get("test", "key1") == "default_value"
+
+        modify(test_conf)
+
+        assert test_conf.snapshot.get("test", "key1") == "new_value"
+
+    def test_invalidated_on_remove(self):
+        test_conf = AirflowConfigParser()
+        test_conf.read_string("[test]\nkey1 = file_value")
+        assert test_conf.snapshot.get("test", "key1") == "file_value"
+
+        test_conf.remove_option("test", "key1", remove_default=False)
+        assert test_conf.snapshot.get("test", "key1") == "default_value"
+
+        test_conf.read_string("[test]\nkey1 = file_value")
+        test_conf.remove_section("test")
+        assert test_conf.snapshot.get("test", "key1") == "default_value"
+
+    def test_environment_changes_require_invalidation(self):
+        test_conf = AirflowConfigParser()
+        assert test_conf.snapshot.get("test", "key1") == "default_value"
+
+        with patch.dict(os.environ, {"AIRFLOW__TEST__KEY1": "env_value"}):
+            assert test_conf.snapshot.get("test", "key1") == "default_value"
+            test_conf.invalidate_cache()
+            assert test_conf.snapshot.get("test", "key1") == "env_value"
+
+    def test_dynamic_options_expire(self):
+        test_conf = AirflowConfigParser()
+        test_conf.read_string("[test]\nsensitive_key_cmd = echo -n cmd_value")
+        test_conf.sensitive_config_values.add(("test", "sensitive_key"))
+        test_conf.mark_dynamic_option("test", "key1", ttl=30)
+
+        with patch("airflow_shared.configuration.parser.time.monotonic", return_value=1000.0):
+            assert test_conf.snapshot.get("test", "sensitive_key") == "cmd_value"
+            assert test_conf.snapshot.get("test", "key1") == "default_value"
+            assert test_conf.snapshot.getint("test", "key2") == 123
+
+        with patch.object(test_conf, "get", return_value="42") as mock_get:
+            with patch("airflow_shared.configuration.parser.time.monotonic", return_value=1029.0):
+                assert test_conf.snapshot.get("test", "key1") == "default_value"
+            with patch("airflow_shared.configuration.parser.time.monotonic", return_value=1030.0):
+                assert test_conf.snapshot.get("test", "key1") == "42"
+                assert test_conf.snapshot.get("test", "sensitive_key") == "cmd_value"
+            with patch("airflow_shared.configuration.parser.time.monotonic", return_value=1060.0):
+                assert test_conf.snapshot.get("test", "sensitive_key") == "42"
+                assert test_conf.snapshot.getint("test", "key2") == 123
+        assert mock_get.call_count == 2
@@ -17,22 +17,25 @@
 # under the License.
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from contextlib import contextmanager
 from importlib.metadata import entry_points
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+# Only the OpenTelemetry API is imported eagerly: the SDK is only needed when tracing is enabled, and
+# importing it noticeably slows down the start of every Airflow process.
 from opentelemetry import context, trace
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
-from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 if TYPE_CHECKING:
     from configparser import ConfigParser
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace.export import SpanExporter
+    from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 log = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
@@ -40,24 +43,40 @@ OVERRIDE_SPAN_ID_KEY = context.create_key("override_span_id")
 OVERRIDE_TRACE_ID_KEY = context.create_key("override_trace_id")
 
 
-class OverrideableRandomIdGenerator(RandomIdGenerator):
-    """Lets you override the span id."""
+@functools.cache
+def _get_overrideable_random_id_generator_class() -> type[RandomIdGenerator]:
+    from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
+
+    class OverrideableRandomIdGenerator(RandomIdGenerator):
+        """Lets you override the span id."""
+
+        def generate_span_id(self):
+            override = context.get_value(OVERRIDE_SPAN_ID_KEY)
+            if override is not None:
+                return override
+            return super().generate_span_id()
+
+        def generate_trace_id(self):
+            override = context.get_value(OVERRIDE_TRACE_ID_KEY)
+            if override is not None:
+                return override
+            return super().generate_trace_id()
 
-    def generate_span_id(self):
-        override = context.get_value(OVERRIDE_SPAN_ID_KEY)
-        if override is not None:
-            return override
-        return super().generate_span_id()
+    OverrideableRandomIdGenerator.__module__ = __name__
+    return OverrideableRandomIdGenerator
 
-    def generate_trace_id(self):
-        override = context.get_value(OVERRIDE_TRACE_ID_KEY)
-        if override is not None:
-            return override
-        return super().generate_trace_id()
+
+def __getattr__(name: str) -> Any:
+    # PEP-562: the id generator class is defined on first access, as it needs the OpenTelemetry SDK.
+    if name == "OverrideableRandomIdGenerator":
+        return _get_overrideable_random_id_generator_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def new_dagrun_trace_carrier() -> dict[str, str]:
     """Generate a fresh W3C traceparent carrier without creating a recordable span."""
+    from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
+
     gen = RandomIdGenerator()
     span_ctx = SpanContext(
         trace_id=gen.generate_trace_id(),
@@ -104,6 +123,8 @@ def _get_backcompat_config(conf: ConfigParser) -> tuple[str | None, Resource | N
     if not os.environ.get("OTEL_SERVICE_NAME") and not os.environ.get("OTEL_RESOURCE_ATTRIBUTES"):
         service_name = conf.get("traces", "otel_service", fallback=None)
         if service_name:
+            from opentelemetry.sdk.resources import Resource
+
             resource = Resource({"service.name": service_name})
 
     endpoint = None
@@ -159,6 +180,9 @@ def configure_otel(conf: ConfigParser):
     if backcompat_endpoint and not (otlp_endpoint or otlp_traces_endpoint):
         os.environ["OTEL_EXPORTER_OTLP_TRACES_ENDPOINT"] = backcompat_endpoint
 
-    provider = TracerProvider(id_generator=OverrideableRandomIdGenerator(), resource=resource)
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    provider = TracerProvider(id_generator=_get_overrideable_random_id_generator_class()(), resource=resource)
     provider.add_span_processor(BatchSpanProcessor(_load_exporter_from_env()))
     trace.set_tracer_provider(provider)
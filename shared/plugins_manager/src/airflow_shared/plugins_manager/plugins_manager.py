@@ -35,7 +35,7 @@ if TYPE_CHECKING:
         from importlib import metadata
     else:
         import importlib_metadata as metadata
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
     from types import ModuleType
 
     from ..listeners.listener import ListenerManager
@@ -176,19 +176,27 @@ def is_valid_plugin(plugin_obj) -> bool:
     return False
 
 
-def _load_entrypoint_plugins() -> tuple[list[AirflowPlugin], dict[str, str]]:
+def _load_entrypoint_plugins(
+    entry_points: Iterable[tuple[metadata.EntryPoint, metadata.Distribution]] | None = None,
+) -> tuple[list[AirflowPlugin], dict[str, str]]:
     """
     Load and register plugins AirflowPlugin subclasses from the entrypoints.
 
     The entry_point group should be 'airflow.plugins'.
+
+    :param entry_points: The entry points with the distribution they come from, e.g. read from a discovery
+        manifest. If not provided, the installed distributions are scanned for them.
     """
     from ..module_loading import entry_points_with_dist
 
     log.debug("Loading plugins from entrypoints")
 
+    if entry_points is None:
+        entry_points = entry_points_with_dist("airflow.plugins")
+
     plugins: list[AirflowPlugin] = []
     import_errors: dict[str, str] = {}
-    for entry_point, dist in entry_points_with_dist("airflow.plugins"):
+    for entry_point, dist in entry_points:
         log.debug("Importing entry_point plugin %s", entry_point.name)
         try:
             plugin_class = entry_point.load()
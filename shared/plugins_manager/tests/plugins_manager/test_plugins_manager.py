@@ -109,3 +109,20 @@ class TestPluginsManager:
                 "test.plugins.test_plugins_manager",
                 "my_fake_module not found",
             ) in import_errors.items()
+
+    def test_entrypoint_plugins_from_given_entry_points(self, mock_metadata_distribution):
+        """Test that entry points passed explicitly, e.g. from a discovery manifest, are not scanned for."""
+        mock_dist = mock.Mock()
+        mock_dist.metadata = {"Name": "test-dist"}
+        mock_dist.version = "1.0.0"
+
+        mock_entrypoint = mock.Mock()
+        mock_entrypoint.name = "test-entrypoint"
+        mock_entrypoint.module = "test.plugins.test_plugins_manager"
+        mock_entrypoint.load.side_effect = ImportError("my_fake_module not found")
+
+        with mock_metadata_distribution() as mock_distributions:
+            _, import_errors = _load_entrypoint_plugins([(mock_entrypoint, mock_dist)])
+
+        mock_distributions.assert_not_called()
+        assert import_errors == {"test.plugins.test_plugins_manager": "my_fake_module not found"}
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 from .providers_discovery import (
     KNOWN_UNHANDLED_OPTIONAL_FEATURE_ERRORS as KNOWN_UNHANDLED_OPTIONAL_FEATURE_ERRORS,
+    DiscoveryManifest as DiscoveryManifest,
     HookClassProvider as HookClassProvider,
     HookInfo as HookInfo,
     LazyDictWithCache as LazyDictWithCache,
@@ -27,8 +28,12 @@ from .providers_discovery import (
     ProviderInfo as ProviderInfo,
     _check_builtin_provider_prefix as _check_builtin_provider_prefix,
     _create_provider_info_schema_validator as _create_provider_info_schema_validator,
+    build_discovery_manifest as build_discovery_manifest,
     discover_all_providers_from_packages as discover_all_providers_from_packages,
+    get_discovery_manifest_path as get_discovery_manifest_path,
+    load_discovery_manifest as load_discovery_manifest,
     log_import_warning as log_import_warning,
     log_optional_feature_disabled as log_optional_feature_disabled,
     provider_info_cache as provider_info_cache,
+    write_discovery_manifest as write_discovery_manifest,
 )
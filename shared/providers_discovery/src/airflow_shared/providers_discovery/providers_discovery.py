@@ -20,10 +20,15 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import hashlib
 import json
 import logging
+import os
 import pathlib
-from collections.abc import Callable, MutableMapping
+import sys
+import tempfile
+from collections.abc import Callable, Iterator, MutableMapping
 from dataclasses import dataclass
 from functools import wraps
 from importlib.resources import files as resource_files
@@ -32,7 +37,12 @@ from typing import Any, NamedTuple, ParamSpec, Protocol, cast
 
 from packaging.utils import canonicalize_name
 
-from ..module_loading import entry_points_with_dist
+from ..module_loading import EPnD, entry_points_with_dist
+
+if sys.version_info >= (3, 12):
+    from importlib import metadata
+else:
+    import importlib_metadata as metadata
 
 log = logging.getLogger(__name__)
 
@@ -310,9 +320,22 @@ def discover_all_providers_from_packages(
     the code. The runtime version is more relaxed (allows for additional properties)
     and verifies only the subset of fields that are needed at runtime.
 
+    If a discovery manifest is present in ``AIRFLOW_HOME``, the providers are read from it instead.
+
     :param provider_dict: Dictionary to populate with discovered providers
     :param provider_schema_validator: JSON schema validator for provider info
     """
+    if (manifest := load_discovery_manifest(get_discovery_manifest_path())) is not None:
+        for package_name, provider_info in manifest.providers.items():
+            provider_dict.setdefault(package_name, provider_info)
+        return
+    _discover_providers_from_entry_points(provider_dict, provider_schema_validator)
+
+
+def _discover_providers_from_entry_points(
+    provider_dict: dict[str, ProviderInfo],
+    provider_schema_validator,
+) -> None:
     for entry_point, dist in entry_points_with_dist("apache_airflow_provider"):
         if not dist.metadata:
             continue
@@ -352,3 +375,136 @@ def discover_all_providers_from_packages(
                 "package name have already been registered",
                 package_name,
             )
+
+
+DISCOVERY_MANIFEST_FILE_NAME = "discovery_manifest.json"
+DISCOVERY_MANIFEST_VERSION = 1
+
+
+class DiscoveryManifest(NamedTuple):
+    """
+    Providers and plugin entry points discovered in the installed distributions.
+
+    :param fingerprint: fingerprint of the installed distributions the manifest was built from
+    :param providers: information about the providers, keyed by package name
+    :param plugin_entry_points: name, value, distribution name and version of the ``airflow.plugins``
+        entry points
+    """
+
+    fingerprint: str
+    providers: dict[str, ProviderInfo]
+    plugin_entry_points: list[tuple[str, str, str, str]]
+
+    def iter_plugin_entry_points(self) -> Iterator[EPnD]:
+        """Iterate over the ``airflow.plugins`` entry points, with the distribution they come from."""
+        for name, value, dist_name, _ in self.plugin_entry_points:
+            yield (
+                metadata.EntryPoint(name=name, value=value, group="airflow.plugins"),
+                metadata.distribution(dist_name),
+            )
+
+
+def get_discovery_manifest_path() -> str:
+    """Return the path of the discovery manifest, in ``AIRFLOW_HOME``."""
+    airflow_home = os.path.expanduser(os.environ.get("AIRFLOW_HOME", "~/airflow"))
+    return os.path.join(airflow_home, DISCOVERY_MANIFEST_FILE_NAME)
+
+
+def get_installed_distributions_fingerprint() -> str:
+    """
+    Return a fingerprint of the distributions installed in the ``sys.path`` entries.
+
+    The fingerprint covers the ``.dist-info`` and ``.egg-info`` directories, whose names hold the name and
+    version of the distributions, and the ``.pth`` files of the ``sys.path`` entries. It thus only changes
+    when distributions are installed, upgraded or removed, and is the same in all processes using the same
+    environment. The metadata of the distributions is not read, which would be as slow as scanning them.
+    """
+    entries = []
+    # The current working directory differs between processes, and is not where distributions are installed.
+    for path in dict.fromkeys(path for path in sys.path if path):
+        with contextlib.suppress(OSError), os.scandir(path) as it:
+            for entry in it:
+                if entry.name.endswith((".dist-info", ".egg-info", ".pth")):
+                    entries.append((path, entry.name, entry.stat().st_mtime_ns))
+    return hashlib.sha256(repr(sorted(entries)).encode()).hexdigest()
+
+
+def build_discovery_manifest(provider_schema_validator) -> DiscoveryManifest:
+    """
+    Discover the providers and plugin entry points by scanning the installed distributions.
+
+    :param provider_schema_validator: JSON schema validator for provider info
+    """
+    providers: dict[str, ProviderInfo] = {}
+    _discover_providers_from_entry_points(providers, provider_schema_validator)
+    plugin_entry_points = [
+        (entry_point.name, entry_point.value, dist.metadata["Name"], dist.version)
+        for entry_point, dist in entry_points_with_dist("airflow.plugins")
+    ]
+    return DiscoveryManifest(
+        fingerprint=get_installed_distributions_fingerprint(),
+        providers=dict(sorted(providers.items())),
+        plugin_entry_points=plugin_entry_points,
+    )
+
+
+def write_discovery_manifest(manifest: DiscoveryManifest, path: str) -> None:
+    """
+    Write the discovery manifest to the given path.
+
+    The file is replaced atomically, so that processes starting concurrently never read a partial manifest.
+    """
+    content = {
+        "version": DISCOVERY_MANIFEST_VERSION,
+        "fingerprint": manifest.fingerprint,
+        "providers": {
+            package_name: {"version": provider.version, "data": provider.data}
+            for package_name, provider in manifest.providers.items()
+        },
+        "plugin_entry_points": manifest.plugin_entry_points,
+    }
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as file:
+        json.dump(content, file)
+    os.replace(file.name, path)
+    load_discovery_manifest.cache_clear()
+
+
+@functools.cache
+def load_discovery_manifest(path: str) -> DiscoveryManifest | None:
+    """
+    Load the discovery manifest from the given path, with a single file read.
+
+    Discovery manifests are opt-in: if there is no manifest at the path, None is returned and the
+    distributions are scanned as usual. A manifest built from distributions different from the installed
+    ones is ignored the same way, until it is rebuilt with ``airflow providers rebuild-manifest``.
+
+    :param path: path of the manifest
+    """
+    try:
+        with open(path) as file:
+            content = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        log.warning("Ignoring the discovery manifest %s which cannot be read: %s", path, e)
+        return None
+    if (
+        content.get("version") == DISCOVERY_MANIFEST_VERSION
+        and content.get("fingerprint") == get_installed_distributions_fingerprint()
+    ):
+        return DiscoveryManifest(
+            fingerprint=content["fingerprint"],
+            providers={
+                package_name: ProviderInfo(provider["version"], provider["data"])
+                for package_name, provider in content["providers"].items()
+            },
+            plugin_entry_points=[tuple(entry_point) for entry_point in content["plugin_entry_points"]],
+        )
+    log.warning(
+        "Ignoring the discovery manifest %s which was built from other distributions than the installed "
+        "ones. Run `airflow providers rebuild-manifest` to rebuild it.",
+        path,
+    )
+    return None
@@ -17,9 +17,20 @@
 # under the License.
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
 
-from airflow_shared.providers_discovery import LazyDictWithCache
+from airflow_shared.providers_discovery import (
+    DiscoveryManifest,
+    LazyDictWithCache,
+    ProviderInfo,
+    discover_all_providers_from_packages,
+    get_discovery_manifest_path,
+    load_discovery_manifest,
+    write_discovery_manifest,
+)
+from airflow_shared.providers_discovery.providers_discovery import get_installed_distributions_fingerprint
 
 
 @pytest.mark.parametrize(
@@ -110,3 +121,83 @@ def test_lazy_cache_dict_clear():
     assert len(lazy_cache_dict) == 0
     assert not lazy_cache_dict._raw_dict
     assert not lazy_cache_dict._resolved
+
+
+class TestDiscoveryManifest:
+    @pytest.fixture(autouse=True)
+    def _clear_manifest_cache(self):
+        load_discovery_manifest.cache_clear()
+        yield
+        load_discovery_manifest.cache_clear()
+
+    @pytest.fixture
+    def manifest(self):
+        return DiscoveryManifest(
+            fingerprint=get_installed_distributions_fingerprint(),
+            providers={"apache-airflow-providers-test": ProviderInfo("1.0.0", {"package-name": "test"})},
+            plugin_entry_points=[("test_plugin", "test.plugin:TestPlugin", "test-dist", "1.0.0")],
+        )
+
+    def test_round_trip(self, manifest, tmp_path):
+        path = str(tmp_path / "discovery_manifest.json")
+
+        write_discovery_manifest(manifest, path)
+
+        assert load_discovery_manifest(path) == manifest
+
+    def test_missing_manifest(self, tmp_path):
+        assert load_discovery_manifest(str(tmp_path / "discovery_manifest.json")) is None
+
+    def test_invalid_manifest(self, tmp_path):
+        path = tmp_path / "discovery_manifest.json"
+        path.write_text("{")
+
+        assert load_discovery_manifest(str(path)) is None
+
+    def test_stale_manifest_is_ignored(self, manifest, tmp_path):
+        path = tmp_path / "discovery_manifest.json"
+        write_discovery_manifest(manifest._replace(fingerprint="stale"), str(path))
+        content = path.read_text()
+
+        with mock.patch(
+            "airflow_shared.providers_discovery.providers_discovery.build_discovery_manifest"
+        ) as mock_build:
+            assert load_discovery_manifest(str(path)) is None
+        mock_build.assert_not_called()
+        assert path.read_text() == content
+
+    def test_fingerprint_only_depends_on_distributions(self, tmp_path, monkeypatch):
+        site_dir = tmp_path / "site-packages"
+        dist_info = site_dir / "test_dist-1.0.0.dist-info"
+        dist_info.mkdir(parents=True)
+        (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: test-dist\nVersion: 1.0.0\n")
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        monkeypatch.syspath_prepend(str(site_dir))
+        monkeypatch.syspath_prepend(str(other_dir))
+        fingerprint = get_installed_distributions_fingerprint()
+
+        # Files written to sys.path entries, e.g. bytecode caches, do not change the fingerprint.
+        (other_dir / "module.py").write_text("")
+        (site_dir / "__pycache__").mkdir()
+        assert get_installed_distributions_fingerprint() == fingerprint
+
+        (site_dir / "test_dist.pth").write_text(str(other_dir))
+        assert get_installed_distributions_fingerprint() != fingerprint
+        fingerprint = get_installed_distributions_fingerprint()
+
+        dist_info.rename(site_dir / "test_dist-2.0.0.dist-info")
+        assert get_installed_distributions_fingerprint() != fingerprint
+
+    def test_providers_are_read_from_manifest(self, manifest, tmp_path, monkeypatch):
+        monkeypatch.setenv("AIRFLOW_HOME", str(tmp_path))
+        write_discovery_manifest(manifest, get_discovery_manifest_path())
+        provider_dict: dict[str, ProviderInfo] = {}
+
+        with mock.patch(
+            "airflow_shared.providers_discovery.providers_discovery.entry_points_with_dist"
+        ) as mock_entry_points:
+            discover_all_providers_from_packages(provider_dict, mock.Mock())
+
+        mock_entry_points.assert_not_called()
+        assert provider_dict == manifest.providers
@@ -55,6 +55,23 @@ class BaseSecretsBackend(ABC):
         """
         raise NotImplementedError()
 
+    def get_variables(self, keys: list[str], team_name: str | None = None) -> dict[str, str]:
+        """
+        Return the values of several Airflow Variables.
+
+        Backends which can look up several variables at once, in a single round-trip, should override it.
+
+        :param keys: Variable Keys
+        :param team_name: Team name associated to the task trying to access the variables (if any)
+        :return: Variable Values, keyed by Variable Key; the variables which are not found are omitted
+        """
+        values = {}
+        for key in keys:
+            value = self.get_variable(key=key, team_name=team_name)
+            if value is not None:
+                values[key] = value
+        return values
+
     def get_config(self, key: str) -> str | None:
         """
         Return value for Airflow Config Key.
@@ -117,3 +134,20 @@ class BaseSecretsBackend(ABC):
         if value:
             return self.deserialize_connection(conn_id=conn_id, value=value)
         return None
+
+    def get_connections(self, conn_ids: list[str], team_name: str | None = None) -> dict:
+        """
+        Return several connection objects.
+
+        Backends which can look up several connections at once, in a single round-trip, should override it.
+
+        :param conn_ids: connection ids
+        :param team_name: Team name associated to the task trying to access the connections (if any)
+        :return: Connection objects, keyed by connection id; the connections which are not found are omitted
+        """
+        connections = {}
+        for conn_id in conn_ids:
+            conn = self.get_connection(conn_id=conn_id, team_name=team_name)
+            if conn:
+                connections[conn_id] = conn
+        return connections
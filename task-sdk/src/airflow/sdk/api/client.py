@@ -45,6 +45,8 @@ from airflow.sdk.api.datamodels._generated import (
     AssetEventsResponse,
     AssetResponse,
     ConnectionResponse,
+    ConnectionsBatchBody,
+    ConnectionsBatchResponse,
     DagResponse,
     DagRun,
     DagRunStateResponse,
@@ -71,6 +73,8 @@ from airflow.sdk.api.datamodels._generated import (
     ValidationError as RemoteValidationError,
     VariablePostBody,
     VariableResponse,
+    VariablesBatchBody,
+    VariablesBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -422,6 +426,12 @@ class ConnectionOperations:
             raise
         return ConnectionResponse.model_validate_json(resp.read())
 
+    def get_many(self, conn_ids: list[str]) -> ConnectionsBatchResponse:
+        """Get several connections from the API server, in a single request."""
+        body = ConnectionsBatchBody(conn_ids=conn_ids)
+        resp = self.client.post("connections/batch", content=body.model_dump_json())
+        return ConnectionsBatchResponse.model_validate_json(resp.read())
+
 
 class VariableOperations:
     __slots__ = ("client",)
@@ -445,6 +455,12 @@ class VariableOperations:
             raise
         return VariableResponse.model_validate_json(resp.read())
 
+    def get_many(self, keys: list[str]) -> VariablesBatchResponse:
+        """Get several variables from the API server, in a single request."""
+        body = VariablesBatchBody(keys=keys)
+        resp = self.client.post("variables/batch", content=body.model_dump_json())
+        return VariablesBatchResponse.model_validate_json(resp.read())
+
     def set(self, key: str, value: str | None, description: str | None = None) -> OKResponse:
         """Set an Airflow Variable via the API server."""
         body = VariablePostBody(val=value, description=description)
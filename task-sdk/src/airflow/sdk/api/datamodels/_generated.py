@@ -27,7 +27,7 @@ from uuid import UUID
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, JsonValue, RootModel
 
-API_VERSION: Final[str] = "2026-04-17"
+API_VERSION: Final[str] = "2026-10-19"
 
 
 class AssetAliasReferenceAssetEventDagRun(BaseModel):
@@ -78,6 +78,14 @@ class ConnectionResponse(BaseModel):
     extra: Annotated[str | None, Field(title="Extra")] = None
 
 
+class ConnectionsBatchBody(BaseModel):
+    """
+    Request body schema for getting several connections at once.
+    """
+
+    conn_ids: Annotated[list[str], Field(min_length=1, title="Conn Ids")]
+
+
 class DagResponse(BaseModel):
     """
     Schema for DAG response.
@@ -419,6 +427,17 @@ class VariableResponse(BaseModel):
     value: Annotated[str | None, Field(title="Value")] = None
 
 
+class VariablesBatchBody(BaseModel):
+    """
+    Request body schema for getting several variables at once.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    keys: Annotated[list[str], Field(min_length=1, title="Keys")]
+
+
 class XComResponse(BaseModel):
     """
     XCom schema for responses with fields that are needed for Runtime.
@@ -452,6 +471,25 @@ class XComSequenceSliceResponse(RootModel[list[JsonValue]]):
     ]
 
 
+class ConnectionsBatchResponse(BaseModel):
+    """
+    Connections found among the requested ones; the connections which are not found are omitted.
+    """
+
+    connections: Annotated[list[ConnectionResponse], Field(title="Connections")]
+
+
+class VariablesBatchResponse(BaseModel):
+    """
+    Variables found among the requested ones; the variables which are not found are omitted.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    variables: Annotated[list[VariableResponse], Field(title="Variables")]
+
+
 class TaskInstance(BaseModel):
     """
     Schema for TaskInstance model with minimal required fields needed for Runtime.
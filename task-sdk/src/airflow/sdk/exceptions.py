@@ -21,14 +21,13 @@ import enum
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
-from airflow.sdk import TriggerRule
-
 # Re exporting AirflowConfigException from shared configuration
 from airflow.sdk._shared.configuration.exceptions import AirflowConfigException as AirflowConfigException
 
 if TYPE_CHECKING:
     from collections.abc import Collection
 
+    from airflow.sdk import TriggerRule
     from airflow.sdk.definitions.asset import AssetNameRef, AssetUniqueKey, AssetUriRef
     from airflow.sdk.execution_time.comms import ErrorResponse
 
@@ -344,8 +343,6 @@ class TaskAlreadyRunningError(AirflowException):
 class FailFastDagInvalidTriggerRule(AirflowException):
     """Raise when a dag has 'fail_fast' enabled yet has a non-default trigger rule."""
 
-    _allowed_rules = (TriggerRule.ALL_SUCCESS, TriggerRule.ALL_DONE_SETUP_SUCCESS)
-
     @classmethod
     def check(cls, *, fail_fast: bool, trigger_rule: TriggerRule):
         """
@@ -353,10 +350,14 @@ class FailFastDagInvalidTriggerRule(AirflowException):
 
         :meta private:
         """
-        if fail_fast and trigger_rule not in cls._allowed_rules:
+        from airflow.sdk import TriggerRule
+
+        if fail_fast and trigger_rule not in (TriggerRule.ALL_SUCCESS, TriggerRule.ALL_DONE_SETUP_SUCCESS):
             raise cls()
 
     def __str__(self) -> str:
+        from airflow.sdk import TriggerRule
+
         return f"A 'fail_fast' dag can only have {TriggerRule.ALL_SUCCESS} trigger rule"
 
 
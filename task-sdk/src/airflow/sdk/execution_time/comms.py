@@ -71,6 +71,7 @@ from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     BundleInfo,
     ConnectionResponse,
+    ConnectionsBatchResponse,
     DagResponse,
     DagRun,
     DagRunStateResponse,
@@ -91,6 +92,7 @@ from airflow.sdk.api.datamodels._generated import (
     TriggerDAGRunPayload,
     UpdateHITLDetailPayload,
     VariableResponse,
+    VariablesBatchResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -531,6 +533,20 @@ class ConnectionResult(ConnectionResponse):
         )
 
 
+class ConnectionsResult(ConnectionsBatchResponse):
+    type: Literal["ConnectionsResult"] = "ConnectionsResult"
+
+    @classmethod
+    def from_response(cls, response: ConnectionsBatchResponse) -> ConnectionsResult:
+        """
+        Get ConnectionsResult from ConnectionsBatchResponse.
+
+        ConnectionsBatchResponse is autogenerated from the API schema, so we need to convert it to
+        ConnectionsResult for communication between the Supervisor and the task process.
+        """
+        return cls(connections=response.connections, type="ConnectionsResult")
+
+
 class VariableResult(VariableResponse):
     type: Literal["VariableResult"] = "VariableResult"
 
@@ -545,6 +561,20 @@ class VariableResult(VariableResponse):
         return cls(**variable_response.model_dump(exclude_defaults=True), type="VariableResult")
 
 
+class VariablesResult(VariablesBatchResponse):
+    type: Literal["VariablesResult"] = "VariablesResult"
+
+    @classmethod
+    def from_response(cls, response: VariablesBatchResponse) -> VariablesResult:
+        """
+        Get VariablesResult from VariablesBatchResponse.
+
+        VariablesBatchResponse is autogenerated from the API schema, so we need to convert it to
+        VariablesResult for communication between the Supervisor and the task process.
+        """
+        return cls(variables=response.variables, type="VariablesResult")
+
+
 class DagRunResult(DagRun):
     type: Literal["DagRunResult"] = "DagRunResult"
 
@@ -714,6 +744,7 @@ ToTask = Annotated[
     AssetResult
     | AssetEventsResult
     | ConnectionResult
+    | ConnectionsResult
     | DagRunResult
     | DagRunStateResult
     | DRCount
@@ -728,6 +759,7 @@ ToTask = Annotated[
     | TaskBreadcrumbsResult
     | TaskStatesResult
     | VariableResult
+    | VariablesResult
     | XComCountResponse
     | XComResult
     | XComSequenceIndexResult
@@ -857,11 +889,25 @@ class GetConnection(BaseModel):
     type: Literal["GetConnection"] = "GetConnection"
 
 
+class GetConnections(BaseModel):
+    """Get several connections at once; the connections which are not found are omitted from the result."""
+
+    conn_ids: list[str]
+    type: Literal["GetConnections"] = "GetConnections"
+
+
 class GetVariable(BaseModel):
     key: str
     type: Literal["GetVariable"] = "GetVariable"
 
 
+class GetVariables(BaseModel):
+    """Get several variables at once; the variables which are not found are omitted from the result."""
+
+    keys: list[str]
+    type: Literal["GetVariables"] = "GetVariables"
+
+
 class PutVariable(BaseModel):
     key: str
     value: str | None
@@ -1049,6 +1095,7 @@ ToSupervisor = Annotated[
     | GetAssetEventByAsset
     | GetAssetEventByAssetAlias
     | GetConnection
+    | GetConnections
     | GetDagRun
     | GetDagRunState
     | GetDRCount
@@ -1061,6 +1108,7 @@ ToSupervisor = Annotated[
     | GetTaskBreadcrumbs
     | GetTaskStates
     | GetVariable
+    | GetVariables
     | GetXCom
     | GetXComCount
     | GetXComSequenceItem
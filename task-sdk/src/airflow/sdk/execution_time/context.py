@@ -325,6 +325,7 @@ def _set_variable(key: str, value: Any, description: str | None = None, serializ
 
     # Invalidate cache after setting the variable
     SecretCache.invalidate_variable(key)
+    ExecutionAPISecretsBackend.invalidate_variable(key)
 
 
 def _delete_variable(key: str) -> None:
@@ -335,6 +336,7 @@ def _delete_variable(key: str) -> None:
     #   keep Task SDK as a separate package than execution time mods.
     from airflow.sdk.execution_time.cache import SecretCache
     from airflow.sdk.execution_time.comms import DeleteVariable
+    from airflow.sdk.execution_time.secrets.execution_api import ExecutionAPISecretsBackend
     from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
 
     msg = SUPERVISOR_COMMS.send(DeleteVariable(key=key))
@@ -343,6 +345,7 @@ def _delete_variable(key: str) -> None:
 
     # Invalidate cache after deleting the variable
     SecretCache.invalidate_variable(key)
+    ExecutionAPISecretsBackend.invalidate_variable(key)
 
 
 class ConnectionAccessor:
@@ -39,16 +39,29 @@ _XComWrapper = collections.namedtuple("_XComWrapper", "value")
 log = structlog.get_logger(logger_name=__name__)
 
 
+def _get_prefetch_size() -> int:
+    from airflow.sdk.configuration import conf
+
+    return conf.getint("workers", "xcom_sequence_prefetch_size", fallback=1000)
+
+
 @attrs.define
 class LazyXComIterator(Iterator[T]):
     seq: LazyXComSequence[T]
     index: int = 0
     dir: Literal[1, -1] = 1
+    prefetch_size: int = attrs.field(factory=_get_prefetch_size)
+    """Number of values fetched at once when iterating forwards; values are fetched one at a time if 0."""
+
+    _prefetched: collections.deque[T] = attrs.field(init=False, factory=collections.deque)
+    _exhausted: bool = attrs.field(init=False, default=False)
 
     def __next__(self) -> T:
         if self.index < 0:
             # When iterating backwards, avoid extra HTTP request
             raise StopIteration()
+        if self.dir == 1 and self.prefetch_size > 0:
+            return self._next_prefetched()
         try:
             val = self.seq[self.index]
         except IndexError:
@@ -56,6 +69,19 @@ class LazyXComIterator(Iterator[T]):
         self.index += self.dir
         return val
 
+    def _next_prefetched(self) -> T:
+        if not self._prefetched:
+            if self._exhausted:
+                raise StopIteration()
+            # A single request for the whole window, instead of one per value.
+            window = self.seq[self.index : self.index + self.prefetch_size]
+            self._exhausted = len(window) < self.prefetch_size
+            if not window:
+                raise StopIteration()
+            self._prefetched.extend(window)
+        self.index += 1
+        return self._prefetched.popleft()
+
     def __iter__(self) -> Iterator[T]:
         return self
 
@@ -35,10 +35,14 @@ from airflow.sdk.api.datamodels._generated import (
 )
 from airflow.sdk.execution_time.comms import (
     ConnectionResult,
+    ConnectionsResult,
     GetConnection,
+    GetConnections,
     GetVariable,
+    GetVariables,
     MaskSecret,
     VariableResult,
+    VariablesResult,
 )
 from airflow.sdk.log import mask_secret
 
@@ -70,6 +74,26 @@ def handle_get_variable(client: Client, msg: GetVariable) -> tuple[BaseModel | N
     return var, {}
 
 
+def handle_get_connections(client: Client, msg: GetConnections) -> tuple[BaseModel | None, dict[str, bool]]:
+    """Fetch several connections at once and mask their sensitive fields."""
+    conns = client.connections.get_many(msg.conn_ids)
+    for conn in conns.connections:
+        if conn.password:
+            mask_secret(conn.password)
+        if conn.extra:
+            mask_secret(conn.extra)
+    return ConnectionsResult.from_response(conns), {"exclude_unset": True, "by_alias": True}
+
+
+def handle_get_variables(client: Client, msg: GetVariables) -> tuple[BaseModel | None, dict[str, bool]]:
+    """Fetch several variables at once and mask their values."""
+    variables = client.variables.get_many(msg.keys)
+    for var in variables.variables:
+        if var.value:
+            mask_secret(var.value, var.key)
+    return VariablesResult.from_response(variables), {"exclude_unset": True}
+
+
 def handle_mask_secret(msg: MaskSecret) -> None:
     """Register a value with the secrets masker."""
     mask_secret(msg.value, msg.name)
@@ -18,12 +18,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from airflow.sdk.bases.secrets_backend import BaseSecretsBackend
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from airflow.sdk import Connection
+    from airflow.sdk.execution_time.comms import ConnectionResult
 
 
 class ExecutionAPISecretsBackend(BaseSecretsBackend):
@@ -33,8 +36,57 @@ class ExecutionAPISecretsBackend(BaseSecretsBackend):
     Routes connection and variable requests through SUPERVISOR_COMMS to the
     Execution API server. This backend should only be registered in client
     processes, not in API server/scheduler processes.
+
+    Connections and variables fetched with :meth:`prefetch` are kept for the lifetime of the process, and
+    returned without further requests.
     """
 
+    _prefetched_connections: ClassVar[dict[str, ConnectionResult]] = {}
+    _prefetched_variables: ClassVar[dict[str, str | None]] = {}
+
+    @classmethod
+    def prefetch(cls, conn_ids: Iterable[str] = (), keys: Iterable[str] = ()) -> None:
+        """
+        Fetch connections and variables with a single request each, and keep them for the process lifetime.
+
+        Used at task start for the connections and variables the task is known to use, instead of one
+        request per connection or variable when they are accessed. The ones which are not found are not
+        kept, so that accessing them behaves as usual.
+
+        :param conn_ids: connection ids
+        :param keys: Variable keys
+        """
+        from airflow.sdk.execution_time.comms import (
+            ConnectionResult,
+            ConnectionsResult,
+            GetConnections,
+            GetVariables,
+            VariablesResult,
+        )
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        if conn_ids := [conn_id for conn_id in conn_ids if conn_id not in cls._prefetched_connections]:
+            msg = SUPERVISOR_COMMS.send(GetConnections(conn_ids=conn_ids))
+            if isinstance(msg, ConnectionsResult):
+                cls._prefetched_connections.update(
+                    (conn.conn_id, ConnectionResult.from_conn_response(conn)) for conn in msg.connections
+                )
+        if keys := [key for key in keys if key not in cls._prefetched_variables]:
+            msg = SUPERVISOR_COMMS.send(GetVariables(keys=keys))
+            if isinstance(msg, VariablesResult):
+                cls._prefetched_variables.update((var.key, var.value) for var in msg.variables)
+
+    @classmethod
+    def invalidate_variable(cls, key: str) -> None:
+        """Forget the prefetched value of a variable, e.g. after it is updated."""
+        cls._prefetched_variables.pop(key, None)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget all the prefetched connections and variables."""
+        cls._prefetched_connections.clear()
+        cls._prefetched_variables.clear()
+
     def get_conn_value(self, conn_id: str, team_name: str | None = None) -> str | None:
         """
         Get connection URI via SUPERVISOR_COMMS.
@@ -56,6 +108,9 @@ class ExecutionAPISecretsBackend(BaseSecretsBackend):
         from airflow.sdk.execution_time.context import _process_connection_result_conn
         from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
 
+        if (prefetched := self._prefetched_connections.get(conn_id)) is not None:
+            return _process_connection_result_conn(prefetched)
+
         try:
             msg = SUPERVISOR_COMMS.send(GetConnection(conn_id=conn_id))
 
@@ -102,6 +157,9 @@ class ExecutionAPISecretsBackend(BaseSecretsBackend):
         from airflow.sdk.execution_time.comms import ErrorResponse, GetVariable, VariableResult
         from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
 
+        if key in self._prefetched_variables:
+            return self._prefetched_variables[key]
+
         try:
             msg = SUPERVISOR_COMMS.send(GetVariable(key=key))
 
@@ -129,6 +187,9 @@ class ExecutionAPISecretsBackend(BaseSecretsBackend):
         from airflow.sdk.execution_time.context import _process_connection_result_conn
         from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
 
+        if (prefetched := self._prefetched_connections.get(conn_id)) is not None:
+            return _process_connection_result_conn(prefetched)
+
         try:
             msg = await SUPERVISOR_COMMS.asend(GetConnection(conn_id=conn_id))
 
@@ -153,6 +214,9 @@ class ExecutionAPISecretsBackend(BaseSecretsBackend):
         from airflow.sdk.execution_time.comms import ErrorResponse, GetVariable, VariableResult
         from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
 
+        if key in self._prefetched_variables:
+            return self._prefetched_variables[key]
+
         try:
             msg = await SUPERVISOR_COMMS.asend(GetVariable(key=key))
 
@@ -78,6 +78,7 @@ from airflow.sdk.execution_time.comms import (
     GetAssetEventByAsset,
     GetAssetEventByAssetAlias,
     GetConnection,
+    GetConnections,
     GetDag,
     GetDagRun,
     GetDagRunState,
@@ -90,6 +91,7 @@ from airflow.sdk.execution_time.comms import (
     GetTaskStates,
     GetTICount,
     GetVariable,
+    GetVariables,
     GetXCom,
     GetXComCount,
     GetXComSequenceItem,
@@ -123,7 +125,9 @@ from airflow.sdk.execution_time.comms import (
 )
 from airflow.sdk.execution_time.request_handlers import (
     handle_get_connection,
+    handle_get_connections,
     handle_get_variable,
+    handle_get_variables,
     handle_mask_secret,
 )
 
@@ -1419,8 +1423,12 @@ class ActivitySubprocess(WatchedSubprocess):
             )
         elif isinstance(msg, GetConnection):
             resp, dump_opts = handle_get_connection(self.client, msg)
+        elif isinstance(msg, GetConnections):
+            resp, dump_opts = handle_get_connections(self.client, msg)
         elif isinstance(msg, GetVariable):
             resp, dump_opts = handle_get_variable(self.client, msg)
+        elif isinstance(msg, GetVariables):
+            resp, dump_opts = handle_get_variables(self.client, msg)
         elif isinstance(msg, GetXCom):
             xcom = self.client.xcoms.get(
                 msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.map_index, msg.include_prior_dates
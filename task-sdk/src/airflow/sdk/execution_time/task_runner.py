@@ -22,6 +22,7 @@ from __future__ import annotations
 import contextvars
 import functools
 import os
+import re
 import sys
 import time
 from collections.abc import Callable, Iterable, Iterator, Mapping
@@ -1023,7 +1024,7 @@ def _serialize_template_field(template_field: Any, name: str) -> str | dict | li
             return obj.to_dict()
         raise TypeError(f"cannot serialize {obj}")
 
-    max_length = conf.getint("core", "max_templated_field_length")
+    max_length = conf.snapshot.getint("core", "max_templated_field_length")
 
     if not is_jsonable(template_field):
         try:
@@ -1123,6 +1124,65 @@ def _serialize_outlet_events(events: OutletEventAccessorsProtocol) -> Iterator[d
             yield attrs.asdict(alias_event)
 
 
+# Accesses to connections and variables in templates, e.g. ``{{ var.value.my_key }}``,
+# ``{{ var.json.get('my key') }}`` or ``{{ conn.my_conn_id.host }}``.
+_TEMPLATE_SECRET_ACCESS = re.compile(
+    r"\b(?P<accessor>var\.value|var\.json|conn)\.(?:get\(\s*(?P<quote>['\"])(?P<quoted_name>.+?)(?P=quote)|(?P<name>\w+))"
+)
+
+
+def _collect_secret_references(task: BaseOperator) -> tuple[set[str], set[str]]:
+    """
+    Collect the connections and variables statically referenced by a task.
+
+    These are the connections named by its ``*conn_id`` attributes, and the connections and variables
+    accessed in its templated fields.
+
+    :return: connection ids and variable keys
+    """
+    conn_ids: set[str] = set()
+    keys: set[str] = set()
+
+    def _collect_from_template(value: Any) -> None:
+        if isinstance(value, str):
+            for match in _TEMPLATE_SECRET_ACCESS.finditer(value):
+                name = match["quoted_name"] or match["name"]
+                # ``conn.get(conn_id)`` with a conn_id only known once rendered
+                if name != "get":
+                    (conn_ids if match["accessor"] == "conn" else keys).add(name)
+        elif isinstance(value, (list, tuple, set)):
+            for item in value:
+                _collect_from_template(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                _collect_from_template(item)
+
+    for field in task.template_fields:
+        _collect_from_template(getattr(task, field, None))
+    for name, value in vars(task).items():
+        if name.endswith("conn_id") and isinstance(value, str) and value and "{{" not in value:
+            conn_ids.add(value)
+    return conn_ids, keys
+
+
+def _prefetch_secrets(task: BaseOperator, log: Logger) -> None:
+    """Fetch the connections and variables referenced by the task with a single request each."""
+    from airflow.sdk.execution_time.secrets.execution_api import ExecutionAPISecretsBackend
+
+    if not conf.getboolean("workers", "prefetch_secrets", fallback=True):
+        return
+    conn_ids, keys = _collect_secret_references(task)
+    if not conn_ids and not keys:
+        return
+    try:
+        ExecutionAPISecretsBackend.prefetch(conn_ids=sorted(conn_ids), keys=sorted(keys))
+    except Exception:
+        # Not fatal: they are then fetched one at a time when accessed.
+        log.debug("Unable to prefetch connections and variables", exc_info=True)
+    else:
+        log.debug("Prefetched connections and variables", conn_ids=sorted(conn_ids), keys=sorted(keys))
+
+
 def _prepare(ti: RuntimeTaskInstance, log: Logger, context: Context) -> ToSupervisor | None:
     ti.hostname = get_hostname()
     ti.task = ti.task.prepare_for_execution()
@@ -1130,6 +1190,8 @@ def _prepare(ti: RuntimeTaskInstance, log: Logger, context: Context) -> ToSuperv
     # update the value of the task that is sent from there
     context["task"] = ti.task
 
+    _prefetch_secrets(ti.task, log)
+
     jinja_env = ti.task.dag.get_template_env()
     ti.render_templates(context=context, jinja_env=jinja_env)
 
@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+import sys
 from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO, TextIO
@@ -257,11 +258,13 @@ def mask_secret(secret: JsonValue, name: str | None = None) -> None:
     _secrets_masker().add_mask(secret, name)
 
     with suppress(Exception):
-        # Try to tell supervisor (only if in task execution context)
-        from airflow.sdk.execution_time import task_runner
-        from airflow.sdk.execution_time.comms import MaskSecret
-
+        # Try to tell supervisor (only if in task execution context). The task runner sets up the
+        # supervisor comms, so there is nothing to tell if it has not been imported, and importing it
+        # here would pull in most of the SDK in processes which are not running tasks.
+        task_runner = sys.modules.get("airflow.sdk.execution_time.task_runner")
         if comms := getattr(task_runner, "SUPERVISOR_COMMS", None):
+            from airflow.sdk.execution_time.comms import MaskSecret
+
             comms.send(MaskSecret(value=secret, name=name))
 
 
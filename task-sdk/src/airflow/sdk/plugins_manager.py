@@ -34,6 +34,7 @@ from airflow.sdk._shared.plugins_manager import (
     integrate_macros_plugins as _integrate_macros_plugins,
     is_valid_plugin,
 )
+from airflow.sdk._shared.providers_discovery import get_discovery_manifest_path, load_discovery_manifest
 from airflow.sdk.configuration import conf
 from airflow.sdk.providers_manager_runtime import ProvidersManagerTaskRuntime
 
@@ -106,7 +107,10 @@ def _get_plugins() -> tuple[list[AirflowPlugin], dict[str, str]]:
                 example_plugins_module="airflow.example_dags.plugins" if load_examples else None,
             )
         )
-        __register_plugins(*_load_entrypoint_plugins())
+        manifest = load_discovery_manifest(get_discovery_manifest_path())
+        __register_plugins(
+            *_load_entrypoint_plugins(manifest.iter_plugin_entry_points() if manifest else None)
+        )
 
         if not settings.LAZY_LOAD_PROVIDERS:
             __register_plugins(*_load_providers_plugins())
@@ -150,11 +150,15 @@ class ProvidersManagerTaskRuntime(LoggingMixin):
         # Keeps dict of hooks keyed by connection type. They are lazy evaluated at access time
         self._hooks_lazy_dict: LazyDictWithCache[str, HookInfo | Callable] = LazyDictWithCache()
         self._plugins_set: set[PluginInfo] = set()
-        self._provider_schema_validator = _create_provider_info_schema_validator()
         self._init_airflow_core_hooks()
         # Populated by initialize_provider_configs(); holds provider-contributed config sections.
         self._provider_configs: dict[str, dict[str, Any]] = {}
 
+    @functools.cached_property
+    def _provider_schema_validator(self):
+        # Created on first use, as importing jsonschema is costly and most processes never need it.
+        return _create_provider_info_schema_validator()
+
     def _init_airflow_core_hooks(self):
         """Initialize the hooks dict with default hooks from Airflow core."""
         core_dummy_hooks = {
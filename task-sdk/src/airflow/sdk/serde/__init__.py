@@ -22,6 +22,7 @@ import functools
 import logging
 import re
 import sys
+import weakref
 from fnmatch import fnmatch
 from importlib import import_module
 from re import Pattern
@@ -68,6 +69,17 @@ _extra_allowed: set[str] = set()
 _primitives = (int, bool, float, str)
 _builtin_collections = (frozenset, list, set, tuple)  # dict is treated specially.
 
+# Exact types of the primitives, which are returned as is without looking any further. Subclasses, e.g.
+# enums, are not included as they may have serializers of their own.
+_primitive_types = frozenset(_primitives)
+
+# How objects of a type are serialized, by type: the qualified name to look up serializers with, the
+# classname to encode the object with if it differs from the one returned by its serializer, and the
+# registered serializer for it if any. Working this out for every object is costly for large values.
+_dispatch_cache: weakref.WeakKeyDictionary[type, tuple[str, str | None, ModuleType | None]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def encode(cls: str, version: int, data: T) -> dict[str, str | int | T]:
     """Encode an object so it can be understood by the deserializer."""
@@ -127,35 +139,33 @@ def serialize(o: object, depth: int = 0) -> U | None:
     if o is None:
         return o
 
+    cls = type(o)
+    if cls in _primitive_types:
+        return o
+
+    # Primitive items, the bulk of large values, are returned as is without a recursive call.
     if isinstance(o, list):
-        return [serialize(d, depth + 1) for d in o]
+        return [d if type(d) in _primitive_types else serialize(d, depth + 1) for d in o]
 
     if isinstance(o, dict):
         if CLASSNAME in o or SCHEMA_ID in o:
             raise AttributeError(f"reserved key {CLASSNAME} or {SCHEMA_ID} found in dict to serialize")
 
-        return {str(k): serialize(v, depth + 1) for k, v in o.items()}
-
-    cls = type(o)
-    qn = qualname(o)
-    classname = None
-
-    # Serialize namedtuple like tuples
-    # We also override the classname returned by the builtin.py serializer. The classname
-    # has to be "builtins.tuple", so that the deserializer can deserialize the object into tuple.
-    if _is_namedtuple(o):
-        qn = "builtins.tuple"
-        classname = qn
+        return {
+            k if type(k) is str else str(k): v if type(v) in _primitive_types else serialize(v, depth + 1)
+            for k, v in o.items()
+        }
 
-    if is_pydantic_model(o):
-        # to match the generic Pydantic serializer and deserializer in _serializers and _deserializers
-        qn = PYDANTIC_MODEL_QUALNAME
-        # the actual Pydantic model class to encode
-        classname = qualname(o)
+    if (dispatch := _dispatch_cache.get(cls)) is None:
+        dispatch = _get_dispatch(o)
+        # The qualified name of callables, e.g. functions, depends on the object rather than its type.
+        if not callable(o):
+            _dispatch_cache[cls] = dispatch
+    qn, classname, serializer = dispatch
 
     # if there is a builtin serializer available use that
-    if qn in _serializers:
-        data, serialized_classname, version, is_serialized = _serializers[qn].serialize(o)
+    if serializer is not None:
+        data, serialized_classname, version, is_serialized = serializer.serialize(o)
         if is_serialized:
             return encode(classname or serialized_classname, version, serialize(data, depth + 1))
 
@@ -220,7 +230,7 @@ def deserialize(o: T | None, full=True, type_hint: Any = None) -> object:
 
     # tuples, sets are included here for backwards compatibility
     if isinstance(o, _builtin_collections):
-        col = [deserialize(d) for d in o]
+        col = [d if type(d) in _primitive_types else deserialize(d) for d in o]
         if isinstance(o, tuple):
             return tuple(col)
 
@@ -238,7 +248,10 @@ def deserialize(o: T | None, full=True, type_hint: Any = None) -> object:
 
     # plain dict and no type hint
     if CLASSNAME not in o and not type_hint or VERSION not in o:
-        return {str(k): deserialize(v, full) for k, v in o.items()}
+        return {
+            k if type(k) is str else str(k): v if type(v) in _primitive_types else deserialize(v, full)
+            for k, v in o.items()
+        }
 
     # custom deserialization starts here
     cls: Any
@@ -302,6 +315,32 @@ def deserialize(o: T | None, full=True, type_hint: Any = None) -> object:
     raise TypeError(f"No deserializer found for {classname}")
 
 
+def _get_dispatch(o: object) -> tuple[str, str | None, ModuleType | None]:
+    """
+    Work out how an object is serialized.
+
+    :return: The qualified name to look up serializers with, the classname to encode the object with if it
+        differs from the one returned by its serializer, and the registered serializer for it if any.
+    """
+    qn = qualname(o)
+    classname = None
+
+    # Serialize namedtuple like tuples
+    # We also override the classname returned by the builtin.py serializer. The classname
+    # has to be "builtins.tuple", so that the deserializer can deserialize the object into tuple.
+    if _is_namedtuple(o):
+        qn = "builtins.tuple"
+        classname = qn
+
+    if is_pydantic_model(o):
+        # to match the generic Pydantic serializer and deserializer in _serializers and _deserializers
+        qn = PYDANTIC_MODEL_QUALNAME
+        # the actual Pydantic model class to encode
+        classname = qualname(o)
+
+    return qn, classname, _serializers.get(qn)
+
+
 def _convert(old: dict) -> dict:
     """Convert an old style serialization to new style."""
     if OLD_TYPE in old and OLD_DATA in old:
@@ -374,6 +413,7 @@ def _register():
     _serializers.clear()
     _deserializers.clear()
     _stringifiers.clear()
+    _dispatch_cache.clear()
 
     stats_factory = stats_utils.get_stats_factory(Stats)
     Stats.initialize(factory=stats_factory)
@@ -65,11 +65,8 @@ def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
     if not isinstance(data, str):
         raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
 
-    from io import BytesIO
-
+    import pyarrow as pa
     from pyarrow import parquet as pq
 
-    with BytesIO(bytes.fromhex(data)) as buf:
-        df = pq.read_table(buf).to_pandas()
-
-    return df
+    # Read the Parquet data from the decoded bytes directly rather than through a Python file object
+    return pq.read_table(pa.BufferReader(bytes.fromhex(data))).to_pandas()
@@ -37,6 +37,7 @@ from airflow.sdk.api.datamodels._generated import (
     AssetEventsResponse,
     AssetResponse,
     ConnectionResponse,
+    ConnectionsBatchResponse,
     DagResponse,
     DagRunState,
     DagRunStateResponse,
@@ -45,6 +46,7 @@ from airflow.sdk.api.datamodels._generated import (
     HITLUser,
     TerminalTIState,
     VariableResponse,
+    VariablesBatchResponse,
     XComResponse,
 )
 from airflow.sdk.exceptions import ErrorType, TaskAlreadyRunningError
@@ -765,6 +767,22 @@ class TestVariableOperations:
     response parsing.
     """
 
+    def test_variable_get_many(self):
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST" and request.url.path == "/variables/batch":
+                assert json.loads(request.read()) == {"keys": ["test_key", "missing_key"]}
+                return httpx.Response(
+                    status_code=200,
+                    json={"variables": [{"key": "test_key", "value": "test_value"}]},
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.variables.get_many(["test_key", "missing_key"])
+
+        assert isinstance(result, VariablesBatchResponse)
+        assert result.variables == [VariableResponse(key="test_key", value="test_value")]
+
     def test_variable_get_success(self):
         with time_machine.travel("2023-01-01T00:00:00Z", tick=False):
             # Simulate a successful response from the server with a variable
@@ -1099,6 +1117,22 @@ class TestConnectionOperations:
         assert result.conn_id == "test_conn"
         assert result.conn_type == "mysql"
 
+    def test_connection_get_many(self):
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST" and request.url.path == "/connections/batch":
+                assert json.loads(request.read()) == {"conn_ids": ["test_conn", "missing_conn"]}
+                return httpx.Response(
+                    status_code=200,
+                    json={"connections": [{"conn_id": "test_conn", "conn_type": "mysql"}]},
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.connections.get_many(["test_conn", "missing_conn"])
+
+        assert isinstance(result, ConnectionsBatchResponse)
+        assert [conn.conn_id for conn in result.connections] == ["test_conn"]
+
     def test_connection_get_404_not_found(self):
         # Simulate a successful response from the server with a connection
         def handle_request(request: httpx.Request) -> httpx.Response:
@@ -73,6 +73,7 @@ def test_len(mock_supervisor_comms, lazy_sequence):
     )
 
 
+@conf_vars({("workers", "xcom_sequence_prefetch_size"): "0"})
 def test_iter(mock_supervisor_comms, lazy_sequence):
     it = iter(lazy_sequence)
 
@@ -105,6 +106,32 @@ def test_iter(mock_supervisor_comms, lazy_sequence):
     )
 
 
+def test_iter_prefetch(mock_supervisor_comms, lazy_sequence):
+    it = iter(lazy_sequence)
+    it.prefetch_size = 2
+
+    mock_supervisor_comms.send.side_effect = [
+        XComSequenceSliceResult(root=["a", "b"]),
+        XComSequenceSliceResult(root=["c"]),
+    ]
+    assert list(it) == ["a", "b", "c"]
+    assert list(it) == []
+    assert mock_supervisor_comms.send.call_args_list == [
+        call(
+            GetXComSequenceSlice(
+                key=BaseXCom.XCOM_RETURN_KEY,
+                dag_id="dag",
+                task_id="task",
+                run_id="run",
+                start=start,
+                stop=stop,
+                step=None,
+            ),
+        )
+        for start, stop in [(0, 2), (2, 4)]
+    ]
+
+
 def test_getitem_index(mock_supervisor_comms, lazy_sequence):
     mock_supervisor_comms.send.return_value = XComSequenceIndexResult(root="f")
     assert lazy_sequence[4] == "f"
@@ -17,6 +17,8 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
 import pytest
 
 from airflow.sdk.definitions.connection import Connection
@@ -179,6 +181,77 @@ class TestExecutionAPISecretsBackend:
         mock_supervisor_comms.send.assert_called_once()
 
 
+class TestExecutionAPISecretsBackendPrefetch:
+    """Test the connections and variables prefetched by ExecutionAPISecretsBackend."""
+
+    @pytest.fixture(autouse=True)
+    def reset_prefetched(self):
+        ExecutionAPISecretsBackend.reset()
+        yield
+        ExecutionAPISecretsBackend.reset()
+
+    def test_prefetch(self, mock_supervisor_comms):
+        """Test that prefetched connections and variables are returned without further requests."""
+        from airflow.sdk.api.datamodels._generated import ConnectionResponse, VariableResponse
+        from airflow.sdk.execution_time.comms import (
+            ConnectionsResult,
+            GetConnections,
+            GetVariables,
+            VariablesResult,
+        )
+
+        mock_supervisor_comms.send.side_effect = [
+            ConnectionsResult(
+                connections=[ConnectionResponse(conn_id="test_conn", conn_type="http", host="example.com")]
+            ),
+            VariablesResult(variables=[VariableResponse(key="test_var", value="test_value")]),
+        ]
+
+        ExecutionAPISecretsBackend.prefetch(conn_ids=["test_conn", "other_conn"], keys=["test_var"])
+
+        assert mock_supervisor_comms.send.call_args_list == [
+            mock.call(GetConnections(conn_ids=["test_conn", "other_conn"])),
+            mock.call(GetVariables(keys=["test_var"])),
+        ]
+        mock_supervisor_comms.send.reset_mock()
+
+        backend = ExecutionAPISecretsBackend()
+        conn = backend.get_connection("test_conn")
+        assert conn is not None
+        assert conn.host == "example.com"
+        assert backend.get_variable("test_var") == "test_value"
+        mock_supervisor_comms.send.assert_not_called()
+
+        # Already prefetched ones are not requested again.
+        ExecutionAPISecretsBackend.prefetch(conn_ids=["test_conn"], keys=["test_var"])
+        mock_supervisor_comms.send.assert_not_called()
+
+    def test_connection_not_prefetched(self, mock_supervisor_comms):
+        """Test that connections not found when prefetching are requested when accessed."""
+        from airflow.sdk.execution_time.comms import ConnectionsResult, GetConnection
+
+        mock_supervisor_comms.send.return_value = ConnectionsResult(connections=[])
+        ExecutionAPISecretsBackend.prefetch(conn_ids=["test_conn"])
+
+        mock_supervisor_comms.send.reset_mock()
+        ExecutionAPISecretsBackend().get_connection("test_conn")
+        mock_supervisor_comms.send.assert_called_once_with(GetConnection(conn_id="test_conn"))
+
+    def test_invalidate_variable(self, mock_supervisor_comms):
+        """Test that invalidated variables are requested again."""
+        from airflow.sdk.api.datamodels._generated import VariableResponse
+        from airflow.sdk.execution_time.comms import VariableResult, VariablesResult
+
+        mock_supervisor_comms.send.return_value = VariablesResult(
+            variables=[VariableResponse(key="test_var", value="old_value")]
+        )
+        ExecutionAPISecretsBackend.prefetch(keys=["test_var"])
+        ExecutionAPISecretsBackend.invalidate_variable("test_var")
+
+        mock_supervisor_comms.send.return_value = VariableResult(key="test_var", value="new_value")
+        assert ExecutionAPISecretsBackend().get_variable("test_var") == "new_value"
+
+
 class TestContextDetection:
     """Test context detection in ensure_secrets_backend_loaded."""
 
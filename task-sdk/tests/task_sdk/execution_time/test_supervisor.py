@@ -56,12 +56,14 @@ from airflow.sdk.api.datamodels._generated import (
     AssetEventResponse,
     AssetProfile,
     AssetResponse,
+    ConnectionResponse,
     DagRun,
     DagRunState,
     DagRunType,
     PreviousTIResponse,
     TaskInstance,
     TaskInstanceState,
+    VariableResponse,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType, TaskAlreadyRunningError
 from airflow.sdk.execution_time import supervisor, task_runner
@@ -70,6 +72,7 @@ from airflow.sdk.execution_time.comms import (
     AssetResult,
     CommsDecoder,
     ConnectionResult,
+    ConnectionsResult,
     CreateHITLDetailPayload,
     DagResult,
     DagRunResult,
@@ -84,6 +87,7 @@ from airflow.sdk.execution_time.comms import (
     GetAssetEventByAsset,
     GetAssetEventByAssetAlias,
     GetConnection,
+    GetConnections,
     GetDag,
     GetDagRun,
     GetDagRunState,
@@ -97,6 +101,7 @@ from airflow.sdk.execution_time.comms import (
     GetTaskStates,
     GetTICount,
     GetVariable,
+    GetVariables,
     GetXCom,
     GetXComCount,
     GetXComSequenceItem,
@@ -128,6 +133,7 @@ from airflow.sdk.execution_time.comms import (
     UpdateHITLDetail,
     ValidateInletsAndOutlets,
     VariableResult,
+    VariablesResult,
     XComCountResponse,
     XComResult,
     XComSequenceIndexResult,
@@ -1529,6 +1535,33 @@ REQUEST_TEST_CASES = [
         expected_body={"key": "test_key", "value": "test_value", "type": "VariableResult"},
         mask_secret_args=("test_value", "test_key"),
     ),
+    RequestTestCase(
+        message=GetConnections(conn_ids=["test_conn", "missing_conn"]),
+        test_id="get_connections",
+        client_mock=ClientMock(
+            method_path="connections.get_many",
+            args=(["test_conn", "missing_conn"],),
+            response=ConnectionsResult(
+                connections=[ConnectionResponse(conn_id="test_conn", conn_type="mysql", password="password")]
+            ),
+        ),
+        expected_body={
+            "connections": [{"conn_id": "test_conn", "conn_type": "mysql", "password": "password"}],
+            "type": "ConnectionsResult",
+        },
+        mask_secret_args=("password",),
+    ),
+    RequestTestCase(
+        message=GetVariables(keys=["test_key", "missing_key"]),
+        test_id="get_variables",
+        client_mock=ClientMock(
+            method_path="variables.get_many",
+            args=(["test_key", "missing_key"],),
+            response=VariablesResult(variables=[VariableResponse(key="test_key", value="test_value")]),
+        ),
+        expected_body={"variables": [{"key": "test_key", "value": "test_value"}], "type": "VariablesResult"},
+        mask_secret_args=("test_value", "test_key"),
+    ),
     RequestTestCase(
         message=PutVariable(key="test_key", value="test_value", description="test_description"),
         test_id="set_variable",
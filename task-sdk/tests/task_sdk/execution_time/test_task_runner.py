@@ -134,6 +134,7 @@ from airflow.sdk.execution_time.context import (
 from airflow.sdk.execution_time.task_runner import (
     RuntimeTaskInstance,
     TaskRunnerMarker,
+    _collect_secret_references,
     _defer_task,
     _execute_task,
     _make_task_span,
@@ -1288,6 +1289,30 @@ def test_startup_and_run_dag_with_templated_fields(
     assert ti.task.bash_command == rendered_command
 
 
+def test_collect_secret_references():
+    """Test that the connections and variables statically referenced by a task are collected."""
+
+    class SecretOperator(BaseOperator):
+        template_fields = ("command", "env")
+
+        def __init__(self, command, env, ssh_conn_id, db_conn_id, **kwargs):
+            super().__init__(**kwargs)
+            self.command = command
+            self.env = env
+            self.ssh_conn_id = ssh_conn_id
+            self.db_conn_id = db_conn_id
+
+    task = SecretOperator(
+        task_id="secret_task",
+        command="echo {{ var.value.foo }} {{ conn.my_conn.host }} {{ conn.get(params.conn_id) }}",
+        env={"BAR": "{{ var.json.bar.nested }}", "BAZ": ["{{ var.value.get('my key', 'default') }}"]},
+        ssh_conn_id="ssh_default",
+        db_conn_id="{{ params.db_conn_id }}",
+    )
+
+    assert _collect_secret_references(task) == ({"my_conn", "ssh_default"}, {"foo", "bar", "my key"})
+
+
 def test_get_context_in_task(create_runtime_ti, time_machine, mock_supervisor_comms):
     """Test that the `get_current_context` & `set_current_context` work correctly."""
 
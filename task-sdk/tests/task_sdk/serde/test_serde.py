@@ -36,11 +36,13 @@ from airflow.sdk.serde import (
     DATA,
     SCHEMA_ID,
     VERSION,
+    _dispatch_cache,
     _get_patterns,
     _get_regexp_patterns,
     _match,
     _match_glob,
     _match_regexp,
+    _register,
     deserialize,
     serialize,
 )
@@ -271,6 +273,26 @@ class TestSerDe:
         e = (1, "something")
         assert i == e
 
+    def test_ser_primitive_items(self):
+        Color = enum.IntEnum("Color", ["RED", "GREEN"])
+        i = [1, 2.5, "a", True, None, Color.GREEN, {"x": 1, 2: Color.RED, "y": [3, "b"]}]
+        e = serialize(i)
+        assert e == [1, 2.5, "a", True, None, 2, {"x": 1, "2": 1, "y": [3, "b"]}]
+        assert deserialize(e) == e
+
+    def test_dispatch_cache(self):
+        i = datetime.datetime(2000, 10, 1)
+        assert serialize(i) == serialize(i)
+        assert datetime.datetime in _dispatch_cache
+
+        _register()
+        assert datetime.datetime not in _dispatch_cache
+
+    def test_dispatch_cache_skips_callables(self):
+        with pytest.raises(TypeError, match="^cannot serialize"):
+            serialize(Exception)
+        assert type not in _dispatch_cache
+
     def test_no_serializer(self):
         i = Exception
         with pytest.raises(TypeError, match="^cannot serialize"):